@@ -0,0 +1 @@
+"""Micro-benchmarks for performance-sensitive backend paths."""
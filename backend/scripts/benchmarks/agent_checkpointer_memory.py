@@ -0,0 +1,128 @@
+"""
+Benchmark process memory of ReAct agent runs under chat load: 1,000 to
+5,000 invocations, each on a new thread (as FinancialAnalysisReActAgent
+does), with a fake model that makes one tool call and answers with ~2 KB of
+text. Compares the previous MemorySaver with BoundedMemorySaver at the
+default limits (1,000 threads / 64 MB / 1 h). Each flow runs in a fresh
+process.
+Run with: python -m scripts.benchmarks.agent_checkpointer_memory [--runs N]
+"""
+
+import argparse
+import asyncio
+import gc
+import multiprocessing
+import time
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.prebuilt import create_react_agent
+
+from src.agent.checkpointer import BoundedMemorySaver
+
+CHECKPOINTS = (1000, 2000, 3000, 4000, 5000)
+
+
+class ToolThenAnswerModel(BaseChatModel):
+    """Fake model: one tool call, then a ~2 KB answer."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-then-answer"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ToolThenAnswerModel":
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if messages[-1].type == "human":
+            call = {"name": "get_historical_prices", "args": {"symbol": "AAPL"}}
+            message = AIMessage(content="", tool_calls=[{**call, "id": "c1"}])
+        else:
+            message = AIMessage(content="AAPL momentum holds above support. " * 60)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@tool
+def get_historical_prices(symbol: str) -> str:
+    """Return 30 days of prices."""
+    return f"2025-01-10 | ${symbol} 100.00 | 101.00 | 99.00 | 100.50\n" * 30
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * 4096 / 2**20
+
+
+def make_saver(flow: str) -> Any:
+    if flow == "MemorySaver":
+        return MemorySaver()
+    return BoundedMemorySaver()
+
+
+async def run_flow(flow: str, runs: int) -> list[tuple[int, float, int, float]]:
+    """(invocations, RSS MB, saver bytes, ms per call) at each checkpoint."""
+    saver = make_saver(flow)
+    agent = create_react_agent(
+        ToolThenAnswerModel(), [get_historical_prices], checkpointer=saver
+    )
+    rows = []
+    started = time.perf_counter()
+    for i in range(1, runs + 1):
+        await agent.ainvoke(
+            {"messages": [("user", "How is AAPL doing this month?")]},
+            {"configurable": {"thread_id": f"thread_{i}"}},
+        )
+        if i in CHECKPOINTS:
+            gc.collect()
+            held = getattr(saver, "total_bytes", -1)
+            per_call = (time.perf_counter() - started) / i * 1000
+            rows.append((i, rss_mb(), held, per_call))
+    return rows
+
+
+def measure(flow: str, runs: int) -> list[tuple[int, float, int, float]]:
+    structlog_quiet()
+    return asyncio.run(run_flow(flow, runs))
+
+
+FLOWS = ("MemorySaver", "BoundedMemorySaver")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'flow':>20} {'runs':>5} {'RSS MB':>7} {'saver MB':>8} {'ms/call':>7}")
+    context = multiprocessing.get_context("spawn")
+    for flow in FLOWS:
+        with context.Pool(1) as pool:
+            rows = pool.apply(measure, (flow, args.runs))
+        for runs, rss, held, per_call in rows:
+            saver_mb = f"{held / 2**20:.1f}" if held >= 0 else "n/a"
+            print(f"{flow:>20} {runs:>5} {rss:>7.1f} {saver_mb:>8} {per_call:>7.2f}")
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
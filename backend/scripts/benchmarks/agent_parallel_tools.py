@@ -0,0 +1,163 @@
+"""
+Benchmark ReAct agent runs whose model asks for 3/6/10 tool calls in one turn
+(Fibonacci + Stochastic + historical prices + ... across symbols), with fake
+tools that sleep for a fixed latency, against a fake model that answers
+instantly. Compares the tool calls run one after another, the previous
+create_react_agent default (one unbounded task per call, no timeouts or
+circuit breaker) and ConcurrentToolNode with the default cap. A second table
+adds one hung tool call to each turn, with timeouts scaled down to 1 s.
+Run with: python -m scripts.benchmarks.agent_parallel_tools [--latency S]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt import create_react_agent
+
+from src.agent.concurrent_tool_node import (
+    DEFAULT_TOOL_CONCURRENCY,
+    ConcurrentToolNode,
+)
+from src.core.utils.circuit_breaker import CircuitBreaker
+
+TOOL_NAMES = (
+    "fibonacci_analysis_tool",
+    "stochastic_analysis_tool",
+    "get_historical_prices",
+)
+SYMBOLS = ("AAPL", "MSFT", "NVDA", "AMD")
+HUNG_SECONDS = 5.0
+SCALED_TIMEOUT = 1.0
+
+
+class OneTurnModel(BaseChatModel):
+    """Fake model: one turn of tool calls, then a final answer."""
+
+    tool_calls: list[dict[str, Any]]
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "one-turn"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "OneTurnModel":
+        return self
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        self.calls += 1
+        if self.calls == 1:
+            message = AIMessage(content="", tool_calls=self.tool_calls)
+        else:
+            message = AIMessage(content="Done.")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        return self._generate(*args, **kwargs)
+
+
+def make_tools(latency: float) -> list[StructuredTool]:
+    def make(name: str) -> StructuredTool:
+        async def run(symbol: str, hang: bool = False) -> str:
+            await asyncio.sleep(HUNG_SECONDS if hang else latency)
+            return f"{name} {symbol}: ok"
+
+        return StructuredTool.from_function(
+            coroutine=run, name=name, description=f"Fake {name}"
+        )
+
+    return [make(name) for name in TOOL_NAMES]
+
+
+def turn(count: int, hung: bool) -> list[dict[str, Any]]:
+    calls = [
+        {
+            "name": TOOL_NAMES[i % len(TOOL_NAMES)],
+            "args": {"symbol": SYMBOLS[i // len(TOOL_NAMES)]},
+            "id": f"call_{i}",
+        }
+        for i in range(count)
+    ]
+    if hung:
+        calls[0]["args"]["hang"] = True
+    return calls
+
+
+def build(flow: str, tools: list[StructuredTool], model: OneTurnModel, hung: bool):
+    timeouts = dict.fromkeys(TOOL_NAMES, SCALED_TIMEOUT) if hung else None
+    if flow == "previous (v2)":
+        return create_react_agent(model, tools)
+    cap = 1 if flow == "one at a time" else DEFAULT_TOOL_CONCURRENCY
+    node = ConcurrentToolNode(
+        tools,
+        max_concurrency=cap,
+        timeouts=timeouts,
+        circuit_breaker=CircuitBreaker(),
+    )
+    return create_react_agent(model, node, version="v1")
+
+
+FLOWS = ("one at a time", "previous (v2)", "ConcurrentToolNode")
+
+
+async def measure(
+    flow: str, count: int, latency: float, hung: bool, trials: int
+) -> float:
+    timings = []
+    for _ in range(trials):
+        model = OneTurnModel(tool_calls=turn(count, hung))
+        agent = build(flow, make_tools(latency), model, hung)
+        started = time.perf_counter()
+        result = await agent.ainvoke({"messages": [("user", "Analyze my list")]})
+        timings.append(time.perf_counter() - started)
+        assert result["messages"][-1].content == "Done."
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds/tool")
+    parser.add_argument("--trials", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{args.latency * 1000:.0f} ms per tool call, "
+        f"ConcurrentToolNode cap {DEFAULT_TOOL_CONCURRENCY}"
+    )
+    for hung in (False, True):
+        if hung:
+            print(
+                f"\nWith one call hanging {HUNG_SECONDS:.0f} s "
+                f"(timeouts scaled to {SCALED_TIMEOUT:.0f} s)"
+            )
+        print(f"{'calls':>5} " + " ".join(f"{flow:>19}" for flow in FLOWS))
+        for count in (3, 6, 10):
+            row = [
+                asyncio.run(measure(flow, count, args.latency, hung, args.trials))
+                for flow in FLOWS
+            ]
+            print(f"{count:>5} " + " ".join(f"{t:>18.2f}s" for t in row))
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Benchmark the ReAct agent's prompt prefix under simulated chat traffic: 20
+users x 3 turns (English and Chinese), each turn one tool call then an
+answer, through FinancialAnalysisReActAgent with its 16 tools. A fake model
+plays a provider-side prefix cache (DashScope/OpenAI style): the request is
+serialized as system prompt, tool schemas, then the conversation; the part
+shared with an earlier request counts as cached in 64-token blocks once it
+reaches 1,024 tokens (tokens ~ chars / 4). The cached count is returned in
+usage_metadata, so the table's last column is what the agent result reports.
+Compares the previous prompt callable (system prompt formatted on every step
+and returned as a str, which LangGraph sends as the only message) with the
+PromptPrefix (memoized system message before the conversation), and times
+the prompt assembly of one step.
+Run with: python -m scripts.benchmarks.agent_prompt_prefix [--users N]
+"""
+
+import argparse
+import asyncio
+import json
+import timeit
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.prebuilt import create_react_agent
+
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.agent.llm_client import FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE
+from src.core.config import Settings
+
+MIN_CACHED_TOKENS = 1024
+BLOCK_TOKENS = 64
+SYMBOLS = ("AAPL", "MSFT", "NVDA", "AMD", "TSLA")
+
+
+def previous_prompt(state: dict) -> str:
+    """The agent's prompt callable before PromptPrefix."""
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    six_months_ago = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
+    return FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE.format(
+        current_date=current_date,
+        six_months_ago=six_months_ago,
+    )
+
+
+def common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix of two strings (binary search on slices)."""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class PrefixCacheModel(BaseChatModel):
+    """Fake model with a simulated provider prefix cache: tool call, then answer."""
+
+    tools: list[dict[str, Any]] = []
+    seen: list[str] = []
+    steps: int = 0
+    conversation_sent: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "prefix-cache"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "PrefixCacheModel":
+        self.tools = [convert_to_openai_tool(tool) for tool in tools]
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.steps += 1
+        self.conversation_sent += len(messages) > 1
+        system = [m.content for m in messages[:1] if m.type == "system"]
+        rest = [
+            (
+                {"role": m.type, "content": m.content, "tool_calls": m.tool_calls}
+                if isinstance(m, AIMessage)
+                else {"role": m.type, "content": m.content}
+            )
+            for m in messages[len(system) :]
+        ]
+        request = json.dumps([system, self.tools, rest], ensure_ascii=False)
+        shared = max((common_prefix(request, old) for old in self.seen), default=0)
+        self.seen.append(request)
+
+        input_tokens = len(request) // 4
+        cached = shared // 4 // BLOCK_TOKENS * BLOCK_TOKENS
+        cached = cached if cached >= MIN_CACHED_TOKENS else 0
+        usage = {
+            "input_tokens": input_tokens,
+            "output_tokens": 50,
+            "total_tokens": input_tokens + 50,
+            "input_token_details": {"cache_read": cached},
+        }
+        if self.steps % 2:
+            call = {"name": "get_historical_prices", "args": {"symbol": "AAPL"}}
+            message = AIMessage(
+                content="", tool_calls=[{**call, "id": f"call_{self.steps}"}]
+            )
+        else:
+            message = AIMessage(content="Momentum is holding above support. " * 20)
+        message.usage_metadata = usage
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def make_agent(model: PrefixCacheModel, flow: str) -> FinancialAnalysisReActAgent:
+    settings = Settings(
+        dashscope_api_key="benchmark",
+        langfuse_public_key="",
+        langfuse_secret_key="",
+        fred_api_key="",
+    )
+    agent = FinancialAnalysisReActAgent(
+        settings,
+        ticker_data_service=MagicMock(),
+        market_service=MagicMock(),
+        llm=model,
+    )
+    if flow == "previous":
+        agent.agent = create_react_agent(
+            model,
+            agent.tool_node,
+            checkpointer=agent.checkpointer,
+            prompt=previous_prompt,
+            version="v1",
+        )
+    return agent
+
+
+async def run_traffic(flow: str, users: int, turns: int) -> dict[str, Any]:
+    """Run the chat sessions; totals over every LLM step."""
+    model = PrefixCacheModel()
+    agent = make_agent(model, flow)
+    input_tokens = cached_tokens = 0
+    for user in range(users):
+        language = "zh-CN" if user % 2 else "en"
+        history: list[dict[str, str]] = []
+        for turn in range(turns):
+            question = f"How is {SYMBOLS[(user + turn) % len(SYMBOLS)]} doing?"
+            result = await agent.ainvoke(
+                question, conversation_history=history, language=language
+            )
+            input_tokens += result["input_tokens"]
+            cached_tokens += result["cached_input_tokens"]
+            history += [
+                {"role": "user", "content": question},
+                {"role": "assistant", "content": result["final_answer"]},
+            ]
+    return {
+        "steps": model.steps,
+        "conversation": model.conversation_sent,
+        "input": input_tokens,
+        "cached": cached_tokens,
+        "agent": agent,
+    }
+
+
+def prompt_build_us(flow: str, agent: FinancialAnalysisReActAgent) -> float:
+    """Microseconds to assemble one step's prompt."""
+    state = {"messages": []}
+    build = previous_prompt if flow == "previous" else agent.prompt_prefix
+    return timeit.timeit(lambda: build(state), number=20000) / 20000 * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{args.users} users x {args.turns} turns, cache from "
+        f"{MIN_CACHED_TOKENS} tokens in {BLOCK_TOKENS}-token blocks"
+    )
+    print(
+        f"{'flow':>13} {'steps':>5} {'w/ conv':>7} {'in tok/step':>11} "
+        f"{'cached':>6} {'build us':>8}"
+    )
+    for flow in ("previous", "prompt_prefix"):
+        totals = asyncio.run(run_traffic(flow, args.users, args.turns))
+        share = totals["cached"] / totals["input"] * 100
+        print(
+            f"{flow:>13} {totals['steps']:>5} {totals['conversation']:>7} "
+            f"{totals['input'] / totals['steps']:>11.0f} {share:>5.1f}% "
+            f"{prompt_build_us(flow, totals['agent']):>8.2f}"
+        )
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
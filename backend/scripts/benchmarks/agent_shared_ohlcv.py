@@ -0,0 +1,190 @@
+"""
+Benchmark one ReAct agent turn that runs the Fibonacci, Stochastic and
+historical-prices tools for 1/3/5 symbols (3/9/15 tool calls), with a fake
+model that answers instantly, a Redis stand-in with round-trip latency and a
+fake Alpha Vantage service with per-call latency. The DataManager has a bar
+store, as in production. Compares the previous flow (every tool loads its
+series through DataManager on its own) with the agent run's ohlcv_scope
+(each series loaded once and shared), for a cold cache (empty Redis and bar
+store) and a warm one.
+Run with: python -m scripts.benchmarks.agent_shared_ohlcv [--latency S]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.agent import langgraph_react_agent
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.core.config import Settings
+from src.services.data_manager import BarStore, DataManager, ohlcv_scope
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+REDIS_RTT = 0.0005
+SYMBOLS = ("AAPL", "MSFT", "NVDA", "AMD", "TSLA")
+TOOLS = ("fibonacci_analysis_tool", "stochastic_analysis_tool", "get_historical_prices")
+HISTORY_DAYS = 2500  # ~10 years of daily bars
+
+
+class LatencyVendor:
+    """Alpha Vantage stand-in: every request waits `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        end = pd.Timestamp.now(tz="UTC").normalize()
+        index = pd.bdate_range(end=end, periods=HISTORY_DAYS)
+        close = 150 + 30 * np.sin(np.linspace(0, 20 * np.pi, HISTORY_DAYS))
+        self.history = pd.DataFrame(
+            {
+                "Open": close - 1,
+                "High": close + 2,
+                "Low": close - 2,
+                "Close": close,
+                "Volume": np.full(HISTORY_DAYS, 1_000_000, dtype=np.int64),
+            },
+            index=index,
+        )
+
+    async def get_daily_bars(self, symbol: str, outputsize: str = "compact"):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self.history if outputsize == "full" else self.history.iloc[-100:]
+
+    get_weekly_bars = get_monthly_bars = get_daily_bars
+
+
+class OneTurnModel(BaseChatModel):
+    """Fake model: one turn of tool calls, then a final answer."""
+
+    tool_calls: list[dict[str, Any]]
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "one-turn"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "OneTurnModel":
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        if self.calls % 2:
+            message = AIMessage(content="", tool_calls=self.tool_calls)
+        else:
+            message = AIMessage(content="Done.")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def make_agent(symbols: int, dm: DataManager) -> FinancialAnalysisReActAgent:
+    calls = [
+        {"name": name, "args": {"symbol": symbol}, "id": f"{symbol}_{name}"}
+        for symbol in SYMBOLS[:symbols]
+        for name in TOOLS
+    ]
+    settings = Settings(
+        dashscope_api_key="benchmark",
+        langfuse_public_key="",
+        langfuse_secret_key="",
+        fred_api_key="",
+        bar_store_enabled=False,
+    )
+    return FinancialAnalysisReActAgent(
+        settings,
+        ticker_data_service=MagicMock(),
+        market_service=MagicMock(),
+        data_manager=dm,
+        llm=OneTurnModel(tool_calls=calls),
+    )
+
+
+FLOWS = {"previous": contextlib.nullcontext, "ohlcv_scope": ohlcv_scope}
+
+
+async def measure(
+    flow: str, symbols: int, latency: float, warm: bool, trials: int
+) -> tuple[float, int, int]:
+    """Median turn time, vendor calls and Redis reads of the measured turn."""
+    langgraph_react_agent.ohlcv_scope = FLOWS[flow]
+    timings, vendor_calls, redis_reads = [], [], []
+    for _ in range(trials):
+        with tempfile.TemporaryDirectory() as bars_dir:
+            server, vendor = FakeRedisServer(REDIS_RTT), LatencyVendor(latency)
+            dm = DataManager(
+                make_pod(server), vendor, bar_store=BarStore(Path(bars_dir))
+            )
+            agent = make_agent(symbols, dm)
+            if warm:
+                await agent.ainvoke("Analyze my list")
+                vendor.calls = 0
+                server.reads.clear()
+            started = time.perf_counter()
+            result = await agent.ainvoke("Analyze my list")
+            timings.append(time.perf_counter() - started)
+            vendor_calls.append(vendor.calls)
+            redis_reads.append(len(server.reads))
+            tool_results = [m for m in result["messages"] if m.type == "tool"]
+            assert len(tool_results) == symbols * len(TOOLS)
+            bad = [m.content for m in tool_results if "error" in m.content]
+            assert not bad, bad
+    langgraph_react_agent.ohlcv_scope = ohlcv_scope
+    return statistics.median(timings), vendor_calls[0], redis_reads[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.3, help="Vendor s/call")
+    parser.add_argument("--trials", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{args.latency * 1000:.0f} ms per vendor call, "
+        f"{REDIS_RTT * 1000:.1f} ms Redis RTT, {HISTORY_DAYS} daily bars"
+    )
+    print(
+        f"{'cache':>5} {'calls':>5} {'flow':>12} {'turn s':>7} {'vendor':>6} {'redis':>5}"
+    )
+    for warm in (False, True):
+        for symbols in (1, 3, 5):
+            for flow in FLOWS:
+                seconds, vendor, reads = asyncio.run(
+                    measure(flow, symbols, args.latency, warm, args.trials)
+                )
+                print(
+                    f"{'warm' if warm else 'cold':>5} {symbols * len(TOOLS):>5} "
+                    f"{flow:>12} {seconds:>7.3f} {vendor:>6} {reads:>5}"
+                )
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Benchmark an AI Sector Risk snapshot (all 7 metrics for a 10-symbol basket)
+against a fake market/FRED service that injects per-call latency, with a cold
+Redis cache for every run. Compares the previous flow (metrics calculated one
+after another, each basket metric fetching its symbols one at a time) with the
+shared prefetch (one bounded-concurrency pass over the basket data plan) and
+concurrent metric calculation. The previous flow is reproduced by serializing
+every vendor call, which also serializes the quote/options pair PCR used to
+fetch together, so its wall time is slightly overstated.
+Run with: python -m scripts.benchmarks.ai_sector_risk_snapshot [--latency S]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytz
+
+from src.core.config import Settings
+from src.services.insights.categories.ai_sector_risk import AISectorRiskCategory
+
+BASKET = ["NVDA", "MSFT", "AVGO", "AMD", "GOOGL", "META", "ORCL", "CRM", "ADBE", "NOW"]
+REDIS_RTT = 0.0005
+
+
+class LatencyRedis:
+    """In-memory Redis stand-in with round-trip latency."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        await asyncio.sleep(REDIS_RTT)
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        await asyncio.sleep(REDIS_RTT)
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+    async def exists(self, key: str) -> bool:
+        return key in self.data
+
+
+class LatencyVendor:
+    """Market + FRED service stand-in: every call waits `latency` seconds.
+
+    With `serial=True` calls never overlap, as in the previous sequential flow.
+    """
+
+    def __init__(self, latency: float, serial: bool):
+        self.latency = latency
+        self.lock = asyncio.Lock() if serial else None
+        self.calls = 0
+
+    async def _wait(self) -> None:
+        self.calls += 1
+        async with self.lock or contextlib.nullcontext():
+            await asyncio.sleep(self.latency)
+
+    async def get_etf_profile(self, symbol: str) -> dict:
+        await self._wait()
+        return {"holdings": [{"symbol": s, "weight": "0.05"} for s in BASKET]}
+
+    async def get_daily_bars(self, symbol: str, outputsize: str = "compact"):
+        await self._wait()
+        days = 1000 if outputsize == "full" else 100
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days)
+        closes = 100 + np.cumsum(np.random.default_rng(len(symbol)).normal(0, 1, days))
+        return pd.DataFrame(
+            {
+                "Open": closes,
+                "High": closes + 1,
+                "Low": closes - 1,
+                "Close": closes,
+                "Volume": np.full(days, 1_000_000),
+            },
+            index=index,
+        )
+
+    get_weekly_bars = get_monthly_bars = get_daily_bars
+
+    async def get_intraday_bars(self, symbol: str, interval: str, outputsize: str):
+        await self._wait()
+        tz = pytz.timezone("America/New_York")
+        today = pd.Timestamp.now(tz).normalize()
+        index = pd.DatetimeIndex(
+            [today + pd.Timedelta(hours=h, minutes=30) for h in range(9, 16)]
+        )
+        return pd.DataFrame(
+            {
+                "Open": np.full(7, 100.0),
+                "High": np.full(7, 101.0),
+                "Low": np.full(7, 99.0),
+                "Close": np.linspace(99.5, 100.5, 7),
+                "Volume": np.full(7, 100_000),
+            },
+            index=index,
+        )
+
+    async def get_quote(self, symbol: str) -> dict:
+        await self._wait()
+        return {
+            "symbol": symbol,
+            "price": 100.0,
+            "volume": 1_000_000,
+            "latest_trading_day": date.today().isoformat(),
+            "previous_close": 99.0,
+            "change": 1.0,
+            "change_percent": "1.0",
+            "open": 99.5,
+            "high": 101.0,
+            "low": 99.0,
+        }
+
+    async def get_historical_options(self, symbol: str) -> dict:
+        await self._wait()
+        expiration = (date.today() + timedelta(days=30)).isoformat()
+        return {
+            "data": [
+                {
+                    "contractID": f"{symbol}{kind[0].upper()}{strike}",
+                    "expiration": expiration,
+                    "strike": strike,
+                    "type": kind,
+                    "last": 2.5,
+                    "bid": 2.4,
+                    "ask": 2.6,
+                    "volume": 100,
+                    "open_interest": 1000 if kind == "call" else 800,
+                    "implied_volatility": 0.4,
+                }
+                for strike in range(90, 111, 5)
+                for kind in ("call", "put")
+            ]
+        }
+
+    async def get_news_sentiment(self, **kwargs: Any) -> dict:
+        await self._wait()
+        return {"feed": [{"overall_sentiment_score": 0.1}] * 50}
+
+    async def get_ipo_calendar(self) -> list[dict]:
+        await self._wait()
+        return [{"ipoDate": (date.today() + timedelta(days=7)).isoformat()}] * 5
+
+    async def get_treasury_yield(self, **kwargs: Any) -> pd.DataFrame:
+        await self._wait()
+        return self._series(4.0, 60)
+
+    async def get_sofr(self, days: int = 60) -> pd.DataFrame:
+        await self._wait()
+        return self._series(5.3, days)
+
+    async def get_effr(self, days: int = 60) -> pd.DataFrame:
+        await self._wait()
+        return self._series(5.33, days)
+
+    async def get_rrp_balance(self, days: int = 60) -> pd.DataFrame:
+        await self._wait()
+        return self._series(400.0, days)
+
+    @staticmethod
+    def _series(value: float, days: int) -> pd.DataFrame:
+        index = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=days)
+        return pd.DataFrame({"value": np.linspace(value * 0.98, value, days)}, index)
+
+
+async def legacy_calculate(category: AISectorRiskCategory) -> list:
+    """The previous flow: one metric after another, no shared prefetch."""
+    ai_basket = await category._get_ai_basket_symbols()
+    calculators = [
+        lambda: category._calculate_ai_price_anomaly(ai_basket),
+        category._calculate_news_sentiment,
+        lambda: category._calculate_smart_money_flow(ai_basket),
+        lambda: category._calculate_options_put_call_ratio(ai_basket),
+        category._calculate_ipo_heat,
+        category._calculate_market_liquidity,
+        category._calculate_fed_expectations,
+    ]
+    return [await calculator() for calculator in calculators]
+
+
+async def measure(latency: float, trials: int, prefetch: bool) -> tuple[list, int]:
+    settings = Settings(bar_store_enabled=False)
+    timings = []
+    calls = 0
+    for _ in range(trials):
+        vendor = LatencyVendor(latency, serial=not prefetch)
+        category = AISectorRiskCategory(
+            settings=settings,
+            redis_cache=LatencyRedis(),  # type: ignore[arg-type]
+            market_service=vendor,
+            fred_service=vendor,
+        )
+        started = time.perf_counter()
+        if prefetch:
+            metrics = await category.calculate_metrics()
+        else:
+            metrics = await legacy_calculate(category)
+        timings.append(time.perf_counter() - started)
+        calls = vendor.calls
+        assert len(metrics) == 7 and all(m.score >= 0 for m in metrics)
+    return timings, calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.15, help="Seconds/call")
+    parser.add_argument("--trials", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{len(BASKET)}-symbol basket, {args.latency * 1000:.0f} ms per vendor call, "
+        f"cold cache, {args.trials} trials"
+    )
+    print(f"{'':>22} {'calls':>6} {'p50 s':>7} {'max s':>7}")
+    results = {}
+    for name, prefetch in (("sequential", False), ("prefetch + concurrent", True)):
+        timings, calls = asyncio.run(measure(args.latency, args.trials, prefetch))
+        results[name] = statistics.median(timings)
+        print(f"{name:>22} {calls:>6} {results[name]:>7.2f} {max(timings):>7.2f}")
+    print(f"speedup: {results['sequential'] / results['prefetch + concurrent']:.1f}x")
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Benchmark event-loop lag while serving concurrent portfolio page loads through
+the Alpaca trading service. Each page load fetches the account summary,
+positions and portfolio history; the alpaca-py client is replaced by a
+stand-in that blocks for a fixed network latency per call. Compares calling
+the client directly on the loop (previous behavior) with the worker pool, and
+also times DataFrame construction for a bar payload: per-bar model objects
+(alpaca-py BarSet + list comprehensions) vs the columnar conversion.
+Run with: python -m scripts.benchmarks.alpaca_event_loop_lag [--pages N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pandas as pd
+from alpaca.data.models import BarSet
+
+from src.services.alpaca.positions import PositionOperations
+from src.services.alpaca.worker_pool import AlpacaWorkerPool
+from src.services.alpaca_data_service import bars_to_frame
+
+TICK_SECONDS = 0.005
+
+
+class BlockingTradingClient:
+    """TradingClient stand-in: each call blocks for `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def _wait(self) -> None:
+        time.sleep(self.latency)
+
+    def get_account(self) -> Any:
+        self._wait()
+        return SimpleNamespace(
+            equity="106870", cash="5000", buying_power="10000", last_equity="106500"
+        )
+
+    def get_all_positions(self) -> list:
+        self._wait()
+        return []
+
+    def get_portfolio_history(self, request: Any) -> Any:
+        self._wait()
+        return SimpleNamespace(
+            base_value=100000.0,
+            timestamp=[1735776000 + i * 86400 for i in range(30)],
+            equity=[100000.0 + i for i in range(30)],
+            profit_loss=[float(i) for i in range(30)],
+            profit_loss_pct=[i / 1e5 for i in range(30)],
+        )
+
+
+class InlinePool:
+    """Runs calls directly on the event loop, as before the worker pool."""
+
+    async def run(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def make_service(latency: float, pool: Any) -> PositionOperations:
+    service = PositionOperations.__new__(PositionOperations)
+    service.client = BlockingTradingClient(latency)
+    service.pool = pool
+    return service
+
+
+async def page_load(service: PositionOperations) -> None:
+    await asyncio.gather(
+        service.get_account_summary("user"),
+        service.get_positions("user"),
+        service.get_portfolio_history(),
+    )
+
+
+async def run(pages: int, latency: float, pool: Any) -> dict[str, float]:
+    service = make_service(latency, pool)
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def monitor() -> None:
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            lags.append(time.perf_counter() - before - TICK_SECONDS)
+
+    monitor_task = asyncio.create_task(monitor())
+    started = time.perf_counter()
+    await asyncio.gather(*(page_load(service) for _ in range(pages)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await monitor_task
+
+    lags.sort()
+    return {
+        "wall": elapsed,
+        "p50": statistics.median(lags) * 1000,
+        "p99": lags[int(len(lags) * 0.99)] * 1000,
+        "max": lags[-1] * 1000,
+    }
+
+
+def raw_bars(count: int) -> dict[str, list[dict[str, Any]]]:
+    start = pd.Timestamp("2020-01-01", tz="UTC")
+    return {
+        "AAPL": [
+            {
+                "t": (start + pd.Timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "o": 100.0 + i,
+                "h": 101.0 + i,
+                "l": 99.0 + i,
+                "c": 100.5 + i,
+                "v": 1000 + i,
+                "n": 10,
+                "vw": 100.2 + i,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def model_frame(payload: dict[str, Any]) -> pd.DataFrame:
+    """Previous conversion: BarSet models, then one list per field."""
+    bars = BarSet(payload).data["AAPL"]
+    return pd.DataFrame(
+        {
+            "Open": [bar.open for bar in bars],
+            "High": [bar.high for bar in bars],
+            "Low": [bar.low for bar in bars],
+            "Close": [bar.close for bar in bars],
+            "Volume": [bar.volume for bar in bars],
+        },
+        index=pd.DatetimeIndex([bar.timestamp for bar in bars]),
+    )
+
+
+def best_of(func, *args, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50, help="Concurrent page loads")
+    parser.add_argument("--latency", type=float, default=0.04, help="Seconds/call")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--bars", type=int, default=20_000)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    pool = AlpacaWorkerPool(args.workers)
+    results = {
+        "on loop": asyncio.run(run(args.pages, args.latency, InlinePool())),
+        f"pool ({args.workers})": asyncio.run(run(args.pages, args.latency, pool)),
+    }
+    pool.shutdown()
+
+    print(
+        f"{args.pages} concurrent page loads, 4 Alpaca calls each, "
+        f"{args.latency * 1000:.0f} ms/call"
+    )
+    print(f"{'':>10} {'wall s':>8} {'lag p50 ms':>11} {'p99 ms':>8} {'max ms':>8}")
+    for name, r in results.items():
+        print(
+            f"{name:>10} {r['wall']:>8.2f} {r['p50']:>11.1f} "
+            f"{r['p99']:>8.1f} {r['max']:>8.1f}"
+        )
+
+    payload = raw_bars(args.bars)
+    models = best_of(model_frame, payload)
+    columnar = best_of(bars_to_frame, payload["AAPL"])
+    print(
+        f"\n{args.bars} bars -> DataFrame: models {models * 1000:.1f} ms, "
+        f"columnar {columnar * 1000:.1f} ms ({models / columnar:.1f}x)"
+    )
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
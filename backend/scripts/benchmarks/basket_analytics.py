@@ -0,0 +1,133 @@
+"""
+Benchmark AI basket analytics for baskets of 10/100/500 symbols: 200-day
+z-scores over ~4 years of daily closes and first/last-hour session returns
+over 100 hourly bars per symbol. Compares the previous per-symbol loops
+(np.mean/np.std per close array, per-DataFrame date filtering) with the
+vectorized symbols × dates matrix in src.services.insights.basket_analytics.
+Run with: python -m scripts.benchmarks.basket_analytics [--repeat N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_manager import OHLCVBars
+from src.services.insights.basket_analytics import BasketMatrix, session_returns
+
+DAYS = 1000
+HOURLY_BARS = 100
+WINDOW = 200
+
+
+def make_daily(count: int) -> dict[str, OHLCVBars]:
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range(end="2025-06-30", periods=DAYS)
+    bars = {}
+    for i in range(count):
+        closes = 100 + np.cumsum(rng.normal(0, 1, DAYS))
+        df = pd.DataFrame(
+            {"Open": closes, "High": closes, "Low": closes, "Close": closes},
+            index=index,
+        )
+        bars[f"S{i:03d}"] = OHLCVBars.from_dataframe(df)
+    return bars
+
+
+def make_hourly(count: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(1)
+    days = pd.bdate_range(end="2025-06-30", periods=HOURLY_BARS // 7 + 1)
+    index = pd.DatetimeIndex(
+        [d + pd.Timedelta(hours=h, minutes=30) for d in days for h in range(9, 16)]
+    )[-HOURLY_BARS:].tz_localize("America/New_York")
+    frames = {}
+    for i in range(count):
+        opens = 100 + rng.normal(0, 1, HOURLY_BARS)
+        closes = opens + rng.normal(0, 0.5, HOURLY_BARS)
+        frames[f"S{i:03d}"] = pd.DataFrame(
+            {"Open": opens, "High": closes, "Low": opens, "Close": closes},
+            index=index,
+        )
+    return frames
+
+
+def loop_zscores(bars: dict[str, OHLCVBars]) -> dict[str, float]:
+    """Previous implementation: one symbol at a time."""
+    z_scores = {}
+    for symbol, b in bars.items():
+        close_prices = b.close
+        if len(close_prices) >= WINDOW:
+            current_price = close_prices[-1]
+            sma = np.mean(close_prices[-WINDOW:])
+            std = np.std(close_prices[-WINDOW:])
+            if std > 0:
+                z_scores[symbol] = (current_price - sma) / std
+    return z_scores
+
+
+def matrix_zscores(bars: dict[str, OHLCVBars]) -> np.ndarray:
+    prices = BasketMatrix.from_bars(bars, lookback=WINDOW)
+    sma, std = prices.latest_mean_std(WINDOW)
+    return (prices.latest - sma) / std
+
+
+def loop_smi(frames: dict[str, pd.DataFrame]) -> list[float]:
+    """Previous implementation: filter each DataFrame to its last session."""
+    smi_values = []
+    for df in frames.values():
+        last_date = df.index[-1].date()
+        todays_bars = df[df.index.date == last_date]
+        if len(todays_bars) >= 2:
+            first, last = todays_bars.iloc[0], todays_bars.iloc[-1]
+            first_ret = (first["Close"] - first["Open"]) / first["Open"] * 100
+            last_ret = (last["Close"] - last["Open"]) / last["Open"] * 100
+            smi_values.append(last_ret - first_ret)
+    return smi_values
+
+
+def matrix_smi(bars: dict[str, OHLCVBars]) -> np.ndarray:
+    return session_returns(bars).smi
+
+
+def best_of(func, arg, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"z-scores: {DAYS} daily closes/symbol, {WINDOW}-day window; "
+        f"SMI: {HOURLY_BARS} hourly bars/symbol (best of {args.repeat}, ms)"
+    )
+    print(
+        f"{'symbols':>7} {'z loop':>8} {'z matrix':>9} "
+        f"{'smi loop':>9} {'smi matrix':>11}"
+    )
+    for count in (10, 100, 500):
+        daily = make_daily(count)
+        hourly = make_hourly(count)
+        hourly_bars = {s: OHLCVBars.from_dataframe(df) for s, df in hourly.items()}
+
+        expected = np.array(list(loop_zscores(daily).values()))
+        np.testing.assert_allclose(matrix_zscores(daily), expected, rtol=1e-6)
+        np.testing.assert_allclose(matrix_smi(hourly_bars), loop_smi(hourly))
+
+        print(
+            f"{count:>7} {best_of(loop_zscores, daily, args.repeat):>8.2f} "
+            f"{best_of(matrix_zscores, daily, args.repeat):>9.2f} "
+            f"{best_of(loop_smi, hourly, args.repeat):>9.2f} "
+            f"{best_of(matrix_smi, hourly_bars, args.repeat):>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
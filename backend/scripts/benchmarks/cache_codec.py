@@ -0,0 +1,163 @@
+"""
+Benchmark cache codecs against the legacy JSON format for quote, options-chain
+and full-history OHLCV payloads: encode/decode time and stored size.
+Run with: python -m scripts.benchmarks.cache_codec [--redis-url redis://localhost:6379/15]
+
+With --redis-url, each payload is also written to Redis and MEMORY USAGE is
+reported (keys are deleted afterwards; use a scratch database).
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_manager import (
+    CacheKeys,
+    OHLCVBars,
+    OptionContract,
+    QuoteData,
+    codec,
+)
+
+
+def quote_payload() -> dict[str, Any]:
+    return QuoteData(
+        symbol="NVDA",
+        price=135.2,
+        volume=250_000_000,
+        latest_trading_day="2025-01-17",
+        previous_close=133.6,
+        change=1.6,
+        change_percent=1.2,
+        open=134.0,
+        high=136.1,
+        low=133.1,
+    ).to_dict()
+
+
+def options_payload(num_contracts: int = 3_000) -> list[dict[str, Any]]:
+    rng = np.random.default_rng(7)
+    return [
+        OptionContract(
+            contract_id=f"NVDA25011{i % 9}C{i:08d}",
+            symbol="NVDA",
+            expiration=datetime(2025, 1, 17 + i % 9),
+            strike=float(50 + i % 300),
+            option_type="call" if i % 2 else "put",
+            last_price=float(rng.uniform(0.05, 40)),
+            bid=float(rng.uniform(0.05, 40)),
+            ask=float(rng.uniform(0.05, 40)),
+            volume=int(rng.integers(0, 50_000)),
+            open_interest=int(rng.integers(0, 200_000)),
+            implied_volatility=float(rng.uniform(0.2, 1.2)),
+            delta=float(rng.uniform(-1, 1)),
+        ).to_dict()
+        for i in range(num_contracts)
+    ]
+
+
+def ohlcv_payload(num_bars: int = 6_500) -> dict[str, Any]:
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 1, num_bars))
+    df = pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.5, num_bars),
+            "High": close + rng.uniform(0.1, 2, num_bars),
+            "Low": close - rng.uniform(0.1, 2, num_bars),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 90_000_000, num_bars),
+        },
+        index=pd.bdate_range("2000-01-03", periods=num_bars),
+    )
+    return OHLCVBars.from_dataframe(df).to_dict()
+
+
+def best_ms(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+async def redis_memory(redis_url: str, payloads: dict[str, bytes]) -> dict[str, int]:
+    import redis.asyncio as redis
+
+    client = redis.from_url(redis_url)
+    usage = {}
+    try:
+        for key, payload in payloads.items():
+            bench_key = f"bench:{key}"
+            await client.set(bench_key, payload)
+            usage[key] = await client.memory_usage(bench_key) or 0
+            await client.delete(bench_key)
+    finally:
+        await client.aclose()
+    return usage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per case")
+    parser.add_argument("--redis-url", help="Also measure Redis MEMORY USAGE")
+    args = parser.parse_args()
+
+    cases = [
+        ("quote", CacheKeys.quote("NVDA"), quote_payload()),
+        ("options (3k)", CacheKeys.options("NVDA"), options_payload()),
+        ("ohlcv (6.5k)", CacheKeys.market("daily", "NVDA"), ohlcv_payload()),
+    ]
+
+    stored: dict[str, bytes] = {}
+    rows = []
+    for label, key, value in cases:
+        legacy = json.dumps(value, default=str).encode()
+        encoded = codec.encode(key, value)
+        stored[f"{label}:legacy"] = legacy
+        stored[f"{label}:codec"] = encoded
+
+        rows.append(
+            (
+                label,
+                codec.codec_for_key(key).name,
+                best_ms(lambda v=value: json.dumps(v, default=str), args.repeat),
+                best_ms(lambda k=key, v=value: codec.encode(k, v), args.repeat),
+                best_ms(lambda p=legacy: json.loads(p), args.repeat),
+                best_ms(lambda p=encoded: codec.decode(p), args.repeat),
+                len(legacy),
+                len(encoded),
+            )
+        )
+
+    memory = asyncio.run(redis_memory(args.redis_url, stored)) if args.redis_url else {}
+
+    print(
+        f"{'payload':>13} {'codec':>10} {'enc json':>9} {'enc codec':>10} "
+        f"{'dec json':>9} {'dec codec':>10} {'json KB':>8} {'codec KB':>9}"
+        + (f" {'redis json KB':>14} {'redis codec KB':>15}" if memory else "")
+    )
+    for label, name, enc_json, enc_codec, dec_json, dec_codec, size_json, size in rows:
+        line = (
+            f"{label:>13} {name:>10} {enc_json:>9.3f} {enc_codec:>10.3f} "
+            f"{dec_json:>9.3f} {dec_codec:>10.3f} "
+            f"{size_json / 1024:>8.1f} {size / 1024:>9.1f}"
+        )
+        if memory:
+            line += (
+                f" {memory[f'{label}:legacy'] / 1024:>14.1f}"
+                f" {memory[f'{label}:codec'] / 1024:>15.1f}"
+            )
+        print(line)
+    print("(times in ms, best of --repeat runs)")
+
+
+if __name__ == "__main__":
+    main()
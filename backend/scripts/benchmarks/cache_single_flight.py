@@ -0,0 +1,150 @@
+"""
+Load test for RedisCache.get_with_dedup: Redis commands and latency for one
+cold miss hit by N concurrent callers spread over several pods, comparing the
+single-flight implementation against the previous lock-and-poll loop.
+Run with: python -m scripts.benchmarks.cache_single_flight [--callers 200] [--pods 4]
+
+By default an in-memory Redis stand-in counts commands. With --redis-url the
+pods connect to a real server and commands are taken from INFO commandstats
+(use a scratch database; the benchmark key is deleted afterwards).
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.database.redis import RedisCache
+
+KEY = "bench:single_flight:AAPL"
+
+
+async def legacy_get_with_dedup(
+    cache: RedisCache,
+    cache_key: str,
+    fetch_func: Callable[[], Awaitable[Any]],
+    ttl_seconds: int = 60,
+    wait_timeout_seconds: float = 5.0,
+    wait_interval_seconds: float = 0.1,
+) -> Any | None:
+    """The previous algorithm: SET NX lock, blind DEL, waiters poll GET."""
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    lock_key = f"lock:{cache_key}"
+    if await cache.acquire_lock(lock_key, 30):
+        try:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                return cached
+            data = await fetch_func()
+            if data is not None:
+                await cache.set(cache_key, data, ttl_seconds=ttl_seconds)
+            return data
+        finally:
+            await cache.release_lock(lock_key)
+
+    elapsed = 0.0
+    while elapsed < wait_timeout_seconds:
+        await asyncio.sleep(wait_interval_seconds)
+        elapsed += wait_interval_seconds
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    data = await fetch_func()
+    if data is not None:
+        await cache.set(cache_key, data, ttl_seconds=ttl_seconds)
+    return data
+
+
+async def connect_pods(count: int, redis_url: str | None) -> tuple[list, Any]:
+    if redis_url is None:
+        from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+        server = FakeRedisServer()
+        return [make_pod(server) for _ in range(count)], server
+
+    pods = []
+    for _ in range(count):
+        pod = RedisCache()
+        await pod.connect(redis_url)
+        pods.append(pod)
+    return pods, None
+
+
+async def command_count(pods: list[RedisCache], server: Any) -> int:
+    if server is not None:
+        return int(server.total_ops)
+    stats = await pods[0].client.info("commandstats")
+    # Exclude the INFO calls made by this measurement itself
+    return sum(v["calls"] for k, v in stats.items() if k != "cmdstat_info")
+
+
+async def run_case(
+    name: str,
+    args: argparse.Namespace,
+    call: Callable[[RedisCache, Callable[[], Awaitable[Any]]], Awaitable[Any]],
+) -> None:
+    pods, server = await connect_pods(args.pods, args.redis_url)
+    fetches = 0
+
+    async def fetch() -> dict[str, Any]:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(args.fetch_ms / 1000)
+        return {"symbol": "AAPL", "close": [1.0] * 100}
+
+    await pods[0].delete(KEY)
+    before = await command_count(pods, server)
+    latencies: list[float] = []
+
+    async def caller(pod: RedisCache) -> None:
+        start = time.perf_counter()
+        await call(pod, fetch)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(caller(pods[i % len(pods)]) for i in range(args.callers)))
+    ops = await command_count(pods, server) - before
+
+    await pods[0].delete(KEY)
+    if server is None:
+        for pod in pods:
+            await pod.disconnect()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    print(
+        f"{name:>14} {fetches:>8} {ops:>11} {ops / args.callers:>14.2f} "
+        f"{p50:>8.1f} {latencies[-1]:>8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--pods", type=int, default=4)
+    parser.add_argument("--fetch-ms", type=float, default=250.0)
+    parser.add_argument("--redis-url", help="Use a real Redis server")
+    args = parser.parse_args()
+
+    print(f"{args.callers} callers over {args.pods} pods, fetch {args.fetch_ms}ms")
+    print(
+        f"{'impl':>14} {'fetches':>8} {'redis cmds':>11} {'cmds/caller':>14} "
+        f"{'p50 ms':>8} {'max ms':>8}"
+    )
+
+    async def single_flight(pod: RedisCache, fetch: Any) -> Any:
+        return await pod.get_with_dedup(KEY, fetch, ttl_seconds=60)
+
+    async def legacy(pod: RedisCache, fetch: Any) -> Any:
+        return await legacy_get_with_dedup(pod, KEY, fetch)
+
+    asyncio.run(run_case("legacy poll", args, legacy))
+    asyncio.run(run_case("single-flight", args, single_flight))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark Fibonacci overlap removal over synthetic candidate sets of 1k-100k trends.
+Run with: python -m scripts.benchmarks.fibonacci_overlap [--compare-legacy]
+"""
+
+import argparse
+import time
+
+from src.core.analysis.fibonacci import TrendDetector
+from src.core.analysis.fibonacci.config import TimeframeConfigs
+
+CANDIDATE_COUNTS = [1_000, 10_000, 50_000, 100_000]
+LEGACY_MAX_CANDIDATES = 10_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--compare-legacy",
+        action="store_true",
+        help=f"Also time the pairwise scan (up to {LEGACY_MAX_CANDIDATES} trends)",
+    )
+    args = parser.parse_args()
+
+    from tests.test_fibonacci_trend_parity import (
+        random_trend_set,
+        reference_remove_overlapping,
+    )
+
+    detector = TrendDetector(TimeframeConfigs.get_config("1d"))
+
+    print(f"{'candidates':>11} {'accepted':>9} {'interval ms':>12} {'legacy ms':>10}")
+    for count in CANDIDATE_COUNTS:
+        trends = random_trend_set(count, seed=11)
+
+        start = time.perf_counter()
+        accepted = detector._remove_overlapping_trends(trends)
+        interval_ms = (time.perf_counter() - start) * 1000
+
+        legacy_cell = "-"
+        if args.compare_legacy and count <= LEGACY_MAX_CANDIDATES:
+            start = time.perf_counter()
+            reference_remove_overlapping(trends)
+            legacy_cell = f"{(time.perf_counter() - start) * 1000:.1f}"
+
+        print(f"{count:>11} {len(accepted):>9} {interval_ms:>12.2f} {legacy_cell:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark Fibonacci trend detection scaling from 100 to 20,000 bars.
+Run with: python -m scripts.benchmarks.fibonacci_trends [--compare-legacy]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from src.core.analysis.fibonacci import TrendDetector
+from src.core.analysis.fibonacci.config import TimeframeConfigs
+
+BAR_COUNTS = [100, 500, 1_000, 5_000, 20_000]
+LEGACY_MAX_BARS = 5_000
+
+
+def synthetic_bars(num_bars: int, seed: int = 7) -> pd.DataFrame:
+    """Daily random walk with ~1.4% volatility and intrabar wicks."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.014, num_bars)))
+    wick = np.abs(rng.normal(0, 0.007, (2, num_bars))) * close
+    return pd.DataFrame(
+        {"High": close + wick[0], "Low": close - wick[1], "Close": close},
+        index=pd.date_range("1990-01-01", periods=num_bars, freq="D"),
+    )
+
+
+def best_of(repeats: int, func: Callable[..., object], *args: object) -> float:
+    """Return the fastest of `repeats` runs in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--compare-legacy",
+        action="store_true",
+        help=f"Also time the scalar reference loop (up to {LEGACY_MAX_BARS} bars)",
+    )
+    args = parser.parse_args()
+
+    config = TimeframeConfigs.get_config("1d")
+    detector = TrendDetector(config)
+    legacy = None
+    if args.compare_legacy:
+        from tests.test_fibonacci_trend_parity import reference_directional_trends
+
+        legacy = reference_directional_trends
+
+    print(f"{'bars':>8} {'candidates':>11} {'vectorized ms':>14} {'legacy ms':>10}")
+    for num_bars in BAR_COUNTS:
+        data = synthetic_bars(num_bars)
+        min_magnitude = data["Close"].median() * config.min_magnitude_pct
+        call_args = (data, config.tolerance_pct, min_magnitude, 3)
+
+        candidates = detector._detect_directional_trends(*call_args)
+        vectorized_ms = best_of(
+            args.repeats, detector._detect_directional_trends, *call_args
+        )
+
+        legacy_cell = "-"
+        if legacy is not None and num_bars <= LEGACY_MAX_BARS:
+            legacy_cell = f"{best_of(1, legacy, *call_args):.1f}"
+
+        print(
+            f"{num_bars:>8} {len(candidates):>11} {vectorized_ms:>14.2f} {legacy_cell:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
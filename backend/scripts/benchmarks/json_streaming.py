@@ -0,0 +1,158 @@
+"""
+Benchmark peak memory of buffered versus streamed decoding of large Alpha
+Vantage responses: the whole body joined and passed to json.loads before
+parsing, versus decode_object_stream feeding SeriesColumns /
+OptionsChainColumns chunk by chunk. Payloads are a synthetic 20-year
+TIME_SERIES_DAILY_ADJUSTED (outputsize=full) body and a large
+HISTORICAL_OPTIONS chain.
+Run with: python -m scripts.benchmarks.json_streaming [--chunk-kb N] [--contracts N]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from scripts.benchmarks.time_series_parsing import make_daily_payload
+from src.services.market_data.json_stream import decode_object_stream
+from src.services.market_data.options import OptionsChainColumns
+from src.services.market_data.parsers import (
+    ADJUSTED_FIELDS,
+    SeriesColumns,
+    adjusted_ohlcv_frame,
+    parse_adjusted_ohlcv_series,
+)
+
+DAILY_KEY = "Time Series (Daily)"
+
+
+def make_options_body(contracts: int) -> bytes:
+    rng = np.random.default_rng(contracts)
+    strikes = rng.uniform(50, 250, contracts).round(1)
+    data = [
+        {
+            "contractID": f"NVDA25{i:06d}",
+            "symbol": "NVDA",
+            "expiration": f"2025-{1 + i % 12:02d}-17",
+            "strike": f"{strike:.2f}",
+            "type": "call" if i % 2 else "put",
+            "last": f"{strike / 10:.2f}",
+            "mark": f"{strike / 10:.2f}",
+            "bid": f"{strike / 10 - 0.05:.2f}",
+            "bid_size": "10",
+            "ask": f"{strike / 10 + 0.05:.2f}",
+            "ask_size": "12",
+            "volume": str(i % 5000),
+            "open_interest": str(i % 9000),
+            "date": "2025-01-10",
+            "implied_volatility": "0.45",
+            "delta": "0.50",
+            "gamma": "0.002",
+            "theta": "-0.05",
+            "vega": "0.10",
+            "rho": "0.01",
+        }
+        for i, strike in enumerate(strikes)
+    ]
+    return json.dumps({"endpoint": "Historical Options", "data": data}).encode()
+
+
+def make_chunks(body: bytes, chunk_size: int) -> list[bytes]:
+    """Pre-split body, standing in for what the socket hands back."""
+    return [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+
+async def replay(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def buffered_daily(chunks: list[bytes]) -> pd.DataFrame:
+    """Previous path: response.json() on the joined body, then parse."""
+    data = json.loads(b"".join(chunks))
+    return parse_adjusted_ohlcv_series(data[DAILY_KEY])
+
+
+async def streamed_daily(chunks: list[bytes]) -> pd.DataFrame:
+    columns = SeriesColumns(ADJUSTED_FIELDS)
+    await decode_object_stream(replay(chunks), DAILY_KEY.__eq__, columns.add)
+    return adjusted_ohlcv_frame(columns.timestamps, columns.matrix())
+
+
+async def buffered_options(chunks: list[bytes]) -> OptionsChainColumns:
+    """Previous path: get_historical_options() dict, reduced afterwards."""
+    data = json.loads(b"".join(chunks))
+    chain = OptionsChainColumns()
+    for item in data["data"]:
+        chain.add(None, item)
+    return chain
+
+
+async def streamed_options(chunks: list[bytes]) -> OptionsChainColumns:
+    chain = OptionsChainColumns()
+    await decode_object_stream(replay(chunks), "data".__eq__, chain.add)
+    return chain
+
+
+def profile(func: Callable[[list[bytes]], Any], chunks: list[bytes]) -> tuple:
+    """Run once under tracemalloc; returns (result, peak MiB, ms)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = asyncio.run(func(chunks))
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 2**20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunk-kb", type=int, default=64, help="Chunk size (KiB)")
+    parser.add_argument(
+        "--contracts", type=int, default=20_000, help="Options chain size"
+    )
+    args = parser.parse_args()
+    chunk_size = args.chunk_kb * 1024
+
+    daily_body = json.dumps({"Meta Data": {}, DAILY_KEY: make_daily_payload(20)})
+    cases = [
+        (
+            "daily 20y full",
+            make_chunks(daily_body.encode(), chunk_size),
+            buffered_daily,
+            streamed_daily,
+        ),
+        (
+            f"options {args.contracts}",
+            make_chunks(make_options_body(args.contracts), chunk_size),
+            buffered_options,
+            streamed_options,
+        ),
+    ]
+
+    print(
+        f"{'payload':>16} {'body MiB':>9} {'buffered MiB':>13} {'streamed MiB':>13} "
+        f"{'buffered ms':>12} {'streamed ms':>12}"
+    )
+    for name, chunks, buffered, streamed in cases:
+        body_mib = sum(map(len, chunks)) / 2**20
+        expected, buffered_peak, buffered_ms = profile(buffered, chunks)
+        actual, streamed_peak, streamed_ms = profile(streamed, chunks)
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(expected, actual)
+        else:
+            assert len(expected) == len(actual)
+        print(
+            f"{name:>16} {body_mib:>9.1f} {buffered_peak:>13.1f} "
+            f"{streamed_peak:>13.1f} {buffered_ms:>12.0f} {streamed_ms:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark OHLCV conversion, cache encode/decode and DataFrame rebuild for
+row objects (list[OHLCVData]) versus columnar OHLCVBars at 100-20,000 bars.
+Run with: python -m scripts.benchmarks.ohlcv_bars [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.services.data_manager import OHLCVBars, OHLCVData
+
+BAR_COUNTS = [100, 1_000, 5_000, 20_000]
+
+
+def make_frame(num_bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(num_bars)
+    close = 100 + np.cumsum(rng.normal(0, 1, num_bars))
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + rng.uniform(0.1, 2, num_bars),
+            "Low": close - rng.uniform(0.1, 2, num_bars),
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, num_bars),
+        },
+        index=pd.date_range("2000-01-01", periods=num_bars, freq="D"),
+    )
+
+
+def rows_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous path: iterrows -> OHLCVData list -> JSON -> objects -> DataFrame."""
+    rows = [
+        OHLCVData(
+            date=idx.to_pydatetime(),
+            open=float(row["Open"]),
+            high=float(row["High"]),
+            low=float(row["Low"]),
+            close=float(row["Close"]),
+            volume=int(row["Volume"]),
+        )
+        for idx, row in df.iterrows()
+    ]
+    rows.sort(key=lambda x: x.date, reverse=True)
+    cached = json.loads(json.dumps([r.to_dict() for r in rows]))
+    restored = [OHLCVData.from_dict(d) for d in cached]
+    return pd.DataFrame(
+        [
+            {
+                "Open": d.open,
+                "High": d.high,
+                "Low": d.low,
+                "Close": d.close,
+                "Volume": d.volume,
+            }
+            for d in restored
+        ],
+        index=pd.DatetimeIndex([d.date for d in restored]),
+    ).sort_index()
+
+
+def columnar_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+    """New path: DataFrame -> OHLCVBars -> JSON -> OHLCVBars -> DataFrame."""
+    bars = OHLCVBars.from_dataframe(df)
+    cached = json.loads(json.dumps(bars.to_dict()))
+    return OHLCVBars.from_cached(cached).to_dataframe()
+
+
+def best_ms(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def rows_bytes(rows: list[OHLCVData]) -> int:
+    per_row = sys.getsizeof(rows[0]) + sys.getsizeof(rows[0].__dict__)
+    per_row += sum(sys.getsizeof(v) for v in rows[0].__dict__.values())
+    return sys.getsizeof(rows) + per_row * len(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case")
+    args = parser.parse_args()
+
+    print(
+        f"{'bars':>7} {'rows ms':>9} {'columnar ms':>12} "
+        f"{'rows KB':>9} {'columnar KB':>12} {'json rows KB':>13} {'json cols KB':>13}"
+    )
+    for count in BAR_COUNTS:
+        df = make_frame(count)
+        bars = OHLCVBars.from_dataframe(df)
+        rows = bars.to_list()
+
+        rows_ms = best_ms(lambda df=df: rows_pipeline(df), args.repeat)
+        columnar_ms = best_ms(lambda df=df: columnar_pipeline(df), args.repeat)
+        json_rows = len(json.dumps([r.to_dict() for r in rows])) / 1024
+        json_cols = len(json.dumps(bars.to_dict())) / 1024
+
+        print(
+            f"{count:>7} {rows_ms:>9.1f} {columnar_ms:>12.1f} "
+            f"{rows_bytes(rows) / 1024:>9.0f} {bars.nbytes / 1024:>12.0f} "
+            f"{json_rows:>13.0f} {json_cols:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
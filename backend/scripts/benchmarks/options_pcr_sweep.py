@@ -0,0 +1,169 @@
+"""
+Benchmark the ATM dollar-weighted Put/Call Ratio over synthetic options
+chains of 1k/5k/20k contracts, for 1 and 27 parameter sets (3 ATM zones x
+3 minimum premiums x 3 minimum open interests), with and without the
+per-expiry breakdown. Compares the previous per-contract loop over
+OptionContract objects (run once per parameter set) with the columnar
+OptionsChain.pcr sweep, plus the cost of decoding the cached chain in each
+format (list of contract dicts vs columnar dict).
+Run with: python -m scripts.benchmarks.options_pcr_sweep [--repeat N]
+"""
+
+import argparse
+import itertools
+import json
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from src.services.data_manager import OptionContract, OptionsChain, PCRParams
+
+PRICE = 100.0
+SWEEP = [
+    PCRParams(zone, premium, oi)
+    for zone, premium, oi in itertools.product(
+        (0.05, 0.10, 0.15), (0.25, 0.50, 1.00), (100, 500, 1000)
+    )
+]
+
+
+def make_contracts(count: int) -> list[OptionContract]:
+    rng = np.random.default_rng(count)
+    expirations = [datetime(2026, 10, 16) + timedelta(weeks=w) for w in range(12)]
+    return [
+        OptionContract(
+            contract_id=f"NVDA{i}",
+            symbol="NVDA",
+            expiration=expirations[i % len(expirations)],
+            strike=float(rng.integers(50, 150)),
+            option_type="call" if i % 2 else "put",
+            last_price=float(rng.uniform(0.05, 8.0)),
+            bid=1.0,
+            ask=1.1,
+            volume=10,
+            open_interest=int(rng.integers(0, 3000)),
+            implied_volatility=0.4,
+            delta=0.5,
+        )
+        for i in range(count)
+    ]
+
+
+def loop_pcr(
+    contracts: list[OptionContract], params: PCRParams, by_expiry: bool
+) -> tuple[float, float, int]:
+    """The previous implementation's filter loop, plus optional expiry dict."""
+    low = PRICE * (1 - params.atm_zone_pct)
+    high = PRICE * (1 + params.atm_zone_pct)
+    puts = calls = 0.0
+    count = 0
+    expiries: dict[str, list[float]] = {}
+    for contract in contracts:
+        if not (low <= contract.strike <= high):
+            continue
+        if contract.last_price < params.min_premium:
+            continue
+        if contract.open_interest < params.min_oi:
+            continue
+        notional = contract.open_interest * contract.last_price * 100
+        if contract.option_type == "put":
+            puts += notional
+        elif contract.option_type == "call":
+            calls += notional
+        count += 1
+        if by_expiry:
+            key = contract.expiration.strftime("%Y-%m-%d")
+            entry = expiries.setdefault(key, [0.0, 0.0, 0])
+            entry[0 if contract.option_type == "put" else 1] += notional
+            entry[2] += 1
+    return puts, calls, count
+
+
+def loop_sweep(
+    contracts: list[OptionContract], sweep: list[PCRParams], by_expiry: bool
+) -> list[tuple[float, float, int]]:
+    return [loop_pcr(contracts, params, by_expiry) for params in sweep]
+
+
+def decode_list(payload: str) -> list[OptionContract]:
+    return [OptionContract.from_dict(d) for d in json.loads(payload)]
+
+
+def decode_columnar(payload: str) -> OptionsChain:
+    return OptionsChain.from_cached("NVDA", json.loads(payload))
+
+
+def timed(func: Callable[..., object], repeat: int, *args: object) -> float:
+    """Median wall time in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7, help="Runs per case")
+    args = parser.parse_args()
+
+    print(
+        f"{'contracts':>9} {'sets':>5} {'expiry':>6} "
+        f"{'loop ms':>9} {'vector ms':>10} {'speedup':>8}"
+    )
+    decode_rows = []
+    for count in (1_000, 5_000, 20_000):
+        contracts = make_contracts(count)
+        chain = OptionsChain.from_contracts("NVDA", contracts)
+
+        for sweep, by_expiry in (
+            (SWEEP[:1], False),
+            (SWEEP, False),
+            (SWEEP, True),
+        ):
+            # Results must agree before timing them
+            for params, totals in zip(
+                sweep, chain.pcr(PRICE, sweep, by_expiry), strict=True
+            ):
+                puts, calls, n = loop_pcr(contracts, params, by_expiry)
+                assert totals.contracts_analyzed == n
+                assert np.isclose(totals.put_notional, puts)
+                assert np.isclose(totals.call_notional, calls)
+
+            loop_ms = timed(loop_sweep, args.repeat, contracts, sweep, by_expiry)
+            vector_ms = timed(chain.pcr, args.repeat, PRICE, sweep, by_expiry)
+            print(
+                f"{count:>9} {len(sweep):>5} {'yes' if by_expiry else 'no':>6} "
+                f"{loop_ms:>9.2f} {vector_ms:>10.2f} {loop_ms / vector_ms:>7.1f}x"
+            )
+
+        legacy = json.dumps([c.to_dict() for c in contracts])
+        columnar = json.dumps(chain.to_dict())
+        decode_rows.append(
+            (
+                count,
+                timed(decode_list, args.repeat, legacy),
+                timed(decode_columnar, args.repeat, columnar),
+                len(legacy),
+                len(columnar),
+            )
+        )
+
+    print()
+    print(
+        f"{'contracts':>9} {'list decode ms':>15} {'columnar decode ms':>19} "
+        f"{'list KB':>8} {'columnar KB':>12}"
+    )
+    for count, list_ms, columnar_ms, list_size, columnar_size in decode_rows:
+        print(
+            f"{count:>9} {list_ms:>15.2f} {columnar_ms:>19.2f} "
+            f"{list_size / 1024:>8.0f} {columnar_size / 1024:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Benchmark Put/Call Ratio for a watchlist of 5/20/50 symbols against a fake
+Alpha Vantage service with per-call latency, with a cold Redis cache for
+every run. The vendor serves at most 10 requests at once, like the
+Alpha Vantage client's connection pool. Compares the previous per-symbol
+flows (one get_put_call_ratio tool call per symbol, i.e. sequential
+get_symbol_pcr; or the unbounded get_symbol_pcr fan-out AI Sector Risk used)
+with get_symbols_pcr (one batched quote request, bounded options fetches).
+A second run issues two overlapping requests for the same watchlist
+(insights refresh + agent tool) to show shared options-chain loads.
+Run with: python -m scripts.benchmarks.pcr_watchlist [--latency S]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, timedelta
+
+from src.services.data_manager import DataManager
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+REDIS_RTT = 0.0005
+VENDOR_CONNECTIONS = 10  # AlphaVantageBase httpx pool (max_connections)
+
+
+class LatencyVendor:
+    """Alpha Vantage stand-in: every request waits `latency` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls: dict[str, int] = {}
+        self.connections = asyncio.Semaphore(VENDOR_CONNECTIONS)
+        self.waiting = 0
+        self.peak_waiting = 0
+
+    async def _wait(self, endpoint: str) -> None:
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        async with self.connections:
+            await asyncio.sleep(self.latency)
+        self.waiting -= 1
+
+    async def get_bulk_quotes(self, symbols: list[str]) -> dict[str, dict]:
+        await self._wait("bulk_quotes")
+        return {s: self._quote(s) for s in symbols}
+
+    async def get_quote(self, symbol: str) -> dict:
+        await self._wait("quote")
+        return self._quote(symbol)
+
+    @staticmethod
+    def _quote(symbol: str) -> dict:
+        return {
+            "symbol": symbol,
+            "price": 100.0,
+            "volume": 1_000_000,
+            "latest_trading_day": date.today().isoformat(),
+            "previous_close": 99.0,
+            "change": 1.0,
+            "change_percent": "1.0",
+            "open": 99.5,
+            "high": 101.0,
+            "low": 99.0,
+        }
+
+    async def get_historical_options(self, symbol: str) -> dict:
+        await self._wait("options")
+        expirations = [
+            (date.today() + timedelta(weeks=w)).isoformat() for w in range(1, 9)
+        ]
+        return {
+            "data": [
+                {
+                    "contractID": f"{symbol}{expiration}{kind[0]}{strike}",
+                    "expiration": expiration,
+                    "strike": strike,
+                    "type": kind,
+                    "last": 2.5,
+                    "bid": 2.4,
+                    "ask": 2.6,
+                    "volume": 100,
+                    "open_interest": 1000 if kind == "call" else 800,
+                    "implied_volatility": 0.4,
+                }
+                for expiration in expirations
+                for strike in range(70, 131, 5)
+                for kind in ("call", "put")
+            ]
+        }
+
+
+class PreviousDataManager(DataManager):
+    """DataManager without shared options-chain loads, as before."""
+
+    async def get_options_chain(self, symbol: str):  # type: ignore[no-untyped-def]
+        return await self._load_options_chain(symbol.upper())
+
+
+async def per_tool_call(dm: DataManager, symbols: list[str]) -> int:
+    """Previous agent flow: one get_put_call_ratio call per symbol."""
+    results = [await dm.get_symbol_pcr(s) for s in symbols]
+    return sum(r is not None for r in results)
+
+
+async def per_symbol_gather(dm: DataManager, symbols: list[str]) -> int:
+    """Previous AI Sector Risk fallback: unbounded get_symbol_pcr fan-out."""
+    results = await asyncio.gather(*(dm.get_symbol_pcr(s) for s in symbols))
+    return sum(r is not None for r in results)
+
+
+async def batch(dm: DataManager, symbols: list[str]) -> int:
+    return len((await dm.get_symbols_pcr(symbols)).data)
+
+
+FLOWS = {
+    "tool per symbol": (per_tool_call, PreviousDataManager),
+    "gather per symbol": (per_symbol_gather, PreviousDataManager),
+    "get_symbols_pcr": (batch, DataManager),
+}
+
+
+async def measure(
+    flow: str, count: int, latency: float, trials: int, overlap: int
+) -> tuple[list[float], LatencyVendor]:
+    run, manager_cls = FLOWS[flow]
+    symbols = [f"S{i:02d}" for i in range(count)]
+    timings = []
+    for _ in range(trials):
+        vendor = LatencyVendor(latency)
+        dm = manager_cls(make_pod(FakeRedisServer(REDIS_RTT)), vendor)
+        started = time.perf_counter()
+        done = await asyncio.gather(*(run(dm, symbols) for _ in range(overlap)))
+        timings.append(time.perf_counter() - started)
+        assert all(n == count for n in done)
+    return timings, vendor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds/call")
+    parser.add_argument("--trials", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{args.latency * 1000:.0f} ms per vendor call, "
+        f"{VENDOR_CONNECTIONS} vendor connections, cold cache"
+    )
+    for overlap in (1, 2):
+        print(f"\n{overlap} concurrent request(s) for the same watchlist")
+        print(
+            f"{'symbols':>7} {'flow':>18} {'p50 s':>7} "
+            f"{'quote reqs':>10} {'options reqs':>12} {'peak queued':>11}"
+        )
+        for count in (5, 20, 50):
+            for flow in FLOWS:
+                if flow == "tool per symbol" and overlap > 1:
+                    continue
+                timings, vendor = asyncio.run(
+                    measure(flow, count, args.latency, args.trials, overlap)
+                )
+                calls = vendor.calls
+                quotes = calls.get("bulk_quotes", 0) + calls.get("quote", 0)
+                print(
+                    f"{count:>7} {flow:>18} {statistics.median(timings):>7.2f} "
+                    f"{quotes:>10} {calls.get('options', 0):>12} "
+                    f"{vendor.peak_waiting:>11}"
+                )
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark PortfolioService.get_user_holdings_with_prices for portfolios of
+5/40/200 holdings with simulated network latency (Redis, Alpaca quotes,
+MongoDB), comparing the previous sequential loop (get_current_price then
+update_price per holding) with the batched refresh (one multi-symbol quote
+request, one bulk_write). The 30 s price cache is cold for every refresh.
+Run with: python -m scripts.benchmarks.portfolio_price_refresh [--trials N]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from src.core.data.ticker_data_service import TickerDataService
+from src.database.repositories.holding_repository import HoldingRepository
+from src.models.holding import Holding
+from src.services.portfolio_service import PortfolioService
+
+# Median round-trip latencies in seconds
+REDIS_RTT = 0.0005
+MONGO_RTT = 0.002
+ALPACA_RTT = 0.040
+
+rng = random.Random(7)
+
+
+async def network(rtt: float) -> None:
+    """Sleep for a jittered round trip (long-tailed like real networks)."""
+    await asyncio.sleep(rtt * rng.lognormvariate(0, 0.35))
+
+
+class LatencyRedis:
+    """In-memory Redis stand-in with round-trip latency."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        await network(REDIS_RTT)
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        await network(REDIS_RTT)
+        self.data[key] = value
+        return True
+
+
+class LatencyAlpaca:
+    """AlpacaDataService stand-in: one round trip per quote request."""
+
+    async def get_latest_price(self, symbol: str) -> float:
+        await network(ALPACA_RTT)
+        return 100.0 + len(symbol)
+
+    async def get_latest_prices(self, symbols: list[str]) -> dict[str, float]:
+        await network(ALPACA_RTT)
+        return {s: 100.0 + len(s) for s in symbols}
+
+
+class UpdateResult:
+    matched_count = modified_count = 0
+
+
+class LatencyCollection:
+    """Motor collection stand-in for the holdings calls, with latency."""
+
+    def __init__(self, holdings: list[Holding]):
+        self.docs = {h.holding_id: h.model_dump() for h in holdings}
+
+    async def find_one(self, query: dict) -> dict | None:
+        await network(MONGO_RTT)
+        doc = self.docs.get(query["holding_id"])
+        return dict(doc) if doc else None
+
+    async def find_one_and_update(self, query, update, return_document=True):
+        await network(MONGO_RTT)
+        doc = self.docs[query["holding_id"]]
+        doc.update(update["$set"])
+        return dict(doc)
+
+    async def bulk_write(self, operations, ordered=True):
+        await network(MONGO_RTT)
+        for op in operations:
+            self.docs[op._filter["holding_id"]].update(op._doc["$set"])
+        return UpdateResult()
+
+
+class LatencyRepo(HoldingRepository):
+    async def list_by_user(self, user_id: str) -> list[Holding]:
+        await network(MONGO_RTT)
+        return [Holding(**doc) for doc in self.collection.docs.values()]
+
+
+def make_holdings(count: int) -> list[Holding]:
+    now = datetime.now(UTC)
+    return [
+        Holding(
+            holding_id=f"holding_{i}",
+            user_id="user",
+            symbol=f"S{i:03d}",
+            quantity=10,
+            avg_price=100.0,
+            cost_basis=1000.0,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+async def legacy_refresh(service: PortfolioService, user_id: str) -> list[Holding]:
+    """The previous implementation: one symbol at a time."""
+    holdings = await service.holding_repo.list_by_user(user_id)
+    updated_holdings = []
+    for holding in holdings:
+        price = await service.ticker_service.get_current_price(holding.symbol)
+        if price and price > 0:
+            updated = await service.holding_repo.update_price(holding.holding_id, price)
+            updated_holdings.append(updated or holding)
+        else:
+            updated_holdings.append(holding)
+    return updated_holdings
+
+
+async def measure(count: int, trials: int, batched: bool) -> list[float]:
+    timings = []
+    for _ in range(trials):
+        repo = LatencyRepo(LatencyCollection(make_holdings(count)))  # type: ignore[arg-type]
+        ticker = TickerDataService(LatencyRedis(), alpaca_data_service=LatencyAlpaca())  # type: ignore[arg-type]
+        service = PortfolioService(repo, ticker, settings=None)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        if batched:
+            result = await service.get_user_holdings_with_prices("user")
+        else:
+            result = await legacy_refresh(service, "user")
+        timings.append(time.perf_counter() - started)
+        assert all(h.current_price for h in result)
+    return timings
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trials", type=int, default=10, help="Refreshes per size")
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"RTT: redis {REDIS_RTT * 1000:.1f} ms, mongo {MONGO_RTT * 1000:.0f} ms, "
+        f"alpaca {ALPACA_RTT * 1000:.0f} ms (lognormal jitter)"
+    )
+    print(
+        f"{'holdings':>8} {'seq p50 ms':>11} {'seq p95 ms':>11} "
+        f"{'batch p50 ms':>13} {'batch p95 ms':>13} {'speedup':>8}"
+    )
+    for count in (5, 40, 200):
+        seq = asyncio.run(measure(count, args.trials, batched=False))
+        batch = asyncio.run(measure(count, args.trials, batched=True))
+        print(
+            f"{count:>8} {statistics.median(seq) * 1000:>11.1f} "
+            f"{percentile(seq, 0.95) * 1000:>11.1f} "
+            f"{statistics.median(batch) * 1000:>13.1f} "
+            f"{percentile(batch, 0.95) * 1000:>13.1f} "
+            f"{statistics.median(seq) / statistics.median(batch):>7.1f}x"
+        )
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Benchmark time-to-first-token and total stream time of the ReAct chat SSE
+endpoint for answers of 500/1500/3000 characters. A fake chat model streams
+the answer in ~4-character tokens at a fixed rate after one tool call with
+fixed latency. Compares the previous flow (agent.ainvoke, then replaying
+final_answer in 10-character chunks with a 30 ms sleep each) with
+stream_with_react_agent forwarding tokens from agent.astream.
+Run with: python -m scripts.benchmarks.react_agent_streaming [--token-ms MS]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.api.chat.streaming.react_agent import stream_with_react_agent
+from src.api.schemas.chat_models import ChatRequest
+from src.core.config import Settings
+
+TOKEN_CHARS = 4
+TITLE_SUFFIX = "\n[chat_title: AAPL Momentum]"
+
+
+class LatencyStreamingChatModel(BaseChatModel):
+    """Fake model: one tool call, then the answer at `token_delay` s/token."""
+
+    answer: str
+    token_delay: float
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-streaming"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "LatencyStreamingChatModel":
+        return self
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("async only")
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ):
+        self.calls += 1
+        usage = {"token_usage": {"input_tokens": 1000, "output_tokens": 200}}
+        if self.calls % 2:
+            await asyncio.sleep(self.token_delay * 5)
+            call = {"name": "get_historical_prices", "args": '{"symbol": "AAPL"}'}
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[{**call, "id": "c1", "index": 0}],
+                    response_metadata=usage,
+                )
+            )
+            return
+
+        text = self.answer + TITLE_SUFFIX
+        for start in range(0, len(text), TOKEN_CHARS):
+            await asyncio.sleep(self.token_delay)
+            token = text[start : start + TOKEN_CHARS]
+            last = start + TOKEN_CHARS >= len(text)
+            chunk = ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content=token, response_metadata=usage if last else {}
+                )
+            )
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        chunks = [c async for c in self._astream(messages, stop, None, **kwargs)]
+        merged = chunks[0]
+        for chunk in chunks[1:]:
+            merged += chunk
+        message = merged.message
+        return ChatResult(
+            generations=[
+                ChatGeneration(
+                    message=AIMessage(
+                        content=message.content,
+                        tool_calls=message.tool_calls,
+                        response_metadata=message.response_metadata,
+                    )
+                )
+            ]
+        )
+
+
+def make_agent(answer_chars: int, token_ms: float, tool_ms: float):
+    answer = ("AAPL momentum holds above support. " * 100)[:answer_chars]
+    market_service = MagicMock()
+
+    async def daily_bars(*args: Any, **kwargs: Any) -> pd.DataFrame:
+        await asyncio.sleep(tool_ms / 1000)
+        return pd.DataFrame()
+
+    market_service.get_daily_bars = daily_bars
+    settings = Settings(
+        dashscope_api_key="benchmark",
+        langfuse_public_key="",
+        langfuse_secret_key="",
+        fred_api_key="",
+        bar_store_enabled=False,
+    )
+    return FinancialAnalysisReActAgent(
+        settings,
+        ticker_data_service=MagicMock(),
+        market_service=market_service,
+        llm=LatencyStreamingChatModel(answer=answer, token_delay=token_ms / 1000),
+    )
+
+
+def mock_services() -> dict[str, Any]:
+    chat_service = MagicMock()
+    chat_service.create_chat = AsyncMock(return_value=MagicMock(chat_id="chat"))
+    chat_service.add_message = AsyncMock(return_value=MagicMock(message_id="msg"))
+    chat_service.get_chat_messages = AsyncMock(return_value=[])
+    chat_service.get_chat = AsyncMock(return_value=MagicMock(ui_state=None))
+    chat_service.update_title_if_new = AsyncMock()
+    credit_service = MagicMock()
+    credit_service.check_balance = AsyncMock(return_value=True)
+    credit_service.create_pending_transaction = AsyncMock(
+        return_value=MagicMock(transaction_id="txn")
+    )
+    credit_service.complete_transaction_with_deduction = AsyncMock(
+        return_value=(MagicMock(actual_cost=1.0), MagicMock(credits=99.0))
+    )
+    credit_service.fail_transaction = AsyncMock()
+    return {
+        "chat_service": chat_service,
+        "credit_service": credit_service,
+        "context_manager": MagicMock(),
+        "message_repo": MagicMock(),
+    }
+
+
+async def previous_flow(agent: FinancialAnalysisReActAgent) -> tuple[float, float]:
+    """agent.ainvoke, then 10-character chunks with a 30 ms sleep each."""
+    started = time.perf_counter()
+    ttft = None
+    result = await agent.ainvoke("How is AAPL doing?")
+    answer = result["final_answer"]
+    for _ in range(0, len(answer), 10):
+        if ttft is None:
+            ttft = time.perf_counter() - started
+        await asyncio.sleep(0.03)
+    return ttft or 0.0, time.perf_counter() - started
+
+
+async def streaming_flow(agent: FinancialAnalysisReActAgent) -> tuple[float, float]:
+    """stream_with_react_agent forwarding agent.astream tokens."""
+    started = time.perf_counter()
+    ttft = None
+    response = await stream_with_react_agent(
+        request=ChatRequest(message="How is AAPL doing?"),
+        user_id="user",
+        agent=agent,
+        **mock_services(),
+    )
+    async for event in response.body_iterator:
+        if ttft is None and json.loads(event[6:])["type"] == "chunk":
+            ttft = time.perf_counter() - started
+    return ttft or 0.0, time.perf_counter() - started
+
+
+FLOWS = {"ainvoke + replay": previous_flow, "astream": streaming_flow}
+
+
+async def measure(
+    flow: str, answer_chars: int, token_ms: float, tool_ms: float, trials: int
+) -> tuple[float, float]:
+    ttfts, totals = [], []
+    for _ in range(trials):
+        agent = make_agent(answer_chars, token_ms, tool_ms)
+        ttft, total = await FLOWS[flow](agent)
+        ttfts.append(ttft)
+        totals.append(total)
+    return statistics.median(ttfts), statistics.median(totals)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--token-ms", type=float, default=15.0, help="ms per token")
+    parser.add_argument("--tool-ms", type=float, default=300.0, help="Tool latency")
+    parser.add_argument("--trials", type=int, default=3)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    print(
+        f"{args.token_ms:.0f} ms per {TOKEN_CHARS}-char token, "
+        f"{args.tool_ms:.0f} ms tool call"
+    )
+    print(f"{'chars':>6} {'flow':>17} {'TTFT s':>7} {'total s':>8}")
+    for chars in (500, 1500, 3000):
+        for flow in FLOWS:
+            ttft, total = asyncio.run(
+                measure(flow, chars, args.token_ms, args.tool_ms, args.trials)
+            )
+            print(f"{chars:>6} {flow:>17} {ttft:>7.2f} {total:>8.2f}")
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark TickerDataService caching under a chart-scrolling workload: users
+open a chart, pan back in time a few weeks at a time, and zoom in/out, so
+successive requests overlap but rarely repeat exactly. Compares the previous
+exact-key cache (hit only on an identical (symbol, start, end, interval))
+against the range-indexed cache, counting upstream Alpaca calls and bars.
+Run with: python -m scripts.benchmarks.ticker_range_cache [--sessions N] [--steps N]
+"""
+
+import argparse
+import asyncio
+import random
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+
+from src.core.data.ticker_data_service import TickerDataService
+
+SYMBOLS = ["AAPL", "NVDA", "MSFT", "TSLA", "AMD"]
+# Visible window sizes in days (3mo, 6mo, 1y, 2y) and pan step sizes
+WINDOWS = [90, 182, 365, 730]
+PAN_DAYS = [7, 14, 30]
+LAST_DAY = date(2025, 6, 30)
+
+
+class DictRedis:
+    """In-memory Redis stand-in."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> bool:
+        self.data[key] = value
+        return True
+
+    async def get_raw(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set_raw(
+        self, key: str, value: bytes, ttl_seconds: int | None = None
+    ) -> bool:
+        self.data[key] = value
+        return True
+
+
+class CountingAlpaca:
+    """Alpaca stand-in: one bar per weekday, counts calls and bars served."""
+
+    def __init__(self):
+        self.calls = 0
+        self.bars = 0
+
+    async def get_bars(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: str,
+        end_date: str,
+        raise_errors: bool = False,
+    ) -> pd.DataFrame:
+        self.calls += 1
+        days = pd.bdate_range(start_date, end_date)
+        self.bars += len(days)
+        index = pd.DatetimeIndex(days + pd.Timedelta(hours=5)).tz_localize("UTC")
+        values = [float(d.toordinal() % 997) for d in days]
+        return pd.DataFrame(
+            dict.fromkeys(["Open", "High", "Low", "Close", "Volume"], values),
+            index=index,
+        )
+
+
+def make_workload(sessions: int, steps: int, seed: int) -> list[tuple[str, str, str]]:
+    """(symbol, start, end) requests from panning/zooming chart sessions."""
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(sessions):
+        symbol = rng.choice(SYMBOLS)
+        end = LAST_DAY - timedelta(days=rng.randrange(0, 60))
+        window = rng.choice(WINDOWS[:2])
+        for _ in range(steps):
+            requests.append(
+                (symbol, (end - timedelta(days=window)).isoformat(), end.isoformat())
+            )
+            action = rng.random()
+            if action < 0.7:
+                end -= timedelta(days=rng.choice(PAN_DAYS))  # pan back
+            elif action < 0.85:
+                end += timedelta(days=rng.choice(PAN_DAYS))  # pan forward
+                end = min(end, LAST_DAY)
+            else:
+                window = rng.choice(WINDOWS)  # zoom
+    return requests
+
+
+async def run(requests: list[tuple[str, str, str]]) -> dict[str, Any]:
+    alpaca = CountingAlpaca()
+    service = TickerDataService(DictRedis(), alpaca_data_service=alpaca)  # type: ignore[arg-type]
+    exact_keys: set[tuple[str, str, str]] = set()
+    exact_hits = 0
+    for symbol, start, end in requests:
+        if (symbol, start, end) in exact_keys:
+            exact_hits += 1
+        exact_keys.add((symbol, start, end))
+        await service.get_ticker_history(symbol, "1d", start_date=start, end_date=end)
+    return {
+        "exact_hits": exact_hits,
+        "stats": service.range_stats,
+        "calls": alpaca.calls,
+        "bars": alpaca.bars,
+    }
+
+
+def legacy_bars(requests: list[tuple[str, str, str]]) -> int:
+    """Bars the exact-key cache downloads (every distinct request in full)."""
+    return sum(len(pd.bdate_range(s, e)) for _, s, e in set(requests))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200, help="Chart sessions")
+    parser.add_argument("--steps", type=int, default=20, help="Requests per session")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    structlog_quiet()
+    requests = make_workload(args.sessions, args.steps, args.seed)
+    result = asyncio.run(run(requests))
+    stats = result["stats"]
+    total = len(requests)
+    legacy_calls = total - result["exact_hits"]
+    served_without_fetch = result["exact_hits"] + stats.hits
+
+    print(f"requests: {total}")
+    print(f"{'':>14} {'hit rate':>9} {'upstream calls':>15} {'bars fetched':>13}")
+    print(
+        f"{'exact key':>14} {result['exact_hits'] / total:>9.1%} "
+        f"{legacy_calls:>15} {legacy_bars(requests):>13}"
+    )
+    print(
+        f"{'range index':>14} {served_without_fetch / total:>9.1%} "
+        f"{result['calls']:>15} {result['bars']:>13}"
+    )
+    print(f"range lookups: {stats.to_dict()}")
+
+
+def structlog_quiet() -> None:
+    """Silence per-request logs so they don't dominate the output."""
+    import logging
+
+    import structlog
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.ERROR)
+    )
+
+
+if __name__ == "__main__":
+    main()
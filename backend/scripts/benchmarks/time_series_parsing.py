@@ -0,0 +1,155 @@
+"""
+Benchmark Alpha Vantage time-series parsing: the previous per-row loop
+(pd.to_datetime per bar, list of dicts) versus the columnar parsers in
+market_data/parsers.py, on synthetic 20-year daily and 2-year intraday payloads.
+Run with: python -m scripts.benchmarks.time_series_parsing [--repeat N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.services.market_data.parsers import (
+    parse_adjusted_ohlcv_series,
+    parse_ohlcv_series,
+)
+
+TRADING_DAYS_PER_YEAR = 252
+# Extended hours (4:00-20:00 ET) at 5-minute bars
+INTRADAY_BARS_PER_DAY = 16 * 12
+
+
+def make_daily_payload(years: int) -> dict[str, dict[str, str]]:
+    count = years * TRADING_DAYS_PER_YEAR
+    rng = np.random.default_rng(count)
+    close = 100 + np.cumsum(rng.normal(0, 1, count)).clip(-90)
+    dates = pd.bdate_range(end="2025-01-10", periods=count)[::-1]
+    return {
+        d.strftime("%Y-%m-%d"): {
+            "1. open": f"{c * 0.99:.4f}",
+            "2. high": f"{c * 1.01:.4f}",
+            "3. low": f"{c * 0.98:.4f}",
+            "4. close": f"{c:.4f}",
+            "5. adjusted close": f"{c * 0.5:.4f}",
+            "6. volume": str(int(v)),
+            "7. dividend amount": "0.0000",
+            "8. split coefficient": "1.0",
+        }
+        for d, c, v in zip(
+            dates, close, rng.integers(1_000, 10_000_000, count), strict=True
+        )
+    }
+
+
+def make_intraday_payload(years: int) -> dict[str, dict[str, str]]:
+    days = pd.bdate_range(end="2025-01-10", periods=years * TRADING_DAYS_PER_YEAR)
+    offsets = pd.timedelta_range("4h", periods=INTRADAY_BARS_PER_DAY, freq="5min")
+    stamps = (days.values[:, None] + offsets.values[None, :]).ravel()[::-1]
+    rng = np.random.default_rng(len(stamps))
+    close = 100 + np.cumsum(rng.normal(0, 0.05, len(stamps)))
+    return {
+        str(ts)[:19].replace("T", " "): {
+            "1. open": f"{c:.4f}",
+            "2. high": f"{c + 0.1:.4f}",
+            "3. low": f"{c - 0.1:.4f}",
+            "4. close": f"{c:.4f}",
+            "5. volume": str(int(v)),
+        }
+        for ts, c, v in zip(
+            stamps, close, rng.integers(100, 100_000, len(stamps)), strict=True
+        )
+    }
+
+
+def legacy_intraday(time_series: dict[str, dict[str, str]]) -> pd.DataFrame:
+    """Previous get_intraday_bars conversion."""
+    df_data = []
+    for timestamp, values in time_series.items():
+        df_data.append(
+            {
+                "timestamp": pd.to_datetime(timestamp),
+                "Open": float(values["1. open"]),
+                "High": float(values["2. high"]),
+                "Low": float(values["3. low"]),
+                "Close": float(values["4. close"]),
+                "Volume": int(values["5. volume"]),
+            }
+        )
+    df = pd.DataFrame(df_data)
+    df.set_index("timestamp", inplace=True)
+    df.sort_index(inplace=True)
+    if not df.empty and df.index.tz is None:
+        df.index = df.index.tz_localize("America/New_York")
+    return df
+
+
+def legacy_adjusted(time_series: dict[str, dict[str, str]]) -> pd.DataFrame:
+    """Previous get_daily_bars conversion."""
+    df_data = []
+    for date, values in time_series.items():
+        raw_close = float(values["4. close"])
+        adjusted_close = float(values["5. adjusted close"])
+        adjustment_factor = adjusted_close / raw_close if raw_close != 0 else 1.0
+        df_data.append(
+            {
+                "date": pd.to_datetime(date),
+                "Open": float(values["1. open"]) * adjustment_factor,
+                "High": float(values["2. high"]) * adjustment_factor,
+                "Low": float(values["3. low"]) * adjustment_factor,
+                "Close": adjusted_close,
+                "Volume": int(values["6. volume"]),
+            }
+        )
+    df = pd.DataFrame(df_data)
+    df.set_index("date", inplace=True)
+    df.sort_index(inplace=True)
+    return df
+
+
+def best_ms(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case")
+    args = parser.parse_args()
+
+    daily = make_daily_payload(20)
+    intraday = make_intraday_payload(2)
+    cases: list[tuple[str, dict[str, Any], Callable, Callable]] = [
+        ("daily 20y", daily, legacy_adjusted, parse_adjusted_ohlcv_series),
+        (
+            "intraday 5min 2y",
+            intraday,
+            legacy_intraday,
+            lambda ts: parse_ohlcv_series(ts, tz="America/New_York"),
+        ),
+    ]
+
+    print(
+        f"{'payload':>18} {'bars':>8} {'row loop ms':>12} {'columnar ms':>12} {'x':>6}"
+    )
+    for name, payload, legacy, columnar in cases:
+        pd.testing.assert_frame_equal(
+            legacy(payload), columnar(payload), check_freq=False
+        )
+        legacy_ms = best_ms(lambda p=payload, f=legacy: f(p), args.repeat)
+        columnar_ms = best_ms(lambda p=payload, f=columnar: f(p), args.repeat)
+        print(
+            f"{name:>18} {len(payload):>8} {legacy_ms:>12.1f} "
+            f"{columnar_ms:>12.1f} {legacy_ms / columnar_ms:>6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Bounded checkpointer for the LangGraph ReAct agent.
+
+LangGraph's MemorySaver keeps every thread's checkpoints for the life of the
+process. The agent starts a new thread per invocation, so under chat load
+the saver only grows. BoundedMemorySaver evicts whole threads by LRU order,
+idle TTL and a byte budget (bytes serialized for checkpoints, blobs and
+writes, counted as InMemorySaver hands them to the serializer).
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+logger = structlog.get_logger()
+
+# Defaults for Settings.agent_checkpoint_*
+DEFAULT_MAX_THREADS = 1000
+DEFAULT_TTL_SECONDS = 3600  # 1 hour idle
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+
+@dataclass
+class _ThreadUsage:
+    """Bookkeeping for one stored thread."""
+
+    last_access: float
+    nbytes: int = 0
+    blob_keys: set[tuple[Any, ...]] = field(default_factory=set)
+    write_keys: set[tuple[str, str, str]] = field(default_factory=set)
+
+
+class _CountingSerializer:
+    """Serializer wrapper that counts the bytes it produces."""
+
+    def __init__(self, serde: SerializerProtocol):
+        self.serde = serde
+        self.nbytes = 0
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        self.nbytes += len(data)
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.serde, name)
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    In-memory checkpointer that evicts least recently used threads.
+
+    A thread is evicted when it has been idle longer than `ttl_seconds`, or
+    when the saver holds more than `max_threads` threads or `max_bytes` of
+    serialized state. The thread being written is never evicted, so a
+    single run larger than the budget still completes. Limits are checked
+    on every write.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        serde: SerializerProtocol | None = None,
+    ):
+        """
+        Initialize the saver.
+
+        Args:
+            max_threads: Threads kept at most
+            ttl_seconds: Seconds a thread is kept after its last read or write
+            max_bytes: Serialized bytes kept at most (approximate)
+            serde: Serializer (default: LangGraph's JsonPlusSerializer)
+        """
+        # Sizes come from the serializer, not from InMemorySaver's stored tuples
+        self._counter = _CountingSerializer(serde or JsonPlusSerializer())
+        super().__init__(serde=self._counter)
+        self.max_threads = max(1, max_threads)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        # Oldest access first
+        self._threads: OrderedDict[str, _ThreadUsage] = OrderedDict()
+
+    @property
+    def thread_count(self) -> int:
+        """Threads currently stored."""
+        return len(self._threads)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Occupancy and eviction counters for monitoring."""
+        return {
+            "threads": len(self._threads),
+            "bytes": self.total_bytes,
+            "evictions": self.evictions,
+            "max_threads": self.max_threads,
+            "max_bytes": self.max_bytes,
+        }
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id not in self._threads:
+            return None  # Don't let the storage defaultdict create the thread
+        self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        before = self._counter.nbytes
+        saved_config = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = saved_config["configurable"]["thread_id"]
+        checkpoint_ns = saved_config["configurable"]["checkpoint_ns"]
+
+        usage = self._touch(thread_id)
+        usage.blob_keys.update(
+            (thread_id, checkpoint_ns, channel, version)
+            for channel, version in new_versions.items()
+        )
+        self._grow(usage, self._counter.nbytes - before)
+        self._evict(keep=thread_id)
+        return saved_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        before = self._counter.nbytes
+        super().put_writes(config, writes, task_id, task_path)
+
+        usage = self._touch(thread_id)
+        usage.write_keys.add(outer_key)
+        self._grow(usage, self._counter.nbytes - before)
+        self._evict(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        # Drop only the thread's own keys instead of scanning all writes/blobs;
+        # InMemorySaver's key layout is covered by the langgraph-checkpoint pin
+        usage = self._threads.pop(thread_id, None)
+        self.storage.pop(thread_id, None)
+        if usage is None:
+            return
+        for write_key in usage.write_keys:
+            self.writes.pop(write_key, None)
+        for blob_key in usage.blob_keys:
+            self.blobs.pop(blob_key, None)
+        self.total_bytes -= usage.nbytes
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        usage = self._threads.get(thread_id)
+        if usage is None:
+            usage = self._threads[thread_id] = _ThreadUsage(time.monotonic())
+        else:
+            usage.last_access = time.monotonic()
+            self._threads.move_to_end(thread_id)
+        return usage
+
+    def _grow(self, usage: _ThreadUsage, nbytes: int) -> None:
+        usage.nbytes += nbytes
+        self.total_bytes += nbytes
+
+    def _evict(self, keep: str) -> None:
+        """Evict expired threads, then the oldest while over a limit."""
+        now = time.monotonic()
+        while self._threads:
+            thread_id, usage = next(iter(self._threads.items()))
+            if thread_id == keep:
+                break
+            expired = now - usage.last_access > self.ttl_seconds
+            over = (
+                len(self._threads) > self.max_threads
+                or self.total_bytes > self.max_bytes
+            )
+            if not (expired or over):
+                break
+            self.delete_thread(thread_id)
+            self.evictions += 1
+            logger.debug(
+                "checkpoint_thread_evicted",
+                thread_id=thread_id,
+                reason="ttl" if expired else "budget",
+                thread_bytes=usage.nbytes,
+            )
@@ -0,0 +1,153 @@
+"""
+Concurrent tool node for the LangGraph ReAct agent.
+
+When the model emits several tool calls in one turn (e.g. Fibonacci +
+Stochastic + historical prices for the same symbol), ConcurrentToolNode runs
+them together with asyncio.gather, at most `max_concurrency` at a time, and
+returns the ToolMessages in the order of the tool calls. Each call gets the
+timeout ToolCacheWrapper uses for that tool and is accounted with the shared
+tool circuit breaker (Story 1.4), so a slow or failing tool degrades to an
+error message instead of stalling the turn.
+
+The guards run in ToolNode's public `awrap_tool_call` hook (langgraph-prebuilt
+1.0+); ToolNode itself gathers the calls.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+import structlog
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.prebuilt import ToolNode
+from langgraph.prebuilt.tool_node import ToolCallRequest
+
+from ..core.utils.circuit_breaker import CircuitBreaker, tool_circuit_breaker
+from ..services.tool_cache_wrapper import ToolCacheWrapper
+
+logger = structlog.get_logger()
+
+# Tool calls of one agent step running at the same time
+DEFAULT_TOOL_CONCURRENCY = 4
+
+
+class ConcurrentToolNode(ToolNode):
+    """
+    ToolNode that runs one step's tool calls concurrently with guards.
+
+    Tool calls of one agent run (LangGraph thread) share a semaphore that
+    lives while any of them is running; steps of a run are sequential, so it
+    caps each step. Results keep the order of the model's tool calls.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool | Callable[..., Any]],
+        *,
+        max_concurrency: int = DEFAULT_TOOL_CONCURRENCY,
+        timeouts: Mapping[str, float] | None = None,
+        default_timeout: float = ToolCacheWrapper.DEFAULT_TIMEOUT_SECONDS,
+        circuit_breaker: CircuitBreaker = tool_circuit_breaker,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the tool node.
+
+        Args:
+            tools: Tools the agent may call
+            max_concurrency: Tool calls of one step running at the same time
+            timeouts: Per-tool timeouts in seconds (default: ToolCacheWrapper.TOOL_TIMEOUTS)
+            default_timeout: Timeout for tools without an entry in `timeouts`
+            circuit_breaker: Breaker shared with ToolCacheWrapper
+            **kwargs: Passed to ToolNode (name, tags, handle_tool_errors, ...)
+        """
+        super().__init__(tools, awrap_tool_call=self._guarded_call, **kwargs)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeouts = dict(
+            ToolCacheWrapper.TOOL_TIMEOUTS if timeouts is None else timeouts
+        )
+        self.default_timeout = default_timeout
+        self.circuit_breaker = circuit_breaker
+        # thread_id -> (semaphore, calls holding or waiting for it)
+        self._slots: dict[Any, tuple[asyncio.Semaphore, int]] = {}
+
+    def get_timeout_for_tool(self, tool_name: str) -> float:
+        """Timeout in seconds for a tool (tool-specific or default)."""
+        return self.timeouts.get(tool_name, self.default_timeout)
+
+    @contextlib.asynccontextmanager
+    async def _run_slot(self, request: ToolCallRequest) -> AsyncIterator[None]:
+        """Hold one concurrency slot of the request's agent run."""
+        # Calls outside a thread (no checkpointer) share the None slots
+        key = request.runtime.config.get("configurable", {}).get("thread_id")
+        semaphore, users = self._slots.get(
+            key, (asyncio.Semaphore(self.max_concurrency), 0)
+        )
+        self._slots[key] = (semaphore, users + 1)
+        try:
+            async with semaphore:
+                yield
+        finally:
+            semaphore, users = self._slots[key]
+            if users == 1:
+                del self._slots[key]
+            else:
+                self._slots[key] = (semaphore, users - 1)
+
+    async def _guarded_call(
+        self,
+        request: ToolCallRequest,
+        execute: Callable[[ToolCallRequest], Awaitable[Any]],
+    ) -> Any:
+        """Run one tool call under the run's slots, timeout and breaker."""
+        call = request.tool_call
+        tool_name = call["name"]
+
+        # ===== CIRCUIT BREAKER CHECK (Story 1.4) =====
+        if not self.circuit_breaker.can_execute(tool_name):
+            return self._error_message(
+                call,
+                f"Tool '{tool_name}' is temporarily unavailable due to repeated "
+                "failures. Please try again later.",
+            )
+
+        timeout_seconds = self.get_timeout_for_tool(tool_name)
+        async with self._run_slot(request):
+            try:
+                result = await asyncio.wait_for(execute(request), timeout_seconds)
+            except TimeoutError:
+                # Record timeout as failure with circuit breaker (Story 1.4)
+                self.circuit_breaker.record_failure(
+                    tool_name,
+                    TimeoutError(f"Tool execution timed out after {timeout_seconds}s"),
+                )
+                logger.warning(
+                    "Tool execution timeout",
+                    tool_name=tool_name,
+                    timeout_seconds=timeout_seconds,
+                    circuit_breaker_status=self.circuit_breaker.get_status(tool_name),
+                )
+                return self._error_message(
+                    call,
+                    f"Tool '{tool_name}' timed out after {timeout_seconds}s. "
+                    "Please try again or use a simpler query.",
+                )
+            except Exception as e:
+                self.circuit_breaker.record_failure(tool_name, e)
+                raise
+
+        # Invalid arguments are the model's mistake, not a failing tool
+        if not (isinstance(result, ToolMessage) and result.status == "error"):
+            self.circuit_breaker.record_success(tool_name)
+        return result
+
+    @staticmethod
+    def _error_message(call: Mapping[str, Any], content: str) -> ToolMessage:
+        return ToolMessage(
+            content=content,
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
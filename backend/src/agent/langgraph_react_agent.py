@@ -7,7 +7,10 @@ SDK for autonomous tool chaining without rigid routing logic.
 Key Features:
 - Auto-loop: LLM dynamically decides tool sequence
 - Tool compression: Results limited to 2-3 lines for context efficiency
-- Message history: MemorySaver checkpointer for conversation continuity
+- Concurrent tools: Tool calls of one turn run together (ConcurrentToolNode)
+- Shared market data: Tools of one run load each OHLCV series once (ohlcv_scope)
+- Message history: Bounded checkpointer (LRU/TTL/byte budget)
+- Prompt prefix: Tool schemas and system prompt built once (prefix caching)
 - Langfuse integration: Automatic tracing via callback handler
 
 Architecture:
@@ -21,7 +24,7 @@ Architecture:
 Key Benefits:
 - LLM-driven routing (autonomous tool selection)
 - Automatic tool chaining based on context
-- Built-in message history management (MemorySaver)
+- Built-in message history management (bounded checkpointer)
 - Compressed tool results (99.5% token reduction)
 - Minimal code footprint (~300 lines)
 
@@ -35,6 +38,8 @@ import asyncio
 import random
 import time
 import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -46,9 +51,9 @@ from ..core.utils.dashscope_fix import patch_tongyi_check_response
 patch_tongyi_check_response()
 
 from langchain_community.chat_models import ChatTongyi
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.tools import tool
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import create_react_agent
 
 from ..core.analysis.fibonacci.analyzer import FibonacciAnalyzer
@@ -60,14 +65,16 @@ from ..core.localization import (
     SupportedLanguage,
     get_brief_language_instruction,
 )
-from ..core.utils import extract_token_usage_from_messages
+from ..core.utils import extract_token_usage_details_from_messages
 from ..services.alphavantage_response_formatter import AlphaVantageResponseFormatter
-from ..services.data_manager import DataManager
+from ..services.data_manager import DataManager, ohlcv_scope
 from ..services.insights import InsightsCategoryRegistry
 from ..services.insights.snapshot_service import InsightsSnapshotService
 from ..services.market_data import FREDService
 from ..services.tool_cache_wrapper import ToolCacheWrapper
-from .llm_client import FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE
+from .checkpointer import BoundedMemorySaver
+from .concurrent_tool_node import ConcurrentToolNode
+from .prompt_prefix import get_prompt_prefix
 from .tools.alpha_vantage_tools import create_alpha_vantage_tools
 from .tools.insights_tools import create_insights_tools
 from .tools.pcr_tools import create_pcr_tools
@@ -89,6 +96,37 @@ except ImportError:
     Langfuse = None
     logger.warning("Langfuse not available - observability disabled")
 
+# ===== RETRY CONFIGURATION (Story 1.4: Retry Logic Optimization) =====
+AGENT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0  # seconds
+RETRY_MAX_DELAY = 30.0  # seconds
+RETRY_JITTER_FACTOR = 0.25  # Add 0-25% random jitter to prevent thundering herd
+
+# Retryable error keywords (network and transient errors)
+RETRYABLE_KEYWORDS = (
+    "ssl",
+    "certificate",
+    "connection",
+    "timeout",
+    "max retries",
+    "eof occurred",
+    "rate limit",
+    "service unavailable",
+    "bad gateway",
+    "gateway timeout",
+)
+
+
+@dataclass
+class _Invocation:
+    """Per-run state shared by ainvoke and astream."""
+
+    trace_id: str
+    messages: list
+    config: dict[str, Any]
+    langfuse_trace: Any
+    start_time: float
+
 
 # ================================
 # FinancialAnalysisReActAgent (SDK-Based)
@@ -114,6 +152,7 @@ class FinancialAnalysisReActAgent:
         data_manager: (
             DataManager | None
         ) = None,  # Singleton DataManager for cached OHLCV
+        llm: BaseChatModel | None = None,
     ):
         """
         Initialize ReAct agent with SDK and MCP tools.
@@ -126,6 +165,7 @@ class FinancialAnalysisReActAgent:
             redis_cache: Optional Redis cache for insights caching (30min TTL)
             snapshot_service: Optional InsightsSnapshotService for cache-first reads (Story 2.5)
             data_manager: Singleton DataManager for cached OHLCV access (created in main.py)
+            llm: Optional chat model to use instead of the configured ChatTongyi
         """
         self.settings = settings
         self.market_service = market_service
@@ -176,7 +216,7 @@ class FinancialAnalysisReActAgent:
             self.stochastic_analyzer = None
 
         # Initialize LLM with centralized configuration
-        self.llm = ChatTongyi(
+        self.llm = llm or ChatTongyi(
             model_name=settings.default_llm_model,
             dashscope_api_key=settings.dashscope_api_key,
             temperature=settings.default_llm_temperature,
@@ -215,6 +255,7 @@ class FinancialAnalysisReActAgent:
             redis_cache=self.redis_cache,  # Enable caching for 30min TTL
             market_service=market_service,
             fred_service=fred_service,
+            data_manager=self.data_manager,
         )
         # Story 2.5: Pass snapshot_service for cache-first reads and trend queries
         insights_tools = create_insights_tools(
@@ -236,38 +277,27 @@ class FinancialAnalysisReActAgent:
         insights_tool_count = len(insights_tools)
         pcr_tool_count = len(pcr_tools)
 
-        # Create ReAct agent with memory and DYNAMIC system prompt
-        # The prompt is a callable that generates fresh date context on each invocation
-        # This fixes the bug where date was frozen at service startup time
-        self.checkpointer = MemorySaver()
-
-        def _dynamic_system_prompt(state: dict) -> str:
-            """Generate system prompt with current date on each agent invocation.
-
-            This callable is invoked by LangGraph before each LLM call, ensuring
-            the date context is always fresh (not frozen at service startup).
+        # Create ReAct agent with memory
+        self.checkpointer = self._create_checkpointer(settings)
 
-            Args:
-                state: LangGraph state dict (contains messages, etc.)
-
-            Returns:
-                System prompt string with current date injected
-            """
-            from datetime import timedelta
+        # Tool calls of one turn run concurrently (capped, with per-tool
+        # timeouts and circuit breaker). version="v1" hands the whole turn to
+        # the tool node so the cap applies across its calls.
+        self.tool_node = ConcurrentToolNode(
+            self.tools, max_concurrency=settings.agent_tool_concurrency
+        )
 
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            six_months_ago = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
-
-            return FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE.format(
-                current_date=current_date,
-                six_months_ago=six_months_ago,
-            )
+        # Tool schemas and the system prompt (current date, rendered once a
+        # day) are built once and sent identically ahead of every step, so
+        # provider-side prefix caching applies across steps and runs
+        self.prompt_prefix = get_prompt_prefix(self.tools)
 
         self.agent = create_react_agent(
-            self.llm,
-            self.tools,
+            self.llm.bind_tools(self.prompt_prefix.tool_schemas),
+            self.tool_node,
             checkpointer=self.checkpointer,
-            prompt=_dynamic_system_prompt,  # Callable for dynamic date injection
+            prompt=self.prompt_prefix,
+            version="v1",
         )
 
         logger.info(
@@ -278,6 +308,21 @@ class FinancialAnalysisReActAgent:
             insights_tools=insights_tool_count,
             pcr_tools=pcr_tool_count,
             total_local_tools=len(self.tools),
+            prompt_prefix_hash=self.prompt_prefix.content_hash,
+        )
+
+    def _create_checkpointer(self, settings: Settings) -> BoundedMemorySaver:
+        """
+        Create the agent's checkpointer from settings.
+
+        Threads are kept in-process and evicted by LRU, idle TTL and byte
+        budget. Every invocation starts a new thread, so none is resumed
+        and there is nothing to share with other pods.
+        """
+        return BoundedMemorySaver(
+            max_threads=settings.agent_checkpoint_max_threads,
+            ttl_seconds=settings.agent_checkpoint_ttl_seconds,
+            max_bytes=settings.agent_checkpoint_max_mb * 1024 * 1024,
         )
 
     def _create_fibonacci_tool(self) -> Any:
@@ -486,30 +531,16 @@ Summary: {result.analysis_summary}"""
                     }
                     granularity = granularity_map.get(interval, "daily")
 
-                    ohlcv_list = await data_manager.get_ohlcv(
+                    bars = await data_manager.get_ohlcv(
                         symbol=symbol,
                         granularity=granularity,
                         outputsize="compact",
                     )
 
-                    if not ohlcv_list:
+                    if not bars:
                         return f"No historical data available for {symbol}"
 
-                    # Convert to DataFrame
-                    df = pd.DataFrame(
-                        [
-                            {
-                                "Open": d.open,
-                                "High": d.high,
-                                "Low": d.low,
-                                "Close": d.close,
-                                "Volume": d.volume,
-                            }
-                            for d in ohlcv_list
-                        ],
-                        index=pd.DatetimeIndex([d.date for d in ohlcv_list]),
-                    )
-                    df = df.sort_index()
+                    df = bars.to_dataframe()
                 else:
                     # Fallback to direct market_service
                     if interval == "weekly":
@@ -565,6 +596,11 @@ Summary: {result.analysis_summary}"""
                 lines.append(
                     f"- Latest Close: ${latest['Close']:.2f} ({latest.name.strftime('%Y-%m-%d')})"
                 )
+                if data_manager and bars.stale and bars.age_seconds is not None:
+                    lines.append(
+                        f"- Note: cached data, {bars.age_seconds / 60:.0f} min old "
+                        "(refresh in progress)"
+                    )
 
                 return "\n".join(lines)
 
@@ -597,33 +633,26 @@ Summary: {result.analysis_summary}"""
             )
             return None
 
-    async def ainvoke(
+    def _prepare_invocation(
         self,
         user_message: str,
-        conversation_history: list[dict[str, str]] | None = None,
-        debug: bool = False,
-        additional_callbacks: list | None = None,
-        language: SupportedLanguage = DEFAULT_LANGUAGE,
-    ) -> dict[str, Any]:
+        conversation_history: list[dict[str, str]] | None,
+        debug: bool,
+        additional_callbacks: list | None,
+        language: SupportedLanguage,
+    ) -> "_Invocation":
         """
-        Invoke ReAct agent with user message and conversation history.
-
-        The agent will autonomously:
-        1. Reason about the query
-        2. Decide which tools to call (if any)
-        3. Execute tools sequentially
-        4. Observe results and decide: more tools OR final answer
-        5. Synthesize final response
+        Build messages, config and tracing shared by ainvoke and astream.
 
         Args:
             user_message: User's query
             conversation_history: Previous messages (optional, for new threads)
             debug: If True, log full LLM prompt for debugging
-            additional_callbacks: Optional list of additional callbacks (e.g., ToolExecutionCallback)
+            additional_callbacks: Optional list of additional callbacks
             language: Response language ("zh-CN" or "en")
 
         Returns:
-            Agent response with messages and final answer
+            _Invocation with trace/thread IDs, messages and LangGraph config
         """
         # Generate trace ID and thread ID with UUID for guaranteed uniqueness
         # UUID suffix prevents collisions in concurrent execution (e.g., parallel market mover analysis)
@@ -723,207 +752,352 @@ Summary: {result.analysis_summary}"""
                 ],
             )
 
-        try:
-            # ===== RETRY CONFIGURATION (Story 1.4: Retry Logic Optimization) =====
-            # Exponential backoff with jitter for DashScope API (SSL errors, timeouts)
-            max_retries = 3
-            base_delay = 2.0  # seconds
-            max_delay = 30.0  # seconds
-            jitter_factor = 0.25  # Add 0-25% random jitter to prevent thundering herd
+        return _Invocation(
+            trace_id=trace_id,
+            messages=messages,
+            config=config,
+            langfuse_trace=langfuse_trace,
+            start_time=agent_start_time,
+        )
 
-            # Retryable error keywords (network and transient errors)
-            retryable_keywords = [
-                "ssl",
-                "certificate",
-                "connection",
-                "timeout",
-                "max retries",
-                "eof occurred",
-                "rate limit",
-                "service unavailable",
-                "bad gateway",
-                "gateway timeout",
-            ]
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float | None:
+        """
+        Backoff before retrying a failed agent run, None if not retryable.
 
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    # Run ReAct loop (auto-loop handles tool calling)
-                    result = await self.agent.ainvoke(
-                        {"messages": messages}, config=config
-                    )
-                    # Success - break out of retry loop
-                    if attempt > 0:
-                        logger.info(
-                            "ReAct agent retry succeeded",
-                            trace_id=trace_id,
-                            attempt=attempt + 1,
-                            recovery_after_retries=attempt,
-                        )
-                    break
-                except Exception as e:
-                    last_exception = e
-                    # Check if this is a retryable error
-                    error_str = str(e).lower()
-                    is_retryable = any(
-                        keyword in error_str for keyword in retryable_keywords
-                    )
+        Exponential backoff with jitter for DashScope API (SSL errors, timeouts).
+        Jitter prevents thundering herd problem when many requests retry
+        simultaneously (Story 1.4: Retry Logic Optimization).
+        """
+        error_str = str(error).lower()
+        is_retryable = any(keyword in error_str for keyword in RETRYABLE_KEYWORDS)
+        if not is_retryable or attempt == AGENT_MAX_RETRIES - 1:
+            return None
 
-                    if not is_retryable or attempt == max_retries - 1:
-                        # Non-retryable error or last attempt - raise immediately
-                        logger.error(
-                            "ReAct agent invocation failed (non-retryable or max retries exhausted)",
-                            trace_id=trace_id,
-                            attempt=attempt + 1,
-                            max_retries=max_retries,
-                            error=str(e),
-                            error_type=type(e).__name__,
-                            is_retryable=is_retryable,
-                            total_attempts=attempt + 1,
-                        )
-                        raise
+        base_wait = min(RETRY_BASE_DELAY * (2**attempt), RETRY_MAX_DELAY)
+        jitter = random.uniform(0, RETRY_JITTER_FACTOR * base_wait)
+        return base_wait + jitter
 
-                    # Calculate exponential backoff with jitter (Story 1.4)
-                    # Jitter prevents thundering herd problem when many requests retry simultaneously
-                    base_wait = min(base_delay * (2**attempt), max_delay)
-                    jitter = random.uniform(0, jitter_factor * base_wait)
-                    delay = base_wait + jitter
+    def _complete_invocation(
+        self, invocation: "_Invocation", result_messages: list
+    ) -> dict[str, Any]:
+        """Summarize a finished agent run (tokens, tools, latency) for callers."""
+        # Extract final answer (last message)
+        final_message = result_messages[-1]
+        final_answer = (
+            final_message.content if hasattr(final_message, "content") else ""
+        )
 
-                    logger.warning(
-                        "ReAct agent retry scheduled",
-                        trace_id=trace_id,
-                        attempt=attempt + 1,
-                        max_retries=max_retries,
-                        remaining_attempts=max_retries - attempt - 1,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                        retry_delay_seconds=round(delay, 2),
-                        base_delay=base_wait,
-                        jitter_applied=round(jitter, 2),
-                    )
+        # Count tool executions
+        tool_messages = [
+            msg for msg in result_messages if msg.__class__.__name__ == "ToolMessage"
+        ]
 
-                    # Wait before retrying
-                    await asyncio.sleep(delay)
+        # Extract token usage (incl. prompt prefix cache hits) from all AI messages
+        usage = extract_token_usage_details_from_messages(result_messages)
+        total_input_tokens = usage["input_tokens"]
+        total_output_tokens = usage["output_tokens"]
+        cached_input_tokens = usage["cached_input_tokens"]
 
-            # If we exhausted all retries, raise the last exception
-            if last_exception:
-                raise last_exception
+        # Calculate agent execution duration (Story 1.4)
+        agent_duration_ms = int((time.perf_counter() - invocation.start_time) * 1000)
 
-            # Extract final answer (last message)
-            final_message = result["messages"][-1]
-            final_answer = (
-                final_message.content if hasattr(final_message, "content") else ""
-            )
+        logger.info(
+            "ReAct agent invocation completed",
+            trace_id=invocation.trace_id,
+            total_messages=len(result_messages),
+            tool_executions=len(tool_messages),
+            final_answer_length=len(final_answer),
+            input_tokens=total_input_tokens,
+            cached_input_tokens=cached_input_tokens,
+            output_tokens=total_output_tokens,
+            agent_duration_ms=agent_duration_ms,
+        )
 
-            # Count tool executions
-            tool_messages = [
-                msg
-                for msg in result["messages"]
-                if msg.__class__.__name__ == "ToolMessage"
-            ]
+        # ===== LANGFUSE LATENCY SPAN UPDATE (Story 1.4) =====
+        # Add latency metrics to Langfuse trace
+        if invocation.langfuse_trace:
+            try:
+                invocation.langfuse_trace.update(
+                    output={"final_answer_length": len(final_answer)},
+                    metadata={
+                        "duration_ms": agent_duration_ms,
+                        "tool_executions": len(tool_messages),
+                        "input_tokens": total_input_tokens,
+                        "cached_input_tokens": cached_input_tokens,
+                        "output_tokens": total_output_tokens,
+                        "total_tokens": total_input_tokens + total_output_tokens,
+                        "status": "success",
+                    },
+                )
+                # Flush to ensure data is sent
+                if self.langfuse_client:
+                    self.langfuse_client.flush()
+            except Exception as e:
+                logger.warning(
+                    "Failed to update Langfuse trace with latency metrics",
+                    error=str(e),
+                )
 
-            # Extract token usage from all AI messages
-            total_input_tokens, total_output_tokens, _ = (
-                extract_token_usage_from_messages(result["messages"])
-            )
+        return {
+            "trace_id": invocation.trace_id,
+            "messages": result_messages,
+            "final_answer": final_answer,
+            "tool_executions": len(tool_messages),
+            "input_tokens": total_input_tokens,
+            "cached_input_tokens": cached_input_tokens,  # Prompt prefix cache hits
+            "output_tokens": total_output_tokens,
+            "total_tokens": total_input_tokens + total_output_tokens,
+            "agent_duration_ms": agent_duration_ms,  # Story 1.4: Include latency
+        }
 
-            # Calculate agent execution duration (Story 1.4)
-            agent_duration_ms = int((time.perf_counter() - agent_start_time) * 1000)
+    def _fail_invocation(
+        self, invocation: "_Invocation", error: Exception
+    ) -> dict[str, Any]:
+        """Log a failed agent run and build the error result for callers."""
+        # Get full traceback for debugging
+        import traceback
+
+        tb_str = traceback.format_exc()
+
+        # Calculate agent execution duration even on error
+        agent_duration_ms = int((time.perf_counter() - invocation.start_time) * 1000)
+
+        logger.error(
+            "ReAct agent invocation failed",
+            trace_id=invocation.trace_id,
+            error=str(error),
+            error_type=type(error).__name__,
+            traceback=tb_str,
+            agent_duration_ms=agent_duration_ms,
+        )
 
-            logger.info(
-                "ReAct agent invocation completed",
-                trace_id=trace_id,
-                total_messages=len(result["messages"]),
-                tool_executions=len(tool_messages),
-                final_answer_length=len(final_answer),
-                input_tokens=total_input_tokens,
-                output_tokens=total_output_tokens,
-                agent_duration_ms=agent_duration_ms,
-            )
+        # ===== LANGFUSE ERROR TRACKING (Story 1.4) =====
+        if invocation.langfuse_trace:
+            try:
+                invocation.langfuse_trace.update(
+                    output={"error": str(error)},
+                    metadata={
+                        "duration_ms": agent_duration_ms,
+                        "status": "error",
+                        "error_type": type(error).__name__,
+                    },
+                )
+                if self.langfuse_client:
+                    self.langfuse_client.flush()
+            except Exception as trace_error:
+                logger.warning(
+                    "Failed to update Langfuse trace with error",
+                    error=str(trace_error),
+                )
 
-            # ===== LANGFUSE LATENCY SPAN UPDATE (Story 1.4) =====
-            # Add latency metrics to Langfuse trace
-            if langfuse_trace:
-                try:
-                    langfuse_trace.update(
-                        output={"final_answer_length": len(final_answer)},
-                        metadata={
-                            "duration_ms": agent_duration_ms,
-                            "tool_executions": len(tool_messages),
-                            "input_tokens": total_input_tokens,
-                            "output_tokens": total_output_tokens,
-                            "total_tokens": total_input_tokens + total_output_tokens,
-                            "status": "success",
-                        },
-                    )
-                    # Flush to ensure data is sent
-                    if self.langfuse_client:
-                        self.langfuse_client.flush()
-                except Exception as e:
-                    logger.warning(
-                        "Failed to update Langfuse trace with latency metrics",
-                        error=str(e),
-                    )
+        return {
+            "trace_id": invocation.trace_id,
+            "messages": invocation.messages,
+            "final_answer": f"Agent execution failed: {str(error)}",
+            "error": str(error),
+            "tool_executions": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+            "agent_duration_ms": agent_duration_ms,  # Story 1.4: Include latency
+        }
 
-            return {
-                "trace_id": trace_id,
-                "messages": result["messages"],
-                "final_answer": final_answer,
-                "tool_executions": len(tool_messages),
-                "input_tokens": total_input_tokens,
-                "output_tokens": total_output_tokens,
-                "total_tokens": total_input_tokens + total_output_tokens,
-                "agent_duration_ms": agent_duration_ms,  # Story 1.4: Include latency
-            }
+    async def ainvoke(
+        self,
+        user_message: str,
+        conversation_history: list[dict[str, str]] | None = None,
+        debug: bool = False,
+        additional_callbacks: list | None = None,
+        language: SupportedLanguage = DEFAULT_LANGUAGE,
+    ) -> dict[str, Any]:
+        """
+        Invoke ReAct agent with user message and conversation history.
+
+        The agent will autonomously:
+        1. Reason about the query
+        2. Decide which tools to call (if any)
+        3. Execute the turn's tools concurrently
+        4. Observe results and decide: more tools OR final answer
+        5. Synthesize final response
+
+        Args:
+            user_message: User's query
+            conversation_history: Previous messages (optional, for new threads)
+            debug: If True, log full LLM prompt for debugging
+            additional_callbacks: Optional list of additional callbacks (e.g., ToolExecutionCallback)
+            language: Response language ("zh-CN" or "en")
+
+        Returns:
+            Agent response with messages and final answer
+        """
+        invocation = self._prepare_invocation(
+            user_message, conversation_history, debug, additional_callbacks, language
+        )
+
+        try:
+            # Tools of this run share the OHLCV series they load
+            with ohlcv_scope():
+                for attempt in range(AGENT_MAX_RETRIES):
+                    try:
+                        # Run ReAct loop (auto-loop handles tool calling)
+                        result = await self.agent.ainvoke(
+                            {"messages": invocation.messages}, config=invocation.config
+                        )
+                        # Success - break out of retry loop
+                        if attempt > 0:
+                            logger.info(
+                                "ReAct agent retry succeeded",
+                                trace_id=invocation.trace_id,
+                                attempt=attempt + 1,
+                                recovery_after_retries=attempt,
+                            )
+                        break
+                    except Exception as e:
+                        delay = self._retry_delay(attempt, e)
+                        if delay is None:
+                            # Non-retryable error or last attempt - raise immediately
+                            logger.error(
+                                "ReAct agent invocation failed (non-retryable or max retries exhausted)",
+                                trace_id=invocation.trace_id,
+                                attempt=attempt + 1,
+                                max_retries=AGENT_MAX_RETRIES,
+                                error=str(e),
+                                error_type=type(e).__name__,
+                                total_attempts=attempt + 1,
+                            )
+                            raise
+
+                        logger.warning(
+                            "ReAct agent retry scheduled",
+                            trace_id=invocation.trace_id,
+                            attempt=attempt + 1,
+                            max_retries=AGENT_MAX_RETRIES,
+                            remaining_attempts=AGENT_MAX_RETRIES - attempt - 1,
+                            error=str(e),
+                            error_type=type(e).__name__,
+                            retry_delay_seconds=round(delay, 2),
+                        )
+
+                        # Wait before retrying
+                        await asyncio.sleep(delay)
+
+            return self._complete_invocation(invocation, result["messages"])
 
         except Exception as e:
-            # Get full traceback for debugging
-            import traceback
+            return self._fail_invocation(invocation, e)
 
-            tb_str = traceback.format_exc()
+    async def astream(
+        self,
+        user_message: str,
+        conversation_history: list[dict[str, str]] | None = None,
+        debug: bool = False,
+        additional_callbacks: list | None = None,
+        language: SupportedLanguage = DEFAULT_LANGUAGE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run the ReAct agent, yielding LLM text tokens as they are generated.
 
-            # Calculate agent execution duration even on error
-            agent_duration_ms = int((time.perf_counter() - agent_start_time) * 1000)
+        Same loop as ainvoke, streamed with LangGraph's "messages" mode:
+        every text delta the model produces is yielded as
+        {"type": "token", "content": str}, while tool calls run and report
+        through the callbacks as before. Text of successive model turns is
+        separated by a blank line. The last event is
+        {"type": "result", "result": <ainvoke-shaped dict>}.
 
-            logger.error(
-                "ReAct agent invocation failed",
-                trace_id=trace_id,
-                error=str(e),
-                error_type=type(e).__name__,
-                traceback=tb_str,
-                agent_duration_ms=agent_duration_ms,
-            )
+        Transient errors are retried like ainvoke only while no token has
+        been yielded; a failure after that ends the run with an error result,
+        since streamed text cannot be taken back.
 
-            # ===== LANGFUSE ERROR TRACKING (Story 1.4) =====
-            if langfuse_trace:
-                try:
-                    langfuse_trace.update(
-                        output={"error": str(e)},
-                        metadata={
-                            "duration_ms": agent_duration_ms,
-                            "status": "error",
-                            "error_type": type(e).__name__,
-                        },
-                    )
-                    if self.langfuse_client:
-                        self.langfuse_client.flush()
-                except Exception as trace_error:
-                    logger.warning(
-                        "Failed to update Langfuse trace with error",
-                        error=str(trace_error),
-                    )
+        Args:
+            user_message: User's query
+            conversation_history: Previous messages (optional, for new threads)
+            debug: If True, log full LLM prompt for debugging
+            additional_callbacks: Optional list of additional callbacks (e.g., ToolExecutionCallback)
+            language: Response language ("zh-CN" or "en")
+
+        Yields:
+            Token events, then one result event
+        """
+        invocation = self._prepare_invocation(
+            user_message, conversation_history, debug, additional_callbacks, language
+        )
+        streamed = False
+
+        try:
+            # Tools of this run share the OHLCV series they load
+            with ohlcv_scope():
+                for attempt in range(AGENT_MAX_RETRIES):
+                    state: dict[str, Any] | None = None
+                    message_id = None
+                    try:
+                        async for mode, payload in self.agent.astream(
+                            {"messages": invocation.messages},
+                            config=invocation.config,
+                            stream_mode=["messages", "values"],
+                        ):
+                            if mode == "values":
+                                state = payload
+                                continue
+
+                            chunk, metadata = payload
+                            if metadata.get("langgraph_node") != "agent":
+                                continue  # Tool results are reported by callbacks
+                            if not isinstance(chunk, AIMessage) or not chunk.text:
+                                continue
+
+                            content = chunk.text
+                            if chunk.id != message_id:
+                                # New model turn: keep it apart from earlier text
+                                if streamed and message_id is not None:
+                                    content = f"\n\n{content}"
+                                message_id = chunk.id
+                            streamed = True
+                            yield {"type": "token", "content": content}
+
+                        if attempt > 0:
+                            logger.info(
+                                "ReAct agent retry succeeded",
+                                trace_id=invocation.trace_id,
+                                attempt=attempt + 1,
+                                recovery_after_retries=attempt,
+                            )
+                        break
+                    except Exception as e:
+                        delay = None if streamed else self._retry_delay(attempt, e)
+                        if delay is None:
+                            logger.error(
+                                "ReAct agent stream failed (non-retryable, max retries "
+                                "exhausted or already streaming)",
+                                trace_id=invocation.trace_id,
+                                attempt=attempt + 1,
+                                max_retries=AGENT_MAX_RETRIES,
+                                error=str(e),
+                                error_type=type(e).__name__,
+                                streamed=streamed,
+                            )
+                            raise
+
+                        logger.warning(
+                            "ReAct agent retry scheduled",
+                            trace_id=invocation.trace_id,
+                            attempt=attempt + 1,
+                            max_retries=AGENT_MAX_RETRIES,
+                            remaining_attempts=AGENT_MAX_RETRIES - attempt - 1,
+                            error=str(e),
+                            error_type=type(e).__name__,
+                            retry_delay_seconds=round(delay, 2),
+                        )
+                        await asyncio.sleep(delay)
+
+            if not state or not state.get("messages"):
+                raise RuntimeError("Agent stream ended without a final state")
+            result = self._complete_invocation(invocation, state["messages"])
+
+        except Exception as e:
+            result = self._fail_invocation(invocation, e)
 
-            return {
-                "trace_id": trace_id,
-                "messages": messages,
-                "final_answer": f"Agent execution failed: {str(e)}",
-                "error": str(e),
-                "tool_executions": 0,
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "total_tokens": 0,
-                "agent_duration_ms": agent_duration_ms,  # Story 1.4: Include latency
-            }
+        yield {"type": "result", "result": result}
 
     async def ainvoke_structured(
         self,
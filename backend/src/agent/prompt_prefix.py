@@ -0,0 +1,115 @@
+"""
+Stable prompt prefix for the LangGraph ReAct agent.
+
+Every LLM step of the agent sends the tool schemas (~5k tokens for the 20
+tools) and the system prompt (~1k) ahead of the conversation. DashScope
+context caching, like OpenAI prompt caching, reuses an already processed
+request prefix and bills it at a discount, but only when the prefix is
+byte-identical. PromptPrefix builds that prefix once and hands LangGraph the
+same objects on every step:
+
+- Tool schemas are converted once; agents with identical tools and prompt
+  share one PromptPrefix, looked up by the content hash of the prefix
+- The system prompt is rendered once per day (it carries the current date)
+- Messages are ordered static-first: system message, conversation history,
+  then the current user message, which ends with the per-request language
+  instruction, so one prefix serves every language
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from datetime import date, timedelta
+from typing import Any
+
+import structlog
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from .llm_client import FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE
+
+logger = structlog.get_logger()
+
+# Prefixes built in this process, by content hash
+_prefixes: dict[str, "PromptPrefix"] = {}
+
+
+class PromptPrefix:
+    """
+    Tool schemas and system message sent ahead of every agent step.
+
+    Bind the model with `tool_schemas` and pass the instance as the
+    `prompt` of create_react_agent; LangGraph then calls it before each
+    LLM step with the graph state.
+    """
+
+    def __init__(
+        self, tool_schemas: list[dict[str, Any]], template: str, content_hash: str
+    ):
+        """
+        Initialize the prefix (use get_prompt_prefix to share instances).
+
+        Args:
+            tool_schemas: OpenAI-format tool schemas, in binding order
+            template: System prompt template with {current_date}/{six_months_ago}
+            content_hash: Hash of the template and tool schemas
+        """
+        self.tool_schemas = tool_schemas
+        self.template = template
+        self.content_hash = content_hash
+        self.renders = 0
+        self._day: date | None = None
+        self._system_message: SystemMessage | None = None
+
+    def system_message(self, today: date | None = None) -> SystemMessage:
+        """System prompt for `today` (default: local date), rendered once a day."""
+        today = today or date.today()
+        if self._system_message is None or today != self._day:
+            self._system_message = SystemMessage(
+                content=self.template.format(
+                    current_date=today.isoformat(),
+                    six_months_ago=(today - timedelta(days=180)).isoformat(),
+                )
+            )
+            self._day = today
+            self.renders += 1
+        return self._system_message
+
+    def __call__(self, state: dict[str, Any]) -> list[BaseMessage]:
+        """LangGraph prompt: the system message, then the conversation."""
+        return [self.system_message(), *state["messages"]]
+
+
+def get_prompt_prefix(
+    tools: Sequence[BaseTool],
+    template: str = FINANCIAL_AGENT_SYSTEM_PROMPT_TEMPLATE,
+) -> PromptPrefix:
+    """
+    Get the shared prompt prefix for a tool set and system prompt template.
+
+    Args:
+        tools: Agent tools, in the order they are bound to the model
+        template: System prompt template
+
+    Returns:
+        PromptPrefix shared by every agent with the same content hash
+    """
+    tool_schemas = [convert_to_openai_tool(tool) for tool in tools]
+    canonical = json.dumps(
+        [template, tool_schemas], sort_keys=True, separators=(",", ":"), default=str
+    )
+    content_hash = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+    prefix = _prefixes.get(content_hash)
+    if prefix is None:
+        prefix = _prefixes[content_hash] = PromptPrefix(
+            tool_schemas, template, content_hash
+        )
+        logger.info(
+            "prompt_prefix_built",
+            prefix_hash=content_hash,
+            tools=len(tool_schemas),
+            prefix_chars=len(canonical),
+        )
+    return prefix
@@ -5,6 +5,7 @@ Provides AI agent access to per-symbol PCR calculations with:
 - ATM Dollar-Weighted methodology
 - Automatic Redis caching (1-hour TTL)
 - Rich output including price, ATM zone, notionals, interpretation
+- Watchlist comparison in a single call (batched quotes and options fetches)
 """
 
 from typing import TYPE_CHECKING
@@ -13,10 +14,13 @@ import structlog
 from langchain_core.tools import tool
 
 if TYPE_CHECKING:
-    from ...services.data_manager import DataManager, SymbolPCRData
+    from ...services.data_manager import BatchPCRResult, DataManager, SymbolPCRData
 
 logger = structlog.get_logger()
 
+# Symbols get_put_call_ratios accepts per call (each may need an options chain)
+MAX_WATCHLIST_SYMBOLS = 25
+
 
 def create_pcr_tools(data_manager: "DataManager") -> list:
     """
@@ -87,7 +91,59 @@ def create_pcr_tools(data_manager: "DataManager") -> list:
             )
             return f"Error calculating Put/Call Ratio for {symbol}: {str(e)}"
 
-    return [get_put_call_ratio]
+    @tool
+    async def get_put_call_ratios(symbols: list[str]) -> str:
+        """
+        Get the Put/Call Ratio for several stock symbols at once.
+
+        Use this instead of calling get_put_call_ratio repeatedly when
+        comparing a watchlist or a group of stocks. Same ATM dollar-weighted
+        methodology and interpretation as get_put_call_ratio.
+
+        Args:
+            symbols: Stock symbols (e.g., ["NVDA", "AAPL", "TSLA"]), up to 25
+
+        Returns:
+            Comparison table with price, put/call notionals, PCR and
+            contracts analyzed per symbol, the combined PCR of the group,
+            and the reason for any symbol without data
+
+        Example:
+            get_put_call_ratios(["NVDA", "AMD", "AVGO"])
+        """
+        requested = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+        if not requested:
+            return "No symbols given. Provide stock symbols like ['NVDA', 'AAPL']."
+        if len(requested) > MAX_WATCHLIST_SYMBOLS:
+            return (
+                f"Too many symbols ({len(requested)}). "
+                f"Request at most {MAX_WATCHLIST_SYMBOLS} at a time."
+            )
+
+        try:
+            batch = await data_manager.get_symbols_pcr(requested)
+            return _format_pcr_batch_output(requested, batch)
+
+        except Exception as e:
+            logger.error(
+                "PCR batch tool error",
+                symbols=requested,
+                error=str(e),
+            )
+            return f"Error calculating Put/Call Ratios: {str(e)}"
+
+    return [get_put_call_ratio, get_put_call_ratios]
+
+
+def _sentiment_emoji(pcr: float) -> str:
+    """Sentiment indicator for a PCR value."""
+    if pcr < 0.7:
+        return "🟢"  # Bullish (contrarian bearish)
+    if pcr < 1.0:
+        return "🔵"  # Neutral-bullish
+    if pcr < 1.3:
+        return "🟠"  # Neutral-bearish
+    return "🔴"  # Bearish (contrarian bullish)
 
 
 def _format_pcr_output(pcr_data: "SymbolPCRData") -> str:
@@ -100,14 +156,7 @@ def _format_pcr_output(pcr_data: "SymbolPCRData") -> str:
         Formatted markdown string
     """
     # Determine sentiment indicator
-    if pcr_data.pcr < 0.7:
-        sentiment_emoji = "🟢"  # Bullish (contrarian bearish)
-    elif pcr_data.pcr < 1.0:
-        sentiment_emoji = "🔵"  # Neutral-bullish
-    elif pcr_data.pcr < 1.3:
-        sentiment_emoji = "🟠"  # Neutral-bearish
-    else:
-        sentiment_emoji = "🔴"  # Bearish (contrarian bullish)
+    sentiment_emoji = _sentiment_emoji(pcr_data.pcr)
 
     lines = [
         f"## {pcr_data.symbol} Put/Call Ratio Analysis {sentiment_emoji}\n",
@@ -134,3 +183,62 @@ def _format_pcr_output(pcr_data: "SymbolPCRData") -> str:
     ]
 
     return "\n".join(lines)
+
+
+def _format_pcr_batch_output(symbols: list[str], batch: "BatchPCRResult") -> str:
+    """Format PCR data of several symbols as a markdown comparison table.
+
+    Args:
+        symbols: Requested symbols (uppercase), in display order
+        batch: BatchPCRResult from DataManager
+
+    Returns:
+        Formatted markdown string
+    """
+    results = [batch.data[s] for s in symbols if s in batch.data]
+    if not results:
+        lines = ["Unable to calculate Put/Call Ratio for any requested symbol."]
+        lines.extend(f"- {s}: {batch.errors.get(s, 'unavailable')}" for s in symbols)
+        return "\n".join(lines)
+
+    total_put = sum(r.put_notional_mm for r in results)
+    total_call = sum(r.call_notional_mm for r in results)
+
+    lines = [
+        f"## Put/Call Ratio Comparison ({len(results)} of {len(symbols)} symbols)\n",
+        "| Symbol | Price | Put Notional | Call Notional | PCR | Contracts |",
+        "|--------|-------|--------------|---------------|-----|-----------|",
+    ]
+    for r in results:
+        lines.append(
+            f"| **{r.symbol}** | ${r.current_price:,.2f} | ${r.put_notional_mm:.2f}M "
+            f"| ${r.call_notional_mm:.2f}M | {r.pcr:.2f} {_sentiment_emoji(r.pcr)} "
+            f"| {r.contracts_analyzed:,} |"
+        )
+
+    if total_call > 0:
+        combined = total_put / total_call
+        lines += [
+            "",
+            f"**Combined PCR: {combined:.2f}** {_sentiment_emoji(combined)} "
+            f"(${total_put:.2f}M puts / ${total_call:.2f}M calls)",
+        ]
+
+    lines += ["", "### Interpretation"]
+    lines.extend(f"- **{r.symbol}**: {r.interpretation}" for r in results)
+
+    missing = [s for s in symbols if s not in batch.data]
+    if missing:
+        lines += ["", "### Unavailable"]
+        lines.extend(f"- {s}: {batch.errors.get(s, 'unavailable')}" for s in missing)
+
+    first = results[0]
+    lines += [
+        "",
+        "### Methodology",
+        f"- ATM Zone: +/- {first.atm_zone_pct * 100:.0f}% of current price",
+        f"- Min Premium: ${first.min_premium:.2f}",
+        f"- Min Open Interest: {first.min_oi:,} contracts",
+    ]
+
+    return "\n".join(lines)
@@ -25,6 +25,7 @@ from ..services.data_manager import DataManager
 from ..services.database_stats_service import DatabaseStatsService
 from ..services.insights import InsightsSnapshotService
 from ..services.kubernetes_metrics_service import KubernetesMetricsService
+from ..services.market_data.scheduler import RequestScheduler
 from .dependencies.auth import (
     get_current_user,
     get_mongodb,
@@ -618,6 +619,7 @@ async def get_cache_warming_status(
 
 @router.get("/cache/stats")
 async def get_cache_stats(
+    request: Request,
     _: None = Depends(require_admin),
     redis_cache: RedisCache = Depends(get_redis_cache),
 ):
@@ -636,17 +638,36 @@ async def get_cache_stats(
         - cache_efficiency: Hits, misses, hit ratio percentage
         - connections: Connected and blocked clients
         - performance: Operations per second, total commands
+        - layers: DataManager L1 (in-process) and L2 (Redis) hit ratios
     """
     logger.info("Cache stats requested via admin endpoint")
 
     try:
         stats = await redis_cache.get_cache_stats()
+        data_manager = getattr(request.app.state, "data_manager", None)
+        if data_manager is not None:
+            stats["layers"] = data_manager.cache_stats()
         return stats
     except Exception as e:
         logger.error("Failed to get cache stats", error=str(e))
         return {"status": "error", "message": str(e)}
 
 
+@router.get("/alpha-vantage/scheduler")
+async def get_alpha_vantage_scheduler_stats(_: None = Depends(require_admin)):
+    """
+    Get Alpha Vantage request scheduler metrics for this pod.
+
+    **Admin only**: Requires admin privileges.
+
+    Returns:
+        dict: Per API key scheduler: rate/burst, available tokens, queue depth
+        and wait times per priority (interactive/analysis/background),
+        throttle notices seen and remaining backoff pause
+    """
+    return {"schedulers": RequestScheduler.all_stats()}
+
+
 # =============================================================================
 # LLM/Agent Performance Metrics Endpoints
 # =============================================================================
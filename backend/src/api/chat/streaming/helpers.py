@@ -75,6 +75,23 @@ def create_chunk_event(content: str) -> str:
     return format_sse_event(chunk_data)
 
 
+def create_answer_event(content: str) -> str:
+    """
+    Create a formatted SSE event carrying the complete saved answer.
+
+    Sent after the chunks when the streamed text differs from the answer
+    that is persisted (text from turns that called tools); clients replace
+    the streamed text with it.
+
+    Args:
+        content: Final answer as saved in the chat
+
+    Returns:
+        SSE-formatted answer event string
+    """
+    return format_sse_event({"type": "answer", "content": content})
+
+
 def create_thinking_event(stage: str, chat_id: str | None = None) -> str:
     """
     Create a formatted SSE thinking event for eager streaming (Story 1.4).
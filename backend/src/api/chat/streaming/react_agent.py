@@ -9,11 +9,14 @@ Story 1.4: Streaming Latency Optimization
 - Added TTFT (Time-To-First-Token) tracking
 - Implemented eager streaming with "thinking" events
 - Added latency metrics for Langfuse observability
+
+LLM tokens are forwarded from FinancialAnalysisReActAgent.astream as they are
+generated, interleaved with tool events, so "first_chunk" is the real TTFT.
 """
 
 import asyncio
-import json
 from collections.abc import AsyncGenerator
+from typing import Any
 
 import structlog
 from fastapi.responses import StreamingResponse
@@ -22,11 +25,15 @@ from ....agent.callbacks.tool_execution_callback import ToolExecutionCallback
 from ....agent.langgraph_react_agent import FinancialAnalysisReActAgent
 from ....core.utils import extract_token_usage_from_agent_result
 from ....core.utils.date_utils import utcnow
-from ....core.utils.title_utils import extract_title_from_response
+from ....core.utils.title_utils import (
+    StreamingTitleFilter,
+    extract_title_from_response,
+)
 from ....database.repositories.message_repository import MessageRepository
 from ....services.chat_service import ChatService
 from ....services.context_window_manager import ContextWindowManager
 from ....services.credit_service import CreditService
+from ....services.market_data.scheduler import RequestPriority, with_priority
 from ...schemas.chat_models import ChatRequest
 from ..helpers import (
     compact_context_if_needed,
@@ -34,6 +41,7 @@ from ..helpers import (
     get_or_create_chat,
 )
 from .helpers import (
+    create_answer_event,
     create_chunk_event,
     create_done_event,
     create_error_event,
@@ -44,6 +52,9 @@ from .helpers import (
 
 logger = structlog.get_logger()
 
+# Pending tool/token events before the agent waits for the client to catch up
+EVENT_QUEUE_SIZE = 256
+
 
 async def stream_with_react_agent(
     request: ChatRequest,
@@ -71,7 +82,7 @@ async def stream_with_react_agent(
     async def generate_stream() -> AsyncGenerator[str, None]:
         chat_id = None
         transaction = None
-        tool_event_queue = None
+        agent_task: asyncio.Task[dict[str, Any] | None] | None = None
 
         # ===== TTFT TRACKING (Story 1.4) =====
         # Track request start time for latency metrics
@@ -220,123 +231,108 @@ async def stream_with_react_agent(
             # Update thinking stage: now reasoning/analyzing
             yield create_thinking_event("reasoning", chat_id)
 
-            # ===== TOOL EXECUTION CALLBACK SETUP =====
-            # Create event queue for real-time tool execution streaming
-            tool_event_queue = asyncio.Queue()
-            tool_callback = ToolExecutionCallback(tool_event_queue, request.language)
-            agent_task = None
-            stream_active = True
-
-            # Background task to continuously drain and stream tool events
-            async def stream_tool_events_background():
-                """Continuously drain tool event queue and yield SSE events in real-time"""
-                nonlocal stream_active, agent_task
-                MAX_QUEUE_SIZE = 100  # Circuit breaker threshold
-                while stream_active:
-                    try:
-                        # Circuit breaker: Check queue size to prevent overflow
-                        queue_size = tool_event_queue.qsize()
-                        if queue_size > MAX_QUEUE_SIZE:
-                            logger.error(
-                                "Event queue overflow - circuit breaker triggered",
-                                queue_size=queue_size,
-                                max_size=MAX_QUEUE_SIZE,
-                            )
-                            # Drain queue to prevent memory exhaustion
-                            while not tool_event_queue.empty():
-                                try:
-                                    tool_event_queue.get_nowait()
-                                except asyncio.QueueEmpty:
-                                    break
-                            stream_active = False
+            # ===== AGENT EVENT STREAMING =====
+            # Tool events (ToolExecutionCallback) and LLM tokens (agent.astream)
+            # share one bounded queue, so they reach the client in the order they
+            # happened. A slow client backs up the agent instead of the queue.
+            event_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+                maxsize=EVENT_QUEUE_SIZE
+            )
+            tool_callback = ToolExecutionCallback(event_queue, request.language)
+            # The LLM ends its answer with [chat_title: ...]; keep it off the wire
+            title_filter = StreamingTitleFilter()
+
+            async def run_agent() -> dict[str, Any] | None:
+                """Forward streamed tokens to the event queue; return the result."""
+                result = None
+                async for event in agent.astream(
+                    user_message=user_message_with_context,  # Use enriched message with symbol context
+                    conversation_history=conversation_history,
+                    debug=debug,
+                    additional_callbacks=[tool_callback],
+                    language=request.language,
+                ):
+                    if event["type"] == "token":
+                        await event_queue.put(event)
+                    else:
+                        result = event["result"]
+                return result
+
+            async def stream_agent_events(
+                task: asyncio.Task[dict[str, Any] | None],
+            ) -> AsyncGenerator[str, None]:
+                """Stream queued tool and token events until `task` finishes."""
+                nonlocal ttft_recorded, first_tool_recorded
+                while True:
+                    getter = asyncio.ensure_future(event_queue.get())
+                    await asyncio.wait(
+                        {getter, task}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not getter.done():
+                        getter.cancel()
+                        if event_queue.empty():
                             break
-
-                        # Use short timeout to check stream_active flag frequently
-                        event = await asyncio.wait_for(
-                            tool_event_queue.get(), timeout=0.1
-                        )
+                        continue
+                    event = getter.result()
+
+                    if event["type"] != "token":
+                        # Track first tool event (Story 1.4: TTFT optimization)
+                        if not first_tool_recorded:
+                            first_tool_recorded = True
+                            yield create_latency_event(
+                                "first_tool",
+                                get_elapsed_ms(),
+                                tool_name=event.get("tool_name"),
+                            )
                         # Stream tool event immediately to frontend
                         yield format_sse_event(event)
                         logger.debug(
                             "Tool event streamed in real-time",
                             event_type=event["type"],
-                            tool_name=event["tool_name"],
+                            tool_name=event.get("tool_name"),
                         )
-                    except TimeoutError:
-                        # No event available - check if agent completed
-                        if agent_task and agent_task.done():
-                            logger.info("Agent completed, stopping tool event stream")
-                            stream_active = False
-                            break
                         continue
-                    except Exception as e:
-                        logger.error(
-                            "Error streaming tool event", error=str(e), exc_info=True
-                        )
-                        break
 
-                # Final drain after agent completes
-                while not tool_event_queue.empty():
-                    try:
-                        event = tool_event_queue.get_nowait()
-                        yield format_sse_event(event)
-                        logger.debug("Tool event drained", event_type=event["type"])
-                    except asyncio.QueueEmpty:
-                        break
+                    text = title_filter.feed(event["content"])
+                    if not text:
+                        continue
+                    # Track TTFT (Time-To-First-Token) - Story 1.4
+                    if not ttft_recorded:
+                        ttft_recorded = True
+                        ttft_ms = get_elapsed_ms()
+                        yield create_latency_event("first_chunk", ttft_ms)
+                        logger.info(
+                            "TTFT recorded (Time-To-First-Token)",
+                            chat_id=chat_id,
+                            ttft_ms=ttft_ms,
+                        )
+                    yield create_chunk_event(text)
 
-            # Invoke ReAct agent with callback (auto-loop handles tool chaining)
+            # Run ReAct agent with callback (auto-loop handles tool chaining)
             try:
                 # Emit latency metric: agent starting
                 yield create_latency_event("agent_started", get_elapsed_ms())
 
-                # Create agent invocation task
                 agent_task = asyncio.create_task(
                     asyncio.wait_for(
-                        agent.ainvoke(
-                            user_message=user_message_with_context,  # Use enriched message with symbol context
-                            conversation_history=conversation_history,
-                            debug=debug,
-                            additional_callbacks=[tool_callback],
-                            language=request.language,
-                        ),
+                        # A user is waiting: data calls jump the vendor queue
+                        with_priority(RequestPriority.INTERACTIVE)(run_agent)(),
                         timeout=120.0,  # 2 minutes max for agent response
                     )
                 )
 
-                # Stream tool events concurrently while agent runs
-                # The generator will automatically stop when agent completes
                 logger.info(
-                    "Starting tool event streaming loop",
+                    "Starting agent event streaming loop",
                     elapsed_ms=get_elapsed_ms(),
                 )
-                async for tool_event in stream_tool_events_background():
-                    # Track first tool event (Story 1.4: TTFT optimization)
-                    # Note: tool_event is already an SSE-formatted string from format_sse_event()
-                    if not first_tool_recorded:
-                        first_tool_recorded = True
-                        # Extract tool_name from SSE string if possible
-                        tool_name = None
-                        if isinstance(tool_event, str) and tool_event.startswith(
-                            "data: "
-                        ):
-                            try:
-                                event_data = json.loads(tool_event[6:].strip())
-                                tool_name = event_data.get("tool_name")
-                            except (json.JSONDecodeError, AttributeError):
-                                pass
-                        elif isinstance(tool_event, dict):
-                            tool_name = tool_event.get("tool_name")
-                        yield create_latency_event(
-                            "first_tool",
-                            get_elapsed_ms(),
-                            tool_name=tool_name,
-                        )
-                    yield tool_event
+                async for sse_event in stream_agent_events(agent_task):
+                    yield sse_event
 
-                # Generator has exited, agent is done
-                logger.info("Tool event streaming completed")
+                logger.info("Agent event streaming completed")
                 result = await agent_task
                 logger.info("Agent result received", has_result=bool(result))
+                if result is None:
+                    raise RuntimeError("Agent stream ended without a result")
 
             except TimeoutError:
                 logger.error(
@@ -345,11 +341,6 @@ async def stream_with_react_agent(
                     user_id=user_id,
                     timeout_seconds=120,
                 )
-                # Drain any pending tool events before erroring
-                if tool_event_queue:
-                    async for tool_event in stream_tool_events_background():
-                        yield tool_event
-
                 # Fail transaction to release credits
                 if transaction:
                     await credit_service.fail_transaction(transaction.transaction_id)
@@ -366,11 +357,6 @@ async def stream_with_react_agent(
                     error=str(e),
                     exc_info=True,
                 )
-                # Drain any pending tool events before erroring
-                if tool_event_queue:
-                    async for tool_event in stream_tool_events_background():
-                        yield tool_event
-
                 # Fail transaction to release credits
                 if transaction:
                     await credit_service.fail_transaction(transaction.transaction_id)
@@ -386,8 +372,18 @@ async def stream_with_react_agent(
 
             # ===== EXTRACT LLM-GENERATED TITLE (Story 3.4) =====
             # LLM includes title at end of response: [chat_title: Title Here]
-            # Extract it and clean the response for display/storage
+            # The filter held it back while streaming. The stream also carries
+            # text from turns that called tools, so the stored answer is the
+            # final answer alone; an answer event below lets the client swap
+            # the streamed text for it. If the model produced no streamed
+            # text, the final answer is sent in one piece below.
+            pending_text = ""
+            if not title_filter.text:
+                pending_text = title_filter.feed(raw_answer)
+            _, streamed_answer, remainder = title_filter.finish()
+            pending_text += remainder
             llm_title, final_answer = extract_title_from_response(raw_answer)
+            final_answer = final_answer or ""
             logger.info(
                 "Extracted result fields",
                 answer_len=len(final_answer),
@@ -450,6 +446,15 @@ async def stream_with_react_agent(
                 )
                 return
 
+            # Release any text held back while checking for the title marker
+            if pending_text:
+                if not ttft_recorded:
+                    ttft_recorded = True
+                    yield create_latency_event("first_chunk", get_elapsed_ms())
+                yield create_chunk_event(pending_text)
+            if streamed_answer != final_answer:
+                yield create_answer_event(final_answer)
+
             # Send tool execution count (optional metadata)
             if tool_executions > 0:
                 tool_info = {
@@ -459,35 +464,10 @@ async def stream_with_react_agent(
                 }
                 yield format_sse_event(tool_info)
 
-            # Stream final answer in batches (10 chars at a time)
-            # Reduces SSE events by 90% while maintaining smooth UX
-            CHUNK_SIZE = 10
-            logger.info(
-                "Starting to stream final answer",
-                answer_length=len(final_answer),
-                chunk_size=CHUNK_SIZE,
-                chat_id=chat_id,
-                elapsed_ms=get_elapsed_ms(),
-            )
-            for i in range(0, len(final_answer), CHUNK_SIZE):
-                chunk_text = final_answer[i : i + CHUNK_SIZE]
-                # Track TTFT (Time-To-First-Token) - Story 1.4
-                if not ttft_recorded:
-                    ttft_recorded = True
-                    ttft_ms = get_elapsed_ms()
-                    yield create_latency_event("first_chunk", ttft_ms)
-                    logger.info(
-                        "TTFT recorded (Time-To-First-Token)",
-                        chat_id=chat_id,
-                        ttft_ms=ttft_ms,
-                        trace_id=trace_id,
-                    )
-                yield create_chunk_event(chunk_text)
-                await asyncio.sleep(0.03)  # Proportional delay (10 chars → 0.03s)
-
             logger.info(
                 "Finished streaming final answer",
                 chat_id=chat_id,
+                answer_length=len(final_answer),
                 elapsed_ms=get_elapsed_ms(),
             )
 
@@ -589,4 +569,10 @@ async def stream_with_react_agent(
 
             yield format_sse_event({"type": "error", "error": str(e)})
 
+        finally:
+            # Client went away mid-stream: stop the agent instead of leaving it
+            # blocked on a full event queue
+            if agent_task and not agent_task.done():
+                agent_task.cancel()
+
     return StreamingResponse(generate_stream(), media_type="text/event-stream")
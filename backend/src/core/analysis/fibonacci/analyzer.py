@@ -221,30 +221,17 @@ class FibonacciAnalyzer:
                 granularity=granularity,
             )
 
-            ohlcv_list = await self.data_manager.get_ohlcv(
+            bars = await self.data_manager.get_ohlcv(
                 symbol=self.symbol,
                 granularity=granularity,
                 outputsize="full",  # Need full data for trend detection
             )
 
-            if not ohlcv_list:
+            if not bars:
                 logger.error("No data returned from DataManager", symbol=self.symbol)
                 return pd.DataFrame()
 
-            # Convert OHLCVData list to DataFrame
-            data = pd.DataFrame(
-                [
-                    {
-                        "Open": d.open,
-                        "High": d.high,
-                        "Low": d.low,
-                        "Close": d.close,
-                        "Volume": d.volume,
-                    }
-                    for d in ohlcv_list
-                ],
-                index=pd.DatetimeIndex([d.date for d in ohlcv_list]),
-            )
+            data = bars.to_dataframe()
 
             # Sort by date ascending (oldest first) for trend detection
             data = data.sort_index()
@@ -3,13 +3,16 @@ Trend detection logic for Fibonacci analysis.
 Uses directional greedy accumulation to detect major trends with pullback tolerance.
 """
 
+from bisect import bisect_right
 from datetime import date
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import structlog
 
 from .config import TimeframeConfig
+from .trend_kernel import detect_directional_candidates
 
 logger = structlog.get_logger()
 
@@ -73,90 +76,45 @@ class TrendDetector:
         Key insight: In uptrends, both high AND low going up is EXPECTED.
         In downtrends, both high AND low going down is EXPECTED.
         Only break when pullbacks exceed tolerance.
-        """
-        trends = []
-
-        for i in range(len(data) - lookback - 1):
-            start_date = data.index[i].date()
-            start_close = data["Close"].iloc[i]
 
-            # Determine direction using lookback period
-            lookback_close = data["Close"].iloc[i + lookback]
-            close_change = lookback_close - start_close
-
-            if abs(close_change) < 0.01:  # Too flat, skip
-                continue
+        The accumulation itself runs in the vectorized kernel; this method only
+        materializes the resulting candidates as trend dicts.
+        """
+        candidates = detect_directional_candidates(
+            data["High"].to_numpy(dtype=np.float64),
+            data["Low"].to_numpy(dtype=np.float64),
+            data["Close"].to_numpy(dtype=np.float64),
+            tolerance_pct,
+            min_magnitude,
+            lookback,
+        )
+        if len(candidates) == 0:
+            return []
 
-            is_uptrend = close_change > 0
-
-            # Track extremes during lookback
-            lookback_high = data["High"].iloc[i : i + lookback + 1].max()
-            lookback_low = data["Low"].iloc[i : i + lookback + 1].min()
-
-            # Continue accumulating from lookback point
-            highest_high = lookback_high
-            lowest_low = lookback_low
-            current_high = data["High"].iloc[i + lookback]
-            current_low = data["Low"].iloc[i + lookback]
-            end_index = i + lookback
-
-            # Greedy accumulation with directional tolerance
-            for j in range(i + lookback + 1, len(data)):
-                next_high = data["High"].iloc[j]
-                next_low = data["Low"].iloc[j]
-
-                # Calculate thresholds based on current prices
-                high_threshold = current_high * tolerance_pct
-                low_threshold = current_low * tolerance_pct
-
-                if is_uptrend:
-                    # In uptrend: Allow high/low to go up (expected) or small pullback
-                    high_change = next_high - current_high
-                    low_change = next_low - current_low
-
-                    high_ok = (high_change >= 0) or (abs(high_change) <= high_threshold)
-                    low_ok = (low_change >= 0) or (abs(low_change) <= low_threshold)
-
-                    if not (high_ok and low_ok):
-                        break  # Pullback too large
-
-                else:  # Downtrend
-                    # In downtrend: Allow high/low to go down (expected) or small pullback
-                    high_change = next_high - current_high
-                    low_change = next_low - current_low
-
-                    low_ok = (low_change <= 0) or (abs(low_change) <= low_threshold)
-                    high_ok = (high_change <= 0) or (abs(high_change) <= high_threshold)
-
-                    if not (high_ok and low_ok):
-                        break  # Pullback too large
-
-                # Continue - update tracking
-                end_index = j
-                current_high = next_high
-                current_low = next_low
-
-                if next_high > highest_high:
-                    highest_high = next_high
-                if next_low < lowest_low:
-                    lowest_low = next_low
-
-            # Save if meets minimum requirements
-            total_magnitude = highest_high - lowest_low
-            if end_index - i >= 3 and total_magnitude >= min_magnitude:
-                trend_type = "Uptrend" if is_uptrend else "Downtrend"
-                trends.append(
-                    {
-                        "Trend Type": trend_type,
-                        "Start Date": start_date,
-                        "End Date": data.index[end_index].date(),
-                        "Absolute High": float(highest_high),
-                        "Absolute Low": float(lowest_low),
-                        "Magnitude": float(total_magnitude),
-                    }
-                )
-
-        return trends
+        index = data.index
+        start_dates = [ts.date() for ts in index[candidates.start_index]]
+        end_dates = [ts.date() for ts in index[candidates.end_index]]
+        magnitudes = candidates.magnitude.tolist()
+
+        return [
+            {
+                "Trend Type": "Uptrend" if is_up else "Downtrend",
+                "Start Date": start_date,
+                "End Date": end_date,
+                "Absolute High": high,
+                "Absolute Low": low,
+                "Magnitude": magnitude,
+            }
+            for is_up, start_date, end_date, high, low, magnitude in zip(
+                candidates.is_uptrend.tolist(),
+                start_dates,
+                end_dates,
+                candidates.highest_high.tolist(),
+                candidates.lowest_low.tolist(),
+                magnitudes,
+                strict=True,
+            )
+        ]
 
     def _remove_overlapping_trends(
         self, trends: list[dict[str, Any]]
@@ -168,28 +126,40 @@ class TrendDetector:
         # Sort by magnitude (descending) to prioritize larger trends
         trends_sorted = sorted(trends, key=lambda x: x["Magnitude"], reverse=True)
         unique_trends: list[dict[str, Any]] = []
+        accepted = _DisjointDateRanges()
 
         for current_trend in trends_sorted:
-            is_overlapping = False
-
-            for existing_trend in unique_trends:
-                # Check for date overlap
-                if self._dates_overlap(
-                    current_trend["Start Date"],
-                    current_trend["End Date"],
-                    existing_trend["Start Date"],
-                    existing_trend["End Date"],
-                ):
-                    is_overlapping = True
-                    break
-
-            if not is_overlapping:
-                unique_trends.append(current_trend)
+            start, end = current_trend["Start Date"], current_trend["End Date"]
+            if accepted.overlaps(start, end):
+                continue
+
+            accepted.add(start, end)
+            unique_trends.append(current_trend)
 
         return unique_trends
 
-    def _dates_overlap(
-        self, start1: date, end1: date, start2: date, end2: date
-    ) -> bool:
-        """Check if two date ranges overlap."""
-        return not (end1 < start2 or end2 < start1)
+
+class _DisjointDateRanges:
+    """
+    Sorted set of pairwise non-overlapping date ranges.
+
+    Accepted trends never overlap each other, so ordering them by start date
+    also orders them by end date. A candidate can then only collide with the
+    accepted range that starts last on or before the candidate's end, which
+    bisect finds in O(log n) instead of scanning every accepted trend.
+    """
+
+    def __init__(self) -> None:
+        self.starts: list[date] = []
+        self.ends: list[date] = []
+
+    def overlaps(self, start: date, end: date) -> bool:
+        """Check whether [start, end] intersects any stored range."""
+        position = bisect_right(self.starts, end) - 1
+        return position >= 0 and self.ends[position] >= start
+
+    def add(self, start: date, end: date) -> None:
+        """Insert a range known not to overlap any stored range."""
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
@@ -0,0 +1,161 @@
+"""
+Vectorized kernel for directional greedy trend accumulation.
+Computes every candidate trend in O(n log n) NumPy operations instead of a nested per-bar loop.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.intp]
+BoolArray = npt.NDArray[np.bool_]
+
+
+@dataclass
+class TrendCandidates:
+    """Column-oriented candidate trends, one row per accepted start bar."""
+
+    start_index: IntArray
+    end_index: IntArray
+    is_uptrend: BoolArray
+    highest_high: FloatArray
+    lowest_low: FloatArray
+
+    @property
+    def magnitude(self) -> FloatArray:
+        """Total high-to-low range of each candidate."""
+        result: FloatArray = self.highest_high - self.lowest_low
+        return result
+
+    def __len__(self) -> int:
+        return int(self.start_index.size)
+
+
+def detect_directional_candidates(
+    high: FloatArray,
+    low: FloatArray,
+    close: FloatArray,
+    tolerance_pct: float,
+    min_magnitude: float,
+    lookback: int,
+) -> TrendCandidates:
+    """
+    Find all trends produced by directional greedy accumulation.
+
+    The greedy loop only ever compares bar j with bar j-1, so whether a step
+    continues an up- or downtrend is independent of where the trend started.
+    That lets us precompute "next break" positions for both directions with
+    a reverse scan and resolve each start's extremes with range queries.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        tolerance_pct: Allowed pullback as a fraction of the previous bar
+        min_magnitude: Minimum highest-high minus lowest-low to keep a trend
+        lookback: Bars used to determine the trend direction
+
+    Returns:
+        TrendCandidates in ascending start order
+    """
+    n = int(close.size)
+    num_starts = n - lookback - 1
+    if num_starts <= 0:
+        return _empty_candidates()
+
+    starts = np.arange(num_starts, dtype=np.intp)
+    close_change = close[starts + lookback] - close[starts]
+
+    # NaN changes are neither flat nor rising, matching the scalar comparisons
+    keep = ~(np.abs(close_change) < 0.01)
+    starts = starts[keep]
+    is_uptrend = close_change[keep] > 0
+
+    end_up, end_down = _trend_end_indices(high, low, tolerance_pct, n)
+    first_step = starts + lookback + 1
+    end_index = np.where(is_uptrend, end_up[first_step], end_down[first_step])
+
+    highest_high = _RangeExtremes(high, np.fmax).query(starts, end_index)
+    lowest_low = _RangeExtremes(low, np.fmin).query(starts, end_index)
+
+    with np.errstate(invalid="ignore"):
+        valid = (end_index - starts >= 3) & (highest_high - lowest_low >= min_magnitude)
+
+    return TrendCandidates(
+        start_index=starts[valid],
+        end_index=end_index[valid],
+        is_uptrend=is_uptrend[valid],
+        highest_high=highest_high[valid],
+        lowest_low=lowest_low[valid],
+    )
+
+
+def _trend_end_indices(
+    high: FloatArray, low: FloatArray, tolerance_pct: float, n: int
+) -> tuple[IntArray, IntArray]:
+    """
+    Return, for every first accumulation step k, the last bar reached.
+
+    end[k] is one less than the first index j >= k whose move from j-1
+    exceeds the pullback tolerance (or n - 1 if the trend never breaks).
+    """
+    prev_high, next_high = high[:-1], high[1:]
+    prev_low, next_low = low[:-1], low[1:]
+    high_change = next_high - prev_high
+    low_change = next_low - prev_low
+    high_within = np.abs(high_change) <= prev_high * tolerance_pct
+    low_within = np.abs(low_change) <= prev_low * tolerance_pct
+
+    up_ok = ((high_change >= 0) | high_within) & ((low_change >= 0) | low_within)
+    down_ok = ((high_change <= 0) | high_within) & ((low_change <= 0) | low_within)
+
+    return _next_break(~up_ok, n) - 1, _next_break(~down_ok, n) - 1
+
+
+def _next_break(breaks: BoolArray, n: int) -> IntArray:
+    """Map each bar index to the first breaking index at or after it (n if none)."""
+    positions = np.full(n + 1, n, dtype=np.intp)
+    # breaks[j - 1] describes the step into bar j
+    positions[1:n] = np.where(breaks, np.arange(1, n, dtype=np.intp), n)
+    result: IntArray = np.minimum.accumulate(positions[::-1])[::-1]
+    return result
+
+
+class _RangeExtremes:
+    """Sparse table answering inclusive range max/min queries in O(1)."""
+
+    def __init__(self, values: FloatArray, reducer: np.ufunc) -> None:
+        self.reducer = reducer
+        self.levels: list[FloatArray] = [values]
+        width = 1
+        while width * 2 <= values.size:
+            previous = self.levels[-1]
+            self.levels.append(reducer(previous[:-width], previous[width:]))
+            width *= 2
+
+    def query(self, left: IntArray, right: IntArray) -> FloatArray:
+        """Reduce values[left[k] : right[k] + 1] for every k."""
+        if left.size == 0:
+            return np.empty(0, dtype=np.float64)
+        span = right - left + 1
+        level = np.floor(np.log2(span)).astype(np.intp)
+        out = np.empty(left.size, dtype=np.float64)
+        for k in np.unique(level):
+            mask = level == k
+            table = self.levels[k]
+            out[mask] = self.reducer(
+                table[left[mask]], table[right[mask] - (1 << int(k)) + 1]
+            )
+        return out
+
+
+def _empty_candidates() -> TrendCandidates:
+    return TrendCandidates(
+        start_index=np.empty(0, dtype=np.intp),
+        end_index=np.empty(0, dtype=np.intp),
+        is_uptrend=np.empty(0, dtype=np.bool_),
+        highest_high=np.empty(0, dtype=np.float64),
+        lowest_low=np.empty(0, dtype=np.float64),
+    )
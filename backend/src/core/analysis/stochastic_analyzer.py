@@ -159,15 +159,7 @@ class StochasticAnalyzer:
         - Daily+: Standard TTL (1-4 hours)
         """
         try:
-
-            # Map timeframe to DataManager granularity
-            granularity_map = {
-                "1h": "60min",
-                "1d": "daily",
-                "1w": "weekly",
-                "1M": "monthly",
-            }
-            granularity = granularity_map.get(self.timeframe, "daily")
+            granularity = self._granularity()
 
             logger.info(
                 "Fetching OHLCV via DataManager",
@@ -175,30 +167,17 @@ class StochasticAnalyzer:
                 granularity=granularity,
             )
 
-            ohlcv_list = await self.data_manager.get_ohlcv(
+            bars = await self.data_manager.get_ohlcv(
                 symbol=self.symbol,
                 granularity=granularity,
                 outputsize="compact",  # 6 months is sufficient for stochastic
             )
 
-            if not ohlcv_list:
+            if not bars:
                 logger.error("No data returned from DataManager", symbol=self.symbol)
                 return pd.DataFrame()
 
-            # Convert OHLCVData list to DataFrame
-            data = pd.DataFrame(
-                [
-                    {
-                        "Open": d.open,
-                        "High": d.high,
-                        "Low": d.low,
-                        "Close": d.close,
-                        "Volume": d.volume,
-                    }
-                    for d in ohlcv_list
-                ],
-                index=pd.DatetimeIndex([d.date for d in ohlcv_list]),
-            )
+            data = bars.to_dataframe()
 
             # Sort by date ascending (oldest first) for stochastic calculation
             data = data.sort_index()
@@ -228,6 +207,16 @@ class StochasticAnalyzer:
             logger.error("Failed to fetch stock data", symbol=self.symbol, error=str(e))
             raise
 
+    def _granularity(self) -> str:
+        """Map the analysis timeframe to a DataManager granularity."""
+        granularity_map = {
+            "1h": "60min",
+            "1d": "daily",
+            "1w": "weekly",
+            "1M": "monthly",
+        }
+        return granularity_map.get(self.timeframe, "daily")
+
     def _calculate_stochastic(
         self,
         data: pd.DataFrame,
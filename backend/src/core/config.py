@@ -60,6 +60,12 @@ class Settings(BaseSettings):
     # LLM Configuration
     default_llm_model: str = "qwen-plus-latest"  # Default model for agents
     default_llm_temperature: float = 0.7  # Default temperature for LLM calls
+    agent_tool_concurrency: int = 4  # Tool calls of one ReAct step run at once
+
+    # ReAct agent checkpointer: threads kept in-process with LRU/TTL eviction
+    agent_checkpoint_max_threads: int = 1000
+    agent_checkpoint_ttl_seconds: int = 3600  # Idle time before a thread expires
+    agent_checkpoint_max_mb: int = 64
 
     # Context Window Management (Portfolio Agent History)
     llm_context_limits: dict[str, int] = {
@@ -79,10 +85,13 @@ class Settings(BaseSettings):
 
     # External APIs - Market Data & Trading
     alpha_vantage_api_key: str = ""  # Alpha Vantage API key (premium: 75 calls/min)
+    alpha_vantage_requests_per_minute: int = 75  # Shared scheduler rate (plan limit)
+    alpha_vantage_burst: int = 5  # Requests allowed back-to-back before pacing
     fred_api_key: str = ""  # FRED API key (free, for liquidity metrics)
     alpaca_api_key: str = ""  # Alpaca Paper Trading API key
     alpaca_secret_key: str = ""  # Alpaca Paper Trading secret key
     alpaca_base_url: str = "https://paper-api.alpaca.markets"  # Paper trading endpoint
+    alpaca_max_workers: int = 8  # Threads for blocking alpaca-py calls (shared)
     polygon_api_key: str = ""  # Polygon.io API key for extended hours data
 
     # Email configuration (Tencent Cloud SES)
@@ -121,6 +130,16 @@ class Settings(BaseSettings):
         86400  # AI insights (24 hours - synced with daily CronJob)
     )
 
+    # In-process L1 cache in front of Redis for DataManager reads
+    l1_cache_enabled: bool = True
+    l1_cache_max_entries: int = 2048
+    l1_cache_max_mb: int = 64
+
+    # On-disk daily bar history for DataManager (full history is extended with
+    # compact fetches instead of re-downloaded); local to each pod
+    bar_store_enabled: bool = False
+    bar_store_dir: str = "/tmp/financial-agent/bars"
+
     # Alpha Vantage Fundamentals Tool Limits
     fundamentals_max_quarterly_periods: int = (
         20  # Max quarterly periods for cash flow/balance sheet
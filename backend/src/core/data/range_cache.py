@@ -0,0 +1,191 @@
+"""
+Range-indexed bar cache for TickerDataService.
+
+Exact `(symbol, start, end, interval)` cache keys can't serve a request for a
+sub-range or an overlapping range of something already fetched. A RangeEntry
+keeps all bars fetched for one symbol/interval plus the date segments they
+cover, so a request is answered by slicing cached bars and fetching only the
+missing sub-ranges.
+
+Coverage is tracked by calendar date (inclusive YYYY-MM-DD segments), not by
+bar timestamps: weekends and holidays inside a covered segment simply have no
+bars.
+
+Entries are stored with the Data Manager's columnar codec (raw NumPy column
+buffers), so a symbol's history decodes without parsing JSON numbers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from ...services.data_manager import codec
+
+# Inclusive (start, end) dates as YYYY-MM-DD
+Segment = tuple[str, str]
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _day(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _shift(value: str, days: int) -> str:
+    return (_day(value) + timedelta(days=days)).isoformat()
+
+
+def merge_segments(segments: Iterable[Segment]) -> list[Segment]:
+    """Sort segments and merge overlapping or adjacent ones."""
+    merged: list[Segment] = []
+    for start, end in sorted(segments):
+        if merged and start <= _shift(merged[-1][1], 1):
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(segments: Iterable[Segment], start: str, end: str) -> list[Segment]:
+    """Sub-ranges of [start, end] not covered by `segments`."""
+    gaps: list[Segment] = []
+    cursor = start
+    for seg_start, seg_end in merge_segments(segments):
+        if seg_end < cursor:
+            continue
+        if seg_start > end:
+            break
+        if seg_start > cursor:
+            gaps.append((cursor, _shift(seg_start, -1)))
+        cursor = _shift(seg_end, 1)
+        if cursor > end:
+            return gaps
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def _utc_index(df: pd.DataFrame) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(df.index)
+    return index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+
+
+def slice_dates(df: pd.DataFrame, start: str, end: str) -> pd.DataFrame:
+    """Rows with timestamps on dates [start, end] (UTC, as Alpaca is queried)."""
+    if df.empty:
+        return df
+    index = _utc_index(df)
+    lower = pd.Timestamp(start, tz="UTC")
+    upper = pd.Timestamp(_shift(end, 1), tz="UTC")
+    return df[(index >= lower) & (index < upper)]
+
+
+def combine_frames(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate bar frames, keeping the latest copy of duplicate timestamps."""
+    parts = [f for f in frames if not f.empty]
+    if not parts:
+        return pd.DataFrame()
+    if len(parts) == 1:
+        return parts[0].sort_index()
+    df = pd.concat(parts)
+    df = df[~df.index.duplicated(keep="last")]
+    return df.sort_index()
+
+
+@dataclass
+class RangeCacheStats:
+    """Outcome counters for range lookups."""
+
+    hits: int = 0  # Served entirely from cached bars
+    partial: int = 0  # Some cached, gaps fetched
+    misses: int = 0  # Nothing cached for the range
+    fetches: int = 0  # Upstream calls for gaps
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.partial + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "partial": self.partial,
+            "misses": self.misses,
+            "fetches": self.fetches,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass
+class RangeEntry:
+    """Bars for one symbol/interval and the date segments they cover."""
+
+    segments: list[Segment] = field(default_factory=list)
+    frame: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    def missing(self, start: str, end: str) -> list[Segment]:
+        """Sub-ranges of [start, end] that must be fetched."""
+        return missing_ranges(self.segments, start, end)
+
+    def slice(self, start: str, end: str) -> pd.DataFrame:
+        """Cached bars on dates [start, end]."""
+        return slice_dates(self.frame, start, end)
+
+    def add(self, start: str, end: str, df: pd.DataFrame) -> None:
+        """Record [start, end] as covered by `df` (which may be empty)."""
+        self.frame = combine_frames([self.frame, slice_dates(df, start, end)])
+        self.segments = merge_segments([*self.segments, (start, end)])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a flat columnar dictionary (one array per column)."""
+        index = pd.DatetimeIndex(self.frame.index)
+        data: dict[str, Any] = {
+            "segments": [list(s) for s in self.segments],
+            "tz": str(index.tz) if index.tz is not None else None,
+        }
+        if len(self.frame):
+            # Epoch nanoseconds (UTC for tz-aware indexes)
+            data["index"] = index.as_unit("ns").asi8
+            for column in OHLCV_COLUMNS:
+                if column in self.frame.columns:
+                    data[column] = self.frame[column].to_numpy()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RangeEntry:
+        """Create from a columnar dictionary."""
+        columns = data.get("columns")  # JSON entries nest columns
+        if not isinstance(columns, dict):
+            columns = {c: data[c] for c in OHLCV_COLUMNS if c in data}
+        frame = pd.DataFrame(columns)
+        if len(frame):
+            nanos = np.asarray(data["index"], dtype=np.int64)
+            index = pd.DatetimeIndex(nanos.view("datetime64[ns]"))
+            tz = data.get("tz")
+            frame.index = index.tz_localize("UTC").tz_convert(tz) if tz else index
+        return cls(
+            segments=[(s, e) for s, e in data.get("segments", [])],
+            frame=frame,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Encode for Redis with the columnar cache codec."""
+        return codec.COLUMNAR.encode(self.to_dict())
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> RangeEntry:
+        """
+        Decode an entry written by `to_bytes` (or a legacy JSON entry).
+
+        Raises:
+            codec.CodecError: If the payload is corrupt
+        """
+        return cls.from_dict(codec.decode(payload))
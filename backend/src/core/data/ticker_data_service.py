@@ -9,13 +9,18 @@ MIGRATION: Replaced yfinance with Alpaca for FREE paper trading data.
 
 from __future__ import annotations
 
+import asyncio
+from datetime import date, timedelta
+
 import pandas as pd
 import structlog
 
 from ...database.redis import RedisCache
 from ...services.alpaca_data_service import AlpacaDataService
 from ...services.alphavantage_market_data import AlphaVantageMarketDataService
+from ...services.data_manager.codec import CodecError
 from ..utils.date_utils import DateUtils
+from .range_cache import RangeCacheStats, RangeEntry, combine_frames
 
 logger = structlog.get_logger()
 
@@ -28,8 +33,20 @@ class TickerDataService:
     to prevent redundant API calls across analyzers.
 
     MIGRATION: Now uses Alpaca instead of yfinance for FREE real-time data.
+
+    Besides exact-request keys, bars are kept per symbol/interval with the
+    date segments they cover (see range_cache.py), so overlapping or nested
+    ranges are sliced from cache and only the missing sub-ranges are fetched.
     """
 
+    # Range entries larger than this are not written back (bars are still
+    # returned); keeps one symbol's history from growing a Redis value without
+    # bound. Intraday entries are decoded on every chart request, so they are
+    # capped lower (~3 weeks of extended-hours minute bars)
+    MAX_RANGE_ROWS = 100_000
+    MAX_INTRADAY_RANGE_ROWS = 20_000
+    DAILY_OR_LONGER_INTERVALS = frozenset({"1d", "1wk", "1mo"})
+
     def __init__(
         self,
         redis_cache: RedisCache,
@@ -48,6 +65,7 @@ class TickerDataService:
         self.alpaca_data_service = alpaca_data_service
         self.alpha_vantage_service = alpha_vantage_service
         self.default_ttl = 1800  # 30 minutes default TTL
+        self.range_stats = RangeCacheStats()
 
     async def get_ticker_history(
         self,
@@ -116,10 +134,15 @@ class TickerDataService:
 
         logger.info("Cache miss", cache_key=cache_key)
 
-        # Fetch from Alpaca
-        df = await self._fetch_from_alpaca(
-            symbol, interval, normalized_start, normalized_end
-        )
+        # Fetch from Alpaca, reusing any cached bars of overlapping ranges
+        if self.alpaca_data_service:
+            df = await self._get_from_ranges(
+                symbol, interval, normalized_start, normalized_end
+            )
+        else:
+            df = await self._fetch_from_alpaca(
+                symbol, interval, normalized_start, normalized_end
+            )
 
         # Cache the result if non-empty
         if not df.empty:
@@ -135,6 +158,98 @@ class TickerDataService:
 
         return df
 
+    async def _get_from_ranges(
+        self, symbol: str, interval: str, start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """
+        Serve [start_date, end_date] from the symbol's range entry, fetching
+        only uncovered sub-ranges (concurrently) and recording them.
+
+        Today's bars are still forming, so today is fetched but never marked
+        as covered. A gap whose fetch failed is not recorded either; an empty
+        result for settled days (e.g. a market holiday) is.
+        """
+        range_key = self._generate_range_key(symbol, interval)
+        entry = await self._load_range_entry(range_key)
+
+        gaps = entry.missing(start_date, end_date)
+        if not gaps:
+            self.range_stats.hits += 1
+            logger.info("Range cache hit", range_key=range_key)
+            return entry.slice(start_date, end_date)
+
+        if len(gaps) == 1 and gaps[0] == (start_date, end_date):
+            self.range_stats.misses += 1
+        else:
+            self.range_stats.partial += 1
+        self.range_stats.fetches += len(gaps)
+        logger.info(
+            "Range cache fetching gaps",
+            range_key=range_key,
+            gaps=[f"{s}..{e}" for s, e in gaps],
+        )
+
+        cached_part = entry.slice(start_date, end_date)
+        results = await asyncio.gather(
+            *(self._fetch_gap(symbol, interval, s, e) for s, e in gaps),
+            return_exceptions=True,
+        )
+
+        last_settled = (date.today() - timedelta(days=1)).isoformat()
+        frames: list[pd.DataFrame] = []
+        updated = False
+        for (gap_start, gap_end), result in zip(gaps, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Range gap fetch failed",
+                    range_key=range_key,
+                    gap=f"{gap_start}..{gap_end}",
+                    error=str(result),
+                )
+                continue
+            frames.append(result)
+            gap_end = min(gap_end, last_settled)
+            if gap_start <= gap_end:
+                entry.add(gap_start, gap_end, result)
+                updated = True
+
+        if updated and len(entry.frame) <= self._max_range_rows(interval):
+            ttl = self._calculate_ttl(interval, start_date, last_settled)
+            await self.redis_cache.set_raw(range_key, entry.to_bytes(), ttl_seconds=ttl)
+
+        return combine_frames([cached_part, *frames])
+
+    async def _fetch_gap(
+        self, symbol: str, interval: str, start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        """Fetch one uncovered sub-range from Alpaca; raises if the request fails."""
+        if not self.alpaca_data_service:
+            raise RuntimeError("Alpaca data service not configured")
+        return await self.alpaca_data_service.get_bars(
+            symbol=symbol,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date,
+            raise_errors=True,
+        )
+
+    async def _load_range_entry(self, range_key: str) -> RangeEntry:
+        """Read a range entry from Redis (empty if missing or unreadable)."""
+        payload = await self.redis_cache.get_raw(range_key)
+        if not payload:
+            return RangeEntry()
+        try:
+            return RangeEntry.from_bytes(payload)
+        except CodecError as e:
+            logger.warning("Range entry unreadable", range_key=range_key, error=str(e))
+            return RangeEntry()
+
+    def _max_range_rows(self, interval: str) -> int:
+        """Row cap for writing back a range entry of this interval."""
+        if interval in self.DAILY_OR_LONGER_INTERVALS:
+            return self.MAX_RANGE_ROWS
+        return self.MAX_INTRADAY_RANGE_ROWS
+
     async def get_current_price(self, symbol: str) -> float | None:
         """
         Get current/latest price for a symbol using Alpaca.
@@ -189,6 +304,53 @@ class TickerDataService:
             )
             return None
 
+    async def get_current_prices(self, symbols: list[str]) -> dict[str, float | None]:
+        """
+        Get current prices for several symbols.
+
+        Same 30-second cache as `get_current_price`; all cache misses are
+        fetched with a single multi-symbol Alpaca quote request.
+
+        Args:
+            symbols: Stock symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            Dict mapping each symbol to its price, or None if unavailable
+        """
+        symbols = list(dict.fromkeys(symbols))
+        cached = await asyncio.gather(
+            *(self.redis_cache.get(f"current_price:{s}") for s in symbols)
+        )
+        prices: dict[str, float | None] = {
+            symbol: float(value) if value is not None else None
+            for symbol, value in zip(symbols, cached, strict=True)
+        }
+        misses = [symbol for symbol, price in prices.items() if price is None]
+        if not misses or not self.alpaca_data_service:
+            return prices
+
+        logger.info("Fetching current prices from Alpaca", symbols=misses)
+        try:
+            fetched = await self.alpaca_data_service.get_latest_prices(misses)
+        except Exception as e:
+            logger.error(
+                "Error fetching current prices",
+                symbols=misses,
+                error=str(e),
+                exc_info=True,
+            )
+            return prices
+
+        valid = {s: p for s, p in fetched.items() if p and p > 0}
+        prices.update(valid)
+        await asyncio.gather(
+            *(
+                self.redis_cache.set(f"current_price:{s}", p, ttl_seconds=30)
+                for s, p in valid.items()
+            )
+        )
+        return prices
+
     def _validate_parameters(
         self, period: str | None, start_date: str | None, end_date: str | None
     ) -> None:
@@ -246,6 +408,15 @@ class TickerDataService:
         normalized_symbol = symbol.upper().strip()
         return f"ticker_data:{normalized_symbol}:{start_date}:{end_date}:{interval}"
 
+    def _generate_range_key(self, symbol: str, interval: str) -> str:
+        """
+        Generate the range-entry cache key for a symbol/interval.
+
+        Returns:
+            Cache key like 'ticker_range:AAPL:1d'
+        """
+        return f"ticker_range:{symbol.upper().strip()}:{interval}"
+
     def _calculate_ttl(self, interval: str, start_date: str, end_date: str) -> int:
         """
         Calculate appropriate TTL based on data characteristics.
@@ -14,6 +14,7 @@ from .date_utils import (
     utcnow,
 )
 from .token_utils import (
+    extract_token_usage_details_from_messages,
     extract_token_usage_from_agent_result,
     extract_token_usage_from_messages,
 )
@@ -42,6 +43,7 @@ __all__ = [
     "ALPACA_PAPER_TRADING_CALL_COST",
     # Token utilities
     "extract_token_usage_from_messages",
+    "extract_token_usage_details_from_messages",
     "extract_token_usage_from_agent_result",
     # Date utilities (replacements for deprecated datetime methods)
     "utcnow",
@@ -330,3 +330,70 @@ def extract_title_from_response(response: str | None) -> tuple[str | None, str |
 
     logger.debug("No LLM-generated title found in response")
     return None, response
+
+
+# Opening of the title marker, lowercased: "[chat_title:"
+_TITLE_MARKER_OPEN = "[chat_title:"
+
+
+class StreamingTitleFilter:
+    """
+    Strip the trailing [chat_title: ...] marker from a streamed response.
+
+    Text is fed in as the LLM produces it. Anything that could still turn
+    out to be the title marker (an opening "[chat_title:" or a trailing
+    prefix of it, plus trailing whitespace) is held back; everything else
+    is released immediately. finish() extracts the title from the full
+    text and returns the held-back remainder.
+
+    Example:
+        >>> f = StreamingTitleFilter()
+        >>> f.feed("AAPL looks strong.\\n[chat_")
+        'AAPL looks strong.'
+        >>> f.feed("title: AAPL Outlook]")
+        ''
+        >>> f.finish()
+        ('AAPL Outlook', 'AAPL looks strong.', '')
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._released = 0
+
+    def feed(self, delta: str) -> str:
+        """Add streamed text; return the part that is safe to show now."""
+        self.text += delta
+        end = max(self._safe_end(), self._released)
+        released = self.text[self._released : end]
+        self._released = end
+        return released
+
+    def finish(self) -> tuple[str | None, str, str]:
+        """
+        Finish the stream.
+
+        Returns:
+            Tuple of (title, cleaned_response, remainder) where remainder is
+            the not-yet-released part of cleaned_response
+        """
+        title, cleaned = extract_title_from_response(self.text)
+        cleaned = cleaned or ""
+        remainder = cleaned[self._released :]
+        self._released = len(self.text)
+        return title, cleaned, remainder
+
+    def _safe_end(self) -> int:
+        """Index up to which the text cannot be part of the title marker."""
+        lowered = self.text.lower()
+        end = len(self.text)
+
+        marker = lowered.find(_TITLE_MARKER_OPEN, self._released)
+        if marker != -1:
+            end = marker
+        else:
+            bracket = lowered.rfind("[", self._released)
+            if bracket != -1 and _TITLE_MARKER_OPEN.startswith(lowered[bracket:]):
+                end = bracket
+
+        # Whitespace before the marker is trimmed from the cleaned response
+        return len(self.text[:end].rstrip())
@@ -4,42 +4,84 @@ Token usage extraction utilities for LangChain messages.
 Handles multiple message formats from different LLM providers (DashScope, OpenAI, etc.).
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 
-def extract_token_usage_from_messages(messages: list[Any]) -> tuple[int, int, int]:
+def _usage_value(usage: Any, key: str) -> Any:
+    """Read a usage field from a dict (LangChain UsageMetadata) or an object."""
+    if isinstance(usage, Mapping):
+        return usage.get(key)
+    return getattr(usage, key, None)
+
+
+def _token_count(usage: Any, *keys: str) -> int:
+    """First integer count found under `keys` (0 if none)."""
+    for key in keys:
+        value = _usage_value(usage, key)
+        if isinstance(value, int) and value:
+            return value
+    return 0
+
+
+def _cached_input_tokens(usage: Any) -> int:
     """
-    Extract total token usage from LangChain messages.
+    Input tokens served from the provider's prompt prefix cache.
 
-    Supports multiple metadata formats:
-    - usage_metadata (newer LangChain format)
-    - response_metadata.token_usage (DashScope/Tongyi format)
-    - response_metadata.usage (OpenAI format)
+    - usage_metadata.input_token_details.cache_read (LangChain)
+    - prompt_tokens_details.cached_tokens (DashScope/OpenAI)
+    - cache_read_input_tokens (Anthropic)
+    """
+    for details_key, count_key in (
+        ("input_token_details", "cache_read"),
+        ("prompt_tokens_details", "cached_tokens"),
+    ):
+        details = _usage_value(usage, details_key)
+        if details:
+            cached = _token_count(details, count_key)
+            if cached:
+                return cached
+    return _token_count(usage, "cache_read_input_tokens")
+
+
+def extract_token_usage_details_from_messages(messages: list[Any]) -> dict[str, int]:
+    """
+    Extract total token usage, including prefix cache hits, from LangChain messages.
+
+    Supports the same metadata formats as extract_token_usage_from_messages.
+    `cached_input_tokens` is the part of `input_tokens` the provider served
+    from its prompt prefix cache.
 
     Args:
         messages: List of LangChain message objects (AIMessage, HumanMessage, etc.)
 
     Returns:
-        Tuple of (input_tokens, output_tokens, total_tokens)
+        Dictionary with keys: input_tokens, output_tokens, total_tokens,
+        cached_input_tokens
 
     Example:
         >>> from langchain_core.messages import AIMessage
-        >>> messages = [AIMessage(content="Hello", usage_metadata={"input_tokens": 10, "output_tokens": 5})]
-        >>> extract_token_usage_from_messages(messages)
-        (10, 5, 15)
+        >>> usage = {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15,
+        ...          "input_token_details": {"cache_read": 8}}
+        >>> extract_token_usage_details_from_messages(
+        ...     [AIMessage(content="Hello", usage_metadata=usage)]
+        ... )
+        {'input_tokens': 10, 'output_tokens': 5, 'total_tokens': 15, 'cached_input_tokens': 8}
     """
     total_input_tokens = 0
     total_output_tokens = 0
+    total_cached_tokens = 0
 
     for msg in messages:
         # Only process AIMessage (responses from LLM)
         if msg.__class__.__name__ != "AIMessage":
             continue
 
-        # Try usage_metadata first (newer LangChain format)
+        # Try usage_metadata first (newer LangChain format, a dict)
         if hasattr(msg, "usage_metadata") and msg.usage_metadata:
-            total_input_tokens += getattr(msg.usage_metadata, "input_tokens", 0)
-            total_output_tokens += getattr(msg.usage_metadata, "output_tokens", 0)
+            usage = msg.usage_metadata
+            total_input_tokens += _token_count(usage, "input_tokens")
+            total_output_tokens += _token_count(usage, "output_tokens")
 
         # Fallback to response_metadata (provider-specific formats)
         elif hasattr(msg, "response_metadata") and msg.response_metadata:
@@ -51,16 +93,49 @@ def extract_token_usage_from_messages(messages: list[Any]) -> tuple[int, int, in
 
             # DashScope uses input_tokens/output_tokens
             # OpenAI uses prompt_tokens/completion_tokens
-            total_input_tokens += usage.get("input_tokens", 0) or usage.get(
-                "prompt_tokens", 0
-            )
-            total_output_tokens += usage.get("output_tokens", 0) or usage.get(
-                "completion_tokens", 0
+            total_input_tokens += _token_count(usage, "input_tokens", "prompt_tokens")
+            total_output_tokens += _token_count(
+                usage, "output_tokens", "completion_tokens"
             )
 
-    total_tokens = total_input_tokens + total_output_tokens
+        else:
+            continue
+
+        total_cached_tokens += _cached_input_tokens(usage)
+
+    return {
+        "input_tokens": total_input_tokens,
+        "output_tokens": total_output_tokens,
+        "total_tokens": total_input_tokens + total_output_tokens,
+        "cached_input_tokens": total_cached_tokens,
+    }
+
+
+def extract_token_usage_from_messages(messages: list[Any]) -> tuple[int, int, int]:
+    """
+    Extract total token usage from LangChain messages.
+
+    Supports multiple metadata formats:
+    - usage_metadata (newer LangChain format)
+    - response_metadata.token_usage (DashScope/Tongyi format)
+    - response_metadata.usage (OpenAI format)
+
+    Use extract_token_usage_details_from_messages for prefix cache hits.
 
-    return total_input_tokens, total_output_tokens, total_tokens
+    Args:
+        messages: List of LangChain message objects (AIMessage, HumanMessage, etc.)
+
+    Returns:
+        Tuple of (input_tokens, output_tokens, total_tokens)
+
+    Example:
+        >>> from langchain_core.messages import AIMessage
+        >>> messages = [AIMessage(content="Hello", usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15})]
+        >>> extract_token_usage_from_messages(messages)
+        (10, 5, 15)
+    """
+    usage = extract_token_usage_details_from_messages(messages)
+    return usage["input_tokens"], usage["output_tokens"], usage["total_tokens"]
 
 
 def extract_token_usage_from_agent_result(
@@ -4,19 +4,33 @@ Following Factor 3: External Dependencies as Services.
 """
 
 import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 import redis.asyncio as redis
 import structlog
+from redis.client import NEVER_DECODE
+
+from .single_flight import SingleFlight
 
 logger = structlog.get_logger()
 
+# Delete the lock only if it still holds the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCache:
     """Redis connection manager with async support."""
 
     def __init__(self) -> None:
         self.client: redis.Redis | None = None
+        self._release_script: Any | None = None
+        self._single_flight = SingleFlight(self)
 
     async def connect(self, redis_url: str) -> None:
         """Establish connection to Redis."""
@@ -182,6 +196,70 @@ class RedisCache:
             logger.error("Redis set operation failed", key=key, error=str(e))
             return False
 
+    async def get_raw(self, key: str) -> bytes | None:
+        """
+        Get the stored bytes for a key without JSON or UTF-8 decoding.
+
+        Used by binary cache codecs; the client's decode_responses setting
+        would otherwise corrupt non-UTF-8 payloads.
+        """
+        if not self.client:
+            raise RuntimeError("Redis connection not established")
+
+        try:
+            value: bytes | None = await self.client.execute_command(
+                "GET", key, **{NEVER_DECODE: True}
+            )
+            logger.debug("Cache HIT" if value else "Cache MISS", cache_key=key)
+            return value
+        except Exception as e:
+            logger.error("Redis get_raw operation failed", key=key, error=str(e))
+            return None
+
+    async def get_raw_with_ttl(self, key: str) -> tuple[bytes | None, float | None]:
+        """
+        Like `get_raw`, plus the key's remaining TTL in seconds (None if the
+        key has no expiry), in one round-trip.
+        """
+        if not self.client:
+            raise RuntimeError("Redis connection not established")
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.execute_command("GET", key, **{NEVER_DECODE: True})
+                pipe.pttl(key)
+                value, pttl = await pipe.execute()
+            logger.debug("Cache HIT" if value else "Cache MISS", cache_key=key)
+            return value, (pttl / 1000 if pttl >= 0 else None)
+        except Exception as e:
+            logger.error(
+                "Redis get_raw_with_ttl operation failed", key=key, error=str(e)
+            )
+            return None, None
+
+    async def set_raw(
+        self,
+        key: str,
+        value: bytes,
+        ttl_seconds: int | None = None,
+        nx: bool = False,
+    ) -> bool:
+        """
+        Set pre-encoded bytes with optional TTL.
+
+        With nx=True the key is only written if it does not exist yet, and
+        False is returned when it already did.
+        """
+        if not self.client:
+            raise RuntimeError("Redis connection not established")
+
+        try:
+            result = await self.client.set(key, value, ex=ttl_seconds, nx=nx)
+            return result is True
+        except Exception as e:
+            logger.error("Redis set_raw operation failed", key=key, error=str(e))
+            return False
+
     async def setex(self, key: str, ttl_seconds: int, value: str) -> bool:
         """
         Set key with TTL (Redis SETEX command).
@@ -221,6 +299,42 @@ class RedisCache:
             logger.error("Redis exists operation failed", key=key, error=str(e))
             return False
 
+    # =========================================================================
+    # Pub/Sub (cross-pod cache invalidation)
+    # =========================================================================
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message; returns the number of subscribers reached."""
+        if not self.client:
+            raise RuntimeError("Redis connection not established")
+
+        try:
+            receivers: int = await self.client.publish(channel, message)
+            return receivers
+        except Exception as e:
+            logger.error("Redis publish failed", channel=channel, error=str(e))
+            return 0
+
+    async def listen(self, channel: str) -> AsyncIterator[str]:
+        """
+        Subscribe to a channel and yield message payloads.
+
+        Runs until cancelled; connection errors propagate so the caller can
+        decide how to resubscribe.
+        """
+        if not self.client:
+            raise RuntimeError("Redis connection not established")
+
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+
     # =========================================================================
     # Request Deduplication (Thundering Herd Prevention)
     # =========================================================================
@@ -229,6 +343,7 @@ class RedisCache:
         self,
         lock_key: str,
         lock_ttl_seconds: int = 30,
+        token: str = "locked",
     ) -> bool:
         """
         Acquire a distributed lock using Redis SET NX EX pattern.
@@ -239,6 +354,8 @@ class RedisCache:
         Args:
             lock_key: Unique key for the lock
             lock_ttl_seconds: Lock expiry time (prevents deadlocks)
+            token: Owner token stored as the lock value; pass the same token
+                to release_lock so only the owner can release it
 
         Returns:
             True if lock acquired, False if already held by another process
@@ -251,7 +368,7 @@ class RedisCache:
             # NX = only set if not exists, EX = expiry in seconds
             result = await self.client.set(
                 lock_key,
-                "locked",
+                token,
                 nx=True,  # Only set if not exists
                 ex=lock_ttl_seconds,  # Auto-expire to prevent deadlocks
             )
@@ -263,12 +380,14 @@ class RedisCache:
             logger.error("Failed to acquire lock", lock_key=lock_key, error=str(e))
             return False
 
-    async def release_lock(self, lock_key: str) -> bool:
+    async def release_lock(self, lock_key: str, token: str | None = None) -> bool:
         """
         Release a distributed lock.
 
         Args:
             lock_key: The lock key to release
+            token: Owner token; when given the lock is only deleted if it still
+                holds this token (it may have expired and been re-acquired)
 
         Returns:
             True if lock released, False otherwise
@@ -277,7 +396,14 @@ class RedisCache:
             raise RuntimeError("Redis connection not established")
 
         try:
-            result = await self.client.delete(lock_key)
+            if token is None:
+                result = await self.client.delete(lock_key)
+            else:
+                if self._release_script is None:
+                    self._release_script = self.client.register_script(
+                        RELEASE_LOCK_SCRIPT
+                    )
+                result = await self._release_script(keys=[lock_key], args=[token])
             released = result > 0
             if released:
                 logger.debug("Lock released", lock_key=lock_key)
@@ -289,102 +415,53 @@ class RedisCache:
     async def get_with_dedup(
         self,
         cache_key: str,
-        fetch_func,
+        fetch_func: Callable[[], Awaitable[Any]],
         ttl_seconds: int = 3600,
         lock_ttl_seconds: int = 30,
         wait_timeout_seconds: float = 5.0,
-        wait_interval_seconds: float = 0.1,
+        encode: Callable[[Any], bytes] | None = None,
+        decode: Callable[[bytes], Any] | None = None,
     ) -> Any | None:
         """
-        Get value from cache with request deduplication.
+        Get value from cache with request deduplication (single-flight).
 
-        If cache miss, acquires lock and fetches data. Other concurrent
-        requests wait for the first request to populate the cache.
+        On a miss, one caller per pod joins an in-process future map, and
+        one pod across the cluster takes a token-owned Redis lock and
+        fetches. Waiting pods are woken by pub/sub when the holder finishes
+        instead of polling.
 
         Args:
             cache_key: Cache key to get/set
             fetch_func: Async function to call on cache miss (returns data)
             ttl_seconds: Cache TTL for the fetched data
             lock_ttl_seconds: Lock TTL (prevents deadlocks)
-            wait_timeout_seconds: How long waiting requests will poll
-            wait_interval_seconds: Polling interval for waiting requests
+            wait_timeout_seconds: How long waiting pods wait for the holder
+                before fetching themselves
+            encode: Optional binary encoder; when given with `decode`, values
+                are stored via set_raw/get_raw instead of JSON
+            decode: Optional binary decoder matching `encode`
 
         Returns:
             Cached or freshly fetched data, or None on error
         """
-        import asyncio
-
-        # 1. Try cache first
-        cached = await self.get(cache_key)
-        if cached is not None:
-            return cached
-
-        # 2. Cache miss - try to acquire lock
-        lock_key = f"lock:{cache_key}"
-        if await self.acquire_lock(lock_key, lock_ttl_seconds):
-            try:
-                # Double-check cache (another request may have populated it)
-                cached = await self.get(cache_key)
-                if cached is not None:
-                    return cached
-
-                # 3. We have the lock - fetch fresh data
-                logger.info(
-                    "Cache miss with lock - fetching data",
-                    cache_key=cache_key,
-                )
-                data = await fetch_func()
-
-                if data is not None:
-                    await self.set(cache_key, data, ttl_seconds=ttl_seconds)
-                    logger.info(
-                        "Cache populated after fetch",
-                        cache_key=cache_key,
-                        ttl=ttl_seconds,
-                    )
 
-                return data
-
-            finally:
-                # Always release lock
-                await self.release_lock(lock_key)
-        else:
-            # 4. Another request has the lock - wait for cache to be populated
-            logger.debug(
-                "Waiting for cache population",
-                cache_key=cache_key,
-                timeout=wait_timeout_seconds,
-            )
+        async def load() -> Any | None:
+            if encode is None or decode is None:
+                return await self.get(cache_key)
+            raw = await self.get_raw(cache_key)
+            return decode(raw) if raw is not None else None
 
-            elapsed = 0.0
-            while elapsed < wait_timeout_seconds:
-                await asyncio.sleep(wait_interval_seconds)
-                elapsed += wait_interval_seconds
-
-                cached = await self.get(cache_key)
-                if cached is not None:
-                    logger.debug(
-                        "Cache populated by another request",
-                        cache_key=cache_key,
-                        wait_time=elapsed,
-                    )
-                    return cached
-
-            # 5. Timeout - fetch ourselves (rare fallback)
-            logger.warning(
-                "Wait timeout - fetching data directly",
-                cache_key=cache_key,
-                timeout=wait_timeout_seconds,
-            )
-            try:
-                data = await fetch_func()
-                if data is not None:
-                    await self.set(cache_key, data, ttl_seconds=ttl_seconds)
-                return data
-            except Exception as e:
-                logger.error(
-                    "Fallback fetch failed",
-                    cache_key=cache_key,
-                    error=str(e),
-                )
-                return None
+        async def store(data: Any) -> None:
+            if encode is None or decode is None:
+                await self.set(cache_key, data, ttl_seconds=ttl_seconds)
+            else:
+                await self.set_raw(cache_key, encode(data), ttl_seconds=ttl_seconds)
+
+        return await self._single_flight.run(
+            cache_key,
+            fetch_func,
+            load,
+            store,
+            lock_ttl_seconds=lock_ttl_seconds,
+            wait_timeout_seconds=wait_timeout_seconds,
+        )
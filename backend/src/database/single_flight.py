@@ -0,0 +1,229 @@
+"""
+Distributed single-flight for Redis-backed cache fills.
+
+Coalesces concurrent cache misses for the same key:
+- Within a pod, callers share one in-process future (no extra Redis traffic)
+- Across pods, one holder takes a token-owned lock and fetches; the others
+  subscribe to a completion channel and wake as soon as the holder publishes
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from .redis import RedisCache
+
+logger = structlog.get_logger()
+
+# Completion statuses published by the lock holder
+FILLED = "filled"  # Value stored; waiters read it from cache
+EMPTY = "empty"  # Fetch returned None; waiters return None
+FAILED = "failed"  # Fetch raised; waiters fetch themselves
+
+
+def lock_key_for(cache_key: str) -> str:
+    return f"lock:{cache_key}"
+
+
+def channel_for(cache_key: str) -> str:
+    return f"dedup:{cache_key}"
+
+
+class SingleFlight:
+    """Per-RedisCache single-flight coordinator."""
+
+    def __init__(self, cache: "RedisCache"):
+        self._cache = cache
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
+    @property
+    def inflight(self) -> int:
+        """Number of keys currently being resolved by this pod."""
+        return len(self._inflight)
+
+    async def run(
+        self,
+        cache_key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        load: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], Awaitable[None]],
+        lock_ttl_seconds: int = 30,
+        wait_timeout_seconds: float = 5.0,
+    ) -> Any | None:
+        """
+        Resolve a key once per pod, and once per cluster on a cold miss.
+
+        Args:
+            cache_key: Cache key being resolved
+            fetch_func: Async function producing the value on a miss
+            load: Reads the cached value (None on miss)
+            store: Writes a fetched value to the cache
+            lock_ttl_seconds: Lock TTL (bounds how long a crashed holder blocks)
+            wait_timeout_seconds: How long to wait for another pod's holder
+
+        Returns:
+            Cached or fetched value; exceptions from fetch_func propagate to
+            every caller coalesced onto this pod's flight
+        """
+        pending = self._inflight.get(cache_key)
+        if pending is not None:
+            logger.debug("Joining in-flight request", cache_key=cache_key)
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This caller was cancelled
+                # The leading caller was cancelled; take over the flight
+                return await self.run(
+                    cache_key,
+                    fetch_func,
+                    load,
+                    store,
+                    lock_ttl_seconds,
+                    wait_timeout_seconds,
+                )
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._resolve(
+                cache_key,
+                fetch_func,
+                load,
+                store,
+                lock_ttl_seconds,
+                wait_timeout_seconds,
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no other caller joined
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[cache_key]
+
+    async def _resolve(
+        self,
+        cache_key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        load: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], Awaitable[None]],
+        lock_ttl_seconds: int,
+        wait_timeout_seconds: float,
+    ) -> Any | None:
+        cached = await load()
+        if cached is not None:
+            return cached
+
+        lock_key = lock_key_for(cache_key)
+        token = uuid.uuid4().hex
+        if await self._cache.acquire_lock(lock_key, lock_ttl_seconds, token=token):
+            return await self._fetch_as_holder(
+                cache_key, fetch_func, load, store, lock_key, token
+            )
+
+        status, cached = await self._wait_for_holder(
+            cache_key, load, wait_timeout_seconds
+        )
+        if status == FILLED and cached is not None:
+            return cached
+        if status == EMPTY:
+            return None
+
+        # Holder failed or timed out - fetch ourselves (rare fallback)
+        logger.warning(
+            "Single-flight wait ended without value - fetching directly",
+            cache_key=cache_key,
+            status=status,
+        )
+        data = await fetch_func()
+        if data is not None:
+            await store(data)
+        return data
+
+    async def _fetch_as_holder(
+        self,
+        cache_key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        load: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], Awaitable[None]],
+        lock_key: str,
+        token: str,
+    ) -> Any | None:
+        status = FAILED
+        try:
+            # Double-check cache (another pod may have populated it)
+            cached = await load()
+            if cached is not None:
+                status = FILLED
+                return cached
+
+            logger.info("Cache miss with lock - fetching data", cache_key=cache_key)
+            data = await fetch_func()
+            if data is not None:
+                await store(data)
+                status = FILLED
+            else:
+                status = EMPTY
+            return data
+        finally:
+            await self._cache.publish(channel_for(cache_key), status)
+            await self._cache.release_lock(lock_key, token=token)
+
+    async def _wait_for_holder(
+        self,
+        cache_key: str,
+        load: Callable[[], Awaitable[Any]],
+        timeout: float,
+    ) -> tuple[str, Any | None]:
+        """
+        Wait for the lock holder's completion message.
+
+        Subscribes before re-reading the cache so a completion published in
+        between is never missed.
+
+        Returns:
+            (status, cached value) where status is FILLED/EMPTY/FAILED or
+            "timeout"
+        """
+        client = self._cache.client
+        if client is None:
+            raise RuntimeError("Redis connection not established")
+
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel_for(cache_key))
+        try:
+            cached = await load()
+            if cached is not None:
+                return FILLED, cached
+
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=remaining
+                )
+                if message is None or message.get("type") != "message":
+                    continue
+                status = message["data"]
+                if isinstance(status, bytes):
+                    status = status.decode()
+                logger.debug(
+                    "Single-flight holder finished",
+                    cache_key=cache_key,
+                    status=status,
+                )
+                return status, (await load() if status == FILLED else None)
+            return "timeout", None
+        finally:
+            await pubsub.unsubscribe(channel_for(cache_key))
+            await pubsub.aclose()
@@ -57,6 +57,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize service variables before try block to ensure they're defined
     # in the finally block even if an early exception occurs
     market_service = None
+    data_manager = None
 
     try:
         await mongodb.connect(settings.mongodb_url)
@@ -141,7 +142,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         from .services.alpaca_trading_service import AlpacaTradingService
         from .services.alphavantage_market_data import AlphaVantageMarketDataService
-        from .services.data_manager import DataManager
+        from .services.data_manager import BarStore, DataManager, LocalCache
         from .services.insights.snapshot_service import InsightsSnapshotService
         from .services.tool_cache_wrapper import ToolCacheWrapper
 
@@ -174,7 +175,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             data_manager = DataManager(
                 redis_cache=redis_cache,
                 alpha_vantage_service=market_service,
+                local_cache=(
+                    LocalCache(
+                        max_entries=settings.l1_cache_max_entries,
+                        max_bytes=settings.l1_cache_max_mb * 1024 * 1024,
+                    )
+                    if settings.l1_cache_enabled
+                    else None
+                ),
+                bar_store=(
+                    BarStore(settings.bar_store_dir)
+                    if settings.bar_store_enabled
+                    else None
+                ),
             )
+            if data_manager.start_cache_sync():
+                logger.info("DataManager L1 cache enabled with pub/sub invalidation")
             snapshot_service = InsightsSnapshotService(
                 mongodb=mongodb,
                 redis_cache=redis_cache,
@@ -255,6 +271,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             redis_cache=redis_cache,
             market_service=market_service,
             fred_service=fred_service,
+            data_manager=data_manager,  # Shares the app's cache and bar store
         )
         app.state.insights_registry = insights_registry
         logger.info(
@@ -291,6 +308,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         yield
 
     finally:
+        if data_manager:
+            await data_manager.stop_cache_sync()
+
         # Cleanup database connections
         await mongodb.disconnect()
         await redis_cache.disconnect()
@@ -8,6 +8,7 @@ import structlog
 from alpaca.trading.client import TradingClient
 
 from ...core.config import Settings
+from .worker_pool import get_worker_pool
 
 logger = structlog.get_logger()
 
@@ -20,6 +21,7 @@ class AlpacaTradingServiceBase:
     - Alpaca TradingClient initialization
     - Paper trading configuration
     - Settings management
+    - Shared worker pool for the blocking client calls
 
     Free tier: Paper trading with $1M virtual portfolio
     """
@@ -39,6 +41,7 @@ class AlpacaTradingServiceBase:
             secret_key=settings.alpaca_secret_key,
             paper=True,  # Paper trading (FREE)
         )
+        self.pool = get_worker_pool(settings.alpaca_max_workers)
 
         logger.info(
             "AlpacaTradingService initialized",
@@ -176,7 +176,7 @@ class OrderOperations(AlpacaTradingServiceBase):
                 )
 
             # Submit order to Alpaca
-            alpaca_order = self.client.submit_order(request)
+            alpaca_order = await self.pool.run(self.client.submit_order, request)
 
             # Convert to our PortfolioOrder model
             order = alpaca_order_to_portfolio_order(
@@ -267,7 +267,9 @@ class OrderOperations(AlpacaTradingServiceBase):
         """
         try:
             # Get order by client_order_id
-            alpaca_order = self.client.get_order_by_client_id(analysis_id)
+            alpaca_order = await self.pool.run(
+                self.client.get_order_by_client_id, analysis_id
+            )
 
             if not alpaca_order:
                 return None
@@ -319,7 +321,7 @@ class OrderOperations(AlpacaTradingServiceBase):
                 limit=limit,
             )
 
-            alpaca_orders = self.client.get_orders(request)
+            alpaca_orders = await self.pool.run(self.client.get_orders, request)
 
             orders = [
                 alpaca_order_to_portfolio_order(alpaca_order, user_id=user_id)
@@ -40,18 +40,19 @@ class PositionOperations(AlpacaTradingServiceBase):
             107.50
         """
         try:
-            # Get account info from Alpaca
-            account = self.client.get_account()
-
-            # Get positions for position count
-            positions = self.client.get_all_positions()
-
             # Get base_value from portfolio history (this is the actual starting balance)
             history_request = GetPortfolioHistoryRequest(
                 period="all",
                 timeframe="1D",
             )
-            history = self.client.get_portfolio_history(history_request)
+
+            # Account info, positions (for the count) and history are
+            # independent, so fetch them concurrently on the worker pool
+            account, positions, history = await asyncio.gather(
+                self.pool.run(self.client.get_account),
+                self.pool.run(self.client.get_all_positions),
+                self.pool.run(self.client.get_portfolio_history, history_request),
+            )
             base_value = history.base_value
 
             # Calculate P&L from actual base value
@@ -116,7 +117,7 @@ class PositionOperations(AlpacaTradingServiceBase):
         """
         try:
             # Get positions from Alpaca
-            alpaca_positions = self.client.get_all_positions()
+            alpaca_positions = await self.pool.run(self.client.get_all_positions)
 
             positions = [
                 alpaca_position_to_portfolio_position(pos, user_id)
@@ -173,10 +174,7 @@ class PositionOperations(AlpacaTradingServiceBase):
                 extended_hours=False,
             )
 
-            # Run blocking Alpaca API call in thread executor to avoid blocking event loop
-            history = await asyncio.to_thread(
-                self.client.get_portfolio_history, request
-            )
+            history = await self.pool.run(self.client.get_portfolio_history, request)
 
             logger.info(
                 "Portfolio history retrieved",
@@ -0,0 +1,64 @@
+"""
+Bounded worker pool for the blocking alpaca-py clients.
+
+alpaca-py's TradingClient and StockHistoricalDataClient are synchronous
+(`requests` under the hood), so calling them from a coroutine stalls the
+event loop for the whole HTTP round trip. Every Alpaca call goes through
+`AlpacaWorkerPool.run`, which executes it on a small dedicated thread pool.
+The pool is shared by the data and trading services so its size also caps
+concurrent Alpaca requests (the free plan allows 200 requests/minute), and a
+burst of portfolio page loads can't exhaust the loop's default executor that
+other blocking work (DNS, file I/O) relies on.
+"""
+
+import asyncio
+import contextvars
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class AlpacaWorkerPool:
+    """Runs blocking Alpaca client calls off the event loop."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="alpaca"
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call `func(*args, **kwargs)` on a pool thread and await the result.
+
+        Context variables (e.g. structlog's bound request context) are
+        propagated, as with `asyncio.to_thread`.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads (queued calls are cancelled)."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_shared_pool: AlpacaWorkerPool | None = None
+
+
+def get_worker_pool(max_workers: int = DEFAULT_MAX_WORKERS) -> AlpacaWorkerPool:
+    """
+    Process-wide pool shared by all Alpaca services.
+
+    `max_workers` only applies when the pool is first created.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = AlpacaWorkerPool(max_workers)
+    return _shared_pool
@@ -10,24 +10,68 @@ Benefits over yfinance:
 4. Consistent with trading service (same provider)
 """
 
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from typing import Any
 
 import pandas as pd
 import structlog
 from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.data.models import Quote
 from alpaca.data.requests import StockBarsRequest, StockLatestQuoteRequest
 from alpaca.data.timeframe import TimeFrame
 
 from ..core.config import Settings
 from ..core.utils import map_frontend_to_alpaca
+from .alpaca.worker_pool import get_worker_pool
 
 logger = structlog.get_logger()
 
+# Raw Alpaca bar field -> DataFrame column
+BAR_COLUMNS = {"o": "Open", "h": "High", "l": "Low", "c": "Close", "v": "Volume"}
+
+
+def bars_to_frame(records: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build an OHLCV DataFrame from raw Alpaca bar records.
+
+    Records are `{"t": RFC 3339 timestamp, "o", "h", "l", "c", "v", ...}`
+    dicts. The frame is built in one columnar pass and timestamps are parsed
+    vectorized, rather than constructing a model object per bar.
+    """
+    if not records:
+        return pd.DataFrame()
+    raw = pd.DataFrame.from_records(records, columns=["t", *BAR_COLUMNS])
+    index = pd.DatetimeIndex(pd.to_datetime(raw["t"], utc=True, format="ISO8601"))
+    df = raw[list(BAR_COLUMNS)].rename(columns=BAR_COLUMNS).astype("float64")
+    df.index = index
+    return df
+
+
+def quote_sides(quote: Quote | dict[str, Any] | None) -> tuple[float, float]:
+    """(ask, bid) of a Quote model or raw quote dict; missing sides are 0.0."""
+    if quote is None:
+        return 0.0, 0.0
+    if isinstance(quote, Quote):
+        return quote.ask_price or 0.0, quote.bid_price or 0.0
+    return quote.get("ap") or 0.0, quote.get("bp") or 0.0
+
+
+def quote_price(quote: Quote | dict[str, Any] | None) -> float | None:
+    """Ask price of a quote, falling back to bid; None if neither is valid."""
+    ask, bid = quote_sides(quote)
+    price = ask if ask > 0 else bid
+    return float(price) if price > 0 else None
+
 
 class AlpacaDataService:
     """
     Alpaca Data API integration for historical OHLCV data.
 
+    alpaca-py is synchronous, so every request runs on the shared Alpaca
+    worker pool instead of blocking the event loop. The client returns raw
+    JSON-decoded payloads, which are converted to DataFrames column-wise.
+
     Free tier: Paper trading includes full market data access.
     """
 
@@ -40,11 +84,13 @@ class AlpacaDataService:
         """
         self.settings = settings
 
-        # Initialize Alpaca data client
+        # Initialize Alpaca data client (raw payloads skip per-bar models)
         self.client = StockHistoricalDataClient(
             api_key=settings.alpaca_api_key,
             secret_key=settings.alpaca_secret_key,
+            raw_data=True,
         )
+        self.pool = get_worker_pool(settings.alpaca_max_workers)
 
         logger.info("AlpacaDataService initialized", paper_trading=True)
 
@@ -54,6 +100,7 @@ class AlpacaDataService:
         interval: str,
         start_date: str,
         end_date: str,
+        raise_errors: bool = False,
     ) -> pd.DataFrame:
         """
         Get historical OHLCV bars for symbol.
@@ -63,6 +110,8 @@ class AlpacaDataService:
             interval: Data interval ("1m", "1h", "1d", "1w")
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            raise_errors: Raise on request failures instead of returning an
+                empty DataFrame (lets callers tell "no bars" from "failed")
 
         Returns:
             DataFrame with OHLCV data (columns: Open, High, Low, Close, Volume)
@@ -74,6 +123,49 @@ class AlpacaDataService:
                                 Open      High       Low     Close      Volume
             2025-01-02 00:00:00  271.50  274.80  270.10  274.20  67844982
         """
+        frames = await self.get_bars_many(
+            [symbol], interval, start_date, end_date, raise_errors=raise_errors
+        )
+        return frames[symbol]
+
+    async def get_bars_many(
+        self,
+        symbols: Iterable[str],
+        interval: str,
+        start_date: str,
+        end_date: str,
+        raise_errors: bool = False,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get historical OHLCV bars for several symbols in one request.
+
+        Args:
+            symbols: Stock symbols (e.g., ["AAPL", "MSFT"])
+            interval: Data interval ("1m", "1h", "1d", "1w")
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            raise_errors: Raise on request failures instead of returning
+                empty DataFrames
+
+        Returns:
+            Dict mapping each requested symbol to its OHLCV DataFrame (empty if
+            Alpaca returned no data or the request failed)
+
+        Raises:
+            Exception: The request failure, only with raise_errors=True
+
+        Example:
+            >>> frames = await service.get_bars_many(
+            ...     ["AAPL", "MSFT"], "1d", "2025-01-01", "2025-11-01"
+            ... )
+            >>> frames["MSFT"]["Close"].iloc[-1]
+            517.03
+        """
+        symbols = list(dict.fromkeys(symbols))
+        frames = {symbol: pd.DataFrame() for symbol in symbols}
+        if not symbols:
+            return frames
+
         try:
             # Convert interval to Alpaca TimeFrame
             timeframe = self._map_interval_to_timeframe(interval)
@@ -87,7 +179,7 @@ class AlpacaDataService:
 
             logger.info(
                 "Fetching bars from Alpaca",
-                symbol=symbol,
+                symbols=symbols,
                 interval=interval,
                 timeframe=str(timeframe),
                 start=start_date,
@@ -96,68 +188,52 @@ class AlpacaDataService:
 
             # Create request
             request = StockBarsRequest(
-                symbol_or_symbols=symbol,
+                symbol_or_symbols=[symbol.upper() for symbol in symbols],
                 timeframe=timeframe,
                 start=start_dt,
                 end=end_dt,
             )
 
-            # Fetch bars
-            bars_response = self.client.get_stock_bars(request)
+            # Fetch bars (raw: {SYMBOL: [bar records]})
+            bars_response = await self.pool.run(self.client.get_stock_bars, request)
 
-            # Convert to DataFrame
-            # Type guard: bars_response should have .data attribute
-            if not hasattr(bars_response, "data"):
-                logger.error(
-                    "Unexpected response format from Alpaca",
-                    response_type=type(bars_response),
-                )
-                return pd.DataFrame()
-
-            if symbol not in bars_response.data or not bars_response.data[symbol]:
-                logger.warning(
-                    "No data returned from Alpaca",
-                    symbol=symbol,
-                    interval=interval,
-                    start=start_date,
-                    end=end_date,
+            if not isinstance(bars_response, dict):
+                raise TypeError(
+                    f"Unexpected response format from Alpaca: {type(bars_response)}"
                 )
-                return pd.DataFrame()
-
-            bars = bars_response.data[symbol]
-
-            # Convert bars to DataFrame
-            data = {
-                "Open": [bar.open for bar in bars],
-                "High": [bar.high for bar in bars],
-                "Low": [bar.low for bar in bars],
-                "Close": [bar.close for bar in bars],
-                "Volume": [bar.volume for bar in bars],
-            }
-
-            df = pd.DataFrame(
-                data,
-                index=pd.DatetimeIndex([bar.timestamp for bar in bars]),
-            )
+
+            for symbol in symbols:
+                records = bars_response.get(symbol.upper())
+                if not records:
+                    logger.warning(
+                        "No data returned from Alpaca",
+                        symbol=symbol,
+                        interval=interval,
+                        start=start_date,
+                        end=end_date,
+                    )
+                    continue
+                frames[symbol] = bars_to_frame(records)
 
             logger.info(
                 "Successfully fetched from Alpaca",
-                symbol=symbol,
-                rows=len(df),
-                columns=list(df.columns),
+                symbols=symbols,
+                rows={symbol: len(df) for symbol, df in frames.items()},
             )
 
-            return df
+            return frames
 
         except Exception as e:
             logger.error(
                 "Error fetching from Alpaca",
-                symbol=symbol,
+                symbols=symbols,
                 interval=interval,
                 error=str(e),
                 exc_info=True,
             )
-            return pd.DataFrame()
+            if raise_errors:
+                raise
+            return {symbol: pd.DataFrame() for symbol in symbols}
 
     async def get_latest_price(self, symbol: str) -> float | None:
         """
@@ -173,65 +249,72 @@ class AlpacaDataService:
             >>> price = await service.get_latest_price("AAPL")
             >>> print(price)  # 274.20
         """
+        prices = await self.get_latest_prices([symbol])
+        return prices[symbol]
+
+    async def get_latest_prices(
+        self, symbols: Iterable[str]
+    ) -> dict[str, float | None]:
+        """
+        Get latest prices for several symbols with one quote request.
+
+        Uses the ask price (current selling price), falling back to the bid
+        price when no ask is available.
+
+        Args:
+            symbols: Stock symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            Dict mapping each requested symbol to its price, or None if
+            unavailable
+        """
+        symbols = list(dict.fromkeys(symbols))
+        prices: dict[str, float | None] = dict.fromkeys(symbols)
+        if not symbols:
+            return prices
+
         try:
-            logger.info("Fetching latest quote from Alpaca", symbol=symbol)
-
-            # Create request for latest quote
-            request = StockLatestQuoteRequest(symbol_or_symbols=symbol)
-
-            # Fetch latest quote
-            quote_response = self.client.get_stock_latest_quote(request)
-
-            # Handle both dict and object responses
-            if isinstance(quote_response, dict):
-                # Response is a dict
-                if symbol not in quote_response or not quote_response[symbol]:
-                    logger.warning("No quote data for symbol", symbol=symbol)
-                    return None
-                quote = quote_response[symbol]
-            elif hasattr(quote_response, "data"):
-                # Response has .data attribute
-                if symbol not in quote_response.data or not quote_response.data[symbol]:
-                    logger.warning("No quote data for symbol", symbol=symbol)
-                    return None
-                quote = quote_response.data[symbol]
-            else:
+            logger.info("Fetching latest quotes from Alpaca", symbols=symbols)
+
+            request = StockLatestQuoteRequest(
+                symbol_or_symbols=[symbol.upper() for symbol in symbols]
+            )
+
+            # Raw response: {SYMBOL: {"ap": ask, "bp": bid, ...}}
+            quote_response = await self.pool.run(
+                self.client.get_stock_latest_quote, request
+            )
+
+            if not isinstance(quote_response, dict):
                 logger.error(
                     "Unexpected quote response format from Alpaca",
                     response_type=type(quote_response),
                 )
-                return None
-
-            # Use ask_price (current selling price) as the "current price"
-            # Fall back to bid_price if ask not available
-            price = quote.ask_price if quote.ask_price > 0 else quote.bid_price
-
-            if price and price > 0:
-                logger.info(
-                    "Got latest price from Alpaca",
-                    symbol=symbol,
-                    price=price,
-                    ask=quote.ask_price,
-                    bid=quote.bid_price,
-                )
-                return float(price)
-            else:
-                logger.warning(
-                    "Invalid price from Alpaca quote",
-                    symbol=symbol,
-                    ask=quote.ask_price,
-                    bid=quote.bid_price,
-                )
-                return None
+                return prices
+
+            for symbol in symbols:
+                quote = quote_response.get(symbol.upper())
+                prices[symbol] = quote_price(quote)
+                if prices[symbol] is None:
+                    ask, bid = quote_sides(quote)
+                    logger.warning(
+                        "Invalid price from Alpaca quote",
+                        symbol=symbol,
+                        ask=ask,
+                        bid=bid,
+                    )
+
+            logger.info("Got latest prices from Alpaca", prices=prices)
+            return prices
 
         except Exception as e:
             logger.error(
-                "Error fetching latest price from Alpaca",
-                symbol=symbol,
+                "Error fetching latest prices from Alpaca",
+                symbols=symbols,
                 error=str(e),
                 exc_info=True,
             )
-            return None
+            return dict.fromkeys(symbols)
 
     def _map_interval_to_timeframe(self, interval: str) -> TimeFrame:
         """
@@ -18,6 +18,7 @@ from motor.motor_asyncio import AsyncIOMotorCollection
 from ..core.config import Settings
 from ..database.redis import RedisCache
 from ..services.alphavantage_market_data import AlphaVantageMarketDataService
+from .market_data.scheduler import RequestPriority, with_priority
 
 logger = structlog.get_logger()
 
@@ -60,6 +61,7 @@ class CacheWarmingService:
         self.settings = settings
         self._warming_in_progress = False
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def warm_startup_cache(self, symbols: list[str] | None = None) -> dict:
         """Warm cache on application startup.
 
@@ -110,6 +112,7 @@ class CacheWarmingService:
 
         return results
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def warm_user_watchlist(self, user_id: str) -> dict:
         """Warm cache for a specific user's watchlist.
 
@@ -169,6 +172,7 @@ class CacheWarmingService:
 
         return results
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def warm_market_movers(self) -> dict:
         """Warm cache with current market movers data.
 
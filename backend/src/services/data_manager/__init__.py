@@ -24,9 +24,16 @@ Cache Key Convention:
     - insights:ai_sector_risk:latest
 """
 
+from .bar_store import BarStore
+from .bars import OHLCVBars
 from .cache import CacheOperations
 from .keys import CacheKeys
+from .local_cache import LocalCache
 from .manager import DataManager
+from .ohlcv_scope import OHLCVScope, current_ohlcv_scope, ohlcv_scope
+from .options_chain import OptionsChain, PCRParams
+from .pcr_types import BatchPCRResult, ExpiryPCRData, SymbolPCRData
+from .quote_batcher import QuoteBatcher
 from .types import (
     DataFetchError,
     Granularity,
@@ -37,7 +44,6 @@ from .types import (
     OptionContract,
     QuoteData,
     SharedDataContext,
-    SymbolPCRData,
     TreasuryData,
     TrendPoint,
 )
@@ -46,14 +52,25 @@ __all__ = [
     "DataManager",
     "CacheKeys",
     "CacheOperations",
+    "LocalCache",
+    "BarStore",
+    "QuoteBatcher",
+    "OHLCVScope",
+    "ohlcv_scope",
+    "current_ohlcv_scope",
     "OHLCVData",
+    "OHLCVBars",
     "TreasuryData",
     "NewsData",
     "IPOData",
     "TrendPoint",
     "QuoteData",
     "OptionContract",
+    "OptionsChain",
+    "PCRParams",
     "SymbolPCRData",
+    "BatchPCRResult",
+    "ExpiryPCRData",
     "SharedDataContext",
     "DataFetchError",
     "Granularity",
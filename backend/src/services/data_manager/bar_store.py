@@ -0,0 +1,322 @@
+"""
+Persistent on-disk OHLCV history for the Data Manager Layer.
+
+Full daily history barely changes, so instead of re-downloading decades of
+bars whenever `market:daily:{SYMBOL}` expires, DataManager keeps them on local
+disk and only fetches the vendor's compact tail (latest 100 bars) to extend
+them. Bars are stored column-wise, one raw little-endian file per column, and
+read back as read-only memory maps:
+
+    {root}/{granularity}/{SYMBOL}/
+        meta.json              {"generation", "rows", "tz", "updated_at"}
+        {generation}.timestamps.i8, .open.f8, .high.f8, .low.f8, .close.f8,
+        .volume.i8
+
+Files are append-only: new rows are written past the committed row count and
+then `meta.json` is atomically replaced, so readers never see a partial row.
+Writers of a series serialize on an exclusive lock file next to its directory,
+so concurrent workers never truncate files a committed `meta.json` points to.
+When the split/dividend-adjusted history changes (a corporate action shows up
+as different values for bars already stored) the series is rewritten under a
+new generation. The newest vendor bar may still be forming, so it is returned
+to callers but never persisted.
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+
+from .bars import OHLCVBars
+
+logger = structlog.get_logger(__name__)
+
+# Column name -> on-disk dtype (fixed little-endian so files are portable)
+COLUMNS: dict[str, str] = {
+    "timestamps": "<i8",
+    "open": "<f8",
+    "high": "<f8",
+    "low": "<f8",
+    "close": "<f8",
+    "volume": "<i8",
+}
+META_FILE = "meta.json"
+
+
+@dataclass
+class BarStoreStats:
+    """Counters for on-disk history use."""
+
+    hits: int = 0  # Reads served from disk (extended by a compact tail)
+    misses: int = 0  # Symbols with no usable history on disk
+    appended_rows: int = 0
+    rewrites: int = 0  # Full rewrites (first fetch or corporate action)
+    errors: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "appended_rows": self.appended_rows,
+            "rewrites": self.rewrites,
+            "errors": self.errors,
+        }
+
+
+def _from_columns(
+    columns: Mapping[str, npt.NDArray[Any]],
+    tz: str,
+    stored_at: float | None = None,
+    stale: bool = False,
+) -> OHLCVBars:
+    return OHLCVBars(
+        timestamps=columns["timestamps"],
+        open=columns["open"],
+        high=columns["high"],
+        low=columns["low"],
+        close=columns["close"],
+        volume=columns["volume"],
+        tz=tz,
+        stored_at=stored_at,
+        stale=stale,
+    )
+
+
+def slice_bars(bars: OHLCVBars, start: int, stop: int | None = None) -> OHLCVBars:
+    """Rows [start:stop] of `bars` (oldest first) as a new OHLCVBars."""
+    window = slice(start, stop)
+    return _from_columns(
+        {name: getattr(bars, name)[window] for name in COLUMNS}, bars.tz
+    )
+
+
+def concat_bars(head: OHLCVBars, tail: OHLCVBars) -> OHLCVBars:
+    """`head` followed by `tail` (timestamps must already be ordered)."""
+    return _from_columns(
+        {
+            name: np.concatenate([getattr(head, name), getattr(tail, name)])
+            for name in COLUMNS
+        },
+        tail.tz,
+        tail.stored_at,
+        tail.stale,
+    )
+
+
+def merge_tail(stored: OHLCVBars, tail: OHLCVBars) -> OHLCVBars | None:
+    """
+    Extend stored history with a recent (compact) series.
+
+    Returns None when the stored history can't be trusted any more and must
+    be refetched in full: the tail starts after the last stored bar (gap), or
+    a stored bar inside the tail's date range is missing from it or has
+    different values (a corporate action changed the adjusted series).
+    """
+    if not len(stored):
+        return None
+    if not len(tail):
+        return stored
+
+    last_stored = stored.timestamps[-1]
+    if tail.timestamps[0] > last_stored:
+        return None
+
+    start = int(np.searchsorted(stored.timestamps, tail.timestamps[0]))
+    stop = int(np.searchsorted(stored.timestamps, tail.timestamps[-1], side="right"))
+    overlap = slice_bars(stored, start, stop)
+    positions = np.searchsorted(tail.timestamps, overlap.timestamps)
+    if not np.array_equal(tail.timestamps[positions], overlap.timestamps):
+        return None
+    for name in ("open", "high", "low", "close"):
+        if not np.allclose(
+            getattr(tail, name)[positions], getattr(overlap, name), rtol=1e-6
+        ):
+            return None
+    if not np.array_equal(tail.volume[positions], overlap.volume):
+        return None
+
+    first_new = int(np.searchsorted(tail.timestamps, last_stored, side="right"))
+    if first_new == len(tail):
+        return stored
+    return concat_bars(stored, slice_bars(tail, first_new))
+
+
+class BarStore:
+    """
+    Column files per (granularity, symbol) under `root`.
+
+    All methods are synchronous. Reads only map files (a 20-year daily series
+    is ~250 KB); `write`, `append` and `delete` take a file lock and fsync, so
+    async callers should run them in a worker thread (`asyncio.to_thread`).
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.stats = BarStoreStats()
+
+    def _series_dir(self, granularity: str, symbol: str) -> Path:
+        return self.root / granularity / symbol.upper()
+
+    @contextlib.contextmanager
+    def _locked(self, granularity: str, symbol: str) -> Iterator[Path]:
+        """Hold the series' exclusive write lock; yields its directory."""
+        directory = self._series_dir(granularity, symbol)
+        directory.parent.mkdir(parents=True, exist_ok=True)
+        # Kept beside the series directory so `delete` can remove the directory
+        with open(directory.parent / f".{directory.name}.lock", "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            yield directory
+
+    @staticmethod
+    def _column_path(directory: Path, generation: int, name: str) -> Path:
+        return directory / f"{generation}.{name}.{COLUMNS[name][1:]}"
+
+    def _read_meta(self, directory: Path) -> dict[str, Any] | None:
+        try:
+            with open(directory / META_FILE, encoding="utf-8") as f:
+                meta: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return None
+        return meta
+
+    def _write_meta(self, directory: Path, meta: dict[str, Any]) -> None:
+        """Commit point: atomically replace meta.json."""
+        tmp = directory / f".{META_FILE}.{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, directory / META_FILE)
+
+    def read(self, granularity: str, symbol: str) -> OHLCVBars | None:
+        """
+        Stored bars for a symbol (memory-mapped, oldest first).
+
+        Returns:
+            OHLCVBars, or None if nothing usable is stored
+        """
+        directory = self._series_dir(granularity, symbol)
+        try:
+            meta = self._read_meta(directory)
+            if meta is None or not meta.get("rows"):
+                return None
+            rows = int(meta["rows"])
+            columns = {
+                name: np.memmap(
+                    self._column_path(directory, meta["generation"], name),
+                    dtype=dtype,
+                    mode="r",
+                    shape=(rows,),
+                )
+                for name, dtype in COLUMNS.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.stats.errors += 1
+            logger.warning(
+                "bar_store_read_failed",
+                granularity=granularity,
+                symbol=symbol,
+                error=str(e),
+            )
+            return None
+        return _from_columns(columns, meta.get("tz", "UTC"))
+
+    def write(self, granularity: str, symbol: str, bars: OHLCVBars) -> None:
+        """Replace a symbol's history with `bars` under a new generation."""
+        with self._locked(granularity, symbol) as directory:
+            self._write(directory, bars)
+
+    def _write(self, directory: Path, bars: OHLCVBars) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        meta = self._read_meta(directory) or {}
+        old_generation = meta.get("generation")
+        generation = int(old_generation or 0) + 1
+
+        for name, dtype in COLUMNS.items():
+            path = self._column_path(directory, generation, name)
+            with open(path, "wb") as f:
+                f.write(np.ascontiguousarray(getattr(bars, name), dtype=dtype))
+                f.flush()
+                os.fsync(f.fileno())
+        self._write_meta(
+            directory,
+            {
+                "generation": generation,
+                "rows": len(bars),
+                "tz": bars.tz,
+                "updated_at": time.time(),
+            },
+        )
+        self.stats.rewrites += 1
+
+        # Readers that mapped the old generation keep their open inodes
+        if old_generation is not None:
+            for name in COLUMNS:
+                self._column_path(directory, old_generation, name).unlink(
+                    missing_ok=True
+                )
+
+    def append(self, granularity: str, symbol: str, bars: OHLCVBars) -> None:
+        """
+        Append bars newer than the stored history.
+
+        Falls back to `write` if nothing is stored yet.
+
+        Raises:
+            ValueError: If `bars` doesn't start after the last stored bar
+        """
+        if not len(bars):
+            return
+        with self._locked(granularity, symbol) as directory:
+            self._append(directory, bars)
+
+    def _append(self, directory: Path, bars: OHLCVBars) -> None:
+        meta = self._read_meta(directory)
+        if meta is None or not meta.get("rows"):
+            self._write(directory, bars)
+            return
+
+        rows = int(meta["rows"])
+        generation = meta["generation"]
+        last = np.memmap(
+            self._column_path(directory, generation, "timestamps"),
+            dtype=COLUMNS["timestamps"],
+            mode="r",
+            shape=(rows,),
+        )[-1]
+        if bars.timestamps[0] <= last:
+            raise ValueError("Appended bars must start after the last stored bar")
+
+        # Write past the committed rows (overwriting any uncommitted bytes left
+        # by an interrupted append), then commit the new row count
+        for name, dtype in COLUMNS.items():
+            path = self._column_path(directory, generation, name)
+            with open(path, "r+b") as f:
+                f.seek(rows * np.dtype(dtype).itemsize)
+                f.write(np.ascontiguousarray(getattr(bars, name), dtype=dtype))
+                f.flush()
+                os.fsync(f.fileno())
+        self._write_meta(
+            directory, {**meta, "rows": rows + len(bars), "updated_at": time.time()}
+        )
+        self.stats.appended_rows += len(bars)
+
+    def delete(self, granularity: str, symbol: str) -> bool:
+        """Drop a symbol's stored history. Returns True if anything existed."""
+        with self._locked(granularity, symbol) as directory:
+            if not directory.is_dir():
+                return False
+            for path in directory.iterdir():
+                path.unlink(missing_ok=True)
+            directory.rmdir()
+            return True
@@ -0,0 +1,248 @@
+"""
+Columnar OHLCV bar container for the Data Manager Layer.
+
+OHLCVBars keeps one NumPy array per field instead of one OHLCVData object per
+bar, so DataManager can cache and hand bars to analyzers without per-row
+object churn. It still behaves like the old newest-first list of OHLCVData
+(len, indexing, iteration) for callers that have not moved to columns.
+"""
+
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC
+from typing import Any, overload
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .types import OHLCVData
+
+CACHE_FORMAT = "columnar-v1"
+
+
+@dataclass(eq=False)
+class OHLCVBars(Sequence[OHLCVData]):
+    """
+    OHLCV bars stored column-wise, oldest first.
+
+    Attributes:
+        timestamps: UTC timestamps as int64 nanoseconds since epoch
+        open/high/low/close: float64 prices
+        volume: int64 volumes
+        tz: Timezone the source index used (e.g. America/New_York for intraday)
+        stored_at: Epoch seconds the bars were cached (None if fetched directly)
+        stale: True if served past the cache TTL while a refresh runs
+    """
+
+    timestamps: npt.NDArray[np.int64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.int64]
+    tz: str = "UTC"
+    stored_at: float | None = None
+    stale: bool = False
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def empty(cls) -> "OHLCVBars":
+        """Create an empty bar set."""
+        return cls(
+            timestamps=np.empty(0, dtype=np.int64),
+            open=np.empty(0, dtype=np.float64),
+            high=np.empty(0, dtype=np.float64),
+            low=np.empty(0, dtype=np.float64),
+            close=np.empty(0, dtype=np.float64),
+            volume=np.empty(0, dtype=np.int64),
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame | None) -> "OHLCVBars":
+        """
+        Build from a vendor DataFrame indexed by timestamp.
+
+        Accepts Title-case or lowercase column names; naive timestamps are
+        treated as UTC, matching the previous row-based conversion.
+        """
+        if df is None or df.empty:
+            return cls.empty()
+
+        index = pd.DatetimeIndex(df.index).as_unit("ns")
+        tz = "UTC"
+        if index.tz is None:
+            index = index.tz_localize(UTC)
+        else:
+            tz = str(index.tz)
+            index = index.tz_convert(UTC)
+
+        order = np.argsort(index.asi8, kind="stable")
+
+        def column(name: str, dtype: type) -> npt.NDArray[Any]:
+            for candidate in (name, name.lower()):
+                if candidate in df.columns:
+                    values = pd.to_numeric(df[candidate], errors="coerce")
+                    if dtype is np.int64:
+                        values = values.fillna(0)
+                    return np.asarray(values, dtype=dtype)[order]
+            return np.zeros(len(df), dtype=dtype)
+
+        return cls(
+            timestamps=index.asi8[order].astype(np.int64),
+            open=column("Open", np.float64),
+            high=column("High", np.float64),
+            low=column("Low", np.float64),
+            close=column("Close", np.float64),
+            volume=column("Volume", np.int64),
+            tz=tz,
+        )
+
+    @classmethod
+    def from_records(cls, records: Sequence[OHLCVData]) -> "OHLCVBars":
+        """Adapter for callers that still hold a list of OHLCVData."""
+        if not records:
+            return cls.empty()
+        df = pd.DataFrame(
+            {
+                "Open": [r.open for r in records],
+                "High": [r.high for r in records],
+                "Low": [r.low for r in records],
+                "Close": [r.close for r in records],
+                "Volume": [r.volume for r in records],
+            },
+            index=pd.to_datetime([r.date for r in records], utc=True),
+        )
+        return cls.from_dataframe(df)
+
+    # =========================================================================
+    # Conversion
+    # =========================================================================
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        """Timestamps as a DatetimeIndex in the source timezone."""
+        return (
+            pd.DatetimeIndex(self.timestamps.view("datetime64[ns]"))
+            .tz_localize(UTC)
+            .tz_convert(self.tz)
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrame with Open/High/Low/Close/Volume columns, oldest first."""
+        return pd.DataFrame(
+            {
+                "Open": self.open,
+                "High": self.high,
+                "Low": self.low,
+                "Close": self.close,
+                "Volume": self.volume,
+            },
+            index=self.index,
+        )
+
+    def to_list(self) -> list[OHLCVData]:
+        """Materialize as OHLCVData objects, newest first."""
+        return list(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a columnar dictionary for JSON serialization."""
+        return {
+            "format": CACHE_FORMAT,
+            "tz": self.tz,
+            "timestamps": self.timestamps.tolist(),
+            "open": self.open.tolist(),
+            "high": self.high.tolist(),
+            "low": self.low.tolist(),
+            "close": self.close.tolist(),
+            "volume": self.volume.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OHLCVBars":
+        """Create from a columnar dictionary."""
+        return cls(
+            timestamps=np.asarray(data["timestamps"], dtype=np.int64),
+            open=np.asarray(data["open"], dtype=np.float64),
+            high=np.asarray(data["high"], dtype=np.float64),
+            low=np.asarray(data["low"], dtype=np.float64),
+            close=np.asarray(data["close"], dtype=np.float64),
+            volume=np.asarray(data["volume"], dtype=np.int64),
+            tz=data.get("tz", "UTC"),
+        )
+
+    @classmethod
+    def from_cached(cls, cached: dict[str, Any] | list[dict[str, Any]]) -> "OHLCVBars":
+        """
+        Decode a cached OHLCV entry.
+
+        Handles both the columnar format and legacy entries written as a
+        list of OHLCVData dicts, so existing Redis keys stay readable.
+        """
+        if isinstance(cached, dict):
+            return cls.from_dict(cached)
+        return cls.from_records([OHLCVData.from_dict(d) for d in cached])
+
+    # =========================================================================
+    # Sequence adapter (newest first, like the old list[OHLCVData])
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return int(self.timestamps.size)
+
+    @overload
+    def __getitem__(self, position: int) -> OHLCVData: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[OHLCVData]: ...
+
+    def __getitem__(self, position: int | slice) -> OHLCVData | list[OHLCVData]:
+        if isinstance(position, slice):
+            return [self[i] for i in range(len(self))[position]]
+        size = len(self)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError("OHLCVBars index out of range")
+        return self._record(size - 1 - position)
+
+    def __iter__(self) -> Iterator[OHLCVData]:
+        for row in range(len(self) - 1, -1, -1):
+            yield self._record(row)
+
+    def _record(self, row: int) -> OHLCVData:
+        date = pd.Timestamp(int(self.timestamps[row]), tz=UTC).tz_convert(self.tz)
+        return OHLCVData(
+            date=date.to_pydatetime(),
+            open=float(self.open[row]),
+            high=float(self.high[row]),
+            low=float(self.low[row]),
+            close=float(self.close[row]),
+            volume=int(self.volume[row]),
+        )
+
+    @property
+    def age_seconds(self) -> float | None:
+        """Seconds since the bars were cached, or None if unknown."""
+        if self.stored_at is None:
+            return None
+        return max(time.time() - self.stored_at, 0.0)
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the column arrays."""
+        return sum(
+            column.nbytes
+            for column in (
+                self.timestamps,
+                self.open,
+                self.high,
+                self.low,
+                self.close,
+                self.volume,
+            )
+        )
@@ -2,83 +2,163 @@
 Cache operations wrapper for the Data Manager Layer.
 
 Provides a thin abstraction over Redis operations with:
-- JSON serialization for complex data types
-- TTL management
+- Optional in-process L1 cache in front of Redis
+- Per-domain value codecs (JSON, compressed JSON, columnar arrays)
+- TTL management, with optional stale-while-revalidate (soft/hard TTL)
 - Cache statistics logging
-- Pattern-based invalidation
+- Pattern-based invalidation (propagated to other pods' L1 via pub/sub)
 """
 
-import json
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
 
+from . import codec
+from .coherence import L1CoherenceMixin
+from .local_cache import LayerStats, LocalCache
+from .refresh import BackgroundRefresher, CachedValue
+
 logger = structlog.get_logger(__name__)
 
 
-class CacheOperations:
+class CacheOperations(L1CoherenceMixin):
     """
     Redis cache operations for the Data Manager Layer.
 
     Wraps the existing RedisCache client with DML-specific functionality:
-    - Automatic JSON serialization/deserialization
-    - Cache hit/miss logging for monitoring
+    - L1 (in-process) lookups before Redis when a LocalCache is supplied
+    - Codec selection per key domain
+    - Cache hit/miss logging and per-layer hit-ratio metrics
     - Pattern-based key invalidation
     """
 
-    def __init__(self, redis_cache: Any):
+    def __init__(
+        self,
+        redis_cache: Any,
+        local_cache: LocalCache | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Initialize cache operations.
 
         Args:
             redis_cache: RedisCache instance from database.redis
+            local_cache: Optional in-process L1 cache shared by this pod
+            clock: Wall-clock time source for entry ages (injectable for tests)
         """
         self._redis = redis_cache
+        self._local = local_cache
+        self._clock = clock
+        self._refresher = BackgroundRefresher()
+        self._l2_stats = LayerStats()
+        self._instance_id = uuid.uuid4().hex
+        self._listener: asyncio.Task[None] | None = None
+
+    def _decode(self, key: str, payload: bytes) -> Any:
+        """Decode a raw payload, treating undecodable entries as a miss."""
+        return self._decode_entry(key, payload)[0]
+
+    def _decode_entry(self, key: str, payload: bytes) -> tuple[Any, float | None]:
+        try:
+            return codec.decode_entry(payload)
+        except codec.CodecError as e:
+            logger.warning("cache_decode_error", key=key, error=str(e))
+            return None, None
+
+    def _l1_enabled(self, key: str) -> bool:
+        return self._local is not None and self._local.ttl_for(key) > 0
 
     async def get(self, key: str) -> dict | list | None:
         """
-        Get cached value by key.
+        Get cached value by key, checking L1 before Redis.
 
         Args:
             key: Cache key
 
         Returns:
-            Cached value (dict or list) or None if not found
+            Cached value (dict or list) or None if not found. Columnar
+            entries decode numeric columns to NumPy arrays. Values served
+            from L1 are shared; treat them as read-only.
+        """
+        entry = await self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    async def get_entry(self, key: str) -> CachedValue | None:
+        """
+        Like `get`, but also returns when the value was stored.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedValue (stored_at is None for entries without a stamp) or
+            None if not found
+        """
+        l1 = self._l1_enabled(key)
+        if self._local is not None and l1:
+            found = self._local.lookup(key)
+            if found is not None:
+                logger.debug("cache_hit", key=key, layer="l1")
+                return CachedValue(*found)
+
+        entry, l2_ttl = await self._get_l2(key, with_ttl=l1)
+        self._l2_stats.record(hit=entry is not None)
+        if entry is not None and self._local is not None and l1:
+            # Never keep the copy past the Redis entry's remaining TTL
+            self._local.set(key, entry.value, l2_ttl, entry.stored_at)
+        return entry
+
+    async def _get_l2(
+        self, key: str, with_ttl: bool = False
+    ) -> tuple[CachedValue | None, float | None]:
+        """
+        Get a value from Redis.
+
+        Returns:
+            (CachedValue or None, remaining Redis TTL in seconds); the TTL is
+            only read when `with_ttl` is set and is None for keys without one
         """
         try:
-            value = await self._redis.get(key)
+            if with_ttl:
+                raw, l2_ttl = await self._redis.get_raw_with_ttl(key)
+            else:
+                raw, l2_ttl = await self._redis.get_raw(key), None
+            value, stored_at = (
+                self._decode_entry(key, raw) if raw is not None else (None, None)
+            )
 
             if value is None:
                 logger.debug("cache_miss", key=key)
-                return None
+                return None, None
 
             logger.debug("cache_hit", key=key)
-
-            # Handle both string and already-parsed values
-            if isinstance(value, dict | list):
-                return value
-
-            # Try to parse JSON string
-            if isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return value
-
-            return value
+            return CachedValue(value, stored_at), l2_ttl
 
         except Exception as e:
             logger.warning("cache_get_error", key=key, error=str(e))
-            return None
+            return None, None
 
-    async def set(self, key: str, value: dict | list, ttl_seconds: int) -> bool:
+    async def set(
+        self,
+        key: str,
+        value: dict | list,
+        ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
+    ) -> bool:
         """
         Set cached value with TTL.
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
-            ttl_seconds: Time-to-live in seconds
+            value: Value to cache (encoded with the key's codec)
+            ttl_seconds: Time-to-live in seconds (soft TTL when stale_ttl_seconds
+                is set)
+            stale_ttl_seconds: Extra seconds Redis keeps the entry so it can be
+                served stale while refreshing (see `get_with_fetch`)
 
         Returns:
             True if successful, False otherwise
@@ -87,12 +167,31 @@ class CacheOperations:
             logger.debug("cache_skip_no_ttl", key=key)
             return False
 
-        try:
-            # Serialize to JSON string
-            json_value = json.dumps(value, default=str)
+        stored_at = self._clock()
+        hard_ttl = ttl_seconds + max(stale_ttl_seconds, 0)
+
+        l1 = self._l1_enabled(key)
+        if self._local is not None and l1:
+            self._local.set(key, value, ttl_seconds, stored_at)
 
-            await self._redis.set(key, json_value, ttl_seconds)
-            logger.debug("cache_set", key=key, ttl=ttl_seconds)
+        try:
+            key_codec = codec.codec_for_key(key)
+            payload = key_codec.encode(value, stored_at)
+            # Other pods hold a key in L1 only while it exists in Redis (L1
+            # TTLs are capped by the remaining Redis TTL), so only a write
+            # that replaces an existing entry needs an invalidation
+            created = l1 and await self._redis.set_raw(key, payload, hard_ttl, nx=True)
+            if not created:
+                await self._redis.set_raw(key, payload, hard_ttl)
+                if l1:
+                    await self._publish_invalidation(keys=[key])
+            logger.debug(
+                "cache_set",
+                key=key,
+                ttl=hard_ttl,
+                codec=key_codec.name,
+                size=len(payload),
+            )
             return True
 
         except Exception as e:
@@ -109,6 +208,10 @@ class CacheOperations:
         Returns:
             True if key was deleted, False otherwise
         """
+        if self._local is not None and self._l1_enabled(key):
+            self._local.delete(key)
+            await self._publish_invalidation(keys=[key])
+
         try:
             result = await self._redis.delete(key)
             logger.debug("cache_delete", key=key, deleted=result > 0)
@@ -145,6 +248,10 @@ class CacheOperations:
         Returns:
             Number of keys deleted
         """
+        if self._local is not None:
+            self._local.delete_pattern(pattern)
+            await self._publish_invalidation(pattern=pattern)
+
         try:
             deleted = 0
             cursor = 0
@@ -152,7 +259,7 @@ class CacheOperations:
             # Use SCAN to safely iterate over keys
             while True:
                 # Access the underlying redis client
-                redis_client = self._redis._client
+                redis_client = self._redis.client
                 cursor, keys = await redis_client.scan(
                     cursor=cursor, match=pattern, count=100
                 )
@@ -175,44 +282,159 @@ class CacheOperations:
         key: str,
         fetch_func,
         ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
     ) -> dict | list | None:
         """
         Get cached value or fetch and cache if missing.
 
-        Uses the existing get_with_dedup pattern from RedisCache
-        if available, falling back to simple get/set.
+        Misses go through RedisCache.get_with_dedup, so concurrent callers
+        across pods share one fetch.
 
         Args:
             key: Cache key
             fetch_func: Async function to call on cache miss
-            ttl_seconds: TTL for cached value
+            ttl_seconds: TTL for cached value (soft TTL with stale_ttl_seconds)
+            stale_ttl_seconds: Window after ttl_seconds during which an expired
+                value is returned immediately while one background refresh
+                runs (0 disables stale-while-revalidate)
 
         Returns:
             Cached or fetched value
+
+        Raises:
+            Exception: Whatever fetch_func raises
+        """
+        entry = await self.get_entry_with_fetch(
+            key, fetch_func, ttl_seconds, stale_ttl_seconds
+        )
+        return entry.value if entry is not None else None
+
+    async def get_entry_with_fetch(
+        self,
+        key: str,
+        fetch_func,
+        ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
+    ) -> CachedValue | None:
+        """
+        Like `get_with_fetch`, but returns the value with its age and whether
+        it was served stale.
+
+        Returns:
+            CachedValue, or None if nothing was cached or fetched
         """
         # Try cache first
-        cached = await self.get(key)
+        cached = await self.get_entry(key)
         if cached is not None:
-            return cached
+            age = cached.age_seconds(self._clock())
+            if age is None or age < ttl_seconds:
+                return cached
+            if age < ttl_seconds + stale_ttl_seconds:
+                cached.stale = True
+                self._refresher.stats.record_stale(key, age)
+                self._refresher.schedule_fetch(
+                    key,
+                    fetch_func,
+                    store=lambda v: self.set(key, v, ttl_seconds, stale_ttl_seconds),
+                    acquire_lock=self._redis.acquire_lock,
+                    release_lock=self._redis.release_lock,
+                )
+                logger.debug("cache_stale_hit", key=key, age_seconds=round(age, 1))
+                return cached
+            # Older than the hard TTL (e.g. an L1 copy outlived Redis): refetch
 
         # Skip caching for zero TTL
         if ttl_seconds <= 0:
-            return await fetch_func()
-
-        # Try to use dedup if available (check it's actually callable, not a mock)
-        get_with_dedup = getattr(self._redis, "get_with_dedup", None)
-        if get_with_dedup is not None and callable(get_with_dedup):
-            # Additional check: ensure it's not a mock (for testing)
-            if not str(type(get_with_dedup).__module__).startswith("unittest.mock"):
-                try:
-                    result = await get_with_dedup(key, fetch_func, ttl_seconds)
-                    return result
-                except Exception:
-                    pass  # Fall back to simple fetch
-
-        # Simple fetch and cache
-        result = await fetch_func()
-        if result is not None:
-            await self.set(key, result, ttl_seconds)
-
-        return result
+            result = await fetch_func()
+            return CachedValue(result, self._clock()) if result is not None else None
+
+        hard_ttl = ttl_seconds + max(stale_ttl_seconds, 0)
+
+        # Deduplicated fetch: one caller across pods fetches, the rest wait;
+        # fetch_func errors propagate to every waiting caller
+        key_codec = codec.codec_for_key(key)
+        result = await self._redis.get_with_dedup(
+            key,
+            fetch_func,
+            hard_ttl,
+            encode=lambda value: key_codec.encode(value, self._clock()),
+            decode=lambda raw: self._decode(key, raw),
+        )
+        if result is None:
+            return None
+        stored_at = self._clock()
+        if self._local is not None and self._l1_enabled(key):
+            self._local.set(key, result, ttl_seconds, stored_at)
+        return CachedValue(result, stored_at)
+
+    async def get_many_with_fetch(
+        self,
+        keys: dict[str, str],
+        fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]],
+        ttl_seconds: int,
+    ) -> dict[str, Any]:
+        """
+        Batch form of `get_with_fetch`: look up many keys, then fetch all
+        misses with one `fetch_many` call and cache each result.
+
+        Args:
+            keys: Item id (e.g. symbol) -> cache key
+            fetch_many: Async function mapping missing ids to {id: value};
+                ids it leaves out are not cached
+            ttl_seconds: TTL for each fetched value
+
+        Returns:
+            Dict of id -> cached or fetched value, for the ids that have one
+
+        Raises:
+            Exception: Whatever fetch_many raises
+        """
+        ids = list(keys)
+        entries = await asyncio.gather(*(self.get_entry(keys[i]) for i in ids))
+
+        now = self._clock()
+        results: dict[str, Any] = {}
+        misses: list[str] = []
+        for item_id, entry in zip(ids, entries, strict=True):
+            if entry is not None:
+                age = entry.age_seconds(now)
+                if age is None or age < ttl_seconds:
+                    results[item_id] = entry.value
+                    continue
+            misses.append(item_id)
+
+        if not misses:
+            return results
+
+        fetched = await fetch_many(misses)
+        fetched = {i: v for i, v in fetched.items() if i in keys and v is not None}
+        await asyncio.gather(
+            *(self.set(keys[i], v, ttl_seconds) for i, v in fetched.items())
+        )
+        logger.debug(
+            "cache_batch_fetch",
+            requested=len(ids),
+            hits=len(results),
+            fetched=len(fetched),
+        )
+        results.update(fetched)
+        return results
+
+    async def wait_for_refreshes(self) -> None:
+        """Wait for background refreshes started by stale reads."""
+        await self._refresher.wait()
+
+    async def cancel_refreshes(self) -> None:
+        """Cancel background refreshes (e.g. at shutdown)."""
+        await self._refresher.cancel_all()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit-ratio metrics per cache layer plus stale-serve/refresh counters."""
+        return {
+            "l1": self._local.to_dict() if self._local is not None else None,
+            "l2": self._l2_stats.to_dict(),
+            "stale": {
+                **self._refresher.stats.to_dict(),
+                "refreshing": self._refresher.inflight,
+            },
+        }
@@ -0,0 +1,286 @@
+"""
+Cache value codecs for the Data Manager Layer.
+
+Cached values are framed as:
+
+    MAGIC (2 bytes) | format version (1 byte) | codec id (1 byte) |
+    stored-at (float64 epoch seconds, format version 2+) | body
+
+The stored-at stamp lets readers tell how old an entry is (stale-while-
+revalidate) without an extra TTL round-trip.
+
+The codec is chosen per key domain (see `codec_for_key`):
+- JSON: small documents (quotes, PCR) where parsing cost is negligible
+- Compressed JSON: larger row-oriented documents (options chains, macro, sentiment)
+- Columnar: OHLCV bar columns stored as raw NumPy buffers
+
+Entries written before framing existed are plain JSON strings. They never start
+with MAGIC (0xFA is not a valid UTF-8 lead byte), so `decode` still reads them.
+"""
+
+import json
+import struct
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+
+from .keys import CacheKeys
+
+MAGIC = b"\xfa\xdc"
+FORMAT_VERSION = 2
+V1_HEADER_SIZE = len(MAGIC) + 2  # No stored-at stamp
+HEADER_SIZE = V1_HEADER_SIZE + 8
+
+
+class CodecError(ValueError):
+    """Raised when a cached payload cannot be decoded."""
+
+
+class CacheCodec(ABC):
+    """Base codec: subclasses implement `encode_body`/`decode_body`."""
+
+    codec_id = 0
+    name = "base"
+
+    def encode(self, value: Any, stored_at: float | None = None) -> bytes:
+        """Encode a value into a framed payload stamped with `stored_at`."""
+        return frame(self.codec_id, self.encode_body(value), stored_at)
+
+    @abstractmethod
+    def encode_body(self, value: Any) -> bytes:
+        """Serialize a value into the codec body (without the frame header)."""
+
+    @abstractmethod
+    def decode_body(self, body: bytes) -> Any:
+        """Deserialize a codec body back into a value."""
+
+
+class JSONCodec(CacheCodec):
+    """Plain UTF-8 JSON (same serialization rules as the legacy cache)."""
+
+    codec_id = 1
+    name = "json"
+
+    def encode_body(self, value: Any) -> bytes:
+        return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+    def decode_body(self, body: bytes) -> Any:
+        return json.loads(body)
+
+
+class CompressedJSONCodec(JSONCodec):
+    """
+    zlib-compressed JSON for large documents.
+
+    Payloads under `min_size` bytes are written as plain JSON, since
+    compression would cost more than it saves.
+    """
+
+    codec_id = 2
+    name = "json+zlib"
+
+    def __init__(self, min_size: int = 1024, level: int = 1):
+        self.min_size = min_size
+        self.level = level
+
+    def encode(self, value: Any, stored_at: float | None = None) -> bytes:
+        body = super().encode_body(value)
+        if len(body) < self.min_size:
+            return frame(JSONCodec.codec_id, body, stored_at)
+        return frame(self.codec_id, zlib.compress(body, self.level), stored_at)
+
+    def encode_body(self, value: Any) -> bytes:
+        return zlib.compress(super().encode_body(value), self.level)
+
+    def decode_body(self, body: bytes) -> Any:
+        return json.loads(zlib.decompress(body))
+
+
+class ColumnarCodec(CacheCodec):
+    """
+    Numeric columns as raw NumPy buffers, everything else as JSON metadata.
+
+    Body layout: uint32 metadata length | metadata JSON | zlib(column buffers).
+    Each column buffer is byte-shuffled (byte 0 of every value, then byte 1...)
+    so slowly-changing prices and timestamps compress well. Numeric lists
+    decode to NumPy arrays rather than lists. Values without numeric columns
+    (e.g. legacy row lists) are handed to `fallback`.
+    """
+
+    codec_id = 3
+    name = "columnar"
+
+    def __init__(self, fallback: CacheCodec, level: int = 1):
+        self.fallback = fallback
+        self.level = level
+
+    def encode(self, value: Any, stored_at: float | None = None) -> bytes:
+        columns = self._numeric_columns(value)
+        if not columns:
+            return self.fallback.encode(value, stored_at)
+        return frame(self.codec_id, self._columnar_body(value, columns), stored_at)
+
+    def encode_body(self, value: Any) -> bytes:
+        columns = self._numeric_columns(value)
+        if not columns:
+            raise CodecError("Value has no numeric columns for the columnar codec")
+        return self._columnar_body(value, columns)
+
+    def _columnar_body(self, value: dict, columns: dict[str, np.ndarray]) -> bytes:
+        fields = {k: v for k, v in value.items() if k not in columns}
+        meta = json.dumps(
+            {
+                "fields": fields,
+                "columns": [
+                    [name, array.dtype.str, len(array)]
+                    for name, array in columns.items()
+                ],
+            },
+            default=str,
+            separators=(",", ":"),
+        ).encode()
+        buffers = b"".join(_shuffle(array) for array in columns.values())
+        return struct.pack("<I", len(meta)) + meta + zlib.compress(buffers, self.level)
+
+    def decode_body(self, body: bytes) -> Any:
+        (meta_size,) = struct.unpack_from("<I", body)
+        meta = json.loads(body[4 : 4 + meta_size])
+        buffers = zlib.decompress(body[4 + meta_size :])
+
+        result = dict(meta["fields"])
+        offset = 0
+        for name, dtype_str, length in meta["columns"]:
+            dtype = np.dtype(dtype_str)
+            size = dtype.itemsize * length
+            result[name] = _unshuffle(buffers[offset : offset + size], dtype)
+            offset += size
+        return result
+
+    @staticmethod
+    def _numeric_columns(value: Any) -> dict[str, np.ndarray]:
+        if not isinstance(value, dict):
+            return {}
+        columns = {}
+        for name, column in value.items():
+            if not isinstance(column, list | np.ndarray) or len(column) == 0:
+                continue
+            array = np.asarray(column)
+            if array.ndim == 1 and array.dtype.kind in "iuf":
+                columns[name] = array
+        return columns
+
+
+def _shuffle(array: np.ndarray) -> bytes:
+    """Transpose a column's bytes so equal-significance bytes are adjacent."""
+    itemsize = array.dtype.itemsize
+    return np.ascontiguousarray(array).view(np.uint8).reshape(-1, itemsize).T.tobytes()
+
+
+def _unshuffle(buffer: bytes, dtype: np.dtype) -> np.ndarray:
+    """Inverse of `_shuffle`."""
+    matrix = np.frombuffer(buffer, dtype=np.uint8).reshape(dtype.itemsize, -1)
+    return np.ascontiguousarray(matrix.T).view(dtype).ravel()
+
+
+JSON = JSONCodec()
+COMPRESSED_JSON = CompressedJSONCodec()
+COLUMNAR = ColumnarCodec(fallback=COMPRESSED_JSON)
+
+_CODECS_BY_ID: dict[int, CacheCodec] = {
+    codec.codec_id: codec for codec in (JSON, COMPRESSED_JSON, COLUMNAR)
+}
+
+# (domain, type) -> codec; "*" matches any type within the domain
+DOMAIN_CODECS: dict[tuple[str, str], CacheCodec] = {
+    (CacheKeys.MARKET, "quote"): JSON,
+    (CacheKeys.MARKET, "pcr"): JSON,
+    (CacheKeys.MARKET, "options"): COMPRESSED_JSON,
+    (CacheKeys.MARKET, "*"): COLUMNAR,  # OHLCV by granularity
+    (CacheKeys.MACRO, "*"): COMPRESSED_JSON,
+    (CacheKeys.SENTIMENT, "*"): COMPRESSED_JSON,
+}
+
+
+def frame(codec_id: int, body: bytes, stored_at: float | None = None) -> bytes:
+    """Prefix a codec body with the versioned header (stored-at defaults to now)."""
+    if stored_at is None:
+        stored_at = time.time()
+    return (
+        MAGIC + bytes((FORMAT_VERSION, codec_id)) + struct.pack("<d", stored_at) + body
+    )
+
+
+def codec_for_key(key: str) -> CacheCodec:
+    """
+    Select the codec for a cache key by its domain and type.
+
+    Args:
+        key: Cache key following the CacheKeys convention
+
+    Returns:
+        Codec to encode values for this key (JSON if the domain is unknown)
+    """
+    return CacheKeys.lookup(key, DOMAIN_CODECS, JSON)
+
+
+def encode(key: str, value: Any) -> bytes:
+    """Encode a value with the codec registered for its key."""
+    return codec_for_key(key).encode(value)
+
+
+def decode(payload: bytes | str) -> Any:
+    """
+    Decode a cached payload written by any codec or by the legacy JSON cache.
+
+    Raises:
+        CodecError: If the header names an unknown version/codec or the body
+            is corrupt
+    """
+    return decode_entry(payload)[0]
+
+
+def decode_entry(payload: bytes | str) -> tuple[Any, float | None]:
+    """
+    Decode a cached payload and its stored-at stamp.
+
+    Returns:
+        (value, stored_at) where stored_at is epoch seconds, or None for
+        legacy and version 1 payloads that carry no stamp
+
+    Raises:
+        CodecError: If the header names an unknown version/codec or the body
+            is corrupt
+    """
+    if isinstance(payload, str):
+        payload = payload.encode()
+
+    if not payload.startswith(MAGIC):
+        try:
+            return json.loads(payload), None
+        except ValueError:
+            # Legacy plain-string values were returned as-is
+            return payload.decode(errors="replace"), None
+
+    if len(payload) < V1_HEADER_SIZE:
+        raise CodecError("Truncated cache payload header")
+    version, codec_id = payload[len(MAGIC)], payload[len(MAGIC) + 1]
+    if version == 1:
+        header_size, stored_at = V1_HEADER_SIZE, None
+    elif version == FORMAT_VERSION:
+        if len(payload) < HEADER_SIZE:
+            raise CodecError("Truncated cache payload header")
+        header_size = HEADER_SIZE
+        (stored_at,) = struct.unpack_from("<d", payload, V1_HEADER_SIZE)
+    else:
+        raise CodecError(f"Unsupported cache format version {version}")
+    codec = _CODECS_BY_ID.get(codec_id)
+    if codec is None:
+        raise CodecError(f"Unknown cache codec id {codec_id}")
+
+    try:
+        return codec.decode_body(payload[header_size:]), stored_at
+    except (ValueError, zlib.error, struct.error) as e:
+        raise CodecError(f"Corrupt {codec.name} payload: {e}") from e
@@ -0,0 +1,97 @@
+"""
+Cross-pod L1 coherence for the Data Manager Layer cache.
+
+Each pod keeps its own in-process L1. When a pod overwrites or deletes a key,
+it publishes an invalidation on a Redis pub/sub channel so other pods drop
+their L1 copy.
+"""
+
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+import structlog
+
+from .local_cache import LocalCache
+
+logger = structlog.get_logger(__name__)
+
+
+class L1CoherenceMixin:
+    """Publishes and applies L1 invalidations for CacheOperations."""
+
+    INVALIDATION_CHANNEL = "dml:invalidate"
+
+    _redis: Any
+    _local: LocalCache | None
+    _instance_id: str
+    _listener: asyncio.Task[None] | None
+
+    async def _publish_invalidation(
+        self, pattern: str | None = None, keys: list[str] | None = None
+    ) -> None:
+        """Tell other pods to drop L1 entries for keys or a pattern."""
+        message = json.dumps(
+            {"origin": self._instance_id, "pattern": pattern, "keys": keys or []}
+        )
+        try:
+            await self._redis.publish(self.INVALIDATION_CHANNEL, message)
+        except Exception as e:
+            logger.warning("cache_invalidation_publish_error", error=str(e))
+
+    def apply_invalidation(self, message: str) -> int:
+        """
+        Apply an invalidation message from another pod to the local L1.
+
+        Returns:
+            Number of L1 entries dropped
+        """
+        if self._local is None:
+            return 0
+        payload = json.loads(message)
+        if payload.get("origin") == self._instance_id:
+            return 0
+        dropped = sum(self._local.delete(key) for key in payload.get("keys", []))
+        if payload.get("pattern"):
+            dropped += self._local.delete_pattern(payload["pattern"])
+        return dropped
+
+    async def _listen_for_invalidations(self) -> None:
+        while True:
+            try:
+                async for message in self._redis.listen(self.INVALIDATION_CHANNEL):
+                    try:
+                        self.apply_invalidation(message)
+                    except (ValueError, TypeError) as e:
+                        logger.warning("cache_invalidation_bad_message", error=str(e))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("cache_invalidation_listener_error", error=str(e))
+            # Messages may have been missed while unsubscribed
+            if self._local is not None:
+                self._local.clear()
+            await asyncio.sleep(1.0)
+
+    def start_invalidation_listener(self) -> bool:
+        """
+        Subscribe to cross-pod invalidations (no-op without L1).
+
+        Returns:
+            True if a listener is running
+        """
+        if self._local is None:
+            return False
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
+        return True
+
+    async def stop_invalidation_listener(self) -> None:
+        """Cancel the invalidation listener if running."""
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._listener
+        self._listener = None
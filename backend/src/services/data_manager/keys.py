@@ -9,6 +9,10 @@ This module provides consistent key generation to ensure:
 - Clear organization by data domain
 """
 
+from typing import TypeVar
+
+T = TypeVar("T")
+
 
 class CacheKeys:
     """
@@ -122,17 +126,20 @@ class CacheKeys:
         return f"{CacheKeys.MARKET}:options:{symbol.upper()}"
 
     @staticmethod
-    def pcr_symbol(symbol: str) -> str:
+    def pcr_symbol(symbol: str, params: str | None = None) -> str:
         """
         Generate cache key for per-symbol Put/Call Ratio data.
 
         Args:
             symbol: Stock symbol (uppercase)
+            params: Non-default PCR parameters joined with ':'
+                (e.g., '0.1:0.5:1000'); None for the defaults
 
         Returns:
-            Cache key like 'market:pcr:NVDA'
+            Cache key like 'market:pcr:NVDA' or 'market:pcr:NVDA:0.1:0.5:1000'
         """
-        return f"{CacheKeys.MARKET}:pcr:{symbol.upper()}"
+        key = f"{CacheKeys.MARKET}:pcr:{symbol.upper()}"
+        return f"{key}:{params}" if params else key
 
     @staticmethod
     def insights(category_id: str, suffix: str = "latest") -> str:
@@ -169,6 +176,26 @@ class CacheKeys:
             "identifier": ":".join(parts[2:]),  # Handle multi-part identifiers
         }
 
+    @staticmethod
+    def lookup(key: str, table: dict[tuple[str, str], T], default: T) -> T:
+        """
+        Resolve a per-domain setting for a key.
+
+        Args:
+            key: Cache key to look up
+            table: Settings keyed by (domain, type); type "*" matches any type
+            default: Value when neither (domain, type) nor (domain, "*") match
+
+        Returns:
+            The most specific matching setting
+        """
+        parts = CacheKeys.parse(key)
+        domain = parts.get("domain", "")
+        key_type = parts.get("type", "")
+        if (domain, key_type) in table:
+            return table[(domain, key_type)]
+        return table.get((domain, "*"), default)
+
     @staticmethod
     def pattern(domain: str, type_prefix: str = "*") -> str:
         """
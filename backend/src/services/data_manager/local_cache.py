@@ -0,0 +1,227 @@
+"""
+In-process L1 cache for the Data Manager Layer.
+
+Sits in front of Redis inside CacheOperations so repeated reads of the same
+quote/OHLCV/options key within a pod skip the Redis round-trip and decode.
+Entries are bounded by count and approximate bytes (LRU eviction) and expire
+after a per-domain TTL that never exceeds the Redis TTL.
+"""
+
+import fnmatch
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .keys import CacheKeys
+
+# (domain, type) -> L1 TTL in seconds; "*" matches any type. Domains not listed
+# (e.g. ETF holdings) bypass L1.
+DEFAULT_L1_TTLS: dict[tuple[str, str], float] = {
+    (CacheKeys.MARKET, "quote"): 5,
+    (CacheKeys.MARKET, "pcr"): 60,
+    (CacheKeys.MARKET, "options"): 300,
+    (CacheKeys.MARKET, "*"): 60,  # OHLCV by granularity
+    (CacheKeys.MACRO, "*"): 300,
+    (CacheKeys.SENTIMENT, "*"): 120,
+    (CacheKeys.INSIGHTS, "*"): 30,
+}
+
+
+@dataclass
+class LayerStats:
+    """Hit/miss counters for one cache layer."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    size: int
+    stored_at: float | None  # Wall-clock time the value was written to Redis
+
+
+class LocalCache:
+    """
+    Bounded, TTL-aware LRU cache.
+
+    Values are returned by reference; callers must treat them as read-only
+    (DataManager converts them into fresh dataclasses immediately).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: dict[tuple[str, str], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the L1 cache.
+
+        Args:
+            max_entries: Maximum number of keys held
+            max_bytes: Maximum approximate size of all values
+            ttls: Per-domain TTLs (defaults to DEFAULT_L1_TTLS)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = DEFAULT_L1_TTLS if ttls is None else ttls
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.stats = LayerStats()
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by cached values."""
+        return self._bytes
+
+    def ttl_for(self, key: str, l2_ttl: float | None = None) -> float:
+        """L1 TTL for a key: the domain TTL, capped by the Redis TTL if known."""
+        ttl = CacheKeys.lookup(key, self.ttls, 0)
+        if l2_ttl is not None:
+            ttl = min(ttl, l2_ttl)
+        return max(ttl, 0)
+
+    def get(self, key: str) -> Any | None:
+        """Return a live value (marking it most recently used) or None."""
+        found = self.lookup(key)
+        return found[0] if found is not None else None
+
+    def lookup(self, key: str) -> tuple[Any, float | None] | None:
+        """Like `get`, but returns (value, stored_at) so callers can age it."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.record(hit=False)
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.stats.record(hit=False)
+            return None
+        self._entries.move_to_end(key)
+        self.stats.record(hit=True)
+        return entry.value, entry.stored_at
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        l2_ttl: float | None = None,
+        stored_at: float | None = None,
+    ) -> bool:
+        """
+        Store a value if its domain is L1-cacheable and it fits the budget.
+
+        Args:
+            key: Cache key
+            value: Decoded value
+            l2_ttl: Upper bound for the L1 TTL (e.g. remaining Redis freshness)
+            stored_at: Wall-clock time the value was written to Redis
+
+        Returns:
+            True if stored
+        """
+        ttl = self.ttl_for(key, l2_ttl)
+        size = approximate_size(value)
+        if ttl <= 0 or size > self.max_bytes:
+            self.delete(key)
+            return False
+
+        self._remove(key)
+        self._entries[key] = _Entry(value, self._clock() + ttl, size, stored_at)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Drop a key; returns True if it was present."""
+        return self._remove(key)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Drop keys matching a Redis-style glob pattern."""
+        matches = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in matches:
+            self._remove(key)
+        return len(matches)
+
+    def clear(self) -> None:
+        """Drop everything (e.g. after missing invalidation messages)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Size, eviction and hit-ratio metrics."""
+        return {
+            **self.stats.to_dict(),
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry.size
+        return True
+
+
+def approximate_size(value: Any) -> int:
+    """
+    Cheap size estimate for cached values.
+
+    Lists are assumed homogeneous (rows of the same shape), so only the
+    first element is measured; arrays report their buffer size.
+    """
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes) + 112
+    if isinstance(value, str | bytes):
+        return len(value) + 49
+    if isinstance(value, dict):
+        return 64 + sum(
+            approximate_size(k) + approximate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, list | tuple):
+        if not value:
+            return 56
+        return 56 + len(value) * (8 + approximate_size(value[0]))
+    return 32
@@ -15,24 +15,30 @@ Key Features:
 """
 
 import asyncio
+from collections.abc import Awaitable, Sequence
 from datetime import UTC, datetime
 from typing import Any
 
 import pandas as pd
 import structlog
 
+from .bar_store import BarStore, merge_tail, slice_bars
+from .bars import OHLCVBars
 from .cache import CacheOperations
 from .keys import CacheKeys
+from .local_cache import LocalCache
+from .ohlcv_scope import current_ohlcv_scope
+from .options_chain import OptionsChain, PCRParams, PCRTotals
+from .pcr_types import BatchPCRResult, ExpiryPCRData, SymbolPCRData
+from .quote_batcher import QuoteBatcher
 from .types import (
     DataFetchError,
     Granularity,
     IPOData,
     NewsData,
-    OHLCVData,
     OptionContract,
     QuoteData,
     SharedDataContext,
-    SymbolPCRData,
     TreasuryData,
 )
 
@@ -51,6 +57,8 @@ class DataManager:
     - 30min-60min: Short TTL (5-15 min)
     - Daily+: Standard TTL (1-4 hours)
     - Macro data: 1-24 hour TTL based on update frequency
+    - Expired entries within their stale window (Granularity.stale_ttl_seconds,
+      STALE_TTL_*) are served immediately while refreshing in the background
     """
 
     # TTL constants (seconds)
@@ -62,10 +70,37 @@ class DataManager:
     TTL_OPTIONS = 3600  # 1 hour (options chains - daily data)
     TTL_PCR = 3600  # 1 hour (per-symbol Put/Call Ratio)
 
+    # Stale-while-revalidate windows (seconds past the TTL an expired entry is
+    # still served while one background refresh runs; 0 = always block)
+    STALE_TTL_TREASURY = 21600  # 6 hours
+    STALE_TTL_NEWS = 1800  # 30 minutes
+    STALE_TTL_IPO = 86400  # 24 hours
+    STALE_TTL_QUOTE = 0  # Quotes must be current
+    STALE_TTL_OPTIONS = 21600  # 6 hours (chain is previous trading day)
+    STALE_TTL_PCR = 21600  # 6 hours (derived from the options chain)
+
+    # Quote batching: concurrent quote misses within the window are merged
+    # into one REALTIME_BULK_QUOTES request of at most QUOTE_BATCH_SIZE symbols
+    QUOTE_BATCH_WINDOW = 0.005  # 5 ms
+    QUOTE_BATCH_SIZE = 100  # Vendor limit per bulk request
+
+    # Fetches prefetch_shared runs at once (the vendor scheduler paces them
+    # further; this keeps a large plan from flooding the cache and event loop)
+    PREFETCH_CONCURRENCY = 8
+
+    # Options chains get_symbols_pcr fetches at once
+    PCR_BATCH_CONCURRENCY = 8
+
+    # Full daily downloads for the bar store are single-flighted through Redis
+    # and kept this long so concurrent callers across pods share one download
+    TTL_DAILY_FULL_DEDUP = 300  # 5 minutes
+
     def __init__(
         self,
         redis_cache: Any,
         alpha_vantage_service: Any,
+        local_cache: LocalCache | None = None,
+        bar_store: BarStore | None = None,
     ):
         """
         Initialize the Data Manager.
@@ -73,9 +108,20 @@ class DataManager:
         Args:
             redis_cache: RedisCache instance for caching
             alpha_vantage_service: AlphaVantageMarketDataService for API calls
+            local_cache: Optional in-process L1 cache in front of Redis
+            bar_store: Optional on-disk daily history, extended by compact
+                fetches instead of re-downloading full history
         """
-        self._cache = CacheOperations(redis_cache)
+        self._cache = CacheOperations(redis_cache, local_cache)
         self._av_service = alpha_vantage_service
+        self._bar_store = bar_store
+        self._quote_batcher = QuoteBatcher(
+            self._fetch_quotes, self.QUOTE_BATCH_WINDOW, self.QUOTE_BATCH_SIZE
+        )
+        # Cleared once the API key turns out not to be entitled to bulk quotes
+        self._bulk_quotes_enabled = True
+        # Options chain loads in progress, shared by concurrent callers
+        self._options_inflight: dict[str, asyncio.Future[OptionsChain]] = {}
         logger.info("data_manager_initialized")
 
     # =========================================================================
@@ -87,7 +133,7 @@ class DataManager:
         symbol: str,
         granularity: str | Granularity,
         outputsize: str = "compact",
-    ) -> list[OHLCVData]:
+    ) -> OHLCVBars:
         """
         Get OHLCV bars for a symbol.
 
@@ -95,6 +141,10 @@ class DataManager:
         - 1min/5min/15min: NO CACHE (returns fresh data)
         - 30min/60min: 5-15 min TTL
         - daily/weekly/monthly: 1-4 hour TTL
+        - daily "full" with a bar store: history is read from disk and
+          extended with the (cached) compact series; not stored in Redis
+        - inside ohlcv_scope(): each series is loaded once per scope and
+          shared by all its callers
 
         Args:
             symbol: Stock symbol (e.g., "AAPL")
@@ -102,7 +152,7 @@ class DataManager:
             outputsize: "compact" (100 points) or "full" (all data)
 
         Returns:
-            List of OHLCVData objects, newest first
+            Columnar OHLCVBars (iterates/indexes as OHLCVData, newest first)
 
         Raises:
             DataFetchError: If fetch fails
@@ -117,8 +167,27 @@ class DataManager:
             gran = granularity
 
         symbol = symbol.upper()
+        scope = current_ohlcv_scope()
+        if scope is not None:
+            return await scope.get(
+                (symbol, gran.value, outputsize),
+                lambda: self._load_ohlcv(symbol, gran, outputsize),
+            )
+        return await self._load_ohlcv(symbol, gran, outputsize)
+
+    async def _load_ohlcv(
+        self, symbol: str, gran: Granularity, outputsize: str
+    ) -> OHLCVBars:
+        """Internal: OHLCV bars through the bar store or cache."""
         cache_key = CacheKeys.market(gran.value, symbol)
 
+        if (
+            self._bar_store is not None
+            and gran is Granularity.DAILY
+            and outputsize == "full"
+        ):
+            return await self._get_daily_history(self._bar_store, symbol)
+
         # Skip cache for intraday
         if gran.is_intraday:
             logger.debug("ohlcv_no_cache", symbol=symbol, granularity=gran.value)
@@ -127,23 +196,25 @@ class DataManager:
         # Try cache first
         async def fetch_func():
             data = await self._fetch_ohlcv(symbol, gran, outputsize)
-            return [d.to_dict() for d in data]
+            return data.to_dict()
 
-        cached = await self._cache.get_with_fetch(
-            cache_key, fetch_func, gran.ttl_seconds
+        cached = await self._cache.get_entry_with_fetch(
+            cache_key, fetch_func, gran.ttl_seconds, gran.stale_ttl_seconds
         )
 
         if cached is None:
             raise DataFetchError(f"Failed to fetch OHLCV for {symbol}", "market")
 
-        return [OHLCVData.from_dict(d) for d in cached]
+        bars = OHLCVBars.from_cached(cached.value)
+        bars.stored_at, bars.stale = cached.stored_at, cached.stale
+        return bars
 
     async def _fetch_ohlcv(
         self,
         symbol: str,
         granularity: Granularity,
         outputsize: str,
-    ) -> list[OHLCVData]:
+    ) -> OHLCVBars:
         """Internal: Fetch OHLCV from Alpha Vantage."""
         try:
             if granularity.is_intraday or granularity in (
@@ -166,7 +237,7 @@ class DataManager:
                 method = method_map.get(granularity, self._av_service.get_daily_bars)
                 df = await method(symbol=symbol, outputsize=outputsize)
 
-            return self._dataframe_to_ohlcv(df)
+            return OHLCVBars.from_dataframe(df)
 
         except Exception as e:
             logger.error(
@@ -177,35 +248,73 @@ class DataManager:
             )
             raise DataFetchError(str(e), "alpha_vantage") from e
 
-    def _dataframe_to_ohlcv(self, df: pd.DataFrame) -> list[OHLCVData]:
-        """Convert pandas DataFrame to list of OHLCVData."""
-        if df is None or df.empty:
-            return []
+    async def _get_daily_history(self, store: BarStore, symbol: str) -> OHLCVBars:
+        """
+        Internal: Full daily history from the bar store plus the compact series.
 
-        result = []
-        for idx, row in df.iterrows():
-            # Handle both timezone-aware and naive datetimes
-            if isinstance(idx, pd.Timestamp):
-                dt = idx.to_pydatetime()
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-            else:
-                dt = datetime.fromisoformat(str(idx))
-
-            result.append(
-                OHLCVData(
-                    date=dt,
-                    open=float(row.get("Open", row.get("open", 0))),
-                    high=float(row.get("High", row.get("high", 0))),
-                    low=float(row.get("Low", row.get("low", 0))),
-                    close=float(row.get("Close", row.get("close", 0))),
-                    volume=int(row.get("Volume", row.get("volume", 0))),
-                )
-            )
+        Falls back to a full download (and rewrites the store) when nothing
+        is stored, the compact bars no longer reach the stored ones, or stored
+        bars changed (split/dividend re-adjustment). A mismatch is first
+        re-checked against a freshly fetched compact series, in case the
+        cached one predates the stored history.
+        """
+        stored = store.read(Granularity.DAILY.value, symbol)
+        if stored is None:
+            store.stats.misses += 1
+        else:
+            for attempt in range(2):
+                if attempt:
+                    await self._cache.delete(
+                        CacheKeys.market(Granularity.DAILY.value, symbol)
+                    )
+                # The re-check bypasses the request scope's shared series
+                load = self._load_ohlcv if attempt else self.get_ohlcv
+                tail = await load(symbol, Granularity.DAILY, "compact")
+                merged = merge_tail(stored, tail)
+                if merged is not None:
+                    store.stats.hits += 1
+                    # The newest bar may still be forming; persist only the
+                    # ones before it
+                    settled = slice_bars(merged, len(stored), len(merged) - 1)
+                    await self._store_bars(store, symbol, settled, append=True)
+                    merged.stored_at, merged.stale = tail.stored_at, tail.stale
+                    return merged
+            logger.info("bar_store_history_changed", symbol=symbol)
+
+        bars = await self._fetch_daily_full(symbol)
+        await self._store_bars(store, symbol, slice_bars(bars, 0, len(bars) - 1))
+        return bars
+
+    async def _fetch_daily_full(self, symbol: str) -> OHLCVBars:
+        """Internal: Full daily download, deduplicated across callers and pods."""
 
-        # Sort newest first
-        result.sort(key=lambda x: x.date, reverse=True)
-        return result
+        async def fetch_func():
+            data = await self._fetch_ohlcv(symbol, Granularity.DAILY, "full")
+            return data.to_dict()
+
+        cached = await self._cache.get_entry_with_fetch(
+            CacheKeys.market(f"{Granularity.DAILY.value}_full", symbol),
+            fetch_func,
+            self.TTL_DAILY_FULL_DEDUP,
+        )
+        if cached is None:
+            raise DataFetchError(f"Failed to fetch OHLCV for {symbol}", "market")
+        return OHLCVBars.from_cached(cached.value)
+
+    @staticmethod
+    async def _store_bars(
+        store: BarStore, symbol: str, bars: OHLCVBars, append: bool = False
+    ) -> None:
+        """Persist daily bars; disk errors are logged and never fail the read."""
+        if not len(bars):
+            return
+        # Writes take a file lock and fsync; keep them off the event loop
+        write = store.append if append else store.write
+        try:
+            await asyncio.to_thread(write, Granularity.DAILY.value, symbol, bars)
+        except (OSError, ValueError) as e:
+            store.stats.errors += 1
+            logger.warning("bar_store_write_failed", symbol=symbol, error=str(e))
 
     # =========================================================================
     # Macro Data (Treasury, IPO)
@@ -238,7 +347,7 @@ class DataManager:
             return [d.to_dict() for d in data]
 
         cached = await self._cache.get_with_fetch(
-            cache_key, fetch_func, self.TTL_TREASURY
+            cache_key, fetch_func, self.TTL_TREASURY, self.STALE_TTL_TREASURY
         )
 
         if cached is None:
@@ -308,7 +417,9 @@ class DataManager:
             data = await self._fetch_ipo_calendar()
             return [d.to_dict() for d in data]
 
-        cached = await self._cache.get_with_fetch(cache_key, fetch_func, self.TTL_IPO)
+        cached = await self._cache.get_with_fetch(
+            cache_key, fetch_func, self.TTL_IPO, self.STALE_TTL_IPO
+        )
 
         if cached is None:
             return []  # IPO calendar can be empty
@@ -398,7 +509,9 @@ class DataManager:
             data = await self._fetch_news_sentiment(topic, tickers)
             return [d.to_dict() for d in data]
 
-        cached = await self._cache.get_with_fetch(cache_key, fetch_func, self.TTL_NEWS)
+        cached = await self._cache.get_with_fetch(
+            cache_key, fetch_func, self.TTL_NEWS, self.STALE_TTL_NEWS
+        )
 
         if cached is None:
             return []
@@ -473,7 +586,8 @@ class DataManager:
         """
         Get real-time quote for a symbol.
 
-        Uses existing QuotesMixin.get_quote() from Alpha Vantage.
+        Cache misses go through the quote batcher, so concurrent callers
+        (e.g. per-symbol PCR calculations) share one bulk request.
         Short TTL since prices change frequently.
 
         Args:
@@ -488,11 +602,13 @@ class DataManager:
         symbol = symbol.upper()
         cache_key = CacheKeys.quote(symbol)
 
-        async def fetch_func() -> dict[str, Any]:
-            data = await self._fetch_quote(symbol)
-            return data.to_dict()
+        async def fetch_func() -> dict[str, Any] | None:
+            data = await self._quote_batcher.load(symbol)
+            return data.to_dict() if data is not None else None
 
-        cached = await self._cache.get_with_fetch(cache_key, fetch_func, self.TTL_QUOTE)
+        cached = await self._cache.get_with_fetch(
+            cache_key, fetch_func, self.TTL_QUOTE, self.STALE_TTL_QUOTE
+        )
 
         if cached is None:
             raise DataFetchError(f"Failed to fetch quote for {symbol}", "market")
@@ -503,27 +619,116 @@ class DataManager:
 
         return QuoteData.from_dict(cached)
 
+    async def get_quotes(self, symbols: list[str]) -> dict[str, QuoteData]:
+        """
+        Get real-time quotes for many symbols.
+
+        Cached quotes are read per symbol; all misses are fetched together
+        (in bulk requests of QUOTE_BATCH_SIZE symbols) and cached under their
+        own `CacheKeys.quote` entries, so later `get_quote` calls hit.
+
+        Args:
+            symbols: Stock symbols (case-insensitive, duplicates ignored)
+
+        Returns:
+            Dict of symbol (uppercase) -> QuoteData. Symbols that could not be
+            fetched are omitted.
+
+        Raises:
+            DataFetchError: If no quote could be fetched for any missing symbol
+        """
+        keys = {s.upper(): CacheKeys.quote(s) for s in symbols}
+        if not keys:
+            return {}
+
+        async def fetch_many(missing: list[str]) -> dict[str, dict[str, Any]]:
+            data = await self._quote_batcher.load_many(missing)
+            return {s: q.to_dict() for s, q in data.items()}
+
+        cached = await self._cache.get_many_with_fetch(keys, fetch_many, self.TTL_QUOTE)
+
+        return {
+            s: QuoteData.from_dict(v) for s, v in cached.items() if isinstance(v, dict)
+        }
+
+    async def _fetch_quotes(self, symbols: list[str]) -> dict[str, QuoteData]:
+        """
+        Internal: Fetch quotes for a batch of symbols from Alpha Vantage.
+
+        Uses REALTIME_BULK_QUOTES when the API key is entitled to it, and
+        per-symbol GLOBAL_QUOTE requests for anything the bulk call missed.
+        """
+        results: dict[str, QuoteData] = {}
+
+        if self._bulk_quotes_enabled and hasattr(self._av_service, "get_bulk_quotes"):
+            chunks = [
+                symbols[i : i + self.QUOTE_BATCH_SIZE]
+                for i in range(0, len(symbols), self.QUOTE_BATCH_SIZE)
+            ]
+            responses = await asyncio.gather(
+                *(self._av_service.get_bulk_quotes(chunk) for chunk in chunks),
+                return_exceptions=True,
+            )
+            for response in responses:
+                if response is None:
+                    logger.info("bulk_quotes_disabled", reason="not_entitled")
+                    self._bulk_quotes_enabled = False
+                elif isinstance(response, Exception):
+                    logger.warning("bulk_quote_fetch_failed", error=str(response))
+                elif isinstance(response, dict):
+                    for symbol, data in response.items():
+                        try:
+                            results[symbol.upper()] = self._quote_from_response(data)
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.warning(
+                                "bulk_quote_parse_failed", symbol=symbol, error=str(e)
+                            )
+
+        missing = [s for s in symbols if s not in results]
+        if not missing:
+            return results
+
+        # Per-symbol fallback (non-premium keys, or symbols the bulk call missed)
+        fetched = await asyncio.gather(
+            *(self._fetch_quote(s) for s in missing), return_exceptions=True
+        )
+        errors = []
+        for symbol, quote in zip(missing, fetched, strict=True):
+            if isinstance(quote, Exception):
+                errors.append(quote)
+            else:
+                results[symbol] = quote
+
+        if not results and errors:
+            raise errors[0]
+        return results
+
     async def _fetch_quote(self, symbol: str) -> QuoteData:
         """Internal: Fetch quote from Alpha Vantage."""
         try:
             # Reuse existing get_quote() from QuotesMixin
             data = await self._av_service.get_quote(symbol)
-            return QuoteData(
-                symbol=data["symbol"],
-                price=data["price"],
-                volume=data["volume"],
-                latest_trading_day=data["latest_trading_day"],
-                previous_close=data["previous_close"],
-                change=data["change"],
-                change_percent=float(data["change_percent"]),
-                open=data["open"],
-                high=data["high"],
-                low=data["low"],
-            )
+            return self._quote_from_response(data)
         except Exception as e:
             logger.error("quote_fetch_failed", symbol=symbol, error=str(e))
             raise DataFetchError(str(e), "alpha_vantage") from e
 
+    @staticmethod
+    def _quote_from_response(data: dict[str, Any]) -> QuoteData:
+        """Internal: Build QuoteData from a QuotesMixin quote dict."""
+        return QuoteData(
+            symbol=data["symbol"],
+            price=data["price"],
+            volume=data["volume"],
+            latest_trading_day=data["latest_trading_day"],
+            previous_close=data["previous_close"],
+            change=data["change"],
+            change_percent=float(data["change_percent"]),
+            open=data["open"],
+            high=data["high"],
+            low=data["low"],
+        )
+
     async def get_options(self, symbol: str) -> list[OptionContract]:
         """
         Get options chain for a symbol.
@@ -537,40 +742,72 @@ class DataManager:
         Returns:
             List of OptionContract objects
 
+        Raises:
+            DataFetchError: If fetch fails
+        """
+        return (await self.get_options_chain(symbol)).to_contracts()
+
+    async def get_options_chain(self, symbol: str) -> OptionsChain:
+        """
+        Get options chain for a symbol as columns.
+
+        Same cache entry as get_options(); preferred for calculations over
+        the whole chain (see OptionsChain.pcr). Concurrent calls for the same
+        symbol share one load.
+
+        Args:
+            symbol: Stock symbol (e.g., "NVDA")
+
+        Returns:
+            OptionsChain (empty if options data is not available)
+
         Raises:
             DataFetchError: If fetch fails
         """
         symbol = symbol.upper()
+        inflight = self._options_inflight.get(symbol)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load_options_chain(symbol))
+            self._options_inflight[symbol] = inflight
+            inflight.add_done_callback(
+                lambda _: self._options_inflight.pop(symbol, None)
+            )
+        return await asyncio.shield(inflight)
+
+    async def _load_options_chain(self, symbol: str) -> OptionsChain:
+        """Internal: Read the options chain through the cache."""
         cache_key = CacheKeys.options(symbol)
 
-        async def fetch_func() -> list[dict[str, Any]]:
-            data = await self._fetch_options(symbol)
-            return [d.to_dict() for d in data]
+        async def fetch_func() -> dict[str, Any]:
+            return (await self._fetch_options_chain(symbol)).to_dict()
 
         cached = await self._cache.get_with_fetch(
-            cache_key, fetch_func, self.TTL_OPTIONS
+            cache_key, fetch_func, self.TTL_OPTIONS, self.STALE_TTL_OPTIONS
         )
 
-        if cached is None:
-            return []  # Options data may not be available
-
-        # Type assertion: cached is list from get_with_fetch
-        if not isinstance(cached, list):
-            return []
+        if not isinstance(cached, dict | list):
+            return OptionsChain.from_contracts(symbol, [])
 
-        return [OptionContract.from_dict(d) for d in cached]
+        return OptionsChain.from_cached(symbol, cached)
 
-    async def _fetch_options(self, symbol: str) -> list[OptionContract]:
+    async def _fetch_options_chain(self, symbol: str) -> OptionsChain:
         """Internal: Fetch options chain from Alpha Vantage."""
         try:
+            if hasattr(self._av_service, "get_options_chain"):
+                # Streamed, columnar chain (only the fields used below)
+                columns = await self._av_service.get_options_chain(symbol)
+                chain = OptionsChain.from_columns(symbol, columns)
+                logger.info("options_fetched", symbol=symbol, contracts=len(chain))
+                return chain
+
             if not hasattr(self._av_service, "get_historical_options"):
                 logger.warning("options_endpoint_not_available")
-                return []
+                return OptionsChain.from_contracts(symbol, [])
 
             data = await self._av_service.get_historical_options(symbol)
 
             if not data or "data" not in data:
-                return []
+                return OptionsChain.from_contracts(symbol, [])
 
             result = []
             for item in data.get("data", []):
@@ -608,7 +845,7 @@ class DataManager:
                 symbol=symbol,
                 contracts=len(result),
             )
-            return result
+            return OptionsChain.from_contracts(symbol, result)
 
         except Exception as e:
             logger.error("options_fetch_failed", symbol=symbol, error=str(e))
@@ -624,6 +861,7 @@ class DataManager:
         atm_zone_pct: float = 0.15,
         min_premium: float = 0.50,
         min_oi: int = 500,
+        by_expiry: bool = False,
     ) -> SymbolPCRData | None:
         """
         Get Put/Call Ratio data for a symbol with caching.
@@ -638,25 +876,34 @@ class DataManager:
         1. AI agent tools (get_put_call_ratio tool)
         2. AI Sector Risk metric (aggregates multiple symbols)
 
+        Each parameter combination is cached under its own key; the options
+        chain behind them is cached once and shared.
+
         Args:
             symbol: Stock symbol (e.g., "NVDA")
             atm_zone_pct: ATM zone range (default ±15%)
             min_premium: Minimum option premium (default $0.50)
             min_oi: Minimum open interest (default 500)
+            by_expiry: Include the per-expiry breakdown
 
         Returns:
             SymbolPCRData with full details, or None if insufficient data
         """
         symbol = symbol.upper()
-        cache_key = CacheKeys.pcr_symbol(symbol)
+        params = PCRParams(atm_zone_pct, min_premium, min_oi)
+        cache_key = CacheKeys.pcr_symbol(
+            symbol, self._pcr_key_params(params, by_expiry)
+        )
 
         async def fetch_func() -> dict[str, Any] | None:
-            data = await self._calculate_symbol_pcr(
-                symbol, atm_zone_pct, min_premium, min_oi
+            (data,) = await self._calculate_symbol_pcr_sweep(
+                symbol, [params], by_expiry
             )
             return data.to_dict() if data else None
 
-        cached = await self._cache.get_with_fetch(cache_key, fetch_func, self.TTL_PCR)
+        cached = await self._cache.get_with_fetch(
+            cache_key, fetch_func, self.TTL_PCR, self.STALE_TTL_PCR
+        )
 
         if cached is None:
             return None
@@ -666,123 +913,281 @@ class DataManager:
 
         return SymbolPCRData.from_dict(cached)
 
-    async def _calculate_symbol_pcr(
+    async def get_symbol_pcr_sweep(
         self,
         symbol: str,
-        atm_zone_pct: float,
-        min_premium: float,
-        min_oi: int,
-    ) -> SymbolPCRData | None:
+        params: Sequence[PCRParams],
+        by_expiry: bool = False,
+    ) -> list[SymbolPCRData | None]:
         """
-        Internal: Calculate PCR for a single symbol.
+        Get Put/Call Ratio for several parameter sets at once.
 
-        Fetches quote and options data, filters to ATM zone,
-        and calculates dollar-weighted Put/Call Ratio.
-        """
-        try:
-            # Fetch quote and options concurrently
-            quote_task = self.get_quote(symbol)
-            options_task = self.get_options(symbol)
+        Fetches the quote and cached options chain once and evaluates every
+        parameter set in one vectorized pass over the chain.
 
-            quote, options = await asyncio.gather(
-                quote_task, options_task, return_exceptions=True
-            )
+        Args:
+            symbol: Stock symbol (e.g., "NVDA")
+            params: Parameter sets (ATM zone, min premium, min open interest)
+            by_expiry: Include the per-expiry breakdown
 
-            # Handle errors
-            if isinstance(quote, Exception):
-                logger.warning("pcr_quote_failed", symbol=symbol, error=str(quote))
-                return None
+        Returns:
+            SymbolPCRData (or None if insufficient data) per parameter set,
+            in order
+        """
+        if not params:
+            return []
+        return await self._calculate_symbol_pcr_sweep(symbol.upper(), params, by_expiry)
 
-            if isinstance(options, Exception) or not options:
-                logger.warning(
-                    "pcr_options_failed",
-                    symbol=symbol,
-                    error=str(options) if isinstance(options, Exception) else "empty",
-                )
-                return None
-
-            # Get current price
-            current_price = quote.price
-            if current_price <= 0:
-                logger.warning("pcr_invalid_price", symbol=symbol, price=current_price)
-                return None
-
-            # Calculate ATM zone
-            atm_zone_low = current_price * (1 - atm_zone_pct)
-            atm_zone_high = current_price * (1 + atm_zone_pct)
-
-            # Filter options to ATM zone
-            put_notional = 0.0
-            call_notional = 0.0
-            contracts_analyzed = 0
-
-            for contract in options:
-                # Check ATM zone
-                if not (atm_zone_low <= contract.strike <= atm_zone_high):
-                    continue
+    async def get_symbols_pcr(
+        self,
+        symbols: Sequence[str],
+        atm_zone_pct: float = 0.15,
+        min_premium: float = 0.50,
+        min_oi: int = 500,
+        by_expiry: bool = False,
+        max_concurrency: int | None = None,
+    ) -> BatchPCRResult:
+        """
+        Get Put/Call Ratio data for many symbols.
 
-                # Check minimum premium
-                if contract.last_price < min_premium:
-                    continue
+        Uses the same per-symbol cache entries as get_symbol_pcr(). Cache
+        misses share one batched quote request, fetched alongside their
+        options chains (at most `max_concurrency` at a time). A symbol that
+        fails doesn't fail the others.
 
-                # Check minimum open interest
-                if contract.open_interest < min_oi:
-                    continue
+        Args:
+            symbols: Stock symbols (case-insensitive, duplicates ignored)
+            atm_zone_pct: ATM zone range (default ±15%)
+            min_premium: Minimum option premium (default $0.50)
+            min_oi: Minimum open interest (default 500)
+            by_expiry: Include the per-expiry breakdown
+            max_concurrency: Options chains fetched at once
+                (default PCR_BATCH_CONCURRENCY)
 
-                # Calculate notional: OI × Price × 100 (options = 100 shares)
-                notional = contract.open_interest * contract.last_price * 100
+        Returns:
+            BatchPCRResult with PCR data per symbol (in request order) and
+            the reason for every symbol without it
+        """
+        return await self._symbols_pcr(
+            symbols,
+            PCRParams(atm_zone_pct, min_premium, min_oi),
+            by_expiry,
+            asyncio.Semaphore(max_concurrency or self.PCR_BATCH_CONCURRENCY),
+        )
+
+    async def _symbols_pcr(
+        self,
+        symbols: Sequence[str],
+        params: PCRParams,
+        by_expiry: bool,
+        semaphore: asyncio.Semaphore,
+    ) -> BatchPCRResult:
+        """
+        Internal: get_symbols_pcr() with vendor fetches bounded by `semaphore`.
 
-                if contract.option_type == "put":
-                    put_notional += notional
-                elif contract.option_type == "call":
-                    call_notional += notional
+        The quote batch and every options chain fetch each hold a slot, so a
+        semaphore shared with other fetches bounds them all together.
+        """
+        result = BatchPCRResult()
+        suffix = self._pcr_key_params(params, by_expiry)
+        keys = {s.upper(): CacheKeys.pcr_symbol(s, suffix) for s in symbols}
+        if not keys:
+            return result
 
-                contracts_analyzed += 1
+        async def bounded(fetch: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await fetch
+
+        async def fetch_many(missing: list[str]) -> dict[str, dict[str, Any]]:
+            # One quote batch, overlapped with the bounded chain fetches
+            quotes_result, fetched_chains = await asyncio.gather(
+                bounded(self.get_quotes(missing)),
+                asyncio.gather(
+                    *(bounded(self.get_options_chain(s)) for s in missing),
+                    return_exceptions=True,
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(fetched_chains, BaseException):
+                # Chain errors are returned per symbol; only cancellation lands here
+                raise fetched_chains
+            quotes: dict[str, QuoteData] = {}
+            if isinstance(quotes_result, BaseException):
+                if not isinstance(quotes_result, Exception):
+                    raise quotes_result
+                logger.warning("pcr_batch_quotes_failed", error=str(quotes_result))
+            else:
+                quotes = quotes_result
+            chains = dict(zip(missing, fetched_chains, strict=True))
 
-            # Check for sufficient data
-            if contracts_analyzed == 0 or call_notional == 0:
-                logger.warning(
-                    "pcr_insufficient_data",
-                    symbol=symbol,
-                    contracts=contracts_analyzed,
-                    call_notional=call_notional,
+            fetched = {}
+            for symbol in missing:
+                (data,), error = self._pcr_sweep_from(
+                    symbol, quotes.get(symbol), chains.get(symbol), [params], by_expiry
                 )
-                return None
+                if data is not None:
+                    fetched[symbol] = data.to_dict()
+                elif error:
+                    result.errors[symbol] = error
+            return fetched
+
+        try:
+            cached = await self._cache.get_many_with_fetch(
+                keys, fetch_many, self.TTL_PCR
+            )
+        except Exception as e:
+            logger.error("pcr_batch_failed", symbols=len(keys), error=str(e))
+            result.errors = dict.fromkeys(keys, str(e))
+            return result
 
-            # Calculate PCR
-            pcr = put_notional / call_notional
+        for symbol in keys:
+            value = cached.get(symbol)
+            if isinstance(value, dict):
+                result.data[symbol] = SymbolPCRData.from_dict(value)
+                result.errors.pop(symbol, None)
+            else:
+                result.errors.setdefault(symbol, "insufficient options data")
 
-            # Generate interpretation
-            interpretation = self._interpret_pcr(pcr)
+        logger.info(
+            "pcr_batch_completed",
+            symbols=len(keys),
+            calculated=len(result.data),
+            errors=len(result.errors),
+        )
+        return result
 
-            logger.info(
-                "pcr_calculated",
-                symbol=symbol,
-                price=current_price,
-                pcr=round(pcr, 2),
-                contracts=contracts_analyzed,
-            )
+    @staticmethod
+    def _pcr_key_params(params: PCRParams, by_expiry: bool) -> str | None:
+        """Internal: Cache key suffix for non-default PCR requests."""
+        if params == PCRParams() and not by_expiry:
+            return None  # Same key as before parameters were part of it
+        suffix = f"{params.atm_zone_pct:g}:{params.min_premium:g}:{params.min_oi}"
+        return f"{suffix}:expiry" if by_expiry else suffix
 
-            return SymbolPCRData(
-                symbol=symbol,
-                current_price=current_price,
-                atm_zone_low=round(atm_zone_low, 2),
-                atm_zone_high=round(atm_zone_high, 2),
-                put_notional_mm=round(put_notional / 1_000_000, 2),
-                call_notional_mm=round(call_notional / 1_000_000, 2),
-                contracts_analyzed=contracts_analyzed,
-                pcr=round(pcr, 2),
-                interpretation=interpretation,
-                calculated_at=datetime.now(UTC),
-                atm_zone_pct=atm_zone_pct,
-                min_premium=min_premium,
-                min_oi=min_oi,
+    async def _calculate_symbol_pcr_sweep(
+        self,
+        symbol: str,
+        params: Sequence[PCRParams],
+        by_expiry: bool = False,
+    ) -> list[SymbolPCRData | None]:
+        """
+        Internal: Calculate PCR for a single symbol and many parameter sets.
+
+        Fetches quote and options data, filters to the ATM zone and
+        calculates dollar-weighted Put/Call Ratio for every parameter set
+        in one pass over the columnar chain.
+        """
+        try:
+            # Fetch quote and options concurrently
+            quote, chain = await asyncio.gather(
+                self.get_quote(symbol),
+                self.get_options_chain(symbol),
+                return_exceptions=True,
             )
+            results, _ = self._pcr_sweep_from(symbol, quote, chain, params, by_expiry)
+            return results
 
         except Exception as e:
             logger.error("pcr_calculation_failed", symbol=symbol, error=str(e))
+            return [None] * len(params)
+
+    def _pcr_sweep_from(
+        self,
+        symbol: str,
+        quote: QuoteData | BaseException | None,
+        chain: OptionsChain | BaseException | None,
+        params: Sequence[PCRParams],
+        by_expiry: bool,
+    ) -> tuple[list[SymbolPCRData | None], str | None]:
+        """
+        Internal: PCR per parameter set from an already fetched quote/chain.
+
+        Returns:
+            (results, error): error says why every result is None when the
+            inputs are unusable; otherwise None
+        """
+        none: list[SymbolPCRData | None] = [None] * len(params)
+
+        # Handle errors
+        if quote is None or isinstance(quote, BaseException):
+            error = f"quote failed: {quote}" if quote else "quote unavailable"
+            logger.warning("pcr_quote_failed", symbol=symbol, error=error)
+            return none, error
+
+        if chain is None or isinstance(chain, BaseException) or not len(chain):
+            error = str(chain) if isinstance(chain, BaseException) else "empty"
+            logger.warning("pcr_options_failed", symbol=symbol, error=error)
+            return none, f"options failed: {error}"
+
+        # Get current price
+        current_price = quote.price
+        if current_price <= 0:
+            logger.warning("pcr_invalid_price", symbol=symbol, price=current_price)
+            return none, f"invalid price: {current_price}"
+
+        calculated_at = datetime.now(UTC)
+        results: list[SymbolPCRData | None] = []
+        for totals in chain.pcr(current_price, params, by_expiry):
+            results.append(
+                self._pcr_from_totals(symbol, current_price, totals, calculated_at)
+            )
+        return results, None
+
+    def _pcr_from_totals(
+        self,
+        symbol: str,
+        current_price: float,
+        totals: PCRTotals,
+        calculated_at: datetime,
+    ) -> SymbolPCRData | None:
+        """Internal: SymbolPCRData from raw aggregates, None if insufficient."""
+        # Check for sufficient data
+        if totals.contracts_analyzed == 0 or totals.call_notional == 0:
+            logger.warning(
+                "pcr_insufficient_data",
+                symbol=symbol,
+                contracts=totals.contracts_analyzed,
+                call_notional=totals.call_notional,
+            )
             return None
 
+        # Calculate PCR
+        pcr = totals.put_notional / totals.call_notional
+
+        logger.info(
+            "pcr_calculated",
+            symbol=symbol,
+            price=current_price,
+            pcr=round(pcr, 2),
+            contracts=totals.contracts_analyzed,
+        )
+
+        return SymbolPCRData(
+            symbol=symbol,
+            current_price=current_price,
+            atm_zone_low=round(totals.atm_zone_low, 2),
+            atm_zone_high=round(totals.atm_zone_high, 2),
+            put_notional_mm=round(totals.put_notional / 1_000_000, 2),
+            call_notional_mm=round(totals.call_notional / 1_000_000, 2),
+            contracts_analyzed=totals.contracts_analyzed,
+            pcr=round(pcr, 2),
+            interpretation=self._interpret_pcr(pcr),
+            calculated_at=calculated_at,
+            atm_zone_pct=totals.params.atm_zone_pct,
+            min_premium=totals.params.min_premium,
+            min_oi=totals.params.min_oi,
+            expiries=[
+                ExpiryPCRData(
+                    expiration=expiration,
+                    put_notional_mm=round(put / 1_000_000, 2),
+                    call_notional_mm=round(call / 1_000_000, 2),
+                    contracts_analyzed=count,
+                    pcr=round(put / call, 2) if call else None,
+                )
+                for expiration, (put, call, count) in totals.by_expiry.items()
+            ],
+        )
+
     def _interpret_pcr(self, pcr: float) -> str:
         """Generate human-readable PCR interpretation."""
         if pcr < 0.5:
@@ -850,6 +1255,12 @@ class DataManager:
         treasury_maturities: list[str] | None = None,
         include_news: bool = False,
         include_ipo: bool = False,
+        include_quotes: bool = False,
+        history_symbols: list[str] | None = None,
+        intraday_symbols: list[str] | None = None,
+        intraday_granularity: str | Granularity = Granularity.MIN_60,
+        pcr_symbols: list[str] | None = None,
+        max_concurrency: int | None = None,
     ) -> SharedDataContext:
         """
         Pre-fetch shared data in parallel.
@@ -871,19 +1282,43 @@ class DataManager:
             treasury_maturities: Treasury maturities to fetch
             include_news: Whether to fetch news sentiment
             include_ipo: Whether to fetch IPO calendar
+            include_quotes: Whether to fetch quotes for `symbols` (one batch)
+            history_symbols: Symbols to fetch full daily history for
+            intraday_symbols: Symbols to fetch intraday bars for
+            intraday_granularity: Granularity for `intraday_symbols`
+            pcr_symbols: Symbols to fetch Put/Call Ratio data for
+            max_concurrency: Fetches in flight at once, the PCR batch's quote
+                and options chain fetches included (default PREFETCH_CONCURRENCY)
 
         Returns:
             SharedDataContext with all fetched data
         """
         context = SharedDataContext()
-        tasks = []
-        task_keys = []
+        # One budget for every fetch below, including the PCR batch's own
+        semaphore = asyncio.Semaphore(max_concurrency or self.PREFETCH_CONCURRENCY)
+        # Heterogeneous fetches; results are dispatched on their task key
+        tasks: list[Awaitable[Any]] = []
+        task_keys: list[tuple[str, str]] = []
 
         # Queue OHLCV tasks
         for symbol in symbols or []:
             tasks.append(self.get_ohlcv(symbol, "daily"))
             task_keys.append(("ohlcv", symbol.upper()))
 
+        for symbol in history_symbols or []:
+            tasks.append(self.get_ohlcv(symbol, Granularity.DAILY, outputsize="full"))
+            task_keys.append(("history", symbol.upper()))
+
+        for symbol in intraday_symbols or []:
+            tasks.append(self.get_ohlcv(symbol, intraday_granularity))
+            task_keys.append(("intraday", symbol.upper()))
+
+        # Queue PCR as a single batched task (one quote batch plus options
+        # chain fetches, each taking a slot of the shared semaphore)
+        if pcr_symbols:
+            tasks.append(self._symbols_pcr(pcr_symbols, PCRParams(), False, semaphore))
+            task_keys.append(("pcr", "batch"))
+
         # Queue treasury tasks
         for maturity in treasury_maturities or []:
             tasks.append(self.get_treasury(maturity))
@@ -899,6 +1334,11 @@ class DataManager:
             tasks.append(self.get_ipo_calendar())
             task_keys.append(("ipo", "calendar"))
 
+        # Queue quotes as a single batched task
+        if include_quotes and symbols:
+            tasks.append(self.get_quotes(symbols))
+            task_keys.append(("quotes", "batch"))
+
         # Execute all in parallel
         if tasks:
             logger.info(
@@ -908,11 +1348,25 @@ class DataManager:
                 total_tasks=len(tasks),
             )
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async def bounded(task: Awaitable[Any]) -> Any:
+                async with semaphore:
+                    return await task
+
+            # The PCR batch takes slots per fetch, not one for the whole batch
+            results = await asyncio.gather(
+                *(
+                    task if data_type == "pcr" else bounded(task)
+                    for task, (data_type, _) in zip(tasks, task_keys, strict=True)
+                ),
+                return_exceptions=True,
+            )
 
             # Process results
-            for (data_type, key), result in zip(task_keys, results, strict=False):
-                if isinstance(result, Exception):
+            for (data_type, key), result in zip(task_keys, results, strict=True):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        # Cancellation or interpreter exit, not a failed fetch
+                        raise result
                     context.errors[f"{data_type}:{key}"] = str(result)
                     logger.warning(
                         "prefetch_task_failed",
@@ -922,16 +1376,30 @@ class DataManager:
                     )
                 elif data_type == "ohlcv":
                     context.ohlcv[key] = result
+                elif data_type == "history":
+                    context.history[key] = result
+                elif data_type == "intraday":
+                    context.intraday[key] = result
+                elif data_type == "pcr":
+                    context.pcr.update(result.data)
+                    for symbol, error in result.errors.items():
+                        context.pcr[symbol] = None
+                        context.errors[f"pcr:{symbol}"] = error
                 elif data_type == "treasury":
                     context.treasury[key] = result
                 elif data_type == "news":
                     context.news[key] = result
                 elif data_type == "ipo":
                     context.ipo = result
+                elif data_type == "quotes":
+                    context.quotes.update(result)
 
             logger.info(
                 "prefetch_completed",
                 ohlcv_count=len(context.ohlcv),
+                history_count=len(context.history),
+                intraday_count=len(context.intraday),
+                pcr_count=len(context.pcr),
                 treasury_count=len(context.treasury),
                 errors=len(context.errors),
             )
@@ -984,3 +1452,26 @@ class DataManager:
             pattern = CacheKeys.pattern(CacheKeys.INSIGHTS)
 
         return await self._cache.invalidate_pattern(pattern)
+
+    def start_cache_sync(self) -> bool:
+        """Start listening for L1 invalidations published by other pods."""
+        return self._cache.start_invalidation_listener()
+
+    async def stop_cache_sync(self) -> None:
+        """Stop the L1 invalidation listener and pending stale refreshes."""
+        await self._cache.stop_invalidation_listener()
+        await self._cache.cancel_refreshes()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Hit-ratio metrics for the L1 (in-process) and L2 (Redis) layers, plus
+        stale-serve counts/ages, background refresh outcomes, quote
+        batching counters and bar store use (when enabled).
+        """
+        stats = {
+            **self._cache.stats(),
+            "quote_batches": self._quote_batcher.stats.to_dict(),
+        }
+        if self._bar_store is not None:
+            stats["bar_store"] = self._bar_store.stats.to_dict()
+        return stats
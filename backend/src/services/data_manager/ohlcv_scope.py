@@ -0,0 +1,90 @@
+"""
+Request-scoped OHLCV sharing for the Data Manager Layer.
+
+Within one request (e.g. one ReAct agent run), the Fibonacci, Stochastic and
+historical-prices tools often ask for the same symbol and granularity. Inside
+`ohlcv_scope()`, DataManager.get_ohlcv loads each (symbol, granularity,
+outputsize) series once and hands every caller the same in-memory OHLCVBars,
+so the later tools make no Redis, bar store or vendor calls. Concurrent
+callers share the load in progress.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+
+import structlog
+
+from .bars import OHLCVBars
+
+logger = structlog.get_logger()
+
+# (symbol, granularity, outputsize)
+OHLCVKey = tuple[str, str, str]
+
+
+class OHLCVScope:
+    """
+    OHLCV series loaded during one request, shared by its callers.
+
+    Failed or cancelled loads are dropped so a later call can retry; a caller
+    cancelled while waiting (e.g. a tool timeout) does not cancel the load
+    for the others.
+    """
+
+    def __init__(self) -> None:
+        self._series: dict[OHLCVKey, asyncio.Future[OHLCVBars]] = {}
+        self.loads = 0  # Series loaded through DataManager
+        self.hits = 0  # Calls served by a series already loaded or loading
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    async def get(
+        self, key: OHLCVKey, load: Callable[[], Awaitable[OHLCVBars]]
+    ) -> OHLCVBars:
+        """Return the series for `key`, calling `load` only for the first caller."""
+        series = self._series.get(key)
+        if series is None:
+            self.loads += 1
+            series = asyncio.ensure_future(load())
+            self._series[key] = series
+            series.add_done_callback(lambda done: self._drop_failed(key, done))
+        else:
+            self.hits += 1
+        return await asyncio.shield(series)
+
+    def _drop_failed(self, key: OHLCVKey, done: asyncio.Future[OHLCVBars]) -> None:
+        if done.cancelled() or done.exception() is not None:
+            if self._series.get(key) is done:
+                del self._series[key]
+
+
+_scope: ContextVar[OHLCVScope | None] = ContextVar("ohlcv_scope", default=None)
+
+
+def current_ohlcv_scope() -> OHLCVScope | None:
+    """OHLCV scope of the current request, or None outside one."""
+    return _scope.get()
+
+
+@contextlib.contextmanager
+def ohlcv_scope() -> Iterator[OHLCVScope]:
+    """Share OHLCV series between the enclosed block's get_ohlcv calls."""
+    scope = OHLCVScope()
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        try:
+            _scope.reset(token)
+        except ValueError:
+            pass  # Closed from another context (async generator finalizer)
+        if scope.loads:
+            logger.debug(
+                "ohlcv_scope_closed",
+                series=len(scope),
+                loads=scope.loads,
+                shared=scope.hits,
+            )
@@ -0,0 +1,348 @@
+"""
+Columnar options chain and vectorized Put/Call Ratio engine.
+
+OptionsChain keeps one NumPy array per contract field instead of one
+OptionContract per contract. PCR for any number of parameter sets (ATM zone,
+minimum premium, minimum open interest), optionally broken down by expiry,
+is computed in one pass over the arrays, so the cached chain is reused for
+every parameter combination instead of being re-filtered contract by
+contract.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .types import OptionContract
+
+CACHE_FORMAT = "columnar-v1"
+
+# option_type codes; anything else (malformed rows) is OTHER
+OTHER, CALL, PUT = 0, 1, 2
+_TYPE_CODES = {"call": CALL, "put": PUT}
+_TYPE_NAMES = {CALL: "call", PUT: "put"}
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_day(expiration: str) -> int | None:
+    """YYYY-MM-DD (or ISO datetime) to days since epoch, None if invalid."""
+    try:
+        return (datetime.fromisoformat(expiration[:10]) - _EPOCH).days
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class PCRParams:
+    """Filter parameters for the ATM Dollar-Weighted Put/Call Ratio."""
+
+    atm_zone_pct: float = 0.15  # ATM zone ±15%
+    min_premium: float = 0.50  # Minimum option premium
+    min_oi: int = 500  # Minimum open interest
+
+
+@dataclass
+class PCRTotals:
+    """Raw PCR aggregates of one parameter set (notionals in dollars)."""
+
+    params: PCRParams
+    atm_zone_low: float
+    atm_zone_high: float
+    put_notional: float
+    call_notional: float
+    contracts_analyzed: int
+    # expiration (YYYY-MM-DD) -> (put notional, call notional, contracts)
+    by_expiry: dict[str, tuple[float, float, int]] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class OptionsChain:
+    """
+    Options chain stored column-wise.
+
+    Attributes:
+        symbol: Underlying symbol
+        contract_id: Vendor contract identifiers
+        expiration: Expiry dates as int64 days since epoch
+        option_type: CALL / PUT / OTHER codes (int8)
+        strike/last_price/bid/ask/implied_volatility: float64 columns
+        delta: float64, NaN where the vendor sent none
+        volume/open_interest: int64 columns
+    """
+
+    symbol: str
+    contract_id: list[str]
+    expiration: npt.NDArray[np.int64]
+    option_type: npt.NDArray[np.int8]
+    strike: npt.NDArray[np.float64]
+    last_price: npt.NDArray[np.float64]
+    bid: npt.NDArray[np.float64]
+    ask: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.int64]
+    open_interest: npt.NDArray[np.int64]
+    implied_volatility: npt.NDArray[np.float64]
+    delta: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.contract_id)
+
+    # =========================================================================
+    # Construction
+    # =========================================================================
+
+    @classmethod
+    def from_contracts(
+        cls, symbol: str, contracts: Sequence[OptionContract]
+    ) -> "OptionsChain":
+        """Build from OptionContract objects."""
+        return cls(
+            symbol=symbol,
+            contract_id=[c.contract_id for c in contracts],
+            expiration=np.array(
+                [(c.expiration.replace(tzinfo=None) - _EPOCH).days for c in contracts],
+                dtype=np.int64,
+            ),
+            option_type=np.array(
+                [_TYPE_CODES.get(c.option_type, OTHER) for c in contracts],
+                dtype=np.int8,
+            ),
+            strike=np.array([c.strike for c in contracts], dtype=np.float64),
+            last_price=np.array([c.last_price for c in contracts], dtype=np.float64),
+            bid=np.array([c.bid for c in contracts], dtype=np.float64),
+            ask=np.array([c.ask for c in contracts], dtype=np.float64),
+            volume=np.array([c.volume for c in contracts], dtype=np.int64),
+            open_interest=np.array(
+                [c.open_interest for c in contracts], dtype=np.int64
+            ),
+            implied_volatility=np.array(
+                [c.implied_volatility for c in contracts], dtype=np.float64
+            ),
+            delta=np.array(
+                [np.nan if c.delta is None else c.delta for c in contracts],
+                dtype=np.float64,
+            ),
+        )
+
+    @classmethod
+    def from_columns(cls, symbol: str, chain: Any) -> "OptionsChain":
+        """
+        Build from a streamed OptionsChainColumns.
+
+        Contracts with an unparseable expiration are dropped, as before.
+        """
+        days = {e: _parse_day(e) for e in set(chain.expiration)}
+        expiration = np.array(
+            [days[e] if days[e] is not None else -1 for e in chain.expiration],
+            dtype=np.int64,
+        )
+        keep = np.array([days[e] is not None for e in chain.expiration], dtype=bool)
+        numeric = chain.numeric()
+
+        return cls(
+            symbol=symbol,
+            contract_id=[c for c, k in zip(chain.contract_id, keep, strict=True) if k],
+            expiration=expiration[keep],
+            option_type=np.array(
+                [_TYPE_CODES.get(t, OTHER) for t in chain.option_type], dtype=np.int8
+            )[keep],
+            strike=numeric["strike"][keep],
+            last_price=numeric["last"][keep],
+            bid=numeric["bid"][keep],
+            ask=numeric["ask"][keep],
+            volume=numeric["volume"][keep].astype(np.int64),
+            open_interest=numeric["open_interest"][keep].astype(np.int64),
+            implied_volatility=numeric["implied_volatility"][keep],
+            delta=numeric["delta"][keep],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a columnar dictionary for JSON serialization."""
+        return {
+            "format": CACHE_FORMAT,
+            "symbol": self.symbol,
+            "contract_id": self.contract_id,
+            "expiration": self.expiration.tolist(),
+            "option_type": self.option_type.tolist(),
+            "strike": self.strike.tolist(),
+            "last_price": self.last_price.tolist(),
+            "bid": self.bid.tolist(),
+            "ask": self.ask.tolist(),
+            "volume": self.volume.tolist(),
+            "open_interest": self.open_interest.tolist(),
+            "implied_volatility": self.implied_volatility.tolist(),
+            # JSON has no NaN: missing deltas are null
+            "delta": [None if np.isnan(d) else d for d in self.delta.tolist()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OptionsChain":
+        """Create from a columnar dictionary."""
+        return cls(
+            symbol=data["symbol"],
+            contract_id=list(data["contract_id"]),
+            expiration=np.asarray(data["expiration"], dtype=np.int64),
+            option_type=np.asarray(data["option_type"], dtype=np.int8),
+            strike=np.asarray(data["strike"], dtype=np.float64),
+            last_price=np.asarray(data["last_price"], dtype=np.float64),
+            bid=np.asarray(data["bid"], dtype=np.float64),
+            ask=np.asarray(data["ask"], dtype=np.float64),
+            volume=np.asarray(data["volume"], dtype=np.int64),
+            open_interest=np.asarray(data["open_interest"], dtype=np.int64),
+            implied_volatility=np.asarray(data["implied_volatility"], dtype=np.float64),
+            delta=np.array(
+                [np.nan if d is None else d for d in data["delta"]], dtype=np.float64
+            ),
+        )
+
+    @classmethod
+    def from_cached(
+        cls, symbol: str, cached: dict[str, Any] | list[dict[str, Any]]
+    ) -> "OptionsChain":
+        """
+        Decode a cached options entry.
+
+        Handles both the columnar format and legacy entries written as a
+        list of OptionContract dicts, so existing Redis keys stay readable.
+        """
+        if isinstance(cached, dict):
+            return cls.from_dict(cached)
+        return cls.from_contracts(symbol, [OptionContract.from_dict(d) for d in cached])
+
+    def to_contracts(self) -> list[OptionContract]:
+        """Materialize as OptionContract objects."""
+        expirations = {
+            day: _EPOCH + timedelta(days=day) for day in set(self.expiration.tolist())
+        }
+        return [
+            OptionContract(
+                contract_id=contract_id,
+                symbol=self.symbol,
+                expiration=expirations[expiration],
+                strike=strike,
+                option_type=_TYPE_NAMES.get(option_type, ""),
+                last_price=last_price,
+                bid=bid,
+                ask=ask,
+                volume=volume,
+                open_interest=open_interest,
+                implied_volatility=iv,
+                delta=None if np.isnan(delta) else delta,
+            )
+            for (
+                contract_id,
+                expiration,
+                option_type,
+                strike,
+                last_price,
+                bid,
+                ask,
+                volume,
+                open_interest,
+                iv,
+                delta,
+            ) in zip(
+                self.contract_id,
+                self.expiration.tolist(),
+                self.option_type.tolist(),
+                self.strike.tolist(),
+                self.last_price.tolist(),
+                self.bid.tolist(),
+                self.ask.tolist(),
+                self.volume.tolist(),
+                self.open_interest.tolist(),
+                self.implied_volatility.tolist(),
+                self.delta.tolist(),
+                strict=True,
+            )
+        ]
+
+    # =========================================================================
+    # Put/Call Ratio
+    # =========================================================================
+
+    def pcr(
+        self,
+        current_price: float,
+        params: Sequence[PCRParams],
+        by_expiry: bool = False,
+    ) -> list[PCRTotals]:
+        """
+        ATM Dollar-Weighted PCR aggregates for each parameter set.
+
+        A contract counts when its strike is inside the ATM zone
+        (price × (1 ± atm_zone_pct)), its premium is at least min_premium and
+        its open interest at least min_oi. Notional = OI × Price × 100.
+        All parameter sets are evaluated together as a (params × contracts)
+        mask.
+
+        Args:
+            current_price: Underlying price the ATM zone is centered on
+            params: Parameter sets to evaluate
+            by_expiry: Also aggregate per expiration date
+
+        Returns:
+            PCRTotals per parameter set, in order
+        """
+        zone = np.array([p.atm_zone_pct for p in params], dtype=np.float64)
+        low = current_price * (1 - zone)
+        high = current_price * (1 + zone)
+        min_premium = np.array([p.min_premium for p in params], dtype=np.float64)
+        min_oi = np.array([p.min_oi for p in params], dtype=np.int64)
+
+        mask = (
+            (self.strike >= low[:, None])
+            & (self.strike <= high[:, None])
+            & (self.last_price >= min_premium[:, None])
+            & (self.open_interest >= min_oi[:, None])
+        )
+
+        # Notional: OI × Price × 100 (options = 100 shares)
+        notional = self.open_interest * self.last_price * 100
+        put_notional = np.where(self.option_type == PUT, notional, 0.0)
+        call_notional = np.where(self.option_type == CALL, notional, 0.0)
+        selected = mask.astype(np.float64)
+
+        puts = selected @ put_notional
+        calls = selected @ call_notional
+        counts = mask.sum(axis=1)
+
+        expiries: list[dict[str, tuple[float, float, int]]] = [{} for _ in params]
+        if by_expiry and len(self):
+            days, codes = np.unique(self.expiration, return_inverse=True)
+            size = len(params) * len(days)
+            index = (np.arange(len(params))[:, None] * len(days) + codes).ravel()
+            per_put = np.bincount(
+                index, (selected * put_notional).ravel(), size
+            ).reshape(len(params), -1)
+            per_call = np.bincount(
+                index, (selected * call_notional).ravel(), size
+            ).reshape(len(params), -1)
+            per_count = np.bincount(index, mask.ravel(), size).reshape(len(params), -1)
+            labels = [
+                (_EPOCH + timedelta(days=int(d))).strftime("%Y-%m-%d") for d in days
+            ]
+            for p in range(len(params)):
+                for d in np.flatnonzero(per_count[p]):
+                    expiries[p][labels[d]] = (
+                        float(per_put[p, d]),
+                        float(per_call[p, d]),
+                        int(per_count[p, d]),
+                    )
+
+        return [
+            PCRTotals(
+                params=p,
+                atm_zone_low=float(low[i]),
+                atm_zone_high=float(high[i]),
+                put_notional=float(puts[i]),
+                call_notional=float(calls[i]),
+                contracts_analyzed=int(counts[i]),
+                by_expiry=expiries[i],
+            )
+            for i, p in enumerate(params)
+        ]
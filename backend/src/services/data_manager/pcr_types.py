@@ -0,0 +1,125 @@
+"""
+Put/Call Ratio result types for the Data Manager Layer.
+
+Returned by DataManager.get_symbol_pcr() / get_symbols_pcr() and cached per
+symbol, so they serialize to and from plain dictionaries.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+
+@dataclass
+class ExpiryPCRData:
+    """Put/Call Ratio of the contracts expiring on one date."""
+
+    expiration: str  # YYYY-MM-DD
+    put_notional_mm: float
+    call_notional_mm: float
+    contracts_analyzed: int
+    pcr: float | None  # None when the expiry has no call notional
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "expiration": self.expiration,
+            "put_notional_mm": self.put_notional_mm,
+            "call_notional_mm": self.call_notional_mm,
+            "contracts_analyzed": self.contracts_analyzed,
+            "pcr": self.pcr,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ExpiryPCRData":
+        """Create from dictionary."""
+        return cls(
+            expiration=data["expiration"],
+            put_notional_mm=float(data["put_notional_mm"]),
+            call_notional_mm=float(data["call_notional_mm"]),
+            contracts_analyzed=int(data["contracts_analyzed"]),
+            pcr=None if data.get("pcr") is None else float(data["pcr"]),
+        )
+
+
+@dataclass
+class SymbolPCRData:
+    """
+    Put/Call Ratio data for a single symbol.
+
+    Cached per-symbol to enable reuse between AI tools and AI Sector Risk metric.
+    Uses ATM Dollar-Weighted methodology: Notional = OI × Price × 100.
+    """
+
+    symbol: str
+    current_price: float
+    atm_zone_low: float
+    atm_zone_high: float
+    put_notional_mm: float  # Put notional in millions
+    call_notional_mm: float  # Call notional in millions
+    contracts_analyzed: int
+    pcr: float  # Put/Call Ratio
+    interpretation: str  # Human-readable interpretation
+    calculated_at: datetime
+    # Filter parameters used for calculation
+    atm_zone_pct: float = 0.15  # ATM zone ±15%
+    min_premium: float = 0.50  # Minimum option premium
+    min_oi: int = 500  # Minimum open interest
+    # Per-expiry breakdown (only when requested)
+    expiries: list[ExpiryPCRData] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "symbol": self.symbol,
+            "current_price": self.current_price,
+            "atm_zone_low": self.atm_zone_low,
+            "atm_zone_high": self.atm_zone_high,
+            "put_notional_mm": self.put_notional_mm,
+            "call_notional_mm": self.call_notional_mm,
+            "contracts_analyzed": self.contracts_analyzed,
+            "pcr": self.pcr,
+            "interpretation": self.interpretation,
+            "calculated_at": self.calculated_at.isoformat(),
+            "atm_zone_pct": self.atm_zone_pct,
+            "min_premium": self.min_premium,
+            "min_oi": self.min_oi,
+            "expiries": [e.to_dict() for e in self.expiries],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SymbolPCRData":
+        """Create from dictionary."""
+        return cls(
+            symbol=data["symbol"],
+            current_price=float(data["current_price"]),
+            atm_zone_low=float(data["atm_zone_low"]),
+            atm_zone_high=float(data["atm_zone_high"]),
+            put_notional_mm=float(data["put_notional_mm"]),
+            call_notional_mm=float(data["call_notional_mm"]),
+            contracts_analyzed=int(data["contracts_analyzed"]),
+            pcr=float(data["pcr"]),
+            interpretation=data["interpretation"],
+            calculated_at=datetime.fromisoformat(data["calculated_at"]),
+            atm_zone_pct=float(data.get("atm_zone_pct", 0.15)),
+            min_premium=float(data.get("min_premium", 0.50)),
+            min_oi=int(data.get("min_oi", 500)),
+            expiries=[ExpiryPCRData.from_dict(e) for e in data.get("expiries", [])],
+        )
+
+
+@dataclass
+class BatchPCRResult:
+    """
+    Put/Call Ratio for many symbols (DataManager.get_symbols_pcr).
+
+    Partial by design: every requested symbol is either in `data` or has
+    the reason it has no PCR in `errors`.
+    """
+
+    data: dict[str, SymbolPCRData] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def get(self, symbol: str) -> SymbolPCRData | None:
+        """Get PCR data for a symbol, or None if unavailable."""
+        return self.data.get(symbol.upper())
@@ -0,0 +1,155 @@
+"""
+Micro-batching for quote fetches in the Data Manager Layer.
+
+Concurrent quote cache misses (PCR jobs, watchlists, portfolio refreshes) are
+collected for a short window and fetched together, so N callers asking for N
+symbols cost one bulk request instead of N single-symbol requests. A symbol
+already waiting in a batch, or already being fetched, is joined rather than
+requested again.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# fetch_many(symbols) -> {symbol: value}; symbols missing from the result
+# resolve to None
+FetchMany = Callable[[list[str]], Awaitable[dict[str, Any]]]
+
+
+@dataclass
+class BatchStats:
+    """Counters for coalesced quote fetches."""
+
+    batches: int = 0
+    symbols: int = 0  # Symbols fetched upstream
+    joined: int = 0  # Requests served by a batch another caller started
+    failures: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "batches": self.batches,
+            "symbols": self.symbols,
+            "joined": self.joined,
+            "failures": self.failures,
+            "avg_batch_size": (
+                round(self.symbols / self.batches, 1) if self.batches else 0.0
+            ),
+        }
+
+
+class QuoteBatcher:
+    """
+    Coalesces per-symbol loads into batched `fetch_many` calls.
+
+    The first load opens a batch and schedules its flush `window_seconds`
+    later; a batch reaching `max_batch` symbols flushes immediately.
+    """
+
+    def __init__(
+        self,
+        fetch_many: FetchMany,
+        window_seconds: float = 0.005,
+        max_batch: int = 100,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            fetch_many: Coroutine fetching a list of symbols in one go
+            window_seconds: How long a batch collects symbols before flushing
+            max_batch: Flush as soon as a batch holds this many symbols
+        """
+        self._fetch_many = fetch_many
+        self.window_seconds = window_seconds
+        self.max_batch = max(max_batch, 1)
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats = BatchStats()
+
+    async def load(self, symbol: str) -> Any:
+        """Value for one symbol (None if the upstream didn't return it)."""
+        # Shielded: a cancelled caller must not cancel the shared future
+        return await asyncio.shield(self._enqueue([symbol])[0])
+
+    async def load_many(self, symbols: list[str]) -> dict[str, Any]:
+        """
+        Values for several symbols, fetched in as few batches as possible.
+
+        Returns:
+            Dict of symbol -> value for the symbols that were returned
+
+        Raises:
+            Exception: The upstream error if a batch fails
+        """
+        symbols = list(dict.fromkeys(symbols))
+        values = await asyncio.gather(
+            *(asyncio.shield(future) for future in self._enqueue(symbols))
+        )
+        return {s: v for s, v in zip(symbols, values, strict=True) if v is not None}
+
+    def _enqueue(self, symbols: list[str]) -> list[asyncio.Future[Any]]:
+        loop = asyncio.get_running_loop()
+        futures = []
+        for symbol in symbols:
+            future = self._pending.get(symbol) or self._inflight.get(symbol)
+            if future is not None:
+                self.stats.joined += 1
+            else:
+                future = loop.create_future()
+                self._pending[symbol] = future
+                if len(self._pending) >= self.max_batch:
+                    self._flush()
+                elif self._flush_handle is None:
+                    self._flush_handle = loop.call_later(
+                        self.window_seconds, self._flush
+                    )
+            futures.append(future)
+        return futures
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self._inflight.update(batch)
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future[Any]]) -> None:
+        self.stats.batches += 1
+        self.stats.symbols += len(batch)
+        try:
+            results = await self._fetch_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            self.stats.failures += 1
+            logger.warning("quote_batch_failed", symbols=len(batch), error=str(e))
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark retrieved so unawaited joiners don't log warnings
+                    future.exception()
+            return
+        finally:
+            for symbol, future in batch.items():
+                if self._inflight.get(symbol) is future:
+                    del self._inflight[symbol]
+
+        for symbol, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(symbol))
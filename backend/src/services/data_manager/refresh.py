@@ -0,0 +1,177 @@
+"""
+Stale-while-revalidate support for the Data Manager Layer.
+
+An entry is fresh for its soft TTL (the domain TTL). For a further stale
+window it is still served immediately while one background refresh replaces
+it; Redis keeps it for soft + stale seconds (the hard TTL), after which
+readers block on a normal fetch again.
+"""
+
+import asyncio
+import contextlib
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Refresh outcomes
+REFRESHED = "refreshed"  # New value stored
+SKIPPED = "skipped"  # Another pod holds the refresh lock
+EMPTY = "empty"  # Fetch returned None; stale value kept until hard TTL
+
+REFRESH_LOCK_TTL_SECONDS = 60
+
+
+@dataclass
+class CachedValue:
+    """A cache read with the wall-clock time its value was stored."""
+
+    value: Any
+    stored_at: float | None  # None for entries written without a stamp
+    stale: bool = False
+
+    def age_seconds(self, now: float) -> float | None:
+        """Seconds since the value was stored, or None if unknown."""
+        if self.stored_at is None:
+            return None
+        return max(now - self.stored_at, 0.0)
+
+
+@dataclass
+class StalenessStats:
+    """Counters for stale serves and background refreshes."""
+
+    stale_hits: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    refresh_skipped: int = 0
+    refresh_empty: int = 0
+    max_stale_age_seconds: float = 0.0
+    last_stale_age_seconds: float | None = None
+    stale_hits_by_type: Counter[str] = field(default_factory=Counter)
+
+    def record_stale(self, key: str, age: float) -> None:
+        self.stale_hits += 1
+        self.last_stale_age_seconds = age
+        self.max_stale_age_seconds = max(self.max_stale_age_seconds, age)
+        # "market:daily:AAPL" -> "market:daily"
+        self.stale_hits_by_type[":".join(key.split(":")[:2])] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        last = self.last_stale_age_seconds
+        return {
+            "stale_hits": self.stale_hits,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "refresh_skipped": self.refresh_skipped,
+            "refresh_empty": self.refresh_empty,
+            "max_stale_age_seconds": round(self.max_stale_age_seconds, 1),
+            "last_stale_age_seconds": round(last, 1) if last is not None else None,
+            "stale_hits_by_type": dict(self.stale_hits_by_type),
+        }
+
+
+class BackgroundRefresher:
+    """Runs at most one background refresh per key in this process."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self.stats = StalenessStats()
+
+    @property
+    def inflight(self) -> int:
+        """Number of refreshes currently running."""
+        return len(self._tasks)
+
+    def schedule(self, key: str, refresh: Callable[[], Awaitable[str]]) -> bool:
+        """
+        Start a refresh for key unless one is already running.
+
+        Args:
+            key: Cache key being refreshed
+            refresh: Coroutine function returning REFRESHED/SKIPPED/EMPTY
+
+        Returns:
+            True if a new refresh was started
+        """
+        if key in self._tasks:
+            return False
+        task = asyncio.create_task(self._run(key, refresh))
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    def schedule_fetch(
+        self,
+        key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        store: Callable[[Any], Awaitable[Any]],
+        acquire_lock: Callable[..., Awaitable[bool]] | None = None,
+        release_lock: Callable[..., Awaitable[Any]] | None = None,
+    ) -> bool:
+        """
+        Refresh a key in the background: fetch, then store if not None.
+
+        With RedisCache lock functions, only the pod holding
+        `lock:refresh:{key}` fetches; the others skip.
+        """
+
+        async def refresh() -> str:
+            lock_key = f"lock:refresh:{key}"
+            token = uuid.uuid4().hex
+            if acquire_lock is not None and not await acquire_lock(
+                lock_key, REFRESH_LOCK_TTL_SECONDS, token=token
+            ):
+                return SKIPPED
+            try:
+                result = await fetch_func()
+                if result is None:
+                    return EMPTY
+                await store(result)
+                return REFRESHED
+            finally:
+                if acquire_lock is not None and release_lock is not None:
+                    await release_lock(lock_key, token=token)
+
+        return self.schedule(key, refresh)
+
+    async def _run(self, key: str, refresh: Callable[[], Awaitable[str]]) -> None:
+        try:
+            outcome = await refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.stats.refresh_failures += 1
+            logger.warning("cache_refresh_failed", key=key, error=str(e))
+            return
+
+        if outcome == REFRESHED:
+            self.stats.refreshes += 1
+            logger.debug("cache_refreshed", key=key)
+        elif outcome == SKIPPED:
+            self.stats.refresh_skipped += 1
+        else:
+            self.stats.refresh_empty += 1
+            logger.warning("cache_refresh_empty", key=key)
+
+    async def wait(self) -> None:
+        """Wait for running refreshes to finish."""
+        # Only gather pending tasks: finished ones may still be in _tasks until
+        # their done-callbacks run, and gathering them never yields to the loop
+        while pending := [task for task in self._tasks.values() if not task.done()]:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def cancel_all(self) -> None:
+        """Cancel running refreshes (e.g. at shutdown)."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -8,7 +8,12 @@ ensuring consistent interfaces across all data consumers.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from .pcr_types import SymbolPCRData
+
+if TYPE_CHECKING:
+    from .bars import OHLCVBars
 
 
 class MetricStatus(str, Enum):
@@ -52,6 +57,21 @@ class Granularity(str, Enum):
         }
         return ttl_map.get(self, 3600)
 
+    @property
+    def stale_ttl_seconds(self) -> int:
+        """
+        Seconds past ttl_seconds an expired entry may still be served while
+        it is refreshed in the background (stale-while-revalidate).
+        """
+        stale_map = {
+            Granularity.MIN_30: 300,  # 5 minutes
+            Granularity.MIN_60: 900,  # 15 minutes
+            Granularity.DAILY: 21600,  # 6 hours
+            Granularity.WEEKLY: 43200,  # 12 hours
+            Granularity.MONTHLY: 86400,  # 24 hours
+        }
+        return stale_map.get(self, 0)
+
 
 @dataclass
 class OHLCVData:
@@ -307,68 +327,6 @@ class TrendPoint:
         )
 
 
-@dataclass
-class SymbolPCRData:
-    """
-    Put/Call Ratio data for a single symbol.
-
-    Cached per-symbol to enable reuse between AI tools and AI Sector Risk metric.
-    Uses ATM Dollar-Weighted methodology: Notional = OI × Price × 100.
-    """
-
-    symbol: str
-    current_price: float
-    atm_zone_low: float
-    atm_zone_high: float
-    put_notional_mm: float  # Put notional in millions
-    call_notional_mm: float  # Call notional in millions
-    contracts_analyzed: int
-    pcr: float  # Put/Call Ratio
-    interpretation: str  # Human-readable interpretation
-    calculated_at: datetime
-    # Filter parameters used for calculation
-    atm_zone_pct: float = 0.15  # ATM zone ±15%
-    min_premium: float = 0.50  # Minimum option premium
-    min_oi: int = 500  # Minimum open interest
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "symbol": self.symbol,
-            "current_price": self.current_price,
-            "atm_zone_low": self.atm_zone_low,
-            "atm_zone_high": self.atm_zone_high,
-            "put_notional_mm": self.put_notional_mm,
-            "call_notional_mm": self.call_notional_mm,
-            "contracts_analyzed": self.contracts_analyzed,
-            "pcr": self.pcr,
-            "interpretation": self.interpretation,
-            "calculated_at": self.calculated_at.isoformat(),
-            "atm_zone_pct": self.atm_zone_pct,
-            "min_premium": self.min_premium,
-            "min_oi": self.min_oi,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "SymbolPCRData":
-        """Create from dictionary."""
-        return cls(
-            symbol=data["symbol"],
-            current_price=float(data["current_price"]),
-            atm_zone_low=float(data["atm_zone_low"]),
-            atm_zone_high=float(data["atm_zone_high"]),
-            put_notional_mm=float(data["put_notional_mm"]),
-            call_notional_mm=float(data["call_notional_mm"]),
-            contracts_analyzed=int(data["contracts_analyzed"]),
-            pcr=float(data["pcr"]),
-            interpretation=data["interpretation"],
-            calculated_at=datetime.fromisoformat(data["calculated_at"]),
-            atm_zone_pct=float(data.get("atm_zone_pct", 0.15)),
-            min_premium=float(data.get("min_premium", 0.50)),
-            min_oi=int(data.get("min_oi", 500)),
-        )
-
-
 @dataclass
 class SharedDataContext:
     """
@@ -378,15 +336,18 @@ class SharedDataContext:
     when multiple metrics need the same data source.
     """
 
-    ohlcv: dict[str, list[OHLCVData]] = field(default_factory=dict)
+    ohlcv: dict[str, "OHLCVBars"] = field(default_factory=dict)
     treasury: dict[str, list[TreasuryData]] = field(default_factory=dict)
     news: dict[str, list[NewsData]] = field(default_factory=dict)
     ipo: list[IPOData] = field(default_factory=list)
     quotes: dict[str, QuoteData] = field(default_factory=dict)
     options: dict[str, list[OptionContract]] = field(default_factory=dict)
+    history: dict[str, "OHLCVBars"] = field(default_factory=dict)  # Full daily
+    intraday: dict[str, "OHLCVBars"] = field(default_factory=dict)
+    pcr: dict[str, SymbolPCRData | None] = field(default_factory=dict)
     errors: dict[str, str] = field(default_factory=dict)
 
-    def get_ohlcv(self, symbol: str) -> list[OHLCVData] | None:
+    def get_ohlcv(self, symbol: str) -> "OHLCVBars | None":
         """Get OHLCV data for a symbol, or None if not fetched."""
         return self.ohlcv.get(symbol.upper())
 
@@ -402,6 +363,18 @@ class SharedDataContext:
         """Get options chain for a symbol, or None if not fetched."""
         return self.options.get(symbol.upper())
 
+    def get_history(self, symbol: str) -> "OHLCVBars | None":
+        """Get full daily history for a symbol, or None if not fetched."""
+        return self.history.get(symbol.upper())
+
+    def get_intraday(self, symbol: str) -> "OHLCVBars | None":
+        """Get intraday bars for a symbol, or None if not fetched."""
+        return self.intraday.get(symbol.upper())
+
+    def get_pcr(self, symbol: str) -> SymbolPCRData | None:
+        """Get Put/Call Ratio data for a symbol, or None if unavailable."""
+        return self.pcr.get(symbol.upper())
+
     def has_errors(self) -> bool:
         """Check if any fetch errors occurred."""
         return len(self.errors) > 0
@@ -14,6 +14,7 @@ import structlog
 
 from ...core.config import Settings
 from ...database.redis import RedisCache
+from ..data_manager import DataManager
 from .models import (
     CategoryMetadata,
     CompositeScore,
@@ -63,6 +64,7 @@ class InsightCategoryBase(ABC):
         redis_cache: RedisCache | None = None,
         market_service: Any | None = None,
         fred_service: Any | None = None,
+        data_manager: DataManager | None = None,
     ) -> None:
         """Initialize category with dependencies.
 
@@ -71,11 +73,13 @@ class InsightCategoryBase(ABC):
             redis_cache: Optional Redis cache for caching results
             market_service: AlphaVantageMarketDataService for data fetching
             fred_service: FREDService for liquidity metrics (SOFR, EFFR, RRP)
+            data_manager: Shared DataManager (app singleton) for cached data
         """
         self.settings = settings
         self.redis_cache = redis_cache
         self.market_service = market_service
         self.fred_service = fred_service
+        self.data_manager = data_manager
 
     @property
     def cache_key_prefix(self) -> str:
@@ -0,0 +1,245 @@
+"""Vectorized analytics over a basket of symbols.
+
+Aligns every basket symbol into one 2-D price matrix (symbols × dates) so
+rolling SMA/std, z-scores and breadth are computed with a handful of NumPy
+operations over the whole basket instead of a Python loop per symbol. Cost
+grows with the number of cells, not with per-symbol overhead, which keeps a
+basket of hundreds of ETF holdings cheap.
+
+Intraday session returns (first hour vs last hour of each symbol's latest
+session) are computed the same way over the concatenated bars of all symbols.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ..data_manager import OHLCVBars
+
+
+def _forward_fill(values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Carry the last valid value forward along each row.
+
+    Cells before a row's first value stay NaN (symbol not trading yet).
+    """
+    valid = ~np.isnan(values)
+    positions = np.where(valid, np.arange(values.shape[1]), 0)
+    np.maximum.accumulate(positions, axis=1, out=positions)
+    filled = np.take_along_axis(values, positions, axis=1)
+    # Leading cells point at column 0; keep them NaN unless it was valid
+    filled[np.maximum.accumulate(valid, axis=1) == 0] = np.nan
+    return filled
+
+
+@dataclass(frozen=True)
+class BasketMatrix:
+    """Prices of a basket aligned on a shared date axis.
+
+    Attributes:
+        symbols: Row labels
+        dates: Column labels, UTC int64 nanoseconds since epoch, ascending
+        values: float64 matrix of shape (len(symbols), len(dates)); a date a
+            symbol has no bar for carries its previous price forward, dates
+            before its first bar are NaN
+    """
+
+    symbols: list[str]
+    dates: npt.NDArray[np.int64]
+    values: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_bars(
+        cls,
+        bars: Mapping[str, OHLCVBars],
+        field: str = "close",
+        lookback: int | None = None,
+    ) -> "BasketMatrix":
+        """Align one OHLCV field of every symbol's bars into a matrix.
+
+        Args:
+            bars: Bars per symbol (oldest first, as OHLCVBars stores them)
+            field: Price column to use ("open", "high", "low" or "close")
+            lookback: Only align each symbol's last `lookback` bars; enough
+                for statistics over the latest `lookback` dates
+        """
+        symbols = list(bars)
+        if not symbols:
+            return cls([], np.empty(0, dtype=np.int64), np.empty((0, 0)))
+
+        tail = slice(-lookback, None) if lookback else slice(None)
+        timestamps = [bars[s].timestamps[tail] for s in symbols]
+        prices = [getattr(bars[s], field)[tail] for s in symbols]
+
+        # Common case: every symbol traded on the same dates
+        first = timestamps[0]
+        if all(np.array_equal(t, first) for t in timestamps[1:]):
+            return cls(symbols, first, np.vstack(prices).astype(np.float64))
+
+        lengths = np.array([len(t) for t in timestamps])
+        all_timestamps = np.concatenate(timestamps)
+        dates = np.unique(all_timestamps)
+
+        values = np.full((len(symbols), len(dates)), np.nan)
+        rows = np.repeat(np.arange(len(symbols)), lengths)
+        cols = np.searchsorted(dates, all_timestamps)
+        values[rows, cols] = np.concatenate(prices)
+
+        return cls(symbols, dates, _forward_fill(values))
+
+    @property
+    def latest(self) -> npt.NDArray[np.float64]:
+        """Most recent price per symbol."""
+        if self.values.shape[1] == 0:
+            return np.full(len(self.symbols), np.nan)
+        return self.values[:, -1]
+
+    def rolling_mean_std(
+        self, window: int
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Rolling mean and population std over the last `window` dates.
+
+        Computed from cumulative sums (O(symbols × dates) for any window).
+        Cells without a full window of prices are NaN.
+
+        Returns:
+            (sma, std) matrices with the same shape as `values`
+        """
+        sma = np.full(self.values.shape, np.nan)
+        std = np.full(self.values.shape, np.nan)
+        if self.values.shape[1] < window:
+            return sma, std
+
+        # Shift each row by its first price: smaller sums, less cancellation
+        # in E[x²] - E[x]²
+        missing = np.isnan(self.values)
+        first_valid = np.argmax(~missing, axis=1)
+        reference = np.nan_to_num(
+            self.values[np.arange(len(self.symbols)), first_valid]
+        )[:, None]
+        shifted = np.nan_to_num(self.values - reference)
+
+        def window_sum(x: npt.NDArray) -> npt.NDArray:
+            csum = np.cumsum(x, axis=1, dtype=np.float64)
+            total = csum[:, window - 1 :].copy()
+            total[:, 1:] -= csum[:, :-window]
+            return total
+
+        mean = window_sum(shifted) / window
+        var = np.maximum(window_sum(shifted**2) / window - mean**2, 0.0)
+        incomplete = window_sum(missing) > 0
+
+        sma[:, window - 1 :] = np.where(incomplete, np.nan, mean + reference)
+        std[:, window - 1 :] = np.where(incomplete, np.nan, np.sqrt(var))
+        return sma, std
+
+    def latest_mean_std(
+        self, window: int
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Mean and population std of the last `window` dates per symbol.
+
+        The last column of `rolling_mean_std` without computing the others.
+        NaN for symbols without a full window.
+        """
+        if self.values.shape[1] < window:
+            missing = np.full(len(self.symbols), np.nan)
+            return missing, missing.copy()
+        tail = self.values[:, -window:]
+        return tail.mean(axis=1), tail.std(axis=1)
+
+    def zscores(self, window: int) -> npt.NDArray[np.float64]:
+        """Rolling z-score of each price vs its trailing `window` SMA/std.
+
+        NaN where the window is incomplete or the prices are flat (std 0).
+        """
+        sma, std = self.rolling_mean_std(window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (self.values - sma) / std
+        z[~np.isfinite(z)] = np.nan
+        return z
+
+
+def breadth(values: npt.NDArray[np.float64], threshold: float = 0.0) -> float | None:
+    """Share of symbols whose value is above `threshold`, ignoring NaN.
+
+    With z-scores and threshold 0 this is the share of the basket trading
+    above its moving average. None when no symbol has a value.
+    """
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return None
+    return float(np.count_nonzero(values[valid] > threshold) / valid.sum())
+
+
+@dataclass(frozen=True)
+class SessionReturns:
+    """First- and last-bar returns of each symbol's latest session, in percent.
+
+    NaN for symbols with fewer than two bars in their latest session.
+    """
+
+    symbols: list[str]
+    first_hour: npt.NDArray[np.float64]
+    last_hour: npt.NDArray[np.float64]
+
+    @property
+    def smi(self) -> npt.NDArray[np.float64]:
+        """Smart Money Index per symbol: last-hour minus first-hour return."""
+        return self.last_hour - self.first_hour
+
+
+def session_returns(bars: Mapping[str, OHLCVBars]) -> SessionReturns:
+    """Open-to-close return of the first and last bar of the latest session.
+
+    Sessions are calendar days in each symbol's own timezone (America/New_York
+    for intraday bars). All symbols are processed in one pass over their
+    concatenated bars.
+    """
+    symbols = list(bars)
+    first = np.full(len(symbols), np.nan)
+    last = np.full(len(symbols), np.nan)
+    if not symbols:
+        return SessionReturns(symbols, first, last)
+
+    lengths = np.array([len(bars[s]) for s in symbols])
+    rows = np.repeat(np.arange(len(symbols)), lengths)
+    if rows.size == 0:
+        return SessionReturns(symbols, first, last)
+
+    # Local calendar day of every bar, converting once per distinct timezone
+    days = np.empty(rows.size, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    by_tz: dict[str, list[int]] = {}
+    for i, symbol in enumerate(symbols):
+        by_tz.setdefault(bars[symbol].tz, []).append(i)
+    for tz, members in by_tz.items():
+        idx = np.concatenate([np.arange(offsets[i], offsets[i + 1]) for i in members])
+        stamps = np.concatenate([bars[symbols[i]].timestamps for i in members])
+        local = pd.DatetimeIndex(stamps.view("datetime64[ns]")).tz_localize("UTC")
+        days[idx] = local.tz_convert(tz).normalize().tz_localize(None).asi8
+
+    opens = np.concatenate([bars[s].open for s in symbols])
+    closes = np.concatenate([bars[s].close for s in symbols])
+
+    # Bars are oldest first per symbol: the latest session is the row's max day
+    last_day = np.full(len(symbols), np.iinfo(np.int64).min)
+    np.maximum.at(last_day, rows, days)
+    in_session = np.flatnonzero(days == last_day[rows])
+    session_rows = rows[in_session]
+
+    present, first_pos = np.unique(session_rows, return_index=True)
+    counts = np.bincount(session_rows, minlength=len(symbols))[present]
+    last_pos = first_pos + counts - 1
+    ok = counts >= 2
+    present, first_idx, last_idx = (
+        present[ok],
+        in_session[first_pos[ok]],
+        in_session[last_pos[ok]],
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        first[present] = (closes[first_idx] - opens[first_idx]) / opens[first_idx]
+        last[present] = (closes[last_idx] - opens[last_idx]) / opens[last_idx]
+    return SessionReturns(symbols, first * 100, last * 100)
@@ -30,8 +30,15 @@ from typing import Any
 import numpy as np
 import structlog
 
-from ...data_manager import DataManager
+from ...data_manager import (
+    DataManager,
+    Granularity,
+    OHLCVBars,
+    SharedDataContext,
+    SymbolPCRData,
+)
 from ..base import InsightCategoryBase
+from ..basket_analytics import BasketMatrix, breadth, session_returns
 from ..models import InsightMetric, MetricExplanation, MetricStatus, ThresholdConfig
 from ..registry import register_category
 
@@ -50,6 +57,16 @@ AI_BASKET_TOP_N = 10
 AI_BASKET_CACHE_KEY = "insights:ai_basket_symbols"
 AI_BASKET_CACHE_TTL = 86400  # 24 hours (ETF holdings change infrequently)
 
+# AI Price Anomaly: z-score of each symbol vs its 200-day SMA
+PRICE_ANOMALY_WINDOW = 200
+
+# Basket symbols analyzed by the intraday and options metrics
+SMART_MONEY_TOP_N = 3
+PCR_TOP_N = 10
+
+# Basket fetches in flight at once during the shared prefetch
+BASKET_PREFETCH_CONCURRENCY = 8
+
 # Market Liquidity calculation constants (FRED-based)
 RRP_PEAK_BILLIONS = 2500  # Dec 2022 peak RRP balance
 SPREAD_STRESS_THRESHOLD_BPS = 50  # SOFR-EFFR spread indicating funding stress
@@ -225,51 +242,106 @@ class AISectorRiskCategory(InsightCategoryBase):
         )
         return AI_BASKET_FALLBACK, "Static fallback basket"
 
+    def _data_manager(self) -> DataManager | None:
+        """The injected DataManager, or one over the category's services.
+
+        Returns None without an injected DataManager and without Redis.
+        """
+        if self.data_manager is None and self.redis_cache and self.market_service:
+            self.data_manager = DataManager(
+                redis_cache=self.redis_cache,
+                alpha_vantage_service=self.market_service,
+            )
+        return self.data_manager
+
+    def _basket_data_plan(self, ai_symbols: list[str]) -> dict[str, list[str]]:
+        """Which basket symbols each per-symbol dataset is needed for.
+
+        Keys are `DataManager.prefetch_shared` arguments:
+        - history_symbols: full daily history (AI Price Anomaly)
+        - intraday_symbols: 60min bars (Smart Money Flow)
+        - pcr_symbols: quote + options chain PCR (Options Put/Call Ratio)
+        """
+        return {
+            "history_symbols": list(ai_symbols),
+            "intraday_symbols": ai_symbols[:SMART_MONEY_TOP_N],
+            "pcr_symbols": ai_symbols[:PCR_TOP_N],
+        }
+
+    async def _prefetch_basket_data(
+        self, ai_symbols: list[str]
+    ) -> SharedDataContext | None:
+        """Fetch every basket dataset once, with bounded concurrency.
+
+        Returns None when there is no DataManager (no Redis); the basket
+        metrics then fetch their own data.
+        """
+        data_manager = self._data_manager()
+        if data_manager is None:
+            return None
+
+        plan = self._basket_data_plan(ai_symbols)
+        context = await data_manager.prefetch_shared(
+            history_symbols=plan["history_symbols"],
+            intraday_symbols=plan["intraday_symbols"],
+            pcr_symbols=plan["pcr_symbols"],
+            max_concurrency=BASKET_PREFETCH_CONCURRENCY,
+        )
+        if context.has_errors():
+            logger.warning(
+                "AI basket prefetch incomplete",
+                errors=context.errors,
+            )
+        return context
+
     async def calculate_metrics(self) -> list[InsightMetric]:
         """Calculate all 7 AI Sector Risk metrics.
 
         This method orchestrates the calculation of all metrics,
         handling partial failures gracefully. The AI basket is fetched
-        once and reused across all metrics that need it.
+        once, the per-symbol data every basket metric needs is prefetched
+        in one bounded-concurrency pass, and all metrics are then
+        calculated concurrently.
         """
         logger.info("Calculating AI Sector Risk metrics")
 
         # Fetch AI basket once for all metrics that need it
         ai_symbols, basket_source = await self._get_ai_basket_symbols()
         ai_basket = (ai_symbols, basket_source)
+        context = await self._prefetch_basket_data(ai_symbols)
 
-        metrics = []
-
-        # Calculate each metric with error handling
-        # Metrics that use AI basket receive it as parameter
+        # Metrics that use AI basket receive it (and the prefetched data)
+        # as parameters
         metric_calculators: list[tuple[str, Any]] = [
-            ("ai_price_anomaly", lambda: self._calculate_ai_price_anomaly(ai_basket)),
+            (
+                "ai_price_anomaly",
+                lambda: self._calculate_ai_price_anomaly(ai_basket, context),
+            ),
             (
                 "news_sentiment",
                 self._calculate_news_sentiment,
             ),  # Uses topics=technology
-            ("smart_money_flow", lambda: self._calculate_smart_money_flow(ai_basket)),
+            (
+                "smart_money_flow",
+                lambda: self._calculate_smart_money_flow(ai_basket, context),
+            ),
             (
                 "options_put_call_ratio",
-                lambda: self._calculate_options_put_call_ratio(ai_basket),
+                lambda: self._calculate_options_put_call_ratio(ai_basket, context),
             ),
             ("ipo_heat", self._calculate_ipo_heat),
             ("market_liquidity", self._calculate_market_liquidity),
             ("fed_expectations", self._calculate_fed_expectations),
         ]
 
-        for metric_id, calculator in metric_calculators:
-            try:
-                metric = await calculator()
-                metrics.append(metric)
-            except Exception as e:
-                logger.error(
-                    "Metric calculation failed",
-                    metric_id=metric_id,
-                    error=str(e),
+        metrics = list(
+            await asyncio.gather(
+                *(
+                    self._run_calculator(metric_id, calculator)
+                    for metric_id, calculator in metric_calculators
                 )
-                # Add placeholder metric for failed calculation
-                metrics.append(self._create_error_metric(metric_id))
+            )
+        )
 
         logger.info(
             "AI Sector Risk metrics calculated",
@@ -279,8 +351,58 @@ class AISectorRiskCategory(InsightCategoryBase):
 
         return metrics
 
+    async def _run_calculator(self, metric_id: str, calculator: Any) -> InsightMetric:
+        """Run one metric calculator, substituting an error metric on failure."""
+        try:
+            metric: InsightMetric = await calculator()
+            return metric
+        except Exception as e:
+            logger.error(
+                "Metric calculation failed",
+                metric_id=metric_id,
+                error=str(e),
+            )
+            # Add placeholder metric for failed calculation
+            return self._create_error_metric(metric_id)
+
+    async def _fetch_daily_history(self, symbols: list[str]) -> dict[str, OHLCVBars]:
+        """Full daily history per symbol, fetched concurrently.
+
+        Goes through DataManager (cached, bar store) when Redis is available.
+        Symbols that fail are logged and left out.
+        """
+        data_manager = self._data_manager()
+
+        async def fetch(symbol: str) -> OHLCVBars:
+            if data_manager:
+                return await data_manager.get_ohlcv(
+                    symbol, Granularity.DAILY, outputsize="full"
+                )
+            df = await self.market_service.get_daily_bars(
+                symbol=symbol,
+                outputsize="full",
+            )
+            return OHLCVBars.from_dataframe(df)
+
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in symbols), return_exceptions=True
+        )
+        history = {}
+        for symbol, result in zip(symbols, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Failed to get data for symbol",
+                    symbol=symbol,
+                    error=str(result),
+                )
+            else:
+                history[symbol] = result
+        return history
+
     async def _calculate_ai_price_anomaly(
-        self, ai_basket: tuple[list[str], str]
+        self,
+        ai_basket: tuple[list[str], str],
+        context: SharedDataContext | None = None,
     ) -> InsightMetric:
         """Calculate AI Price Anomaly metric using real market data.
 
@@ -289,6 +411,8 @@ class AISectorRiskCategory(InsightCategoryBase):
 
         Args:
             ai_basket: Tuple of (symbols list, source description) from AIQ ETF
+            context: Prefetched basket data (full daily history); fetched
+                here when not given
         """
         if not self.market_service:
             return self._create_placeholder_metric(
@@ -301,43 +425,39 @@ class AISectorRiskCategory(InsightCategoryBase):
         # Use pre-fetched AI basket
         ai_symbols, basket_source = ai_basket
 
-        z_scores = []
-        symbol_data = {}
-
-        for symbol in ai_symbols:
-            try:
-                # Get daily bars (need 200+ days for SMA calculation)
-                df = await self.market_service.get_daily_bars(
-                    symbol=symbol,
-                    outputsize="full",
-                )
-
-                if df is not None and len(df) >= 200:
-                    # Calculate 200-day SMA and Z-score
-                    close_prices = df["Close"].values
-                    current_price = close_prices[-1]
-                    sma_200 = np.mean(close_prices[-200:])
-                    std_200 = np.std(close_prices[-200:])
-
-                    if std_200 > 0:
-                        z_score = (current_price - sma_200) / std_200
-                        z_scores.append(z_score)
-                        symbol_data[symbol] = {
-                            "current": round(current_price, 2),
-                            "sma_200": round(sma_200, 2),
-                            "z_score": round(z_score, 2),
-                        }
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to get data for symbol",
-                    symbol=symbol,
-                    error=str(e),
-                )
+        # Get daily bars (need 200+ days for SMA calculation)
+        if context is not None:
+            history = {
+                symbol: bars
+                for symbol in ai_symbols
+                if (bars := context.get_history(symbol)) is not None
+            }
+        else:
+            history = await self._fetch_daily_history(ai_symbols)
+
+        # Whole basket at once: symbols × dates close matrix, 200-day SMA/std
+        # of the latest date, Z = (P - SMA200) / σ200
+        prices = BasketMatrix.from_bars(history, lookback=PRICE_ANOMALY_WINDOW)
+        current = prices.latest
+        sma_200, std_200 = prices.latest_mean_std(PRICE_ANOMALY_WINDOW)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (current - sma_200) / std_200
+        valid = np.isfinite(z) & (std_200 > 0)
+        z_scores = z[valid]
+        above_sma = breadth(np.where(valid, z, np.nan))
+
+        symbol_data = {
+            prices.symbols[i]: {
+                "current": round(float(current[i]), 2),
+                "sma_200": round(float(sma_200[i]), 2),
+                "z_score": round(float(z[i]), 2),
+            }
+            for i in np.flatnonzero(valid)
+        }
 
         # Calculate average Z-score and normalize to 0-100
-        if z_scores:
-            avg_z_score = np.mean(z_scores)
+        if z_scores.size:
+            avg_z_score = float(np.mean(z_scores))
             # Z-score of -2 to +3 maps to 0-100
             score = self.normalize_score(avg_z_score, -2.0, 3.0)
         else:
@@ -384,6 +504,9 @@ class AISectorRiskCategory(InsightCategoryBase):
                 "basket_source": basket_source,
                 "avg_z_score": round(avg_z_score, 3),
                 "symbol_data": symbol_data,
+                "breadth_above_sma": (
+                    round(above_sma, 3) if above_sma is not None else None
+                ),
             },
         )
 
@@ -487,7 +610,9 @@ class AISectorRiskCategory(InsightCategoryBase):
             )
 
     async def _calculate_smart_money_flow(
-        self, ai_basket: tuple[list[str], str]
+        self,
+        ai_basket: tuple[list[str], str],
+        context: SharedDataContext | None = None,
     ) -> InsightMetric:
         """Calculate Smart Money Flow using Smart Money Index (SMI) logic.
 
@@ -501,6 +626,8 @@ class AISectorRiskCategory(InsightCategoryBase):
 
         Args:
             ai_basket: Tuple of (symbols list, source description) from AIQ ETF
+            context: Prefetched basket data (60min bars); fetched here when
+                not given
         """
         if not self.market_service:
             return self._create_placeholder_metric(
@@ -513,47 +640,41 @@ class AISectorRiskCategory(InsightCategoryBase):
         try:
             # Use pre-fetched AI basket
             ai_symbols, _ = ai_basket
-            symbols_to_analyze = ai_symbols[:3]  # Analyze top 3 holdings
-            smi_values = []
-
-            for symbol in symbols_to_analyze:
-                # Get intraday bars (60min to isolate first/last hour)
-                # We need enough data to cover the current/last trading session
-                df = await self.market_service.get_intraday_bars(
-                    symbol=symbol,
-                    interval="60min",
-                    outputsize="compact",  # Latest 100 points
+            symbols_to_analyze = ai_symbols[:SMART_MONEY_TOP_N]  # Top holdings
+
+            # Get intraday bars (60min to isolate first/last hour)
+            # We need enough data to cover the current/last trading session
+            if context is not None:
+                intraday = {
+                    symbol: bars
+                    for symbol in symbols_to_analyze
+                    if (bars := context.get_intraday(symbol)) is not None
+                }
+            else:
+                frames = await asyncio.gather(
+                    *(
+                        self.market_service.get_intraday_bars(
+                            symbol=symbol,
+                            interval="60min",
+                            outputsize="compact",  # Latest 100 points
+                        )
+                        for symbol in symbols_to_analyze
+                    )
                 )
+                intraday = {
+                    symbol: OHLCVBars.from_dataframe(df)
+                    for symbol, df in zip(symbols_to_analyze, frames, strict=True)
+                }
+
+            # First hour bar (9:30 - 10:30) and last hour bar (15:30 - 16:00)
+            # of each symbol's latest session (bars are America/New_York);
+            # returns are (Close - Open) / Open.
+            # SMI = Last Hour - First Hour
+            # If Last Hour (Smart) > First Hour (Dumb) -> Positive SMI (Bullish)
+            smi = session_returns(intraday).smi
+            smi_values = smi[~np.isnan(smi)]
 
-                if df is not None and not df.empty:
-                    # Group by date to get daily sessions
-                    # df index is timezone aware (America/New_York)
-                    last_date = df.index[-1].date()
-                    todays_bars = df[df.index.date == last_date]
-
-                    if len(todays_bars) >= 2:
-                        # First hour bar (9:30 - 10:30)
-                        first_hour = todays_bars.iloc[0]
-                        # Last hour bar (15:30 - 16:00/16:30)
-                        last_hour = todays_bars.iloc[-1]
-
-                        # Calculate returns
-                        # (Close - Open) / Open
-                        first_hour_return = (
-                            (first_hour["Close"] - first_hour["Open"])
-                            / first_hour["Open"]
-                        ) * 100
-
-                        last_hour_return = (
-                            (last_hour["Close"] - last_hour["Open"]) / last_hour["Open"]
-                        ) * 100
-
-                        # SMI = Last Hour - First Hour
-                        # If Last Hour (Smart) > First Hour (Dumb) -> Positive SMI (Bullish)
-                        smi = last_hour_return - first_hour_return
-                        smi_values.append(smi)
-
-            if smi_values:
+            if smi_values.size:
                 avg_smi = float(np.mean(smi_values))
                 # SMI typically ranges from -2% to +2%
                 # Map to 0-100 score where higher is more bullish (smart money buying)
@@ -617,11 +738,13 @@ class AISectorRiskCategory(InsightCategoryBase):
             )
 
     async def _calculate_options_put_call_ratio(
-        self, ai_basket: tuple[list[str], str]
+        self,
+        ai_basket: tuple[list[str], str],
+        context: SharedDataContext | None = None,
     ) -> InsightMetric:
         """Calculate Options Put/Call Ratio using cached per-symbol PCR data.
 
-        Uses DataManager.get_symbol_pcr() for cached, reusable PCR calculations.
+        Uses DataManager.get_symbols_pcr() for cached, reusable PCR calculations.
         This is a CONTRARIAN indicator:
         - Low PCR (< 0.5) = High Risk (too many calls, euphoria)
         - High PCR (> 1.0) = Low Risk (too many puts, fear)
@@ -633,11 +756,14 @@ class AISectorRiskCategory(InsightCategoryBase):
 
         Args:
             ai_basket: Tuple of (symbols list, source description)
+            context: Prefetched basket data (per-symbol PCR); fetched here
+                when not given
 
         Returns:
             InsightMetric with PCR score (contrarian: low PCR = high risk)
         """
-        if not self.market_service or not self.redis_cache:
+        data_manager = self._data_manager()
+        if not self.market_service or not self.redis_cache or data_manager is None:
             return self._create_placeholder_metric(
                 "options_put_call_ratio",
                 "Options Put/Call Ratio",
@@ -645,15 +771,18 @@ class AISectorRiskCategory(InsightCategoryBase):
                 "Market service or Redis cache not available",
             )
 
-        # Create DataManager for cached PCR calculations
-        data_manager = DataManager(
-            redis_cache=self.redis_cache,
-            alpha_vantage_service=self.market_service,
-        )
-
         # Use top 10 AI basket symbols for broader market picture (Story 2.8)
         ai_symbols, basket_source = ai_basket
-        symbols_to_analyze = ai_symbols[:10]
+        symbols_to_analyze = ai_symbols[:PCR_TOP_N]
+
+        # Fetch PCR for each symbol using cached service
+        if context is not None:
+            pcr_results: list[SymbolPCRData | None] = [
+                context.get_pcr(symbol) for symbol in symbols_to_analyze
+            ]
+        else:
+            batch = await data_manager.get_symbols_pcr(symbols_to_analyze)
+            pcr_results = [batch.get(symbol) for symbol in symbols_to_analyze]
 
         total_put_notional = 0.0
         total_call_notional = 0.0
@@ -661,39 +790,28 @@ class AISectorRiskCategory(InsightCategoryBase):
         contracts_analyzed = 0
         successful_symbols = []
 
-        # Fetch PCR for each symbol using cached service
-        for symbol in symbols_to_analyze:
-            try:
-                pcr_data = await data_manager.get_symbol_pcr(symbol)
-
-                if pcr_data is None:
-                    logger.debug(
-                        "PCR data not available for symbol",
-                        symbol=symbol,
-                    )
-                    continue
-
-                # Aggregate notionals (convert from millions back to raw)
-                total_put_notional += pcr_data.put_notional_mm * 1_000_000
-                total_call_notional += pcr_data.call_notional_mm * 1_000_000
-                contracts_analyzed += pcr_data.contracts_analyzed
-                successful_symbols.append(symbol)
-
-                symbol_details[symbol] = {
-                    "current_price": pcr_data.current_price,
-                    "atm_zone": f"${pcr_data.atm_zone_low:.2f} - ${pcr_data.atm_zone_high:.2f}",
-                    "put_notional_mm": pcr_data.put_notional_mm,
-                    "call_notional_mm": pcr_data.call_notional_mm,
-                    "contracts_used": pcr_data.contracts_analyzed,
-                    "symbol_pcr": pcr_data.pcr,
-                }
-
-            except Exception as e:
-                logger.warning(
-                    "Failed to get PCR for symbol",
+        for symbol, pcr_data in zip(symbols_to_analyze, pcr_results, strict=True):
+            if pcr_data is None:
+                logger.debug(
+                    "PCR data not available for symbol",
                     symbol=symbol,
-                    error=str(e),
                 )
+                continue
+
+            # Aggregate notionals (convert from millions back to raw)
+            total_put_notional += pcr_data.put_notional_mm * 1_000_000
+            total_call_notional += pcr_data.call_notional_mm * 1_000_000
+            contracts_analyzed += pcr_data.contracts_analyzed
+            successful_symbols.append(symbol)
+
+            symbol_details[symbol] = {
+                "current_price": pcr_data.current_price,
+                "atm_zone": f"${pcr_data.atm_zone_low:.2f} - ${pcr_data.atm_zone_high:.2f}",
+                "put_notional_mm": pcr_data.put_notional_mm,
+                "call_notional_mm": pcr_data.call_notional_mm,
+                "contracts_used": pcr_data.contracts_analyzed,
+                "symbol_pcr": pcr_data.pcr,
+            }
 
         # Calculate aggregate PCR
         if total_call_notional > 0:
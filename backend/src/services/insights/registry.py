@@ -11,6 +11,7 @@ import structlog
 
 from ...core.config import Settings
 from ...database.redis import RedisCache
+from ..data_manager import DataManager
 from .base import InsightCategoryBase
 from .models import CategoryMetadata, InsightCategory
 
@@ -76,6 +77,7 @@ class InsightsCategoryRegistry:
         redis_cache: RedisCache | None = None,
         market_service: Any | None = None,
         fred_service: Any | None = None,
+        data_manager: DataManager | None = None,
     ) -> None:
         """Initialize registry with dependencies.
 
@@ -84,11 +86,13 @@ class InsightsCategoryRegistry:
             redis_cache: Optional Redis cache
             market_service: AlphaVantageMarketDataService instance
             fred_service: FREDService instance for liquidity metrics
+            data_manager: Shared DataManager (app singleton) for categories
         """
         self.settings = settings
         self.redis_cache = redis_cache
         self.market_service = market_service
         self.fred_service = fred_service
+        self.data_manager = data_manager
         self._instances: dict[str, InsightCategoryBase] = {}
 
         # Auto-discover and load categories
@@ -119,6 +123,7 @@ class InsightsCategoryRegistry:
                     redis_cache=self.redis_cache,
                     market_service=self.market_service,
                     fred_service=self.fred_service,
+                    data_manager=self.data_manager,
                 )
                 self._instances[category_id] = instance
                 logger.info(
@@ -21,6 +21,7 @@ from ...database.mongodb import MongoDB
 from ...database.redis import RedisCache
 from ..data_manager import CacheKeys, DataManager
 from ..market_data import FREDService
+from ..market_data.scheduler import RequestPriority, with_priority
 from .models import CompositeScore, InsightMetric
 from .registry import InsightsCategoryRegistry
 
@@ -88,6 +89,7 @@ class InsightsSnapshotService:
                 settings=self.settings,
                 redis_cache=self.redis_cache,
                 fred_service=fred_service,
+                data_manager=self.data_manager,
             )
         return self._registry
 
@@ -111,6 +113,7 @@ class InsightsSnapshotService:
             collection=SNAPSHOTS_COLLECTION,
         )
 
+    @with_priority(RequestPriority.BACKGROUND)
     async def create_snapshot(
         self,
         category_id: str = "ai_sector_risk",
@@ -6,6 +6,15 @@ import pandas as pd
 import structlog
 
 from .base import AlphaVantageBase
+from .parsers import (
+    ADJUSTED_FIELDS,
+    OHLCV_FIELDS,
+    SeriesColumns,
+    adjusted_ohlcv_frame,
+    ohlcv_frame,
+    parse_adjusted_ohlcv_series,
+    parse_ohlcv_series,
+)
 
 logger = structlog.get_logger()
 
@@ -31,56 +40,48 @@ class BarsBasicMixin(AlphaVantageBase):
             DataFrame with Open, High, Low, Close, Volume columns
         """
         try:
-            response = await self.client.get(
-                self.base_url,
-                params={
-                    "function": "TIME_SERIES_INTRADAY",
-                    "symbol": symbol,
-                    "interval": interval,
-                    "outputsize": outputsize,
-                    "extended_hours": "true",  # Include pre/post market
-                    "entitlement": "delayed",  # 15-minute delayed data (premium)
-                    "apikey": self.api_key,
-                },
-            )
+            params = {
+                "function": "TIME_SERIES_INTRADAY",
+                "symbol": symbol,
+                "interval": interval,
+                "outputsize": outputsize,
+                "extended_hours": "true",  # Include pre/post market
+                "entitlement": "delayed",  # 15-minute delayed data (premium)
+                "apikey": self.api_key,
+            }
+            ts_key = f"Time Series ({interval})"
 
-            if response.status_code != 200:
-                sanitized_text = self._sanitize_text(response.text)
-                raise ValueError(
-                    f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
+            if outputsize == "full":
+                # Full-length series are several MB; decode bars as they arrive
+                columns = SeriesColumns(OHLCV_FIELDS)
+                _, streamed = await self._get_json_stream(
+                    params, ts_key.__eq__, columns.add
+                )
+                if streamed is None:
+                    raise ValueError(f"No intraday data for symbol: {symbol}")
+                df = ohlcv_frame(
+                    columns.timestamps, columns.matrix(), tz="America/New_York"
                 )
+            else:
+                response = await self.client.get(self.base_url, params=params)
 
-            data = response.json()
+                if response.status_code != 200:
+                    sanitized_text = self._sanitize_text(response.text)
+                    raise ValueError(
+                        f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
+                    )
 
-            # Find the time series key
-            ts_key = f"Time Series ({interval})"
-            if ts_key not in data:
-                raise ValueError(f"No intraday data for symbol: {symbol}")
-
-            time_series = data[ts_key]
-
-            # Convert to DataFrame
-            df_data = []
-            for timestamp, values in time_series.items():
-                df_data.append(
-                    {
-                        "timestamp": pd.to_datetime(timestamp),
-                        "Open": float(values["1. open"]),
-                        "High": float(values["2. high"]),
-                        "Low": float(values["3. low"]),
-                        "Close": float(values["4. close"]),
-                        "Volume": int(values["5. volume"]),
-                    }
-                )
+                data = response.json()
 
-            df = pd.DataFrame(df_data)
-            df.set_index("timestamp", inplace=True)
-            df.sort_index(inplace=True)  # Ensure chronological order
+                # Find the time series key
+                if ts_key not in data:
+                    raise ValueError(f"No intraday data for symbol: {symbol}")
 
-            # Alpha Vantage returns intraday timestamps in US Eastern Time
-            # Localize naive timestamps to ET for proper session detection
-            if not df.empty and df.index.tz is None:
-                df.index = df.index.tz_localize("America/New_York")
+                time_series = data[ts_key]
+
+                # Alpha Vantage returns intraday timestamps in US Eastern Time
+                # Localize naive timestamps to ET for proper session detection
+                df = parse_ohlcv_series(time_series, tz="America/New_York")
 
             logger.info(
                 "Intraday bars fetched",
@@ -116,65 +117,47 @@ class BarsBasicMixin(AlphaVantageBase):
             DataFrame with Open, High, Low, Close, Volume columns (split-adjusted)
         """
         try:
-            response = await self.client.get(
-                self.base_url,
-                params={
-                    "function": "TIME_SERIES_DAILY_ADJUSTED",
-                    "symbol": symbol,
-                    "outputsize": outputsize,
-                    "apikey": self.api_key,
-                },
-            )
-
-            if response.status_code != 200:
-                sanitized_text = self._sanitize_text(response.text)
-                raise ValueError(
-                    f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
-                )
-
-            data = response.json()
-
+            params = {
+                "function": "TIME_SERIES_DAILY_ADJUSTED",
+                "symbol": symbol,
+                "outputsize": outputsize,
+                "apikey": self.api_key,
+            }
             # DAILY_ADJUSTED returns data with different key name
             key = "Time Series (Daily)"
-            if key not in data:
-                raise ValueError(
-                    f"No daily data for symbol: {symbol}. Keys: {list(data.keys())}"
-                )
-
-            time_series = data[key]
 
-            # Convert to DataFrame
             # DAILY_ADJUSTED provides: adjusted close (field 5), dividend (7), split coeff (8)
             # IMPORTANT: We must adjust ALL OHLC values using the adjustment factor,
             # not just Close. Otherwise, stock splits create frankendata where
             # pre-split OHLC (~$1700) is mixed with adjusted Close (~$170).
-            df_data = []
-            for date, values in time_series.items():
-                raw_close = float(values["4. close"])
-                adjusted_close = float(values["5. adjusted close"])
-
-                # Calculate adjustment factor (handles both splits and dividends)
-                # For a 10:1 split: raw_close=1700, adjusted_close=170, factor=0.1
-                adjustment_factor = (
-                    adjusted_close / raw_close if raw_close != 0 else 1.0
+            if outputsize == "full":
+                # 20+ years of bars; decode them as they arrive
+                columns = SeriesColumns(ADJUSTED_FIELDS)
+                header, streamed = await self._get_json_stream(
+                    params, key.__eq__, columns.add
                 )
+                if streamed is None:
+                    raise ValueError(
+                        f"No daily data for symbol: {symbol}. Keys: {list(header.keys())}"
+                    )
+                df = adjusted_ohlcv_frame(columns.timestamps, columns.matrix())
+            else:
+                response = await self.client.get(self.base_url, params=params)
 
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(date),
-                        "Open": float(values["1. open"]) * adjustment_factor,
-                        "High": float(values["2. high"]) * adjustment_factor,
-                        "Low": float(values["3. low"]) * adjustment_factor,
-                        "Close": adjusted_close,
-                        "Volume": int(
-                            values["6. volume"]
-                        ),  # Volume is field 6 in DAILY_ADJUSTED
-                    }
-                )
+                if response.status_code != 200:
+                    sanitized_text = self._sanitize_text(response.text)
+                    raise ValueError(
+                        f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
+                    )
 
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+                data = response.json()
+
+                if key not in data:
+                    raise ValueError(
+                        f"No daily data for symbol: {symbol}. Keys: {list(data.keys())}"
+                    )
+
+                df = parse_adjusted_ohlcv_series(data[key])
 
             logger.info(
                 "Daily bars fetched (split-adjusted)",
@@ -230,32 +213,8 @@ class BarsBasicMixin(AlphaVantageBase):
 
             time_series = data["Weekly Adjusted Time Series"]
 
-            # Convert to DataFrame with split adjustment
-            # Same logic as daily: adjust OHLC using adjustment factor
-            df_data = []
-            for date, values in time_series.items():
-                raw_close = float(values["4. close"])
-                adjusted_close = float(values["5. adjusted close"])
-
-                # Calculate adjustment factor (handles both splits and dividends)
-                adjustment_factor = (
-                    adjusted_close / raw_close if raw_close != 0 else 1.0
-                )
-
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(date),
-                        "Open": float(values["1. open"]) * adjustment_factor,
-                        "High": float(values["2. high"]) * adjustment_factor,
-                        "Low": float(values["3. low"]) * adjustment_factor,
-                        "Close": adjusted_close,
-                        "Volume": int(values["6. volume"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            # Split-adjust OHLC (same logic as daily)
+            df = parse_adjusted_ohlcv_series(time_series)
 
             logger.info(
                 "Weekly bars fetched (split-adjusted)",
@@ -311,32 +270,8 @@ class BarsBasicMixin(AlphaVantageBase):
 
             time_series = data["Monthly Adjusted Time Series"]
 
-            # Convert to DataFrame with split adjustment
-            # Same logic as daily: adjust OHLC using adjustment factor
-            df_data = []
-            for date, values in time_series.items():
-                raw_close = float(values["4. close"])
-                adjusted_close = float(values["5. adjusted close"])
-
-                # Calculate adjustment factor (handles both splits and dividends)
-                adjustment_factor = (
-                    adjusted_close / raw_close if raw_close != 0 else 1.0
-                )
-
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(date),
-                        "Open": float(values["1. open"]) * adjustment_factor,
-                        "High": float(values["2. high"]) * adjustment_factor,
-                        "Low": float(values["3. low"]) * adjustment_factor,
-                        "Close": adjusted_close,
-                        "Volume": int(values["6. volume"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            # Split-adjust OHLC (same logic as daily)
+            df = parse_adjusted_ohlcv_series(time_series)
 
             logger.info(
                 "Monthly bars fetched (split-adjusted)",
@@ -1,15 +1,24 @@
 """
 Base class for Alpha Vantage market data service.
-Provides initialization, HTTP client management, and sanitization utilities.
+Provides initialization, HTTP client management, request scheduling,
+streamed JSON decoding and sanitization utilities.
 """
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 import httpx
 import structlog
 
 from ...core.config import Settings
+from .json_stream import ItemCallback, decode_object_stream
+from .scheduler import (
+    THROTTLE_DAILY,
+    RequestScheduler,
+    ScheduledClient,
+    classify_notice,
+)
 
 logger = structlog.get_logger()
 
@@ -20,6 +29,8 @@ class AlphaVantageBase:
 
     Provides:
     - HTTP client with connection pooling
+    - Quota-aware request scheduling (shared token bucket per API key)
+    - Streamed JSON decoding for large responses
     - API key management
     - Response sanitization (removes API keys from logs)
     - Resource cleanup
@@ -42,14 +53,26 @@ class AlphaVantageBase:
         self.base_url = "https://www.alphavantage.co/query"
         self.redis_cache = redis_cache  # Optional caching support
 
-        # Persistent HTTP client with connection pooling
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=10,
-                keepalive_expiry=30.0,
+        # All instances using this key share one token bucket, so requests
+        # from chats, API calls and background jobs count against one quota
+        self.scheduler = RequestScheduler.shared(
+            self.api_key,
+            requests_per_minute=settings.alpha_vantage_requests_per_minute,
+            burst=settings.alpha_vantage_burst,
+        )
+
+        # Persistent HTTP client with connection pooling; get() is paced by
+        # the scheduler and retried on throttle notices
+        self.client = ScheduledClient(
+            httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=5,
+                    max_connections=10,
+                    keepalive_expiry=30.0,
+                ),
             ),
+            self.scheduler,
         )
 
         if not self.api_key:
@@ -59,6 +82,7 @@ class AlphaVantageBase:
             "Alpha Vantage market data service initialized",
             api_key_configured=bool(self.api_key),
             connection_pool_enabled=True,
+            requests_per_minute=round(self.scheduler.rate * 60),
         )
 
     async def close(self) -> None:
@@ -66,6 +90,63 @@ class AlphaVantageBase:
         await self.client.aclose()
         logger.info("Alpha Vantage market data service closed")
 
+    async def _get_json_stream(
+        self,
+        params: dict[str, str],
+        stream_key: Callable[[str], bool],
+        on_item: ItemCallback,
+    ) -> tuple[dict[str, Any], str | None]:
+        """
+        GET a large JSON response and decode it incrementally.
+
+        The body is read as a byte stream; records of the member selected by
+        `stream_key` go to `on_item` as they arrive (see json_stream.py), so
+        peak memory is one network chunk plus what `on_item` keeps. Throttle
+        notices are retried with backoff like `client.get`.
+
+        Args:
+            params: Query parameters
+            stream_key: Selects the member to stream (e.g. the time series key)
+            on_item: Called per record of that member
+
+        Returns:
+            (other top-level members, streamed member key or None)
+
+        Raises:
+            ValueError: On non-200 responses or malformed bodies
+        """
+        max_retries = getattr(self.client, "max_retries", 3)
+        attempt = 0
+        while True:
+            async with self.client.stream_get(self.base_url, params=params) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    sanitized_text = self._sanitize_text(response.text)
+                    raise ValueError(
+                        f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
+                    )
+                header, streamed = await decode_object_stream(
+                    response.aiter_bytes(), stream_key, on_item
+                )
+
+            throttle = classify_notice(header) if streamed is None else None
+            if throttle is None:
+                self.scheduler.report_success()
+                return header, streamed
+
+            backoff = self.scheduler.report_throttle(throttle)
+            logger.warning(
+                "Alpha Vantage throttled request",
+                function=params.get("function"),
+                throttle=throttle,
+                attempt=attempt + 1,
+                backoff_seconds=backoff,
+                streamed=True,
+            )
+            if throttle == THROTTLE_DAILY or attempt >= max_retries:
+                return header, None
+            attempt += 1
+
     def _sanitize_text(self, text: str) -> str:
         """Remove API key from text strings before logging or raising exceptions."""
         # Use pre-compiled regex pattern (class-level optimization)
@@ -0,0 +1,152 @@
+"""
+Incremental JSON decoding for large Alpha Vantage responses.
+
+Full-history bars and HISTORICAL_OPTIONS chains are multi-megabyte JSON
+objects of which we keep a few fields per record. `decode_object_stream`
+reads the top-level object from byte chunks as they arrive and hands the
+records of one member (the time series mapping or the "data" array) to a
+callback one at a time, so neither the whole body nor the whole decoded
+tree is ever held in memory. All other members (e.g. "Meta Data", "Note",
+"Error Message") are small and decoded whole.
+"""
+
+import codecs
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+# on_item(key, value): key is the member name for streamed objects, None for
+# streamed arrays
+ItemCallback = Callable[[str | None, Any], None]
+
+
+class JSONStreamError(ValueError):
+    """Raised when a streamed body is not the expected JSON object."""
+
+
+class _StreamBuffer:
+    """Decoded text window over an async byte stream."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks: AsyncIterator[bytes] = aiter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    async def _fill(self) -> None:
+        """Append the next chunk, dropping text that was already consumed."""
+        try:
+            chunk = await anext(self._chunks)
+            decoded = self._utf8.decode(chunk)
+        except StopAsyncIteration:
+            self._eof = True
+            decoded = self._utf8.decode(b"", final=True)
+        self._text = self._text[self._pos :] + decoded
+        self._pos = 0
+
+    async def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)."""
+        while True:
+            while self._pos < len(self._text) and self._text[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if self._eof:
+                return ""
+            await self._fill()
+
+    async def expect(self, allowed: str) -> str:
+        """Consume the next character, which must be one of `allowed`."""
+        char = await self.peek()
+        if not char or char not in allowed:
+            found = repr(char) if char else "end of stream"
+            raise JSONStreamError(f"Expected one of {allowed!r}, found {found}")
+        self._pos += 1
+        return char
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._text, self._pos)
+                # A value ending exactly at the buffer edge may be a truncated
+                # number; wait for the next character unless the stream ended
+                if end < len(self._text) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise JSONStreamError(str(e)) from e
+            await self._fill()
+
+
+async def _stream_container(
+    buffer: _StreamBuffer, opener: str, on_item: ItemCallback
+) -> int:
+    closer = "]" if opener == "[" else "}"
+    if await buffer.peek() == closer:
+        await buffer.expect(closer)
+        return 0
+
+    count = 0
+    while True:
+        key = None
+        if opener == "{":
+            key = await buffer.value()
+            if not isinstance(key, str):
+                raise JSONStreamError("Object keys must be strings")
+            await buffer.expect(":")
+        on_item(key, await buffer.value())
+        count += 1
+        if await buffer.expect("," + closer) == closer:
+            return count
+
+
+async def decode_object_stream(
+    chunks: AsyncIterable[bytes],
+    stream_key: Callable[[str], bool],
+    on_item: ItemCallback,
+) -> tuple[dict[str, Any], str | None]:
+    """
+    Decode a top-level JSON object, streaming one member's records.
+
+    Args:
+        chunks: Response body as byte chunks (e.g. httpx `aiter_bytes()`)
+        stream_key: Selects the member to stream (first match only); its
+            value must be an array or object
+        on_item: Called once per array element / object member of the
+            streamed member, in document order
+
+    Returns:
+        (other members decoded whole, key of the streamed member or None if
+        no member matched)
+
+    Raises:
+        JSONStreamError: If the body is not a JSON object or is truncated
+    """
+    buffer = _StreamBuffer(chunks)
+    header: dict[str, Any] = {}
+    streamed: str | None = None
+
+    await buffer.expect("{")
+    if await buffer.peek() == "}":
+        return header, None
+
+    while True:
+        key = await buffer.value()
+        if not isinstance(key, str):
+            raise JSONStreamError("Object keys must be strings")
+        await buffer.expect(":")
+        if streamed is None and stream_key(key):
+            opener = await buffer.expect("[{")
+            await _stream_container(buffer, opener, on_item)
+            streamed = key
+        else:
+            header[key] = await buffer.value()
+        if await buffer.expect(",}") == "}":
+            return header, streamed
@@ -6,6 +6,7 @@ import pandas as pd
 import structlog
 
 from .base import AlphaVantageBase
+from .parsers import parse_value_series
 
 logger = structlog.get_logger()
 
@@ -45,19 +46,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No REAL_GDP data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info("REAL_GDP data fetched", interval=interval, data_points=len(df))
 
@@ -99,19 +88,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No CPI data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info("CPI data fetched", interval=interval, data_points=len(df))
 
@@ -149,19 +126,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No INFLATION data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info("INFLATION data fetched", data_points=len(df))
 
@@ -199,19 +164,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No UNEMPLOYMENT data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info("UNEMPLOYMENT data fetched", data_points=len(df))
 
@@ -256,19 +209,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No commodity price data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info(
                 "Commodity prices (WTI) fetched",
@@ -340,19 +281,7 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No {commodity} price data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            df.set_index("date", inplace=True)
-            df.sort_index(inplace=True)
+            df = parse_value_series(data["data"])
 
             logger.info(
                 "Commodity price fetched",
@@ -414,23 +343,8 @@ class MacroMixin(AlphaVantageBase):
                 sanitized = self._sanitize_response(data)
                 raise ValueError(f"No TREASURY_YIELD data available: {sanitized}")
 
-            # Convert to DataFrame
-            df_data = []
-            for item in data["data"]:
-                # Skip entries with "." as value (no data)
-                if item.get("value") == ".":
-                    continue
-                df_data.append(
-                    {
-                        "date": pd.to_datetime(item["date"]),
-                        "value": float(item["value"]),
-                    }
-                )
-
-            df = pd.DataFrame(df_data)
-            if not df.empty:
-                df.set_index("date", inplace=True)
-                df.sort_index(inplace=True)
+            # Skip entries with "." as value (no data)
+            df = parse_value_series(data["data"], skip_missing=True)
 
             logger.info(
                 "TREASURY_YIELD data fetched",
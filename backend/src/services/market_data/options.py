@@ -4,8 +4,11 @@ Options data methods for Alpha Vantage service.
 Provides access to HISTORICAL_OPTIONS endpoint for options chain data.
 """
 
+import math
+from array import array
 from typing import Any
 
+import numpy as np
 import structlog
 
 from .base import AlphaVantageBase
@@ -13,6 +16,55 @@ from .base import AlphaVantageBase
 logger = structlog.get_logger()
 
 
+class OptionsChainColumns:
+    """
+    Options chain kept column-wise, with only the fields the PCR
+    calculation uses (greeks other than delta are dropped).
+
+    Contracts with non-numeric values are skipped; a missing delta is NaN.
+    """
+
+    NUMERIC_FIELDS = (
+        "strike",
+        "last",
+        "bid",
+        "ask",
+        "volume",
+        "open_interest",
+        "implied_volatility",
+    )
+
+    def __init__(self) -> None:
+        self.contract_id: list[str] = []
+        self.expiration: list[str] = []
+        self.option_type: list[str] = []
+        self.skipped = 0
+        self._values = array("d")  # NUMERIC_FIELDS + delta, row-major
+
+    def __len__(self) -> int:
+        return len(self.contract_id)
+
+    def add(self, _key: str | None, item: dict[str, Any]) -> None:
+        """Keep one contract from the vendor "data" array."""
+        try:
+            row = [float(item.get(name) or 0) for name in self.NUMERIC_FIELDS]
+            delta = item.get("delta")
+            row.append(float(delta) if delta else math.nan)
+        except (AttributeError, TypeError, ValueError):
+            self.skipped += 1
+            return
+        self._values.extend(row)
+        self.contract_id.append(str(item.get("contractID", "")))
+        self.expiration.append(str(item.get("expiration", "")))
+        self.option_type.append(str(item.get("type", "")).lower())
+
+    def numeric(self) -> dict[str, Any]:
+        """Numeric columns (NUMERIC_FIELDS plus "delta") as float64 arrays."""
+        names = (*self.NUMERIC_FIELDS, "delta")
+        matrix = np.frombuffer(self._values, dtype=np.float64).reshape(-1, len(names))
+        return {name: matrix[:, i] for i, name in enumerate(names)}
+
+
 class OptionsMixin(AlphaVantageBase):
     """Methods for options chain data from Alpha Vantage."""
 
@@ -105,3 +157,54 @@ class OptionsMixin(AlphaVantageBase):
         except Exception as e:
             logger.error("Options fetch failed", symbol=symbol, error=str(e))
             raise
+
+    async def get_options_chain(
+        self, symbol: str, date: str | None = None
+    ) -> OptionsChainColumns:
+        """
+        Get the HISTORICAL_OPTIONS chain as columns.
+
+        Unlike `get_historical_options`, the response is decoded as it
+        streams in and each contract is reduced to the fields in
+        OptionsChainColumns, so a chain of thousands of contracts never
+        exists as a list of dicts.
+
+        Args:
+            symbol: Stock symbol (e.g., "NVDA")
+            date: Optional date in YYYY-MM-DD format (defaults to previous trading day)
+
+        Returns:
+            OptionsChainColumns (empty on vendor error/information responses)
+        """
+        chain = OptionsChainColumns()
+        try:
+            params: dict[str, str] = {
+                "function": "HISTORICAL_OPTIONS",
+                "symbol": symbol.upper(),
+                "apikey": self.api_key,
+            }
+            if date:
+                params["date"] = date
+
+            header, _ = await self._get_json_stream(params, "data".__eq__, chain.add)
+
+            if "Error Message" in header:
+                error_msg = self._sanitize_text(str(header["Error Message"]))
+                logger.warning("options_api_error", symbol=symbol, error=error_msg)
+            elif "Information" in header:
+                info_msg = self._sanitize_text(str(header["Information"]))
+                logger.warning("options_api_info", symbol=symbol, info=info_msg)
+
+            logger.info(
+                "Options chain fetched",
+                symbol=symbol,
+                date=date or "previous_trading_day",
+                contracts=len(chain),
+                skipped=chain.skipped,
+                streamed=True,
+            )
+            return chain
+
+        except Exception as e:
+            logger.error("Options fetch failed", symbol=symbol, error=str(e))
+            raise
@@ -0,0 +1,218 @@
+"""
+Columnar parsers for Alpha Vantage time-series payloads.
+
+Alpha Vantage returns series as JSON mappings of timestamp -> {field: "str"}
+(bars) or lists of {"date", "value"} records (macro/treasury). These helpers
+turn them into DataFrames in one pass: all fields are pulled into a single
+float64 array, timestamps are converted in bulk, and timezone localization
+happens once on the whole index. SeriesColumns collects the same arrays from
+a streamed response (see json_stream.py) without keeping the records.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import itemgetter
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Vendor field names for raw and split/dividend-adjusted bar series
+OHLCV_FIELDS = ["1. open", "2. high", "3. low", "4. close", "5. volume"]
+ADJUSTED_FIELDS = [
+    "1. open",
+    "2. high",
+    "3. low",
+    "4. close",
+    "5. adjusted close",
+    "6. volume",
+]
+
+
+def _rows_to_matrix(rows: list[Any], width: int) -> Any:
+    if not rows:
+        return np.empty((0, width), dtype=np.float64)
+    return np.array(rows, dtype=np.float64).reshape(-1, width)
+
+
+def _to_matrix(records: Iterable[Mapping[str, Any]], fields: Sequence[str]) -> Any:
+    """Stack the given fields of every record into an (n, len(fields)) array."""
+    getter = itemgetter(*fields)
+    return _rows_to_matrix([getter(record) for record in records], len(fields))
+
+
+class SeriesColumns:
+    """
+    Accumulates (timestamp, record) pairs as timestamps plus float64 blocks.
+
+    Only `fields` are kept; every `block_rows` records the pending string
+    tuples are converted, so a streamed series never holds all records.
+    """
+
+    def __init__(self, fields: Sequence[str], block_rows: int = 4096):
+        self.fields = list(fields)
+        self.timestamps: list[str] = []
+        self._getter = itemgetter(*self.fields)
+        self._block_rows = block_rows
+        self._pending: list[Any] = []
+        self._blocks: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, timestamp: str | None, record: Mapping[str, Any]) -> None:
+        """Keep one record's fields (KeyError if one is missing)."""
+        self._pending.append(self._getter(record))
+        self.timestamps.append(str(timestamp))
+        if len(self._pending) >= self._block_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._blocks.append(_rows_to_matrix(self._pending, len(self.fields)))
+        self._pending = []
+
+    def matrix(self) -> Any:
+        """All rows as an (n, len(fields)) float64 array."""
+        if self._pending or not self._blocks:
+            self._flush()
+        if len(self._blocks) > 1:
+            self._blocks = [np.concatenate(self._blocks)]
+        return self._blocks[0]
+
+
+def _to_index(timestamps: Sequence[str], name: str, tz: str | None) -> pd.DatetimeIndex:
+    """Parse vendor timestamps in bulk and localize naive values once."""
+    index = pd.DatetimeIndex(pd.to_datetime(list(timestamps), format="ISO8601"))
+    index.name = name
+    if tz is not None and index.tz is None and len(index):
+        index = index.tz_localize(tz)
+    return index
+
+
+def _build_frame(index: pd.DatetimeIndex, columns: dict[str, Any]) -> pd.DataFrame:
+    """Assemble a DataFrame sorted chronologically (vendor order is newest first)."""
+    df = pd.DataFrame(columns, index=index)
+    if index.is_monotonic_increasing:
+        return df
+    if index.is_monotonic_decreasing:
+        return df.iloc[::-1]
+    return df.sort_index(kind="stable")
+
+
+def parse_ohlcv_series(
+    time_series: Mapping[str, Mapping[str, str]],
+    index_name: str = "timestamp",
+    tz: str | None = None,
+) -> pd.DataFrame:
+    """
+    Parse a raw (unadjusted) bar series such as TIME_SERIES_INTRADAY.
+
+    Args:
+        time_series: Mapping of timestamp -> {"1. open": ..., "5. volume": ...}
+        index_name: Name of the resulting DatetimeIndex
+        tz: Timezone to localize naive timestamps to (e.g. "America/New_York")
+
+    Returns:
+        DataFrame with Open, High, Low, Close (float64) and Volume (int64),
+        sorted oldest first
+
+    Raises:
+        KeyError: If a bar is missing a field
+        ValueError: If a value is not numeric
+    """
+    matrix = _to_matrix(time_series.values(), OHLCV_FIELDS)
+    return ohlcv_frame(list(time_series), matrix, index_name, tz)
+
+
+def ohlcv_frame(
+    timestamps: Sequence[str],
+    matrix: Any,
+    index_name: str = "timestamp",
+    tz: str | None = None,
+) -> pd.DataFrame:
+    """Build the raw bar DataFrame from timestamps and an OHLCV_FIELDS matrix."""
+    index = _to_index(timestamps, index_name, tz)
+    columns = {name: matrix[:, i] for i, name in enumerate(OHLCV_COLUMNS[:4])}
+    columns["Volume"] = matrix[:, 4].astype(np.int64)
+    return _build_frame(index, columns)
+
+
+def parse_adjusted_ohlcv_series(
+    time_series: Mapping[str, Mapping[str, str]],
+    index_name: str = "date",
+) -> pd.DataFrame:
+    """
+    Parse a *_ADJUSTED bar series, adjusting all OHLC values.
+
+    Open/High/Low are scaled by adjusted_close / close so splits don't mix
+    pre-split OHLC with an adjusted Close (factor 1.0 when close is 0).
+
+    Args:
+        time_series: Mapping of date -> {"1. open": ..., "6. volume": ...}
+        index_name: Name of the resulting DatetimeIndex
+
+    Returns:
+        DataFrame with split-adjusted Open, High, Low, Close (float64) and
+        Volume (int64), sorted oldest first
+
+    Raises:
+        KeyError: If a bar is missing a field
+        ValueError: If a value is not numeric
+    """
+    matrix = _to_matrix(time_series.values(), ADJUSTED_FIELDS)
+    return adjusted_ohlcv_frame(list(time_series), matrix, index_name)
+
+
+def adjusted_ohlcv_frame(
+    timestamps: Sequence[str],
+    matrix: Any,
+    index_name: str = "date",
+) -> pd.DataFrame:
+    """Build the split-adjusted bar DataFrame from an ADJUSTED_FIELDS matrix."""
+    index = _to_index(timestamps, index_name, None)
+
+    raw_close = matrix[:, 3]
+    adjusted_close = matrix[:, 4]
+    factor = np.divide(
+        adjusted_close,
+        raw_close,
+        out=np.ones_like(raw_close),
+        where=raw_close != 0,
+    )
+
+    columns = {
+        "Open": matrix[:, 0] * factor,
+        "High": matrix[:, 1] * factor,
+        "Low": matrix[:, 2] * factor,
+        "Close": adjusted_close,
+        "Volume": matrix[:, 5].astype(np.int64),
+    }
+    return _build_frame(index, columns)
+
+
+def parse_value_series(
+    records: Sequence[Mapping[str, str]],
+    skip_missing: bool = False,
+) -> pd.DataFrame:
+    """
+    Parse a macro series ([{"date": ..., "value": ...}, ...]).
+
+    Args:
+        records: Vendor "data" list
+        skip_missing: Drop records whose value is "." (no observation)
+            instead of failing on them
+
+    Returns:
+        DataFrame with a float64 "value" column and a "date" index, sorted
+        oldest first
+
+    Raises:
+        KeyError: If a record is missing date or value
+        ValueError: If a value is not numeric
+    """
+    if skip_missing:
+        records = [r for r in records if r.get("value") != "."]
+    matrix = _to_matrix(records, ["value"])
+    index = _to_index([r["date"] for r in records], "date", None)
+    return _build_frame(index, {"value": matrix[:, 0]})
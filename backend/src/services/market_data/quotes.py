@@ -8,6 +8,7 @@ import pandas as pd
 import structlog
 
 from .base import AlphaVantageBase
+from .scheduler import classify_notice
 
 logger = structlog.get_logger()
 
@@ -15,6 +16,9 @@ logger = structlog.get_logger()
 class QuotesMixin(AlphaVantageBase):
     """Methods for stock quotes, symbol search, and market status."""
 
+    # Vendor limit on symbols per REALTIME_BULK_QUOTES request
+    BULK_QUOTES_LIMIT = 100
+
     async def search_symbols(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """
         Search for stock symbols using Alpha Vantage SYMBOL_SEARCH.
@@ -157,6 +161,89 @@ class QuotesMixin(AlphaVantageBase):
             logger.error("Quote fetch failed", symbol=symbol, error=str(e))
             raise
 
+    async def get_bulk_quotes(
+        self, symbols: list[str]
+    ) -> dict[str, dict[str, Any]] | None:
+        """
+        Get quotes for many symbols using Alpha Vantage REALTIME_BULK_QUOTES.
+
+        One request covers up to BULK_QUOTES_LIMIT symbols; callers chunk
+        larger lists.
+
+        Args:
+            symbols: Stock symbols (at most BULK_QUOTES_LIMIT)
+
+        Returns:
+            Dict of symbol -> quote (same fields as get_quote) for the symbols
+            the vendor returned, or None if the endpoint is not available for
+            this API key (premium-only)
+
+        Raises:
+            ValueError: On API errors and throttle notices (daily quota, or a
+                per-minute limit the client stopped retrying)
+        """
+        if len(symbols) > self.BULK_QUOTES_LIMIT:
+            raise ValueError(
+                f"At most {self.BULK_QUOTES_LIMIT} symbols per bulk quote request"
+            )
+
+        try:
+            response = await self.client.get(
+                self.base_url,
+                params={
+                    "function": "REALTIME_BULK_QUOTES",
+                    "symbol": ",".join(symbols),
+                    "entitlement": "delayed",
+                    "apikey": self.api_key,
+                },
+            )
+
+            if response.status_code != 200:
+                sanitized_text = self._sanitize_text(response.text)
+                raise ValueError(
+                    f"Alpha Vantage API error: {response.status_code} - {sanitized_text}"
+                )
+
+            data = response.json()
+            rows = data.get("data")
+            if not isinstance(rows, list):
+                sanitized = self._sanitize_response(data)
+                if classify_notice(data) is not None:
+                    # Quota/throttle notice the client gave up retrying
+                    raise ValueError(f"Alpha Vantage rate limit: {sanitized}")
+                # Non-premium keys get an "Information"/"message" notice instead
+                logger.warning("Bulk quotes unavailable", response=sanitized)
+                return None
+
+            results: dict[str, dict[str, Any]] = {}
+            for row in rows:
+                symbol = str(row.get("symbol", "")).upper()
+                if not symbol:
+                    continue
+                results[symbol] = {
+                    "symbol": symbol,
+                    "price": float(row.get("close") or 0),
+                    "volume": int(float(row.get("volume") or 0)),
+                    "latest_trading_day": str(row.get("timestamp", ""))[:10],
+                    "previous_close": float(row.get("previous_close") or 0),
+                    "change": float(row.get("change") or 0),
+                    "change_percent": str(row.get("change_percent") or "0").rstrip("%"),
+                    "open": float(row.get("open") or 0),
+                    "high": float(row.get("high") or 0),
+                    "low": float(row.get("low") or 0),
+                }
+
+            logger.info(
+                "Bulk quotes fetched",
+                requested=len(symbols),
+                returned=len(results),
+            )
+            return results
+
+        except Exception as e:
+            logger.error("Bulk quote fetch failed", count=len(symbols), error=str(e))
+            raise
+
     async def get_market_status(self, region: str = "United States") -> dict[str, Any]:
         """
         Get global market open/close status from Alpha Vantage MARKET_STATUS API.
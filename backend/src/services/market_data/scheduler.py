@@ -0,0 +1,407 @@
+"""
+Quota-aware request scheduler for Alpha Vantage.
+
+Every Alpha Vantage call made through `AlphaVantageBase.client` waits for a
+token from a per-API-key token bucket, so bursts from insights snapshots,
+cache warming and chats share the vendor's per-minute limit instead of
+tripping it. Waiters are served by priority class:
+
+    INTERACTIVE (chat)  >  ANALYSIS (API requests)  >  BACKGROUND (warming, snapshots)
+
+The priority is carried in a context variable, so entry points set it once
+(`request_priority` / `with_priority`) and every call underneath inherits it.
+When a response body is a throttle notice ("Note"/"Information" mentioning the
+rate limit) the bucket pauses with exponential backoff and the request is
+retried.
+"""
+
+import asyncio
+import contextlib
+import functools
+import heapq
+import itertools
+import json
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, ParamSpec, TypeVar
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class RequestPriority(IntEnum):
+    """Scheduling class for Alpha Vantage calls (lower value is served first)."""
+
+    INTERACTIVE = 0  # Chat / agent tools, a user is waiting
+    ANALYSIS = 1  # REST analysis and market endpoints
+    BACKGROUND = 2  # Cache warming, insights snapshots
+
+
+_priority: ContextVar[RequestPriority] = ContextVar(
+    "alpha_vantage_priority", default=RequestPriority.ANALYSIS
+)
+
+
+def current_priority() -> RequestPriority:
+    """Priority of Alpha Vantage calls made from the current context."""
+    return _priority.get()
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run the enclosed block's Alpha Vantage calls at `priority`."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def with_priority(
+    priority: RequestPriority,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator form of `request_priority` for async functions."""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with request_priority(priority):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# =============================================================================
+# Throttle Detection
+# =============================================================================
+
+# Throttle notices are short; anything larger is a data payload
+_THROTTLE_BODY_MAX_BYTES = 1024
+_THROTTLE_PHRASES = (
+    "rate limit",
+    "call frequency",
+    "requests per",
+    "requests/minute",
+    "request per second",
+)
+
+THROTTLE_MINUTE = "minute"
+THROTTLE_DAILY = "daily"
+
+
+def detect_throttle(response: httpx.Response) -> str | None:
+    """
+    Classify a response as an Alpha Vantage throttle notice.
+
+    Returns:
+        THROTTLE_DAILY if the daily quota is exhausted (retrying won't help),
+        THROTTLE_MINUTE for per-minute/burst limits, or None
+    """
+    if response.status_code != 200:
+        return None
+    content = getattr(response, "content", None)
+    if not isinstance(content, bytes) or len(content) > _THROTTLE_BODY_MAX_BYTES:
+        return None  # No buffered body, or too large to be a notice
+    if b'"Note"' not in content and b'"Information"' not in content:
+        return None
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return classify_notice(data)
+
+
+def classify_notice(data: dict[str, Any]) -> str | None:
+    """
+    Classify a decoded response body as a throttle notice.
+
+    Returns:
+        THROTTLE_DAILY, THROTTLE_MINUTE or None (see `detect_throttle`)
+    """
+    message = str(data.get("Note") or data.get("Information") or "").lower()
+    if not any(phrase in message for phrase in _THROTTLE_PHRASES):
+        return None  # e.g. premium-endpoint notices
+    return THROTTLE_DAILY if "per day" in message else THROTTLE_MINUTE
+
+
+# =============================================================================
+# Token Bucket Scheduler
+# =============================================================================
+
+
+@dataclass
+class PriorityStats:
+    """Per-priority request and wait-time counters."""
+
+    requests: int = 0
+    waited: int = 0  # Requests that had to queue
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.waited += 1
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        average = self.total_wait_seconds / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "waited": self.waited,
+            "avg_wait_ms": round(average * 1000, 1),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 1),
+        }
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    event: asyncio.Event = field(compare=False, default_factory=asyncio.Event)
+
+
+class RequestScheduler:
+    """
+    Async token bucket with strict priority between waiters.
+
+    There is no background task: the waiter at the head of the queue sleeps
+    until its token is due, takes it and wakes the next head. A higher
+    priority arrival becomes the head immediately.
+    """
+
+    BACKOFF_BASE_SECONDS = 5.0
+    BACKOFF_MAX_SECONDS = 60.0
+
+    _shared: dict[str, "RequestScheduler"] = {}
+
+    def __init__(
+        self,
+        requests_per_minute: float = 75,
+        burst: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_minute: Sustained rate (the vendor plan limit)
+            burst: Bucket capacity (requests allowed back-to-back)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.rate = requests_per_minute / 60.0
+        self.burst = max(burst, 1)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self.stats = {priority: PriorityStats() for priority in RequestPriority}
+        self.throttles: dict[str, int] = {THROTTLE_MINUTE: 0, THROTTLE_DAILY: 0}
+
+    @classmethod
+    def shared(
+        cls, api_key: str, requests_per_minute: float, burst: int
+    ) -> "RequestScheduler":
+        """Process-wide scheduler for an API key (the vendor quota is per key)."""
+        scheduler = cls._shared.get(api_key)
+        if scheduler is None:
+            scheduler = cls(requests_per_minute, burst)
+            cls._shared[api_key] = scheduler
+        return scheduler
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently waiting for a token."""
+        return len(self._queue)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _delay_until_token(self) -> float:
+        now = self._clock()
+        self._refill(now)
+        pause = self._paused_until - now
+        deficit = (1.0 - self._tokens) / self.rate if self._tokens < 1.0 else 0.0
+        return max(pause, deficit, 0.0)
+
+    def _wake_head(self) -> None:
+        if self._queue:
+            self._queue[0].event.set()
+
+    async def acquire(self, priority: RequestPriority | None = None) -> float:
+        """
+        Wait for a request token.
+
+        Args:
+            priority: Scheduling class (defaults to the context's priority)
+
+        Returns:
+            Seconds spent waiting
+        """
+        priority = current_priority() if priority is None else priority
+        start = self._clock()
+        waiter = _Waiter(int(priority), next(self._seq))
+        heapq.heappush(self._queue, waiter)
+        try:
+            while True:
+                if self._queue[0] is waiter:
+                    delay = self._delay_until_token()
+                    if delay <= 0:
+                        self._tokens -= 1.0
+                        heapq.heappop(self._queue)
+                        self._wake_head()
+                        break
+                    # Sleep until the token is due, or until displaced as head
+                    waiter.event.clear()
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(waiter.event.wait(), delay)
+                else:
+                    waiter.event.clear()
+                    await waiter.event.wait()
+        except BaseException:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+                heapq.heapify(self._queue)
+                self._wake_head()
+            raise
+
+        wait = self._clock() - start
+        self.stats[priority].record(wait)
+        if wait >= 1.0:
+            logger.info(
+                "Alpha Vantage request queued",
+                priority=priority.name.lower(),
+                wait_ms=round(wait * 1000),
+                queue_depth=self.queue_depth,
+            )
+        return wait
+
+    def report_throttle(self, kind: str = THROTTLE_MINUTE) -> float:
+        """
+        Record a throttle notice and pause the bucket.
+
+        Returns:
+            Backoff in seconds before the next request is released
+        """
+        self.throttles[kind] = self.throttles.get(kind, 0) + 1
+        backoff: float = min(
+            self.BACKOFF_BASE_SECONDS * 2.0**self._consecutive_throttles,
+            self.BACKOFF_MAX_SECONDS,
+        )
+        self._consecutive_throttles += 1
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, now + backoff)
+        self._wake_head()  # Head re-computes its delay against the pause
+        return backoff
+
+    def report_success(self) -> None:
+        """Reset the backoff after a non-throttled response."""
+        self._consecutive_throttles = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Queue depth, wait times per priority and throttle counts."""
+        depth = {priority.name.lower(): 0 for priority in RequestPriority}
+        for waiter in self._queue:
+            depth[RequestPriority(waiter.priority).name.lower()] += 1
+        now = self._clock()
+        self._refill(now)
+        return {
+            "requests_per_minute": round(self.rate * 60, 2),
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "queue_depth": depth,
+            "paused_for_seconds": round(max(self._paused_until - now, 0.0), 2),
+            "throttles": dict(self.throttles),
+            "priorities": {
+                priority.name.lower(): stats.to_dict()
+                for priority, stats in self.stats.items()
+            },
+        }
+
+    @classmethod
+    def all_stats(cls) -> list[dict[str, Any]]:
+        """Metrics for every shared scheduler (API keys are not included)."""
+        return [scheduler.to_dict() for scheduler in cls._shared.values()]
+
+
+class ScheduledClient:
+    """
+    httpx.AsyncClient facade whose `get` is paced by a RequestScheduler.
+
+    Throttle notices pause the scheduler and the request is retried (up to
+    `max_retries`); the last response is returned either way so callers keep
+    their existing "Note"/"Information" handling. Other attributes (e.g.
+    `aclose`) pass through to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        scheduler: RequestScheduler,
+        max_retries: int = 3,
+    ):
+        self._client = client
+        self.scheduler = scheduler
+        self.max_retries = max_retries
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    @contextlib.asynccontextmanager
+    async def stream_get(
+        self, url: str, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed GET once a token is available.
+
+        The body is not buffered, so throttle notices can't be detected here;
+        callers classify the decoded body with `classify_notice` and report
+        back to `scheduler` (see AlphaVantageBase._get_json_stream).
+        """
+        await self.scheduler.acquire()
+        async with self._client.stream("GET", url, **kwargs) as response:
+            yield response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET once a token is available, retrying throttled responses."""
+        attempt = 0
+        while True:
+            await self.scheduler.acquire()
+            response = await self._client.get(url, **kwargs)
+            throttle = detect_throttle(response)
+            if throttle is None:
+                self.scheduler.report_success()
+                return response
+
+            backoff = self.scheduler.report_throttle(throttle)
+            function = (kwargs.get("params") or {}).get("function")
+            logger.warning(
+                "Alpha Vantage throttled request",
+                function=function,
+                throttle=throttle,
+                attempt=attempt + 1,
+                backoff_seconds=backoff,
+            )
+            if throttle == THROTTLE_DAILY or attempt >= self.max_retries:
+                return response
+            attempt += 1
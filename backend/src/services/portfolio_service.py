@@ -4,6 +4,7 @@ Portfolio service for holdings management with real-time pricing.
 Coordinates between holding repository and market data services.
 """
 
+import asyncio
 from typing import Any
 
 import structlog
@@ -19,6 +20,10 @@ logger = structlog.get_logger()
 class PortfolioService:
     """Service for portfolio management with real-time pricing."""
 
+    # Concurrent per-symbol price fetches / updates when batching isn't
+    # available
+    PRICE_FETCH_CONCURRENCY = 8
+
     def __init__(
         self,
         holding_repo: HoldingRepository,
@@ -120,8 +125,9 @@ class PortfolioService:
 
         This method:
         1. Fetches holdings from DB
-        2. Updates current prices from market data
-        3. Recalculates P&L for each holding
+        2. Fetches current prices for all symbols at once (one multi-symbol
+           quote request; symbols it misses are retried one at a time)
+        3. Writes new prices and recalculated P&L in one bulk update
 
         Args:
             user_id: User identifier
@@ -130,39 +136,80 @@ class PortfolioService:
             List of holdings with current prices
         """
         holdings = await self.holding_repo.list_by_user(user_id)
+        if not holdings:
+            return []
+
+        prices = await self._fetch_prices(
+            list(dict.fromkeys(h.symbol for h in holdings))
+        )
 
-        # Update prices for all holdings (parallel)
-        updated_holdings = []
+        updates = []
         for holding in holdings:
-            try:
-                current_price = await self.ticker_service.get_current_price(
-                    holding.symbol
-                )
-                if current_price and current_price > 0:
-                    updated_holding = await self.holding_repo.update_price(
-                        holding.holding_id, current_price
-                    )
-                    if updated_holding:
-                        updated_holdings.append(updated_holding)
-                    else:
-                        updated_holdings.append(holding)
-                else:
-                    updated_holdings.append(holding)
-                    if current_price is not None and current_price <= 0:
-                        logger.warning(
-                            "Invalid price received (<=0)",
-                            symbol=holding.symbol,
-                            current_price=current_price,
-                        )
-            except Exception as e:
+            current_price = prices.get(holding.symbol)
+            if current_price and current_price > 0:
+                updates.append((holding, current_price))
+            elif current_price is not None:
                 logger.warning(
-                    "Failed to update holding price",
+                    "Invalid price received (<=0)",
                     symbol=holding.symbol,
-                    error=str(e),
+                    current_price=current_price,
                 )
-                updated_holdings.append(holding)
 
-        return updated_holdings
+        updated = await self._store_prices(updates)
+        return [updated.get(holding.holding_id, holding) for holding in holdings]
+
+    async def _fetch_prices(self, symbols: list[str]) -> dict[str, float | None]:
+        """
+        Current prices for `symbols`; missing or failed symbols map to None.
+
+        Uses the ticker service's batch lookup, then retries the symbols it
+        couldn't price one at a time.
+        """
+        prices = await self.ticker_service.get_current_prices(symbols)
+
+        remaining = [symbol for symbol in symbols if prices.get(symbol) is None]
+        if not remaining:
+            return prices
+
+        semaphore = asyncio.Semaphore(self.PRICE_FETCH_CONCURRENCY)
+
+        async def fetch(symbol: str) -> float | None:
+            async with semaphore:
+                try:
+                    return await self.ticker_service.get_current_price(symbol)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to update holding price",
+                        symbol=symbol,
+                        error=str(e),
+                    )
+                    return None
+
+        results = await asyncio.gather(*(fetch(symbol) for symbol in remaining))
+        prices.update(zip(remaining, results, strict=True))
+        return prices
+
+    async def _store_prices(
+        self, updates: list[tuple[Holding, float]]
+    ) -> dict[str, Holding]:
+        """
+        Persist new prices, returning updated holdings by holding_id.
+
+        Holdings whose update fails are left out (callers keep the original).
+        """
+        if not updates:
+            return {}
+
+        try:
+            updated = await self.holding_repo.update_prices_batch(updates)
+        except Exception as e:
+            logger.warning(
+                "Failed to update holding prices",
+                holding_count=len(updates),
+                error=str(e),
+            )
+            return {}
+        return {holding.holding_id: holding for holding in updated}
 
     async def get_portfolio_summary(self, user_id: str) -> dict[str, Any]:
         """
@@ -0,0 +1,209 @@
+"""
+Tests for the ReAct agent's bounded checkpointers.
+
+Tests cover:
+- BoundedMemorySaver LRU, idle TTL and byte budget eviction
+- Byte accounting and per-thread cleanup
+- Steady-state size over hundreds of new threads
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.prebuilt import create_react_agent
+
+from src.agent import checkpointer as checkpointer_module
+from src.agent.checkpointer import BoundedMemorySaver
+
+
+class ToolThenAnswerModel(BaseChatModel):
+    """Fake model: a tool call for each question, then an answer."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "tool-then-answer"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ToolThenAnswerModel":
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if messages[-1].type == "human":
+            message = AIMessage(
+                content="",
+                tool_calls=[{"name": "prices", "args": {"symbol": "AAPL"}, "id": "c1"}],
+            )
+        else:
+            message = AIMessage(content="AAPL is trading near its high. " * 20)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@tool
+def prices(symbol: str) -> str:
+    """Return recent prices."""
+    return f"{symbol} 2025-01-10 | 100.00 | 101.00\n" * 10
+
+
+def make_agent(saver: BoundedMemorySaver):
+    return create_react_agent(
+        ToolThenAnswerModel(), [prices], checkpointer=saver, version="v1"
+    )
+
+
+async def run(agent, thread_id: str) -> dict:
+    return await agent.ainvoke(
+        {"messages": [("user", "How is AAPL doing?")]},
+        {"configurable": {"thread_id": thread_id}},
+    )
+
+
+def config(thread_id: str) -> dict:
+    return {"configurable": {"thread_id": thread_id}}
+
+
+class FakeClock:
+    """Stand-in for the checkpointer module's `time`."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(
+        checkpointer_module, "time", SimpleNamespace(monotonic=fake.monotonic)
+    )
+    return fake
+
+
+class TestBoundedMemorySaver:
+    """Test eviction and accounting of BoundedMemorySaver."""
+
+    @pytest.mark.asyncio
+    async def test_lru_thread_limit(self):
+        """Beyond max_threads the least recently used thread goes first."""
+        saver = BoundedMemorySaver(max_threads=2)
+        agent = make_agent(saver)
+
+        await run(agent, "a")
+        await run(agent, "b")
+        assert saver.get_tuple(config("a")) is not None  # "a" is now newest
+        await run(agent, "c")
+
+        assert saver.thread_count == 2
+        assert saver.get_tuple(config("b")) is None
+        assert saver.get_tuple(config("a")) is not None
+        assert saver.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_ttl(self, clock):
+        """Threads idle longer than the TTL are evicted on the next write."""
+        saver = BoundedMemorySaver(ttl_seconds=60)
+        agent = make_agent(saver)
+
+        await run(agent, "old")
+        clock.now += 30
+        await run(agent, "recent")
+        clock.now += 45
+        await run(agent, "new")
+
+        assert saver.get_tuple(config("old")) is None
+        assert saver.get_tuple(config("recent")) is not None
+        assert saver.thread_count == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_keeps_current_thread(self):
+        """Over the byte budget older threads go, never the one being run."""
+        saver = BoundedMemorySaver(max_bytes=1)
+        agent = make_agent(saver)
+
+        await run(agent, "first")
+        result = await run(agent, "second")
+
+        assert result["messages"][-1].content.startswith("AAPL")
+        assert saver.thread_count == 1
+        assert saver.get_tuple(config("second")) is not None
+        assert saver.total_bytes > 0
+
+    @pytest.mark.asyncio
+    async def test_accounting_returns_to_zero(self):
+        """Deleting every thread leaves no bytes, writes or blobs behind."""
+        saver = BoundedMemorySaver()
+        agent = make_agent(saver)
+        for thread_id in ("a", "b", "c"):
+            await run(agent, thread_id)
+        assert saver.total_bytes > 0
+
+        for thread_id in ("a", "b", "c"):
+            saver.delete_thread(thread_id)
+
+        assert saver.total_bytes == 0
+        assert saver.thread_count == 0
+        assert not saver.storage and not saver.writes and not saver.blobs
+
+    def test_unknown_thread_read_stores_nothing(self):
+        """Reading a thread that was never written does not create it."""
+        saver = BoundedMemorySaver()
+
+        assert saver.get_tuple(config("missing")) is None
+        assert not saver.storage and saver.thread_count == 0
+
+
+def put_checkpoint(saver: BoundedMemorySaver, thread_id: str, payload: str) -> None:
+    """Store one checkpoint with a single new channel value."""
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": payload}
+    checkpoint["channel_versions"] = {"messages": 1}
+    saver.put(
+        {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+        checkpoint,
+        {},
+        {"messages": 1},
+    )
+
+
+class TestSteadyState:
+    """Write hundreds of new threads, like the agent does per invocation."""
+
+    def test_size_levels_off_at_thread_limit(self):
+        """Threads and bytes stop growing once the limit is reached."""
+        saver = BoundedMemorySaver(max_threads=50)
+        payload = "AAPL is trading near its high. " * 20
+
+        for i in range(100):
+            put_checkpoint(saver, f"warmup-{i:03d}", payload)
+        warm_bytes = saver.total_bytes
+
+        for i in range(300):
+            put_checkpoint(saver, f"thread-{i:03d}", payload)  # Same length ids
+
+        assert saver.thread_count == 50
+        assert saver.total_bytes == warm_bytes
+        assert saver.evictions == 350
+        assert len(saver.storage) == len(saver.blobs) == 50
+
+    def test_byte_budget_bounds_total_bytes(self):
+        """With a byte budget, held bytes stay within one thread of it."""
+        saver = BoundedMemorySaver(max_bytes=20_000)
+        payload = "x" * 1000
+
+        for i in range(300):
+            put_checkpoint(saver, f"thread-{i}", payload)
+            assert saver.total_bytes <= saver.max_bytes + 2_000
+
+        assert 0 < saver.thread_count < 300
@@ -1,15 +1,28 @@
 """Tests for AI Sector Risk logic with mocked data."""
 
+import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
 import pytz
 
 from src.core.config import Settings
-from src.services.insights.categories.ai_sector_risk import AISectorRiskCategory
+from src.services.data_manager import (
+    BatchPCRResult,
+    DataManager,
+    OHLCVBars,
+    SharedDataContext,
+    SymbolPCRData,
+)
+from src.services.insights.categories.ai_sector_risk import (
+    PCR_TOP_N,
+    SMART_MONEY_TOP_N,
+    AISectorRiskCategory,
+)
 from src.services.insights.models import MetricStatus
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
 
 
 class TestAISectorRiskLogic:
@@ -276,6 +289,189 @@ class TestAISectorRiskLogic:
         assert len(metric.raw_data["symbols_analyzed"]) == 3
 
 
+class TestBasketPrefetch:
+    """Tests for the shared basket prefetch and concurrent metric calculation."""
+
+    BASKET = ["NVDA", "MSFT", "AMD", "AVGO"]
+
+    @pytest.fixture
+    def daily_df(self):
+        """250 daily closes trending up, so the last close is above its SMA."""
+        index = pd.date_range("2024-01-01", periods=250, freq="B")
+        closes = [100.0 + i * 0.5 for i in range(250)]
+        return pd.DataFrame(
+            {
+                "Open": closes,
+                "High": closes,
+                "Low": closes,
+                "Close": closes,
+                "Volume": [1000000] * 250,
+            },
+            index=index,
+        )
+
+    @pytest.fixture
+    def intraday_df(self):
+        """One session: first hour -1%, last hour +1% (SMI = +2%)."""
+        tz = pytz.timezone("America/New_York")
+        today = datetime.now(tz).date()
+        index = pd.DatetimeIndex(
+            [
+                pd.Timestamp(datetime.combine(today, datetime.min.time()))
+                .replace(hour=hour, minute=30)
+                .tz_localize(tz)
+                for hour in (9, 15)
+            ]
+        )
+        return pd.DataFrame(
+            {
+                "Open": [100.0, 100.0],
+                "High": [101.0, 102.0],
+                "Low": [98.0, 99.0],
+                "Close": [99.0, 101.0],
+                "Volume": [1000000, 1000000],
+            },
+            index=index,
+        )
+
+    @pytest.fixture
+    def pcr_data(self):
+        return SymbolPCRData(
+            symbol="NVDA",
+            current_price=140.0,
+            atm_zone_low=119.0,
+            atm_zone_high=161.0,
+            put_notional_mm=80.0,
+            call_notional_mm=100.0,
+            contracts_analyzed=20,
+            pcr=0.8,
+            interpretation="Neutral",
+            calculated_at=datetime.now(pytz.UTC),
+        )
+
+    @pytest.fixture
+    def market_service(self, daily_df, intraday_df):
+        service = MagicMock()
+        service.get_daily_bars = AsyncMock(return_value=daily_df)
+        service.get_intraday_bars = AsyncMock(return_value=intraday_df)
+        service.get_etf_profile = AsyncMock(side_effect=RuntimeError("offline"))
+        return service
+
+    @pytest.fixture
+    def category(self, market_service):
+        return AISectorRiskCategory(
+            settings=Settings(),
+            redis_cache=make_pod(FakeRedisServer()),
+            market_service=market_service,
+        )
+
+    @pytest.mark.asyncio
+    async def test_prefetch_follows_basket_plan(self, category, market_service):
+        """Each dataset is fetched once for the symbols that need it."""
+        with patch.object(
+            DataManager,
+            "_symbols_pcr",
+            AsyncMock(
+                side_effect=lambda symbols, *args: BatchPCRResult(
+                    errors=dict.fromkeys(symbols, "insufficient options data")
+                )
+            ),
+        ) as get_pcr:
+            context = await category._prefetch_basket_data(self.BASKET)
+
+        assert context is not None
+        assert set(context.history) == set(self.BASKET)
+        assert set(context.intraday) == set(self.BASKET[:SMART_MONEY_TOP_N])
+        assert set(context.pcr) == set(self.BASKET[:PCR_TOP_N])
+        assert market_service.get_daily_bars.call_count == len(self.BASKET)
+        assert market_service.get_intraday_bars.call_count == SMART_MONEY_TOP_N
+        get_pcr.assert_awaited_once()
+        assert get_pcr.call_args.args[0] == self.BASKET[:PCR_TOP_N]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skipped_without_redis(self, market_service):
+        """Without Redis there is no DataManager, so no shared context."""
+        category = AISectorRiskCategory(
+            settings=Settings(), market_service=market_service
+        )
+
+        assert await category._prefetch_basket_data(self.BASKET) is None
+
+    def test_uses_injected_data_manager(self, market_service):
+        """The app's DataManager is used instead of building one per call."""
+        redis = make_pod(FakeRedisServer())
+        data_manager = DataManager(redis, market_service)
+        category = AISectorRiskCategory(
+            settings=Settings(),
+            redis_cache=redis,
+            market_service=market_service,
+            data_manager=data_manager,
+        )
+
+        assert category._data_manager() is data_manager
+
+    def test_builds_data_manager_once(self, category):
+        """Without an injected DataManager, one is built and reused."""
+        assert category._data_manager() is category._data_manager()
+
+    @pytest.mark.asyncio
+    async def test_metrics_read_prefetched_context(
+        self, category, market_service, daily_df, intraday_df, pcr_data
+    ):
+        """Basket metrics use the context instead of fetching again."""
+        context = SharedDataContext(
+            history={"NVDA": OHLCVBars.from_dataframe(daily_df)},
+            intraday={"NVDA": OHLCVBars.from_dataframe(intraday_df)},
+            pcr={"NVDA": pcr_data},
+        )
+        basket = (["NVDA"], "Test Basket")
+
+        anomaly = await category._calculate_ai_price_anomaly(basket, context)
+        smart_money = await category._calculate_smart_money_flow(basket, context)
+        pcr = await category._calculate_options_put_call_ratio(basket, context)
+
+        market_service.get_daily_bars.assert_not_called()
+        market_service.get_intraday_bars.assert_not_called()
+        assert list(anomaly.raw_data["symbol_data"]) == ["NVDA"]
+        assert anomaly.raw_data["breadth_above_sma"] == 1.0
+        assert smart_money.raw_data["avg_smi"] == pytest.approx(2.0, abs=0.05)
+        assert pcr.raw_data["pcr"] == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_calculate_metrics_runs_concurrently(self, category):
+        """All calculators overlap and results keep their order."""
+        calculators = [
+            "_calculate_ai_price_anomaly",
+            "_calculate_news_sentiment",
+            "_calculate_smart_money_flow",
+            "_calculate_options_put_call_ratio",
+            "_calculate_ipo_heat",
+            "_calculate_market_liquidity",
+            "_calculate_fed_expectations",
+        ]
+
+        def slow(name):
+            async def calculate(*args):
+                await asyncio.sleep(0.1)
+                return MagicMock(id=name, score=50.0)
+
+            return calculate
+
+        category._get_ai_basket_symbols = AsyncMock(
+            return_value=(self.BASKET, "Test Basket")
+        )
+        category._prefetch_basket_data = AsyncMock(return_value=None)
+        for name in calculators:
+            setattr(category, name, slow(name))
+
+        started = asyncio.get_running_loop().time()
+        metrics = await category.calculate_metrics()
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert elapsed < 0.3
+        assert [m.id for m in metrics] == calculators
+
+
 class TestMarketLiquidityLogic:
     """Tests for Market Liquidity metric calculation logic."""
 
@@ -0,0 +1,225 @@
+"""
+Unit tests for the non-blocking Alpaca data and trading clients.
+
+Covers columnar bar conversion, multi-symbol bar and quote requests, and
+blocking alpaca-py calls running on the worker pool instead of the event loop.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from alpaca.data.models import Quote
+
+from src.services.alpaca.positions import PositionOperations
+from src.services.alpaca.worker_pool import AlpacaWorkerPool
+from src.services.alpaca_data_service import (
+    AlpacaDataService,
+    bars_to_frame,
+    quote_price,
+)
+
+
+def bar(day: int, close: float) -> dict:
+    return {
+        "t": f"2025-01-{day:02d}T05:00:00Z",
+        "o": close - 1,
+        "h": close + 1,
+        "l": close - 2,
+        "c": close,
+        "v": 1000 + day,
+        "n": 10,
+        "vw": close,
+    }
+
+
+class FakeDataClient:
+    """Blocking alpaca-py data client stand-in returning raw payloads."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: list = []
+        self.threads: set[str] = set()
+        self.bars = {
+            "AAPL": [bar(2, 100.0), bar(3, 101.0)],
+            "MSFT": [bar(2, 400.0)],
+        }
+        self.quotes = {
+            "AAPL": {"ap": 101.5, "bp": 101.4},
+            "MSFT": {"ap": 0.0, "bp": 399.9},
+            "TSLA": {"ap": 0.0, "bp": 0.0},
+        }
+
+    def _call(self, request, payload):
+        self.requests.append(request)
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {s: payload[s] for s in request.symbol_or_symbols if s in payload}
+
+    def get_stock_bars(self, request):
+        return self._call(request, self.bars)
+
+    def get_stock_latest_quote(self, request):
+        return self._call(request, self.quotes)
+
+
+@pytest.fixture
+def settings():
+    settings = Mock()
+    settings.alpaca_api_key = "test_key"
+    settings.alpaca_secret_key = "test_secret"
+    settings.alpaca_max_workers = 4
+    return settings
+
+
+@pytest.fixture
+def client():
+    return FakeDataClient()
+
+
+@pytest.fixture
+def service(settings, client):
+    with patch("src.services.alpaca_data_service.StockHistoricalDataClient"):
+        service = AlpacaDataService(settings)
+    service.client = client
+    service.pool = AlpacaWorkerPool(max_workers=4)
+    yield service
+    service.pool.shutdown()
+
+
+class TestConversion:
+    """Test raw payload conversion."""
+
+    def test_bars_to_frame(self):
+        """Raw records become a float OHLCV frame with a UTC index."""
+        df = bars_to_frame([bar(2, 100.0), bar(3, 101.0)])
+
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert df["Close"].tolist() == [100.0, 101.0]
+        assert df["Volume"].tolist() == [1002.0, 1003.0]
+        assert str(df.index.tz) == "UTC"
+        assert df.index[0] == pd.Timestamp("2025-01-02 05:00", tz="UTC")
+
+    def test_empty_records(self):
+        """No records gives an empty frame."""
+        assert bars_to_frame([]).empty
+
+    def test_quote_price_falls_back_to_bid(self):
+        """Ask is preferred, bid used when ask is zero, None when neither."""
+        assert quote_price({"ap": 10.0, "bp": 9.9}) == 10.0
+        assert quote_price({"ap": 0.0, "bp": 9.9}) == 9.9
+        assert quote_price({"ap": 0.0, "bp": 0.0}) is None
+        assert quote_price(None) is None
+
+    def test_quote_price_accepts_quote_model(self):
+        """Quote models (non-raw clients) are read by attribute."""
+        quote = Quote(
+            "AAPL",
+            {"t": "2025-01-02T15:00:00Z", "ap": 0.0, "bp": 9.9, "as": 1, "bs": 1},
+        )
+
+        assert quote_price(quote) == 9.9
+
+
+class TestAlpacaDataService:
+    """Test multi-symbol requests through the worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_get_bars_many_single_request(self, service, client):
+        """All symbols are fetched with one request."""
+        frames = await service.get_bars_many(
+            ["AAPL", "msft", "NVDA"], "1d", "2025-01-01", "2025-01-10"
+        )
+
+        assert len(client.requests) == 1
+        assert client.requests[0].symbol_or_symbols == ["AAPL", "MSFT", "NVDA"]
+        assert len(frames["AAPL"]) == 2
+        assert frames["msft"]["Close"].tolist() == [400.0]
+        assert frames["NVDA"].empty
+
+    @pytest.mark.asyncio
+    async def test_get_bars(self, service, client):
+        """Single-symbol bars keep their previous shape."""
+        df = await service.get_bars("AAPL", "1d", "2025-01-01", "2025-01-10")
+
+        assert df["Close"].tolist() == [100.0, 101.0]
+        assert all(name.startswith("alpaca") for name in client.threads)
+
+    @pytest.mark.asyncio
+    async def test_get_bars_error_returns_empty(self, service, client):
+        """A failed request gives empty frames."""
+        client.get_stock_bars = Mock(side_effect=RuntimeError("boom"))
+
+        frames = await service.get_bars_many(
+            ["AAPL", "MSFT"], "1d", "2025-01-01", "2025-01-10"
+        )
+
+        assert all(df.empty for df in frames.values())
+
+    @pytest.mark.asyncio
+    async def test_get_latest_prices(self, service, client):
+        """Quotes for all symbols come from one request."""
+        prices = await service.get_latest_prices(["AAPL", "MSFT", "TSLA", "NVDA"])
+
+        assert len(client.requests) == 1
+        assert prices == {"AAPL": 101.5, "MSFT": 399.9, "TSLA": None, "NVDA": None}
+        assert await service.get_latest_price("AAPL") == 101.5
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_does_not_stall_loop(self, service, client):
+        """The event loop keeps running while the client blocks."""
+        client.delay = 0.2
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await service.get_bars("AAPL", "1d", "2025-01-01", "2025-01-10")
+        task.cancel()
+
+        assert ticks >= 10
+
+
+class TestPositionOperations:
+    """Test trading client calls on the worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_account_summary_fetches_concurrently(self, settings):
+        """Account, positions and history requests overlap."""
+        with patch("src.services.alpaca.base.TradingClient"):
+            service = PositionOperations(settings)
+        service.pool = AlpacaWorkerPool(max_workers=4)
+
+        def slow(value):
+            def call(*args):
+                time.sleep(0.2)
+                return value
+
+            return call
+
+        service.client = SimpleNamespace(
+            get_account=slow(
+                SimpleNamespace(
+                    equity="110", cash="10", buying_power="20", last_equity="100"
+                )
+            ),
+            get_all_positions=slow([]),
+            get_portfolio_history=slow(SimpleNamespace(base_value=100.0)),
+        )
+
+        started = time.perf_counter()
+        summary = await service.get_account_summary("user_1")
+        elapsed = time.perf_counter() - started
+        service.pool.shutdown()
+
+        assert summary.total_pl == pytest.approx(10.0)
+        assert summary.position_count == 0
+        assert elapsed < 0.5
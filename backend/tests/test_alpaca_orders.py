@@ -32,6 +32,7 @@ def order_service(mock_alpaca_client):
         mock_settings.alpaca_api_key = "test_key"
         mock_settings.alpaca_api_secret = "test_secret"
         mock_settings.alpaca_paper = True
+        mock_settings.alpaca_max_workers = 4
 
         service = OrderOperations(mock_settings)
         service.client = mock_alpaca_client
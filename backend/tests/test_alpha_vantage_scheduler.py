@@ -0,0 +1,342 @@
+"""
+Unit tests for the Alpha Vantage request scheduler.
+Covers token-bucket pacing, priority classes, throttle detection/backoff and
+metrics, plus end-to-end runs against a local fake Alpha Vantage HTTP server
+that enforces a per-window limit with "Note" throttle bodies.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import pytest
+
+from src.core.config import Settings
+from src.services.market_data.quotes import QuotesMixin
+from src.services.market_data.scheduler import (
+    THROTTLE_DAILY,
+    THROTTLE_MINUTE,
+    RequestPriority,
+    RequestScheduler,
+    ScheduledClient,
+    current_priority,
+    detect_throttle,
+    request_priority,
+    with_priority,
+)
+
+MINUTE_NOTE = {
+    "Note": "Thank you for using Alpha Vantage! You have exceeded the rate limit "
+    "per minute for your plan, 75 requests/minute."
+}
+DAILY_NOTE = {
+    "Information": "Our standard API rate limit is 25 requests per day. Please "
+    "subscribe to any of the premium plans."
+}
+PREMIUM_NOTE = {
+    "Information": "Thank you for using Alpha Vantage! This is a premium endpoint."
+}
+
+
+def quote_body(symbol: str) -> dict[str, Any]:
+    return {
+        "Global Quote": {
+            "01. symbol": symbol,
+            "02. open": "100.0",
+            "03. high": "101.0",
+            "04. low": "99.0",
+            "05. price": "100.5",
+            "06. volume": "1000",
+            "07. latest trading day": "2024-01-02",
+            "08. previous close": "100.0",
+            "09. change": "0.5",
+            "10. change percent": "0.5%",
+        }
+    }
+
+
+class FakeAlphaVantageServer:
+    """
+    Minimal HTTP/1.1 server speaking the Alpha Vantage query API.
+
+    Answers at most `limit` requests per `window` seconds; extra requests
+    (and the next `throttle_next` requests) get a "Note" throttle body.
+    `responder(params)` builds the body for accepted requests.
+    """
+
+    def __init__(
+        self,
+        limit: int = 1000,
+        window: float = 1.0,
+        responder: Callable[[dict[str, str]], Any] | None = None,
+    ):
+        self.limit = limit
+        self.window = window
+        self.responder = responder or (lambda params: quote_body(params["symbol"]))
+        self.throttle_next = 0
+        self.accepted: list[dict[str, str]] = []
+        self.throttled = 0
+        self._times: list[float] = []
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/query"
+
+    async def __aenter__(self) -> "FakeAlphaVantageServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _respond(self, params: dict[str, str]) -> Any:
+        now = time.monotonic()
+        self._times = [t for t in self._times if now - t < self.window]
+        if self.throttle_next > 0 or len(self._times) >= self.limit:
+            self.throttle_next = max(self.throttle_next - 1, 0)
+            self.throttled += 1
+            return MINUTE_NOTE
+        self._times.append(now)
+        self.accepted.append(params)
+        return self.responder(params)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                target = head.split(b" ", 2)[1].decode()
+                params = dict(parse_qsl(urlsplit(target).query))
+                body = json.dumps(self._respond(params)).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def make_service(server: FakeAlphaVantageServer, scheduler: RequestScheduler):
+    service = QuotesMixin(Settings(alpha_vantage_api_key="test_api_key"))
+    service.base_url = server.url
+    service.client = ScheduledClient(httpx.AsyncClient(), scheduler)
+    return service
+
+
+def response(body: Any) -> httpx.Response:
+    return httpx.Response(200, json=body)
+
+
+class TestThrottleDetection:
+    """Only rate-limit notices count as throttling."""
+
+    def test_minute_limit(self):
+        assert detect_throttle(response(MINUTE_NOTE)) == THROTTLE_MINUTE
+
+    def test_daily_quota(self):
+        assert detect_throttle(response(DAILY_NOTE)) == THROTTLE_DAILY
+
+    def test_premium_notice_is_not_throttle(self):
+        assert detect_throttle(response(PREMIUM_NOTE)) is None
+
+    def test_data_payload_is_not_throttle(self):
+        assert detect_throttle(response(quote_body("AAPL"))) is None
+
+
+class TestPriorityContext:
+    """Priority is inherited from the calling context."""
+
+    @pytest.mark.asyncio
+    async def test_decorator_sets_and_restores_priority(self):
+        @with_priority(RequestPriority.BACKGROUND)
+        async def job():
+            return current_priority()
+
+        assert await job() == RequestPriority.BACKGROUND
+        assert current_priority() == RequestPriority.ANALYSIS
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_priority(self):
+        async def probe():
+            return current_priority()
+
+        with request_priority(RequestPriority.INTERACTIVE):
+            task = asyncio.create_task(probe())
+
+        assert await task == RequestPriority.INTERACTIVE
+
+
+class TestRequestScheduler:
+    """Token bucket pacing, strict priority and backoff."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        scheduler = RequestScheduler(requests_per_minute=600, burst=2)  # 10/s
+        start = time.monotonic()
+
+        waits = await asyncio.gather(*(scheduler.acquire() for _ in range(6)))
+
+        assert max(waits[:2]) < 0.01
+        assert time.monotonic() - start >= 0.35  # 4 paced tokens at 10/s
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_served_first(self):
+        scheduler = RequestScheduler(requests_per_minute=1200, burst=1)
+        await scheduler.acquire()  # Drain the bucket
+        order: list[str] = []
+
+        async def request(priority: RequestPriority) -> None:
+            await scheduler.acquire(priority)
+            order.append(priority.name)
+
+        tasks = [
+            asyncio.create_task(request(priority))
+            for priority in (
+                RequestPriority.BACKGROUND,
+                RequestPriority.ANALYSIS,
+                RequestPriority.INTERACTIVE,
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 3
+        await asyncio.gather(*tasks)
+
+        assert order == ["INTERACTIVE", "ANALYSIS", "BACKGROUND"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = RequestScheduler(requests_per_minute=60, burst=1)
+        await scheduler.acquire()
+        task = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_throttle_pauses_bucket_with_backoff(self):
+        scheduler = RequestScheduler(requests_per_minute=6000, burst=5)
+        scheduler.BACKOFF_BASE_SECONDS = 0.1
+
+        assert scheduler.report_throttle() == pytest.approx(0.1)
+        assert scheduler.report_throttle() == pytest.approx(0.2)
+        wait = await scheduler.acquire()
+
+        assert wait >= 0.15
+        scheduler.report_success()
+        assert scheduler.report_throttle() == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_metrics(self):
+        scheduler = RequestScheduler(requests_per_minute=600, burst=1)
+        await asyncio.gather(
+            scheduler.acquire(RequestPriority.INTERACTIVE),
+            scheduler.acquire(RequestPriority.BACKGROUND),
+        )
+        scheduler.report_throttle(THROTTLE_DAILY)
+
+        stats = scheduler.to_dict()
+
+        assert stats["priorities"]["interactive"]["requests"] == 1
+        assert stats["priorities"]["background"]["waited"] == 1
+        assert stats["priorities"]["background"]["max_wait_ms"] > 0
+        assert stats["queue_depth"] == {
+            "interactive": 0,
+            "analysis": 0,
+            "background": 0,
+        }
+        assert stats["throttles"][THROTTLE_DAILY] == 1
+
+    def test_shared_per_api_key(self):
+        settings = Settings(alpha_vantage_api_key="shared_key_for_test")
+
+        first, second = QuotesMixin(settings), QuotesMixin(settings)
+
+        assert isinstance(first.client, ScheduledClient)
+        assert first.scheduler is second.scheduler
+        assert first.scheduler.rate == pytest.approx(75 / 60)
+
+
+class TestAgainstFakeServer:
+    """End-to-end through QuotesMixin and a real local HTTP server."""
+
+    @pytest.mark.asyncio
+    async def test_burst_stays_under_vendor_limit(self):
+        # Bucket admits at most burst + rate * window = 2 + 2.5 per 0.5s
+        async with FakeAlphaVantageServer(limit=5, window=0.5) as server:
+            scheduler = RequestScheduler(requests_per_minute=300, burst=2)
+            service = make_service(server, scheduler)
+
+            quotes = await asyncio.gather(
+                *(service.get_quote(f"S{i}") for i in range(8))
+            )
+            await service.close()
+
+        assert [q["symbol"] for q in quotes] == [f"S{i}" for i in range(8)]
+        assert server.throttled == 0
+        assert scheduler.throttles[THROTTLE_MINUTE] == 0
+
+    @pytest.mark.asyncio
+    async def test_throttle_body_triggers_backoff_and_retry(self):
+        async with FakeAlphaVantageServer() as server:
+            scheduler = RequestScheduler(requests_per_minute=6000, burst=10)
+            scheduler.BACKOFF_BASE_SECONDS = 0.05
+            service = make_service(server, scheduler)
+            server.throttle_next = 2
+
+            quote = await service.get_quote("AAPL")
+            await service.close()
+
+        assert quote["price"] == 100.5
+        assert server.throttled == 2
+        assert scheduler.throttles[THROTTLE_MINUTE] == 2
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_surface_existing_error(self):
+        async with FakeAlphaVantageServer() as server:
+            scheduler = RequestScheduler(requests_per_minute=6000, burst=10)
+            scheduler.BACKOFF_BASE_SECONDS = 0.01
+            service = make_service(server, scheduler)
+            server.throttle_next = 10
+
+            with pytest.raises(ValueError, match="No quote data"):
+                await service.get_quote("AAPL")
+            await service.close()
+
+        assert server.throttled == 4  # First attempt + 3 retries
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_overtake_background_backlog(self):
+        async with FakeAlphaVantageServer() as server:
+            scheduler = RequestScheduler(requests_per_minute=1200, burst=1)  # 20/s
+            service = make_service(server, scheduler)
+
+            with request_priority(RequestPriority.BACKGROUND):
+                warming = [
+                    asyncio.create_task(service.get_quote(f"W{i}")) for i in range(6)
+                ]
+            await asyncio.sleep(0.01)
+            with request_priority(RequestPriority.INTERACTIVE):
+                chat = asyncio.create_task(service.get_quote("CHAT"))
+            await asyncio.gather(chat, *warming)
+            await service.close()
+
+        symbols = [params["symbol"] for params in server.accepted]
+        assert symbols.index("CHAT") <= 2
@@ -29,10 +29,8 @@ from src.services.alphavantage_market_data import (
 
 @pytest.fixture
 def settings():
-    """Mock settings with Alpha Vantage API key"""
-    settings = Mock(spec=Settings)
-    settings.alpha_vantage_api_key = "TEST_API_KEY_1234567890"
-    return settings
+    """Settings with Alpha Vantage API key"""
+    return Settings(alpha_vantage_api_key="TEST_API_KEY_1234567890")
 
 
 @pytest.fixture
@@ -0,0 +1,253 @@
+"""
+Unit tests for the on-disk bar store in the Data Manager Layer.
+
+Covers BarStore persistence (write/append/read), merge_tail corporate-action
+and gap detection, and DataManager serving full daily history from disk plus
+the compact series.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_manager import BarStore, DataManager, Granularity, OHLCVBars
+from src.services.data_manager.bar_store import merge_tail, slice_bars
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+def make_df(days: int, end: str = "2025-01-10", scale: float = 1.0) -> pd.DataFrame:
+    index = pd.bdate_range(end=end, periods=days, name="date")
+    close = np.linspace(100, 200, days) * scale
+    return pd.DataFrame(
+        {
+            "Open": close - 1,
+            "High": close + 1,
+            "Low": close - 2,
+            "Close": close,
+            "Volume": np.arange(days, dtype=np.int64) + 1000,
+        },
+        index=index,
+    )
+
+
+def make_bars(days: int, end: str = "2025-01-10", scale: float = 1.0) -> OHLCVBars:
+    return OHLCVBars.from_dataframe(make_df(days, end, scale))
+
+
+class DailyBarsService:
+    """Alpha Vantage stand-in serving a fixed full daily history."""
+
+    def __init__(self, history: pd.DataFrame, delay: float = 0.0):
+        self.history = history
+        self.delay = delay
+        self.calls: list[str] = []
+
+    async def get_daily_bars(self, symbol: str, outputsize: str = "compact"):
+        self.calls.append(outputsize)
+        await asyncio.sleep(self.delay)
+        return self.history if outputsize == "full" else self.history.iloc[-100:]
+
+    get_weekly_bars = get_monthly_bars = get_daily_bars
+
+
+class TestBarStore:
+    """Test column file persistence."""
+
+    def test_write_then_read_roundtrip(self, tmp_path):
+        """Stored bars read back identical and memory-mapped."""
+        store = BarStore(tmp_path)
+        bars = make_bars(300)
+
+        store.write("daily", "aapl", bars)
+        stored = store.read("daily", "AAPL")
+
+        assert stored is not None
+        assert isinstance(stored.close, np.memmap)
+        np.testing.assert_array_equal(stored.timestamps, bars.timestamps)
+        np.testing.assert_array_equal(stored.volume, bars.volume)
+        assert stored.tz == bars.tz
+
+    def test_append_extends_series(self, tmp_path):
+        """Appended rows follow the stored ones."""
+        store = BarStore(tmp_path)
+        bars = make_bars(300)
+        store.write("daily", "AAPL", slice_bars(bars, 0, 250))
+
+        store.append("daily", "AAPL", slice_bars(bars, 250))
+
+        stored = store.read("daily", "AAPL")
+        np.testing.assert_array_equal(stored.close, bars.close)
+        assert store.stats.appended_rows == 50
+
+    def test_append_rejects_overlap(self, tmp_path):
+        """Appending bars that are already stored is an error."""
+        store = BarStore(tmp_path)
+        bars = make_bars(10)
+        store.write("daily", "AAPL", bars)
+
+        with pytest.raises(ValueError):
+            store.append("daily", "AAPL", slice_bars(bars, 5))
+
+    def test_uncommitted_append_is_ignored(self, tmp_path):
+        """Bytes written past the committed row count are not read."""
+        store = BarStore(tmp_path)
+        store.write("daily", "AAPL", make_bars(10))
+        with open(tmp_path / "daily" / "AAPL" / "1.close.f8", "ab") as f:
+            f.write(b"\x00" * 8)
+
+        assert len(store.read("daily", "AAPL")) == 10
+
+    def test_rewrite_replaces_generation(self, tmp_path):
+        """A rewrite switches generation and removes the old files."""
+        store = BarStore(tmp_path)
+        store.write("daily", "AAPL", make_bars(10))
+        mapped = store.read("daily", "AAPL")
+
+        store.write("daily", "AAPL", make_bars(10, scale=0.5))
+
+        files = sorted(p.name for p in (tmp_path / "daily" / "AAPL").iterdir())
+        assert all(name.startswith("2.") for name in files if name != "meta.json")
+        assert store.read("daily", "AAPL").close[-1] == 100.0
+        # Earlier readers keep their mapping of the old generation
+        assert mapped.close[-1] == 200.0
+
+    def test_concurrent_writers_keep_store_readable(self, tmp_path):
+        """Writers in other threads or BarStore instances never clobber a
+        committed generation."""
+        stores = [BarStore(tmp_path), BarStore(tmp_path)]
+        bars = make_bars(300)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for i in range(20):
+                pool.submit(stores[i % 2].write, "daily", "AAPL", bars)
+
+        stored = stores[0].read("daily", "AAPL")
+        np.testing.assert_array_equal(stored.close, bars.close)
+        files = list((tmp_path / "daily" / "AAPL").iterdir())
+        assert len(files) == 7  # One generation's 6 column files + meta.json
+
+    def test_missing_or_corrupt_returns_none(self, tmp_path):
+        """Nothing stored or an unreadable meta file reads as None."""
+        store = BarStore(tmp_path)
+        assert store.read("daily", "AAPL") is None
+
+        directory = tmp_path / "daily" / "AAPL"
+        directory.mkdir(parents=True)
+        (directory / "meta.json").write_text("{not json")
+
+        assert store.read("daily", "AAPL") is None
+        assert store.stats.errors == 1
+
+
+class TestMergeTail:
+    """Test extending stored history with a compact series."""
+
+    def test_appends_new_bars(self):
+        """Bars after the last stored one are appended."""
+        full = make_bars(300)
+
+        merged = merge_tail(slice_bars(full, 0, 280), slice_bars(full, 200))
+
+        np.testing.assert_array_equal(merged.timestamps, full.timestamps)
+
+    def test_tail_older_than_store(self):
+        """A tail ending before the stored history changes nothing."""
+        full = make_bars(300)
+        stored = slice_bars(full, 0)
+
+        assert merge_tail(stored, slice_bars(full, 100, 200)) is stored
+
+    def test_gap_needs_full_fetch(self):
+        """A tail that starts after the stored history can't be merged."""
+        full = make_bars(300)
+
+        assert merge_tail(slice_bars(full, 0, 100), slice_bars(full, 200)) is None
+
+    def test_adjusted_history_change_needs_full_fetch(self):
+        """Re-adjusted values for stored bars invalidate the store."""
+        stored = make_bars(300)
+        adjusted = make_bars(300, scale=0.5)
+
+        assert merge_tail(stored, slice_bars(adjusted, 200)) is None
+
+
+class TestDataManagerHistory:
+    """Test full daily history through DataManager with a bar store."""
+
+    @pytest.fixture
+    def redis(self):
+        return make_pod(FakeRedisServer())
+
+    @pytest.mark.asyncio
+    async def test_first_fetch_downloads_and_stores(self, tmp_path, redis):
+        """Without stored bars, full history is downloaded once and kept."""
+        service = DailyBarsService(make_df(500))
+        store = BarStore(tmp_path)
+        data_manager = DataManager(redis, service, bar_store=store)
+
+        bars = await data_manager.get_ohlcv("AAPL", "daily", outputsize="full")
+
+        assert len(bars) == 500
+        assert service.calls == ["full"]
+        # The newest (possibly still forming) bar is not persisted
+        assert len(store.read("daily", "AAPL")) == 499
+
+    @pytest.mark.asyncio
+    async def test_next_fetch_uses_compact_tail(self, tmp_path, redis):
+        """Stored history is extended with the compact series only."""
+        history = make_df(500)
+        store = BarStore(tmp_path)
+        store.write("daily", "AAPL", OHLCVBars.from_dataframe(history.iloc[:480]))
+        service = DailyBarsService(history)
+        data_manager = DataManager(redis, service, bar_store=store)
+
+        bars = await data_manager.get_ohlcv("AAPL", Granularity.DAILY, "full")
+
+        assert service.calls == ["compact"]
+        assert len(bars) == 500
+        assert len(store.read("daily", "AAPL")) == 499
+        assert data_manager.cache_stats()["bar_store"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_corporate_action_rewrites_history(self, tmp_path, redis):
+        """Re-adjusted history triggers a full download and rewrite."""
+        store = BarStore(tmp_path)
+        store.write("daily", "AAPL", OHLCVBars.from_dataframe(make_df(500)[:480]))
+        service = DailyBarsService(make_df(500, scale=0.5))
+        data_manager = DataManager(redis, service, bar_store=store)
+
+        bars = await data_manager.get_ohlcv("AAPL", "daily", "full")
+
+        # Cached compact re-checked once fresh before the full download
+        assert service.calls == ["compact", "compact", "full"]
+        assert bars.close[-1] == pytest.approx(100.0)
+        assert store.read("daily", "AAPL").close[0] == pytest.approx(50.0)
+        assert store.stats.rewrites == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_fetches_share_download(self, tmp_path, redis):
+        """Concurrent full-history misses share one download."""
+        service = DailyBarsService(make_df(500), delay=0.05)
+        data_manager = DataManager(redis, service, bar_store=BarStore(tmp_path))
+
+        results = await asyncio.gather(
+            *(data_manager.get_ohlcv("AAPL", "daily", "full") for _ in range(3))
+        )
+
+        assert [len(bars) for bars in results] == [500, 500, 500]
+        assert service.calls == ["full"]
+
+    @pytest.mark.asyncio
+    async def test_compact_requests_unchanged(self, tmp_path, redis):
+        """Compact daily requests don't touch the store."""
+        service = DailyBarsService(make_df(500))
+        store = BarStore(tmp_path)
+        data_manager = DataManager(redis, service, bar_store=store)
+
+        bars = await data_manager.get_ohlcv("AAPL", "daily")
+
+        assert len(bars) == 100
+        assert store.read("daily", "AAPL") is None
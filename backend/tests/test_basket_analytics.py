@@ -0,0 +1,233 @@
+"""Tests for vectorized basket analytics (symbols × dates matrix)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_manager import OHLCVBars
+from src.services.insights.basket_analytics import (
+    BasketMatrix,
+    breadth,
+    session_returns,
+)
+
+
+def daily_bars(dates: list[str], closes: list[float]) -> OHLCVBars:
+    index = pd.DatetimeIndex(dates)
+    return OHLCVBars.from_dataframe(
+        pd.DataFrame(
+            {
+                "Open": closes,
+                "High": closes,
+                "Low": closes,
+                "Close": closes,
+                "Volume": [1000] * len(closes),
+            },
+            index=index,
+        )
+    )
+
+
+def hourly_bars(rows: list[tuple[str, float, float]]) -> OHLCVBars:
+    """Bars from (local time, open, close) in America/New_York."""
+    index = pd.DatetimeIndex([t for t, _, _ in rows]).tz_localize("America/New_York")
+    opens = [o for _, o, _ in rows]
+    closes = [c for _, _, c in rows]
+    return OHLCVBars.from_dataframe(
+        pd.DataFrame(
+            {
+                "Open": opens,
+                "High": closes,
+                "Low": opens,
+                "Close": closes,
+                "Volume": [1000] * len(rows),
+            },
+            index=index,
+        )
+    )
+
+
+class TestBasketMatrix:
+    """Test alignment and rolling statistics."""
+
+    def test_from_bars_aligns_dates(self):
+        """Symbols share one date axis; gaps carry forward, pre-listing is NaN."""
+        matrix = BasketMatrix.from_bars(
+            {
+                "AAA": daily_bars(
+                    ["2025-01-02", "2025-01-03", "2025-01-06"], [1, 2, 3]
+                ),
+                "BBB": daily_bars(["2025-01-03", "2025-01-07"], [10, 20]),
+            }
+        )
+
+        assert matrix.symbols == ["AAA", "BBB"]
+        assert len(matrix.dates) == 4
+        np.testing.assert_array_equal(matrix.values[0], [1, 2, 3, 3])
+        np.testing.assert_array_equal(matrix.values[1], [np.nan, 10, 10, 20])
+        np.testing.assert_array_equal(matrix.latest, [3, 20])
+
+    def test_empty_basket(self):
+        """No symbols gives an empty matrix."""
+        matrix = BasketMatrix.from_bars({})
+
+        assert matrix.values.shape == (0, 0)
+        assert breadth(matrix.latest) is None
+
+    def test_rolling_mean_std_matches_pandas(self):
+        """Rolling SMA and population std match a per-symbol pandas rolling."""
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range("2020-01-01", periods=300).strftime("%Y-%m-%d")
+        closes = {s: 500 + np.cumsum(rng.normal(0, 5, 300)) for s in ("A", "B", "C")}
+        matrix = BasketMatrix.from_bars(
+            {s: daily_bars(list(dates), list(c)) for s, c in closes.items()}
+        )
+
+        sma, std = matrix.rolling_mean_std(50)
+
+        for i, symbol in enumerate(matrix.symbols):
+            series = pd.Series(closes[symbol])
+            np.testing.assert_allclose(
+                sma[i], series.rolling(50).mean(), rtol=1e-9, equal_nan=True
+            )
+            np.testing.assert_allclose(
+                std[i], series.rolling(50).std(ddof=0), rtol=1e-6, equal_nan=True
+            )
+
+    def test_zscores_match_per_symbol_formula(self):
+        """Latest z-score equals (P - SMA) / σ over the symbol's own window."""
+        rng = np.random.default_rng(1)
+        dates = list(pd.bdate_range("2022-01-03", periods=250).strftime("%Y-%m-%d"))
+        closes = {s: 100 + np.cumsum(rng.normal(0, 1, 250)) for s in ("X", "Y")}
+        matrix = BasketMatrix.from_bars(
+            {s: daily_bars(dates, list(c)) for s, c in closes.items()}
+        )
+
+        z = matrix.zscores(200)[:, -1]
+
+        for i, symbol in enumerate(matrix.symbols):
+            tail = closes[symbol][-200:]
+            expected = (tail[-1] - np.mean(tail)) / np.std(tail)
+            assert z[i] == pytest.approx(expected, rel=1e-6)
+
+    def test_incomplete_or_flat_windows_are_nan(self):
+        """Short histories and flat prices give no z-score."""
+        dates = ["2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07"]
+        matrix = BasketMatrix.from_bars(
+            {
+                "FLAT": daily_bars(dates, [5, 5, 5, 5]),
+                "LATE": daily_bars(dates[2:], [1, 2]),
+                "OK": daily_bars(dates, [1, 2, 3, 4]),
+            }
+        )
+
+        z = matrix.zscores(3)[:, -1]
+
+        assert np.isnan(z[0])
+        assert np.isnan(z[1])
+        assert z[2] == pytest.approx((4 - 3) / np.std([2, 3, 4]))
+
+    def test_lookback_latest_stats_match_full_history(self):
+        """Aligning only the last window of bars gives the same latest stats."""
+        rng = np.random.default_rng(2)
+        dates = list(pd.bdate_range("2022-01-03", periods=300).strftime("%Y-%m-%d"))
+        bars = {
+            "X": daily_bars(dates, list(100 + np.cumsum(rng.normal(0, 1, 300)))),
+            # Listed later and missing one recent date
+            "Y": daily_bars(
+                dates[50:-3] + dates[-2:],
+                list(50 + np.cumsum(rng.normal(0, 1, 249))),
+            ),
+        }
+
+        full = BasketMatrix.from_bars(bars)
+        recent = BasketMatrix.from_bars(bars, lookback=200)
+        sma, std = full.rolling_mean_std(200)
+        latest_sma, latest_std = recent.latest_mean_std(200)
+
+        assert recent.values.shape == (2, 201)
+        np.testing.assert_allclose(latest_sma, sma[:, -1], rtol=1e-9)
+        np.testing.assert_allclose(latest_std, std[:, -1], rtol=1e-6)
+        np.testing.assert_array_equal(recent.latest, full.latest)
+
+    def test_window_longer_than_history(self):
+        """A window longer than the date axis gives all-NaN statistics."""
+        matrix = BasketMatrix.from_bars({"A": daily_bars(["2025-01-02"], [1.0])})
+
+        sma, std = matrix.rolling_mean_std(5)
+        latest_sma, latest_std = matrix.latest_mean_std(5)
+
+        assert np.isnan(sma).all()
+        assert np.isnan(std).all()
+        assert np.isnan(latest_sma).all()
+        assert np.isnan(latest_std).all()
+
+
+class TestBreadth:
+    """Test basket breadth."""
+
+    def test_share_above_threshold(self):
+        """NaN is ignored; share counts values strictly above the threshold."""
+        assert breadth(np.array([1.0, -0.5, np.nan, 0.2])) == pytest.approx(2 / 3)
+        assert breadth(np.array([1.0, 2.0]), threshold=1.5) == 0.5
+        assert breadth(np.array([np.nan])) is None
+
+
+class TestSessionReturns:
+    """Test first/last hour returns of the latest session."""
+
+    def test_latest_session_per_symbol(self):
+        """Each symbol uses its own latest session; single-bar sessions are NaN."""
+        returns = session_returns(
+            {
+                "NVDA": hourly_bars(
+                    [
+                        ("2025-01-02 09:30", 50.0, 60.0),  # previous session
+                        ("2025-01-03 09:30", 100.0, 99.0),
+                        ("2025-01-03 12:30", 99.0, 99.5),
+                        ("2025-01-03 15:30", 100.0, 101.0),
+                    ]
+                ),
+                "MSFT": hourly_bars(
+                    [
+                        ("2025-01-02 09:30", 100.0, 100.0),
+                        ("2025-01-02 15:30", 100.0, 101.0),
+                    ]
+                ),
+                "AMD": hourly_bars(
+                    [
+                        ("2025-01-02 09:30", 100.0, 101.0),
+                        ("2025-01-03 09:30", 100.0, 101.0),
+                    ]
+                ),
+                "EMPTY": OHLCVBars.empty(),
+            }
+        )
+
+        assert returns.symbols == ["NVDA", "MSFT", "AMD", "EMPTY"]
+        np.testing.assert_allclose(returns.first_hour[:2], [-1.0, 0.0])
+        np.testing.assert_allclose(returns.last_hour[:2], [1.0, 1.0])
+        np.testing.assert_allclose(returns.smi[:2], [2.0, 1.0])
+        assert np.isnan(returns.smi[2:]).all()
+
+    def test_sessions_use_local_dates(self):
+        """A 19:30 New York bar belongs to that day, not the next UTC day."""
+        returns = session_returns(
+            {
+                "NVDA": hourly_bars(
+                    [
+                        ("2025-01-02 09:30", 100.0, 102.0),
+                        ("2025-01-02 19:30", 100.0, 99.0),
+                    ]
+                )
+            }
+        )
+
+        assert returns.smi[0] == pytest.approx(-3.0)
+
+    def test_no_symbols(self):
+        """An empty basket gives empty results."""
+        returns = session_returns({})
+
+        assert returns.symbols == []
+        assert returns.smi.size == 0
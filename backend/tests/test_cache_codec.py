@@ -0,0 +1,238 @@
+"""
+Unit tests for Data Manager cache codecs.
+Covers per-domain codec selection, framed round-trips, legacy JSON decoding and
+CacheOperations' binary path.
+"""
+
+import json
+import zlib
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.database.redis import RedisCache
+from src.services.data_manager import CacheKeys, CacheOperations, OHLCVBars, codec
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+def make_bars(num_bars: int = 50) -> OHLCVBars:
+    close = np.linspace(100.0, 120.0, num_bars)
+    return OHLCVBars.from_dataframe(
+        pd.DataFrame(
+            {
+                "Open": close,
+                "High": close + 1,
+                "Low": close - 1,
+                "Close": close,
+                "Volume": np.arange(num_bars) * 100,
+            },
+            index=pd.date_range("2024-01-01", periods=num_bars, freq="D"),
+        )
+    )
+
+
+def make_chain(num_contracts: int = 200) -> list[dict]:
+    return [
+        {
+            "contract_id": f"NVDA250117C{i:05d}",
+            "symbol": "NVDA",
+            "expiration": "2025-01-17T00:00:00",
+            "strike": 100.0 + i,
+            "option_type": "call" if i % 2 else "put",
+            "last_price": 1.5,
+            "volume": i,
+            "delta": None,
+        }
+        for i in range(num_contracts)
+    ]
+
+
+class TestCodecSelection:
+    """Codecs are chosen by CacheKeys domain/type."""
+
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            (CacheKeys.market("daily", "AAPL"), codec.COLUMNAR),
+            (CacheKeys.quote("AAPL"), codec.JSON),
+            (CacheKeys.pcr_symbol("AAPL"), codec.JSON),
+            (CacheKeys.options("AAPL"), codec.COMPRESSED_JSON),
+            (CacheKeys.treasury("2y"), codec.COMPRESSED_JSON),
+            (CacheKeys.insights("ai_sector_risk"), codec.JSON),
+            ("unstructured", codec.JSON),
+        ],
+    )
+    def test_codec_for_key(self, key, expected):
+        assert codec.codec_for_key(key) is expected
+
+    def test_base_codec_is_abstract(self):
+        with pytest.raises(TypeError):
+            codec.CacheCodec()
+
+    def test_columnar_body_requires_numeric_columns(self):
+        with pytest.raises(codec.CodecError):
+            codec.COLUMNAR.encode_body({"symbol": "AAPL"})
+
+
+class TestRoundTrip:
+    """Each codec decodes what it encodes."""
+
+    def test_columnar_ohlcv(self):
+        bars = make_bars()
+
+        payload = codec.encode(CacheKeys.market("daily", "AAPL"), bars.to_dict())
+        restored = OHLCVBars.from_cached(codec.decode(payload))
+
+        assert payload[len(codec.MAGIC) + 1] == codec.COLUMNAR.codec_id
+        assert restored.tz == bars.tz
+        pd.testing.assert_frame_equal(restored.to_dataframe(), bars.to_dataframe())
+
+    def test_columnar_falls_back_for_row_lists(self):
+        rows = [d.to_dict() for d in make_bars(3)]
+
+        payload = codec.COLUMNAR.encode(rows)
+
+        assert payload[len(codec.MAGIC) + 1] != codec.COLUMNAR.codec_id
+        assert codec.decode(payload) == rows
+
+    def test_compressed_json_options_chain(self):
+        chain = make_chain()
+
+        payload = codec.COMPRESSED_JSON.encode(chain)
+
+        assert payload[len(codec.MAGIC) + 1] == codec.COMPRESSED_JSON.codec_id
+        assert len(payload) < len(json.dumps(chain))
+        assert codec.decode(payload) == chain
+
+    def test_small_documents_skip_compression(self):
+        quote = {"symbol": "AAPL", "price": 190.5}
+
+        payload = codec.COMPRESSED_JSON.encode(quote)
+
+        assert payload[len(codec.MAGIC) + 1] == codec.JSON.codec_id
+        assert codec.decode(payload) == quote
+
+    def test_compressed_body_round_trip(self):
+        quote = {"symbol": "AAPL", "price": 190.5}
+
+        body = codec.COMPRESSED_JSON.encode_body(quote)
+
+        assert json.loads(zlib.decompress(body)) == quote
+        assert codec.COMPRESSED_JSON.decode_body(body) == quote
+
+
+class TestLegacyAndVersioning:
+    """Unframed JSON still decodes; unknown headers are rejected."""
+
+    def test_legacy_json_string(self):
+        assert codec.decode('{"price": 1.5}') == {"price": 1.5}
+        assert codec.decode(b"[1, 2]") == [1, 2]
+
+    def test_legacy_plain_string(self):
+        assert codec.decode("locked") == "locked"
+
+    def test_stored_at_round_trip(self):
+        payload = codec.JSON.encode({"price": 1.5}, stored_at=1700000000.25)
+
+        assert codec.decode_entry(payload) == ({"price": 1.5}, 1700000000.25)
+
+    def test_version_1_payload_has_no_stamp(self):
+        payload = codec.MAGIC + bytes((1, codec.JSON.codec_id)) + b'{"v":1}'
+
+        assert codec.decode_entry(payload) == ({"v": 1}, None)
+        assert codec.decode_entry('{"v": 1}') == ({"v": 1}, None)
+
+    def test_unknown_version_raises(self):
+        payload = codec.MAGIC + bytes((codec.FORMAT_VERSION + 1, 1)) + b"{}"
+
+        with pytest.raises(codec.CodecError):
+            codec.decode(payload)
+
+    def test_unknown_codec_raises(self):
+        with pytest.raises(codec.CodecError):
+            codec.decode(codec.frame(99, b"{}"))
+
+    def test_corrupt_body_raises(self):
+        payload = codec.frame(codec.COMPRESSED_JSON.codec_id, b"not zlib")
+
+        with pytest.raises(codec.CodecError):
+            codec.decode(payload)
+
+    def test_compressed_body_is_zlib(self):
+        payload = codec.COMPRESSED_JSON.encode(make_chain())
+
+        body = zlib.decompress(payload[codec.HEADER_SIZE :])
+
+        assert json.loads(body) == make_chain()
+
+
+class TestCacheOperationsBinary:
+    """CacheOperations stores values as framed codec payloads."""
+
+    @pytest.fixture
+    def server(self):
+        return FakeRedisServer()
+
+    @pytest.fixture
+    def cache_ops(self, server):
+        return CacheOperations(make_pod(server))
+
+    @pytest.mark.asyncio
+    async def test_set_writes_framed_payload(self, cache_ops, server):
+        key = CacheKeys.market("daily", "AAPL")
+
+        assert await cache_ops.set(key, make_bars().to_dict(), 3600)
+
+        assert server.data[key].startswith(codec.MAGIC)
+        restored = OHLCVBars.from_cached(await cache_ops.get(key))
+        assert len(restored) == 50
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_json_entries(self, cache_ops, server):
+        key = CacheKeys.quote("AAPL")
+        server.data[key] = json.dumps({"symbol": "AAPL"}).encode()
+
+        assert await cache_ops.get(key) == {"symbol": "AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_undecodable_entry_is_a_miss(self, cache_ops, server):
+        key = CacheKeys.quote("AAPL")
+        server.data[key] = codec.frame(99, b"")
+
+        assert await cache_ops.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_get_with_fetch_populates_cache(self, cache_ops, server):
+        key = CacheKeys.options("NVDA")
+        chain = make_chain()
+
+        async def fetch():
+            return chain
+
+        assert await cache_ops.get_with_fetch(key, fetch, 3600) == chain
+        assert codec.decode(server.data[key]) == chain
+
+
+class TestRedisCacheRawDedup:
+    """RedisCache.get_with_dedup stores through the supplied codec."""
+
+    @pytest.mark.asyncio
+    async def test_dedup_uses_raw_bytes(self):
+        server = FakeRedisServer()
+        cache = RedisCache()
+        cache.client = server.client()
+        key = CacheKeys.options("NVDA")
+
+        result = await cache.get_with_dedup(
+            key,
+            AsyncMock(return_value=make_chain()),
+            ttl_seconds=60,
+            encode=codec.COMPRESSED_JSON.encode,
+            decode=codec.decode,
+        )
+
+        assert result == make_chain()
+        assert server.data[key].startswith(codec.MAGIC)
+        assert codec.decode(await cache.get_raw(key)) == make_chain()
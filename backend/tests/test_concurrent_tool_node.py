@@ -0,0 +1,169 @@
+"""Tests for ConcurrentToolNode (parallel tool calls in the ReAct loop)."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from src.agent.concurrent_tool_node import ConcurrentToolNode
+from src.core.utils.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class Probe:
+    """Tracks how many fake tool calls run at once."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.finished: list[str] = []
+
+
+@pytest.fixture
+def probe() -> Probe:
+    return Probe()
+
+
+@pytest.fixture
+def tools(probe: Probe) -> list:
+    @tool
+    async def slow_tool(symbol: str, delay: float) -> str:
+        """Return after `delay` seconds."""
+        probe.running += 1
+        probe.peak = max(probe.peak, probe.running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            probe.running -= 1
+        probe.finished.append(symbol)
+        return f"{symbol} done"
+
+    @tool
+    async def broken_tool(symbol: str) -> str:
+        """Always fail."""
+        raise RuntimeError("vendor down")
+
+    return [slow_tool, broken_tool]
+
+
+def calls(*specs: tuple[str, dict]) -> list[dict]:
+    return [
+        {"name": name, "args": args, "id": f"call_{i}"}
+        for i, (name, args) in enumerate(specs)
+    ]
+
+
+async def run_turn(node: ConcurrentToolNode, tool_calls: list) -> list[ToolMessage]:
+    """Run one agent step's tool calls through the node in a graph."""
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", node)
+    graph.add_edge(START, "tools")
+    graph.add_edge("tools", END)
+    result = await graph.compile().ainvoke(
+        {"messages": [AIMessage(content="", tool_calls=tool_calls)]}
+    )
+    return result["messages"][1:]
+
+
+class TestConcurrentToolNode:
+    """Test concurrent execution, ordering, timeouts and circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_runs_calls_concurrently_in_call_order(self, tools, probe):
+        """Results follow the tool calls even when later calls finish first."""
+        node = ConcurrentToolNode(tools, circuit_breaker=CircuitBreaker())
+
+        messages = await run_turn(
+            node,
+            calls(
+                ("slow_tool", {"symbol": "AAPL", "delay": 0.05}),
+                ("slow_tool", {"symbol": "MSFT", "delay": 0.01}),
+                ("slow_tool", {"symbol": "NVDA", "delay": 0.02}),
+            ),
+        )
+
+        assert [m.content for m in messages] == ["AAPL done", "MSFT done", "NVDA done"]
+        assert [m.tool_call_id for m in messages] == ["call_0", "call_1", "call_2"]
+        assert probe.finished == ["MSFT", "NVDA", "AAPL"]
+        assert probe.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, tools, probe):
+        """No more than max_concurrency calls of a step run at once."""
+        node = ConcurrentToolNode(
+            tools, max_concurrency=2, circuit_breaker=CircuitBreaker()
+        )
+
+        messages = await run_turn(
+            node,
+            calls(
+                *(("slow_tool", {"symbol": f"S{i}", "delay": 0.01}) for i in range(6))
+            ),
+        )
+
+        assert len(messages) == 6
+        assert probe.peak == 2
+        assert node._slots == {}
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_error_and_counts_failure(self, tools):
+        """A slow call times out alone; the other calls still answer."""
+        breaker = CircuitBreaker()
+        node = ConcurrentToolNode(
+            tools, timeouts={"slow_tool": 0.05}, circuit_breaker=breaker
+        )
+
+        messages = await run_turn(
+            node,
+            calls(
+                ("slow_tool", {"symbol": "AAPL", "delay": 1.0}),
+                ("slow_tool", {"symbol": "MSFT", "delay": 0.0}),
+            ),
+        )
+
+        assert messages[0].status == "error"
+        assert "timed out after 0.05s" in messages[0].content
+        assert messages[1].content == "MSFT done"
+        status = breaker.get_status("slow_tool")
+        assert status["failures"] == 1
+        assert status["successes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_blocks_without_running(self, tools, probe):
+        """A tool with an open circuit is answered with an error message."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("slow_tool")
+        node = ConcurrentToolNode(tools, circuit_breaker=breaker)
+
+        (message,) = await run_turn(
+            node, calls(("slow_tool", {"symbol": "AAPL", "delay": 0.0}))
+        )
+
+        assert message.status == "error"
+        assert "temporarily unavailable" in message.content
+        assert probe.finished == []
+
+    @pytest.mark.asyncio
+    async def test_tool_exception_recorded_and_raised(self, tools):
+        """Unhandled tool errors are counted by the breaker and propagate."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        node = ConcurrentToolNode(tools, circuit_breaker=breaker)
+
+        with pytest.raises(RuntimeError, match="vendor down"):
+            await run_turn(node, calls(("broken_tool", {"symbol": "AAPL"})))
+
+        assert breaker.get_status("broken_tool")["state"] == CircuitState.OPEN.value
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_not_counted(self, tools):
+        """Model mistakes (bad arguments) do not trip the breaker."""
+        breaker = CircuitBreaker()
+        node = ConcurrentToolNode(tools, circuit_breaker=breaker)
+
+        (message,) = await run_turn(node, calls(("slow_tool", {"symbol": "AAPL"})))
+
+        assert message.status == "error"
+        status = breaker.get_status("slow_tool")
+        assert status["failures"] == 0
+        assert status["successes"] == 0
@@ -9,6 +9,7 @@ Tests cover:
 - Cache hit/miss logging
 """
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
@@ -16,6 +17,7 @@ import pandas as pd
 import pytest
 
 from src.services.data_manager import (
+    BatchPCRResult,
     CacheKeys,
     CacheOperations,
     DataManager,
@@ -27,6 +29,7 @@ from src.services.data_manager import (
     SymbolPCRData,
     TreasuryData,
 )
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
 
 
 class TestCacheKeys:
@@ -448,68 +451,83 @@ class TestSharedDataContext:
         assert ctx.get_options("nvda") == options  # Case-insensitive
         assert ctx.get_options("MSFT") is None
 
+    def test_get_basket_datasets_by_symbol(self):
+        """Verify history, intraday and PCR lookups are case-insensitive."""
+        ctx = SharedDataContext()
+        pcr = SymbolPCRData(
+            symbol="NVDA",
+            pcr=0.85,
+            put_notional_mm=100.0,
+            call_notional_mm=117.6,
+            current_price=142.50,
+            atm_zone_low=121.13,
+            atm_zone_high=163.88,
+            contracts_analyzed=12,
+            interpretation="Neutral",
+            calculated_at=datetime.now(UTC),
+        )
+        ctx.history["NVDA"] = ["daily"]  # type: ignore[assignment]
+        ctx.intraday["NVDA"] = ["60min"]  # type: ignore[assignment]
+        ctx.pcr["NVDA"] = pcr
+
+        assert ctx.get_history("nvda") == ["daily"]
+        assert ctx.get_intraday("nvda") == ["60min"]
+        assert ctx.get_pcr("nvda") == pcr
+        assert ctx.get_history("MSFT") is None
+        assert ctx.get_pcr("MSFT") is None
+
 
 class TestCacheOperations:
     """Test cache operations wrapper."""
 
     @pytest.fixture
-    def mock_redis(self):
-        """Create mock Redis client."""
-        redis = AsyncMock()
-        redis.get = AsyncMock(return_value=None)
-        redis.set = AsyncMock()
-        redis.delete = AsyncMock(return_value=1)
-        redis.exists = AsyncMock(return_value=False)
-        return redis
+    def server(self):
+        """Create in-memory Redis server."""
+        return FakeRedisServer()
 
     @pytest.fixture
-    def cache_ops(self, mock_redis):
-        """Create CacheOperations with mock Redis."""
-        return CacheOperations(mock_redis)
+    def cache_ops(self, server):
+        """Create CacheOperations on a RedisCache backed by the fake server."""
+        return CacheOperations(make_pod(server))
 
     @pytest.mark.asyncio
-    async def test_get_cache_miss(self, cache_ops, mock_redis):
+    async def test_get_cache_miss(self, cache_ops, server):
         """Verify cache miss returns None."""
         result = await cache_ops.get("nonexistent:key")
         assert result is None
-        mock_redis.get.assert_called_once_with("nonexistent:key")
+        assert server.reads == ["nonexistent:key"]
 
     @pytest.mark.asyncio
-    async def test_get_cache_hit_dict(self, cache_ops, mock_redis):
+    async def test_get_cache_hit_dict(self, cache_ops, server):
         """Verify cache hit returns parsed dict."""
-        mock_redis.get = AsyncMock(return_value='{"foo": "bar"}')
+        server.data["test:key"] = b'{"foo": "bar"}'
         result = await cache_ops.get("test:key")
         assert result == {"foo": "bar"}
 
     @pytest.mark.asyncio
-    async def test_set_with_ttl(self, cache_ops, mock_redis):
+    async def test_set_with_ttl(self, cache_ops, server):
         """Verify set calls Redis with TTL."""
         await cache_ops.set("test:key", {"data": 123}, 3600)
-        mock_redis.set.assert_called_once()
+        assert server.ops["SET"] == 1
         # Verify the key and TTL were passed
-        call_args = mock_redis.set.call_args
-        assert call_args[0][0] == "test:key"
+        assert server.ttls["test:key"] == 3600
+        assert await cache_ops.get("test:key") == {"data": 123}
 
     @pytest.mark.asyncio
-    async def test_set_skips_zero_ttl(self, cache_ops, mock_redis):
+    async def test_set_skips_zero_ttl(self, cache_ops, server):
         """Verify zero TTL skips caching."""
         result = await cache_ops.set("test:key", {"data": 123}, 0)
         assert result is False
-        mock_redis.set.assert_not_called()
+        assert server.ops["SET"] == 0
 
 
 class TestDataManager:
     """Test DataManager core functionality."""
 
     @pytest.fixture
-    def mock_redis(self):
-        """Create mock Redis cache that simulates cache miss then stores."""
-        redis = AsyncMock()
-        redis.get = AsyncMock(return_value=None)  # Cache miss
-        redis.set = AsyncMock()
-        redis.delete = AsyncMock(return_value=1)
-        redis.exists = AsyncMock(return_value=False)
-        return redis
+    def redis(self):
+        """Create empty Redis cache (every first read misses, then stores)."""
+        return make_pod(FakeRedisServer())
 
     @pytest.fixture
     def sample_df(self):
@@ -546,9 +564,9 @@ class TestDataManager:
         return service
 
     @pytest.fixture
-    def data_manager(self, mock_redis, mock_av_service):
+    def data_manager(self, redis, mock_av_service):
         """Create DataManager with mocks."""
-        return DataManager(mock_redis, mock_av_service)
+        return DataManager(redis, mock_av_service)
 
     @pytest.mark.asyncio
     async def test_get_ohlcv_daily_fetches_on_miss(self, data_manager, mock_av_service):
@@ -561,9 +579,7 @@ class TestDataManager:
         assert result[0].close == 151.0
 
     @pytest.mark.asyncio
-    async def test_get_ohlcv_intraday_always_fresh(
-        self, data_manager, mock_redis, mock_av_service
-    ):
+    async def test_get_ohlcv_intraday_always_fresh(self, data_manager, mock_av_service):
         """Intraday OHLCV should NOT be cached - always fresh."""
         result = await data_manager.get_ohlcv("AAPL", "1min")
 
@@ -599,7 +615,101 @@ class TestDataManager:
         assert mock_av_service.get_treasury_yield.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_prefetch_continues_on_partial_error(self, mock_redis, sample_df):
+    async def test_prefetch_shared_basket_datasets(self, data_manager, mock_av_service):
+        """Prefetch should fill history, intraday and PCR per symbol."""
+        pcr = SymbolPCRData(
+            symbol="NVDA",
+            current_price=100.0,
+            atm_zone_low=85.0,
+            atm_zone_high=115.0,
+            put_notional_mm=1.0,
+            call_notional_mm=2.0,
+            contracts_analyzed=10,
+            pcr=0.5,
+            interpretation="Bullish",
+            calculated_at=datetime.now(UTC),
+        )
+        data_manager._symbols_pcr = AsyncMock(
+            return_value=BatchPCRResult(
+                data={"NVDA": pcr}, errors={"MSFT": "insufficient options data"}
+            )
+        )
+
+        context = await data_manager.prefetch_shared(
+            history_symbols=["nvda", "MSFT"],
+            intraday_symbols=["NVDA"],
+            pcr_symbols=["NVDA", "MSFT"],
+        )
+
+        assert set(context.history) == {"NVDA", "MSFT"}
+        assert set(context.intraday) == {"NVDA"}
+        assert set(context.pcr) == {"NVDA", "MSFT"}
+        assert mock_av_service.get_daily_bars.call_args.kwargs["outputsize"] == "full"
+        assert mock_av_service.get_intraday_bars.call_args.kwargs["interval"] == "60min"
+        # One batched PCR task; symbols without PCR are recorded as errors
+        data_manager._symbols_pcr.assert_awaited_once()
+        assert context.get_pcr("NVDA") is pcr
+        assert context.get_pcr("MSFT") is None
+        assert context.errors == {"pcr:MSFT": "insufficient options data"}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_shared_bounds_concurrency(
+        self, data_manager, mock_av_service, sample_df
+    ):
+        """No more than max_concurrency fetches should be in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_daily_bars(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return sample_df
+
+        mock_av_service.get_daily_bars = slow_daily_bars
+
+        context = await data_manager.prefetch_shared(
+            history_symbols=[f"S{i}" for i in range(10)],
+            max_concurrency=3,
+        )
+
+        assert len(context.history) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_shared_bounds_pcr_fetches(
+        self, data_manager, mock_av_service, sample_df
+    ):
+        """PCR quote and options fetches share the prefetch concurrency budget."""
+        in_flight = 0
+        peak = 0
+
+        async def slow(result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return result
+
+        mock_av_service.get_daily_bars = lambda *args, **kwargs: slow(sample_df)
+        data_manager.get_quotes = lambda symbols: slow({})
+        data_manager.get_options_chain = lambda symbol: slow(None)
+
+        context = await data_manager.prefetch_shared(
+            history_symbols=[f"S{i}" for i in range(6)],
+            pcr_symbols=[f"P{i}" for i in range(6)],
+            max_concurrency=3,
+        )
+
+        assert len(context.history) == 6
+        assert set(context.pcr) == {f"P{i}" for i in range(6)}
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_continues_on_partial_error(self, redis, sample_df):
         """Prefetch should continue even if one fetch fails."""
         # Create service where first call fails, second succeeds
         mock_av_service = AsyncMock()
@@ -614,7 +724,7 @@ class TestDataManager:
         mock_av_service.get_daily_bars = mock_daily_bars
         mock_av_service.get_treasury_yield = AsyncMock(return_value=sample_df)
 
-        dm = DataManager(mock_redis, mock_av_service)
+        dm = DataManager(redis, mock_av_service)
         context = await dm.prefetch_shared(symbols=["FAIL", "MSFT"])
 
         # Should have error for first symbol
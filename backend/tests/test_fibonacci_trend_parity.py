@@ -0,0 +1,248 @@
+"""
+Parity tests for the vectorized Fibonacci trend kernel.
+Compares TrendDetector output against the original scalar nested-loop implementation.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.analysis.fibonacci import TrendDetector
+from src.core.analysis.fibonacci.config import TimeframeConfigs
+from src.core.analysis.fibonacci.trend_kernel import detect_directional_candidates
+
+
+def reference_directional_trends(
+    data: pd.DataFrame, tolerance_pct: float, min_magnitude: float, lookback: int
+) -> list[dict]:
+    """Original O(n^2) implementation, kept verbatim as the parity oracle."""
+    trends = []
+
+    for i in range(len(data) - lookback - 1):
+        start_date = data.index[i].date()
+        start_close = data["Close"].iloc[i]
+        lookback_close = data["Close"].iloc[i + lookback]
+        close_change = lookback_close - start_close
+
+        if abs(close_change) < 0.01:
+            continue
+
+        is_uptrend = close_change > 0
+        lookback_high = data["High"].iloc[i : i + lookback + 1].max()
+        lookback_low = data["Low"].iloc[i : i + lookback + 1].min()
+
+        highest_high = lookback_high
+        lowest_low = lookback_low
+        current_high = data["High"].iloc[i + lookback]
+        current_low = data["Low"].iloc[i + lookback]
+        end_index = i + lookback
+
+        for j in range(i + lookback + 1, len(data)):
+            next_high = data["High"].iloc[j]
+            next_low = data["Low"].iloc[j]
+            high_threshold = current_high * tolerance_pct
+            low_threshold = current_low * tolerance_pct
+            high_change = next_high - current_high
+            low_change = next_low - current_low
+
+            if is_uptrend:
+                high_ok = (high_change >= 0) or (abs(high_change) <= high_threshold)
+                low_ok = (low_change >= 0) or (abs(low_change) <= low_threshold)
+            else:
+                low_ok = (low_change <= 0) or (abs(low_change) <= low_threshold)
+                high_ok = (high_change <= 0) or (abs(high_change) <= high_threshold)
+
+            if not (high_ok and low_ok):
+                break
+
+            end_index = j
+            current_high = next_high
+            current_low = next_low
+            if next_high > highest_high:
+                highest_high = next_high
+            if next_low < lowest_low:
+                lowest_low = next_low
+
+        total_magnitude = highest_high - lowest_low
+        if end_index - i >= 3 and total_magnitude >= min_magnitude:
+            trends.append(
+                {
+                    "Trend Type": "Uptrend" if is_uptrend else "Downtrend",
+                    "Start Date": start_date,
+                    "End Date": data.index[end_index].date(),
+                    "Absolute High": float(highest_high),
+                    "Absolute Low": float(lowest_low),
+                    "Magnitude": float(total_magnitude),
+                }
+            )
+
+    return trends
+
+
+def reference_remove_overlapping(trends: list[dict]) -> list[dict]:
+    """Original pairwise overlap filter, kept as the parity oracle."""
+    trends_sorted = sorted(trends, key=lambda x: x["Magnitude"], reverse=True)
+    unique_trends: list[dict] = []
+    for current in trends_sorted:
+        if not any(
+            not (
+                current["End Date"] < existing["Start Date"]
+                or existing["End Date"] < current["Start Date"]
+            )
+            for existing in unique_trends
+        ):
+            unique_trends.append(current)
+    return unique_trends
+
+
+def random_trend_set(count: int, seed: int) -> list[dict]:
+    """Random candidate trends with short spans and frequent magnitude ties."""
+    rng = np.random.default_rng(seed)
+    base = date(2000, 1, 1)
+    starts = rng.integers(0, count, count)
+    spans = rng.integers(0, 30, count)
+    magnitudes = rng.integers(1, 50, count).astype(float)
+    return [
+        {
+            "Start Date": base + timedelta(days=int(start)),
+            "End Date": base + timedelta(days=int(start + span)),
+            "Magnitude": magnitude,
+        }
+        for start, span, magnitude in zip(starts, spans, magnitudes, strict=True)
+    ]
+
+
+def random_walk_ohlc(
+    num_bars: int, seed: int, volatility: float = 0.01
+) -> pd.DataFrame:
+    """Generate a geometric random walk with plausible high/low wicks."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, volatility, num_bars)))
+    wick = np.abs(rng.normal(0, volatility / 2, (2, num_bars))) * close
+    return pd.DataFrame(
+        {"High": close + wick[0], "Low": close - wick[1], "Close": close},
+        index=pd.date_range("2000-01-03", periods=num_bars, freq="D"),
+    )
+
+
+class TestTrendKernelParity:
+    """Vectorized output must match the scalar reference exactly."""
+
+    @pytest.mark.parametrize("timeframe", ["1m", "1h", "1d", "1w", "1M"])
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_random_walk_parity(self, timeframe, seed):
+        config = TimeframeConfigs.get_config(timeframe)
+        data = random_walk_ohlc(300, seed, volatility=config.tolerance_pct * 2)
+        min_magnitude = data["Close"].median() * config.min_magnitude_pct
+
+        expected = reference_directional_trends(
+            data, config.tolerance_pct, min_magnitude, lookback=3
+        )
+        actual = TrendDetector(config)._detect_directional_trends(
+            data, config.tolerance_pct, min_magnitude, lookback=3
+        )
+
+        assert actual == expected
+
+    @pytest.mark.parametrize("lookback", [1, 3, 5])
+    def test_parity_across_lookbacks(self, lookback):
+        config = TimeframeConfigs.get_config("1d")
+        data = random_walk_ohlc(200, seed=42)
+
+        expected = reference_directional_trends(data, 0.007, 1.0, lookback)
+        actual = TrendDetector(config)._detect_directional_trends(
+            data, 0.007, 1.0, lookback
+        )
+
+        assert actual == expected
+
+    def test_integer_prices_and_flat_segments(self):
+        """Integer columns and flat closes exercise the skip and dtype paths."""
+        dates = pd.date_range("2024-01-01", periods=12, freq="D")
+        data = pd.DataFrame(
+            {
+                "High": [100, 100, 100, 100, 102, 104, 103, 106, 108, 107, 105, 103],
+                "Low": [98, 98, 98, 98, 100, 102, 101, 104, 106, 105, 103, 101],
+                "Close": [99, 99, 99, 99, 101, 103, 102, 105, 107, 106, 104, 102],
+            },
+            index=dates,
+        )
+        config = TimeframeConfigs.get_config("1d")
+
+        expected = reference_directional_trends(data, 0.007, 0.5, lookback=3)
+        actual = TrendDetector(config)._detect_directional_trends(
+            data, 0.007, 0.5, lookback=3
+        )
+
+        assert actual == expected
+
+    def test_missing_values_parity(self):
+        """NaN bars break accumulation the same way as the scalar comparisons."""
+        data = random_walk_ohlc(120, seed=7)
+        data.iloc[[10, 11, 50, 90], [0, 1]] = np.nan
+        data.iloc[[30, 70], 2] = np.nan
+        config = TimeframeConfigs.get_config("1d")
+
+        expected = reference_directional_trends(data, 0.007, 1.0, lookback=3)
+        actual = TrendDetector(config)._detect_directional_trends(
+            data, 0.007, 1.0, lookback=3
+        )
+
+        assert actual == expected
+
+    def test_short_series_returns_no_candidates(self):
+        data = random_walk_ohlc(4, seed=0)
+        prices = data["Close"].to_numpy()
+
+        candidates = detect_directional_candidates(
+            prices, prices, prices, 0.007, 0.0, lookback=3
+        )
+
+        assert len(candidates) == 0
+
+
+class TestOverlapRemovalParity:
+    """Interval-based overlap filtering must match the pairwise scan."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_trend_sets(self, seed):
+        trends = random_trend_set(500, seed)
+        detector = TrendDetector(TimeframeConfigs.get_config("1d"))
+
+        assert detector._remove_overlapping_trends(
+            trends
+        ) == reference_remove_overlapping(trends)
+
+    def test_touching_ranges_overlap(self):
+        """Ranges sharing an endpoint date count as overlapping."""
+        day = date(2024, 1, 1)
+        trends = [
+            {"Start Date": day, "End Date": day + timedelta(5), "Magnitude": 10.0},
+            {
+                "Start Date": day + timedelta(5),
+                "End Date": day + timedelta(9),
+                "Magnitude": 8.0,
+            },
+            {
+                "Start Date": day + timedelta(6),
+                "End Date": day + timedelta(9),
+                "Magnitude": 6.0,
+            },
+        ]
+        detector = TrendDetector(TimeframeConfigs.get_config("1d"))
+
+        result = detector._remove_overlapping_trends(trends)
+
+        assert [t["Magnitude"] for t in result] == [10.0, 6.0]
+
+    def test_detected_trends_parity(self):
+        config = TimeframeConfigs.get_config("1d")
+        data = random_walk_ohlc(400, seed=3)
+        detector = TrendDetector(config)
+        candidates = detector._detect_directional_trends(data, 0.007, 1.0, 3)
+
+        assert detector._remove_overlapping_trends(
+            candidates
+        ) == reference_remove_overlapping(candidates)
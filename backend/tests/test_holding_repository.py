@@ -631,6 +631,53 @@ class TestUpdatePrice:
         assert result is None
 
 
+class TestUpdatePricesBatch:
+    """Test bulk price updates"""
+
+    @pytest.mark.asyncio
+    async def test_update_prices_batch(self, repository, mock_collection):
+        """All price updates go out in one bulk_write"""
+        now = datetime.now(UTC)
+        holdings = [
+            Holding(
+                holding_id=f"holding_{symbol}",
+                user_id="user_123",
+                symbol=symbol,
+                quantity=10,
+                avg_price=100.00,
+                cost_basis=1000.00,
+                created_at=now,
+                updated_at=now,
+            )
+            for symbol in ["AAPL", "MSFT"]
+        ]
+        mock_collection.bulk_write = AsyncMock(
+            return_value=Mock(matched_count=2, modified_count=2)
+        )
+
+        result = await repository.update_prices_batch(
+            [(holdings[0], 120.00), (holdings[1], 90.00)]
+        )
+
+        mock_collection.bulk_write.assert_awaited_once()
+        operations = mock_collection.bulk_write.call_args.args[0]
+        assert len(operations) == 2
+        assert operations[0]._filter == {"holding_id": "holding_AAPL"}
+        assert operations[0]._doc["$set"]["market_value"] == 1200.00
+        assert result[0].current_price == 120.00
+        assert result[0].unrealized_pl_pct == 20.00
+        assert result[1].unrealized_pl == -100.00
+        mock_collection.find_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_prices_batch_empty(self, repository, mock_collection):
+        """No updates means no database call"""
+        mock_collection.bulk_write = AsyncMock()
+
+        assert await repository.update_prices_batch([]) == []
+        mock_collection.bulk_write.assert_not_called()
+
+
 # ===== Delete Tests =====
 
 
@@ -0,0 +1,237 @@
+"""
+Unit tests for the DataManager in-process L1 cache.
+Covers LRU/byte bounds, per-domain TTLs capped by Redis TTL, layered reads in
+CacheOperations and pub/sub invalidation between pods.
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from src.services.data_manager import CacheKeys, CacheOperations, LocalCache
+from src.services.data_manager.local_cache import approximate_size
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+QUOTE_KEY = CacheKeys.quote("AAPL")
+DAILY_KEY = CacheKeys.market("daily", "AAPL")
+
+
+class TestLocalCache:
+    """Bounds, TTLs and pattern deletes."""
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = LocalCache(max_entries=2)
+        cache.set("market:daily:A", {"v": 1})
+        cache.set("market:daily:B", {"v": 2})
+        cache.get("market:daily:A")
+        cache.set("market:daily:C", {"v": 3})
+
+        assert cache.get("market:daily:B") is None
+        assert cache.get("market:daily:A") == {"v": 1}
+        assert cache.evictions == 1
+
+    def test_byte_budget_evicts(self):
+        big = {"close": np.zeros(1000)}
+        cache = LocalCache(max_bytes=approximate_size(big) * 2 + 10)
+        for symbol in "ABC":
+            cache.set(f"market:daily:{symbol}", big)
+
+        assert len(cache) == 2
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_oversized_value_is_not_stored(self):
+        cache = LocalCache(max_bytes=100)
+
+        assert not cache.set(DAILY_KEY, {"close": np.zeros(1000)})
+        assert len(cache) == 0
+
+    def test_domain_ttl_expires(self):
+        clock = FakeClock()
+        cache = LocalCache(clock=clock)
+        cache.set(QUOTE_KEY, {"price": 1})
+
+        clock.now = 4.9
+        assert cache.get(QUOTE_KEY) == {"price": 1}
+        clock.now = 5.0
+        assert cache.get(QUOTE_KEY) is None
+        assert cache.expirations == 1
+
+    def test_ttl_capped_by_redis_ttl(self):
+        cache = LocalCache()
+
+        assert cache.ttl_for(DAILY_KEY) == 60
+        assert cache.ttl_for(DAILY_KEY, l2_ttl=10) == 10
+
+    def test_uncached_domain_bypasses_l1(self):
+        cache = LocalCache()
+        key = CacheKeys.etf_holdings("AIQ")
+
+        assert not cache.set(key, {"state": 1})
+
+    def test_delete_pattern(self):
+        cache = LocalCache()
+        cache.set(DAILY_KEY, {"v": 1})
+        cache.set(CacheKeys.market("weekly", "AAPL"), {"v": 2})
+        cache.set(CacheKeys.market("daily", "MSFT"), {"v": 3})
+
+        assert cache.delete_pattern("market:*:AAPL") == 2
+        assert len(cache) == 1
+
+    def test_hit_ratio(self):
+        cache = LocalCache()
+        cache.set(DAILY_KEY, {"v": 1})
+        cache.get(DAILY_KEY)
+        cache.get("market:daily:MISSING")
+
+        assert cache.to_dict()["hit_ratio"] == 0.5
+
+
+class TestLayeredReads:
+    """CacheOperations consults L1 before Redis."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_served_from_l1(self):
+        server = FakeRedisServer()
+        writer = CacheOperations(make_pod(server))
+        await writer.set(DAILY_KEY, {"close": [1.0, 2.0]}, 3600)
+        ops = CacheOperations(make_pod(server), LocalCache())
+
+        first = await ops.get(DAILY_KEY)
+        second = await ops.get(DAILY_KEY)
+
+        assert server.reads == [DAILY_KEY]
+        assert second is first
+        stats = ops.stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l2"] == {"hits": 1, "misses": 0, "hit_ratio": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_l1_copy_capped_by_remaining_redis_ttl(self):
+        server = FakeRedisServer()
+        await CacheOperations(make_pod(server)).set(DAILY_KEY, {"v": 1}, 3600)
+        server.ttls[DAILY_KEY] = 3  # Written ~an hour ago by another pod
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(server), LocalCache(clock=clock))
+
+        await ops.get(DAILY_KEY)
+        clock.now = 2.9
+        await ops.get(DAILY_KEY)
+        clock.now = 3.0
+        await ops.get(DAILY_KEY)
+
+        assert server.reads == [DAILY_KEY, DAILY_KEY]
+
+    @pytest.mark.asyncio
+    async def test_get_with_fetch_fills_l1(self):
+        server = FakeRedisServer()
+        ops = CacheOperations(make_pod(server), LocalCache())
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return {"price": 10.0}
+
+        assert await ops.get_with_fetch(QUOTE_KEY, fetch, 300) == {"price": 10.0}
+        reads = len(server.reads)
+        for _ in range(4):
+            assert await ops.get_with_fetch(QUOTE_KEY, fetch, 300) == {"price": 10.0}
+
+        assert calls == 1
+        assert len(server.reads) == reads
+        assert ops.stats()["l1"]["hits"] == 4
+
+    @pytest.mark.asyncio
+    async def test_without_l1_stats_report_redis_only(self):
+        ops = CacheOperations(make_pod(FakeRedisServer()))
+
+        await ops.get(QUOTE_KEY)
+
+        stats = ops.stats()
+        assert stats["l1"] is None
+        assert stats["l2"] == {"hits": 0, "misses": 1, "hit_ratio": 0.0}
+
+
+def published(server: FakeRedisServer) -> list[dict]:
+    return [
+        json.loads(message)
+        for channel, message in server.published
+        if channel == CacheOperations.INVALIDATION_CHANNEL
+    ]
+
+
+class TestInvalidation:
+    """Invalidations clear local L1 and propagate to other pods."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_clears_redis_and_l1(self):
+        server = FakeRedisServer()
+        ops = CacheOperations(make_pod(server), LocalCache())
+        await ops.set(DAILY_KEY, {"v": 1}, 3600)
+
+        deleted = await ops.invalidate_pattern("market:*:AAPL")
+
+        assert deleted == 1
+        assert await ops.get(DAILY_KEY) is None
+        assert published(server)[-1]["pattern"] == "market:*:AAPL"
+
+    @pytest.mark.asyncio
+    async def test_other_pod_drops_entries_via_pubsub(self):
+        server = FakeRedisServer()
+        pod_a = CacheOperations(make_pod(server), LocalCache())
+        pod_b = CacheOperations(make_pod(server), LocalCache())
+        await pod_b.set(DAILY_KEY, {"v": 1}, 3600)
+        assert pod_b.start_invalidation_listener()
+        await asyncio.sleep(0)
+
+        await pod_a.invalidate_pattern("market:*:AAPL")
+        await asyncio.sleep(0)
+
+        assert pod_b._local is not None
+        assert pod_b._local.get(DAILY_KEY) is None
+        await pod_b.stop_invalidation_listener()
+
+    def test_own_messages_are_ignored(self):
+        ops = CacheOperations(make_pod(FakeRedisServer()), LocalCache())
+        ops._local.set(DAILY_KEY, {"v": 1})
+        message = json.dumps(
+            {"origin": ops._instance_id, "pattern": "market:*", "keys": []}
+        )
+
+        assert ops.apply_invalidation(message) == 0
+        assert ops.apply_invalidation(message.replace(ops._instance_id, "x")) == 1
+
+    @pytest.mark.asyncio
+    async def test_overwrite_invalidates_key_on_other_pods(self):
+        server = FakeRedisServer()
+        pod_a = CacheOperations(make_pod(server), LocalCache())
+        pod_b = CacheOperations(make_pod(server), LocalCache())
+        await pod_b.set(QUOTE_KEY, {"price": 1}, 300)
+
+        await pod_a.set(QUOTE_KEY, {"price": 2}, 300)
+        pod_b.apply_invalidation(json.dumps(published(server)[-1]))
+
+        assert pod_b._local.get(QUOTE_KEY) is None
+        assert await pod_b.get(QUOTE_KEY) == {"price": 2}
+
+    @pytest.mark.asyncio
+    async def test_new_key_publishes_nothing(self):
+        server = FakeRedisServer()
+        ops = CacheOperations(make_pod(server), LocalCache())
+
+        await ops.set(QUOTE_KEY, {"price": 1}, 300)
+        await ops.set(CacheKeys.quote("MSFT"), {"price": 2}, 300)
+
+        assert published(server) == []
+        assert server.data.keys() == {QUOTE_KEY, CacheKeys.quote("MSFT")}
@@ -4,11 +4,14 @@ Unit tests for BarsBasicMixin - intraday, daily, weekly, monthly bars.
 Tests Alpha Vantage API interactions with mocked HTTP responses.
 """
 
+import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, Mock, patch
 
 import pandas as pd
 import pytest
 
+from src.core.config import Settings
 from src.services.market_data.bars_basic import BarsBasicMixin
 
 
@@ -17,10 +20,8 @@ from src.services.market_data.bars_basic import BarsBasicMixin
 
 @pytest.fixture
 def mock_settings():
-    """Mock Settings"""
-    settings = Mock()
-    settings.alpha_vantage_api_key = "test_api_key"
-    return settings
+    """Settings with a test API key"""
+    return Settings(alpha_vantage_api_key="test_api_key")
 
 
 @pytest.fixture
@@ -228,15 +229,24 @@ class TestGetIntradayBars:
     @pytest.mark.asyncio
     async def test_intraday_bars_outputsize_parameter(self, bars_service, mock_intraday_response):
         """Test intraday bars with outputsize parameter"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_intraday_response
-        bars_service.client.get = AsyncMock(return_value=mock_response)
+        requests = []
 
-        await bars_service.get_intraday_bars("AAPL", outputsize="full")
+        @asynccontextmanager
+        async def stream_get(url, params):
+            # Full-length series are read through the client's streamed GET
+            requests.append(params)
 
-        call_args = bars_service.client.get.call_args
-        assert call_args[1]["params"]["outputsize"] == "full"
+            async def aiter_bytes():
+                yield json.dumps(mock_intraday_response).encode()
+
+            yield Mock(status_code=200, aiter_bytes=aiter_bytes)
+
+        bars_service.client.stream_get = stream_get
+
+        df = await bars_service.get_intraday_bars("AAPL", outputsize="full")
+
+        assert requests[0]["outputsize"] == "full"
+        assert len(df) == 2
 
 
 # ===== get_daily_bars Tests =====
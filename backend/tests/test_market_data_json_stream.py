@@ -0,0 +1,267 @@
+"""
+Unit tests for streamed JSON decoding of Alpha Vantage responses.
+Covers the incremental decoder on arbitrary chunk boundaries, and the
+streamed bar/options paths end-to-end through a ScheduledClient whose
+transport serves bodies in small chunks.
+"""
+
+import json
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+from unittest.mock import Mock
+
+import httpx
+import pandas as pd
+import pytest
+
+from src.core.config import Settings
+from src.services.data_manager import DataManager
+from src.services.market_data import AlphaVantageMarketDataService
+from src.services.market_data.json_stream import JSONStreamError, decode_object_stream
+from src.services.market_data.parsers import parse_adjusted_ohlcv_series
+from src.services.market_data.scheduler import (
+    THROTTLE_MINUTE,
+    RequestScheduler,
+    ScheduledClient,
+)
+
+
+async def chunked(payload: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(payload), size):
+        yield payload[start : start + size]
+
+
+async def decode(payload: Any, size: int, key: str = "data"):
+    items: list[tuple[str | None, Any]] = []
+    raw = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    header, streamed = await decode_object_stream(
+        chunked(raw, size), key.__eq__, lambda k, v: items.append((k, v))
+    )
+    return header, streamed, items
+
+
+def daily_body(days: int = 30) -> dict[str, Any]:
+    dates = pd.bdate_range(end="2025-01-10", periods=days)[::-1]
+    return {
+        "Meta Data": {"2. Symbol": "AAPL"},
+        "Time Series (Daily)": {
+            d.strftime("%Y-%m-%d"): {
+                "1. open": f"{100 + i}.00",
+                "2. high": f"{101 + i}.00",
+                "3. low": f"{99 + i}.00",
+                "4. close": f"{200 + i}.00" if i % 7 == 0 else f"{100 + i}.50",
+                "5. adjusted close": f"{100 + i}.50",
+                "6. volume": str(1000 + i),
+                "7. dividend amount": "0.0000",
+                "8. split coefficient": "1.0",
+            }
+            for i, d in enumerate(dates)
+        },
+    }
+
+
+def options_body() -> dict[str, Any]:
+    return {
+        "endpoint": "Historical Options",
+        "message": "success",
+        "data": [
+            {
+                "contractID": "NVDA250117C00100000",
+                "symbol": "NVDA",
+                "expiration": "2025-01-17",
+                "strike": "100.00",
+                "type": "call",
+                "last": "38.50",
+                "mark": "38.45",
+                "bid": "38.30",
+                "ask": "38.70",
+                "volume": "1234",
+                "open_interest": "5678",
+                "implied_volatility": "0.45",
+                "delta": "0.95",
+                "gamma": "0.002",
+                "theta": "-0.05",
+                "vega": "0.10",
+            },
+            {
+                "contractID": "NVDA250117P00100000",
+                "expiration": "2025-01-17",
+                "strike": "100.00",
+                "type": "put",
+                "last": "0.55",
+                "bid": "0.50",
+                "ask": "0.60",
+                "volume": "",
+                "open_interest": "900",
+                "implied_volatility": "0.50",
+                "delta": "",
+            },
+            {"contractID": "BAD", "expiration": "2025-01-17", "strike": "n/a"},
+        ],
+    }
+
+
+def make_service(
+    responder: Callable[[dict[str, str]], Any], chunk_size: int = 64
+) -> tuple[AlphaVantageMarketDataService, RequestScheduler]:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.dumps(responder(dict(request.url.params))).encode()
+        return httpx.Response(200, content=chunked(body, chunk_size))
+
+    service = AlphaVantageMarketDataService(
+        Settings(alpha_vantage_api_key="test_api_key")
+    )
+    scheduler = RequestScheduler(requests_per_minute=6000, burst=10)
+    scheduler.BACKOFF_BASE_SECONDS = 0.01
+    service.scheduler = scheduler
+    service.client = ScheduledClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)), scheduler
+    )
+    return service, scheduler
+
+
+class TestDecodeObjectStream:
+    """Test the incremental decoder."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 3, 17, 4096])
+    async def test_any_chunk_boundary(self, size):
+        """Chunking never changes the decoded result."""
+        body = {
+            "Meta Data": {"symbol": "AAPL", "count": 12345},
+            "data": [{"a": 1.5, "b": "x"}, {"a": -2e3, "b": "é"}, [], None],
+            "total": 1234567,
+        }
+
+        header, streamed, items = await decode(body, size)
+
+        assert header == {"Meta Data": body["Meta Data"], "total": 1234567}
+        assert streamed == "data"
+        assert [v for _, v in items] == body["data"]
+
+    @pytest.mark.asyncio
+    async def test_object_members_are_streamed_with_keys(self):
+        """Streamed objects yield (key, value) in document order."""
+        body = {"series": {"2025-01-02": {"v": "1"}, "2025-01-01": {"v": "2"}}}
+
+        _, streamed, items = await decode(body, 5, key="series")
+
+        assert streamed == "series"
+        assert items == list(body["series"].items())
+
+    @pytest.mark.asyncio
+    async def test_missing_member_returns_header_only(self):
+        """Error bodies come back whole with no streamed member."""
+        header, streamed, items = await decode({"Error Message": "Invalid"}, 4)
+
+        assert header == {"Error Message": "Invalid"}
+        assert streamed is None
+        assert items == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "raw", [b'{"data": [1, 2', b'["not", "an object"]', b'{"data": 5}', b""]
+    )
+    async def test_malformed_bodies_raise(self, raw):
+        """Truncated or unexpected bodies raise JSONStreamError."""
+        with pytest.raises(JSONStreamError):
+            await decode(raw, 2)
+
+
+class TestStreamedEndpoints:
+    """Test streamed paths through ScheduledClient.stream_get."""
+
+    @pytest.mark.asyncio
+    async def test_full_daily_bars_match_buffered_parse(self):
+        """Streamed full history equals the buffered parser output."""
+        body = daily_body()
+        service, _ = make_service(lambda params: body)
+
+        df = await service.get_daily_bars("AAPL", outputsize="full")
+        await service.close()
+
+        expected = parse_adjusted_ohlcv_series(body["Time Series (Daily)"])
+        pd.testing.assert_frame_equal(df, expected)
+
+    @pytest.mark.asyncio
+    async def test_full_intraday_bars(self):
+        """Streamed intraday bars are localized to US Eastern."""
+        body = {
+            "Time Series (5min)": {
+                "2025-01-10 16:00:00": {
+                    "1. open": "1",
+                    "2. high": "2",
+                    "3. low": "0.5",
+                    "4. close": "1.5",
+                    "5. volume": "10",
+                }
+            }
+        }
+        service, _ = make_service(lambda params: body)
+
+        df = await service.get_intraday_bars("AAPL", "5min", outputsize="full")
+        await service.close()
+
+        assert len(df) == 1
+        assert str(df.index.tz) == "America/New_York"
+
+    @pytest.mark.asyncio
+    async def test_missing_series_raises(self):
+        """An error body surfaces the existing 'No daily data' error."""
+        service, _ = make_service(lambda params: {"Error Message": "Invalid API call"})
+
+        with pytest.raises(ValueError, match="No daily data for symbol"):
+            await service.get_daily_bars("BAD", outputsize="full")
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_throttle_notice_is_retried(self):
+        """Throttle notices back off and retry like buffered requests."""
+        calls = []
+
+        def responder(params):
+            calls.append(params)
+            if len(calls) == 1:
+                return {"Note": "You have exceeded the rate limit per minute."}
+            return daily_body(5)
+
+        service, scheduler = make_service(responder)
+
+        df = await service.get_daily_bars("AAPL", outputsize="full")
+        await service.close()
+
+        assert len(df) == 5
+        assert len(calls) == 2
+        assert scheduler.throttles[THROTTLE_MINUTE] == 1
+
+    @pytest.mark.asyncio
+    async def test_options_chain_keeps_needed_columns(self):
+        """Contracts are reduced to columns; bad rows are skipped."""
+        service, _ = make_service(lambda params: options_body(), chunk_size=16)
+
+        chain = await service.get_options_chain("NVDA")
+        await service.close()
+
+        assert len(chain) == 2
+        assert chain.skipped == 1
+        assert chain.option_type == ["call", "put"]
+        numeric = chain.numeric()
+        assert numeric["strike"].tolist() == [100.0, 100.0]
+        assert numeric["volume"].tolist() == [1234.0, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_data_manager_builds_contracts_from_chain(self):
+        """DataManager turns the streamed chain into OptionContracts."""
+        service, _ = make_service(lambda params: options_body())
+        redis = Mock()
+
+        chain = await DataManager(redis, service)._fetch_options_chain("NVDA")
+        await service.close()
+
+        contracts = chain.to_contracts()
+
+        assert [c.option_type for c in contracts] == ["call", "put"]
+        assert contracts[0].delta == 0.95
+        assert contracts[1].delta is None
+        assert contracts[1].open_interest == 900
+        assert contracts[0].expiration.year == 2025
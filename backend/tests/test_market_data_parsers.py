@@ -0,0 +1,191 @@
+"""
+Unit tests for the columnar Alpha Vantage time-series parsers.
+
+Each parser is checked against the row-by-row conversion it replaced.
+"""
+
+import pandas as pd
+import pytest
+
+from src.services.market_data.parsers import (
+    parse_adjusted_ohlcv_series,
+    parse_ohlcv_series,
+    parse_value_series,
+)
+
+
+def _intraday_series(count: int) -> dict[str, dict[str, str]]:
+    stamps = pd.date_range("2025-01-10 04:00", periods=count, freq="min")[::-1]
+    return {
+        ts.strftime("%Y-%m-%d %H:%M:%S"): {
+            "1. open": f"{100 + i * 0.01:.4f}",
+            "2. high": f"{101 + i * 0.01:.4f}",
+            "3. low": f"{99 + i * 0.01:.4f}",
+            "4. close": f"{100.5 + i * 0.01:.4f}",
+            "5. volume": str(1000 + i),
+        }
+        for i, ts in enumerate(stamps)
+    }
+
+
+def _adjusted_series() -> dict[str, dict[str, str]]:
+    return {
+        "2025-01-10": {
+            "1. open": "170.00",
+            "2. high": "175.00",
+            "3. low": "168.00",
+            "4. close": "172.00",
+            "5. adjusted close": "172.00",
+            "6. volume": "5000000",
+        },
+        # Pre-split bar: raw prices 10x the adjusted close
+        "2025-01-09": {
+            "1. open": "1700.00",
+            "2. high": "1750.00",
+            "3. low": "1680.00",
+            "4. close": "1720.00",
+            "5. adjusted close": "172.00",
+            "6. volume": "500000",
+        },
+        "2025-01-08": {
+            "1. open": "1.00",
+            "2. high": "1.00",
+            "3. low": "1.00",
+            "4. close": "0",
+            "5. adjusted close": "5.00",
+            "6. volume": "1",
+        },
+    }
+
+
+def _legacy_adjusted(time_series: dict[str, dict[str, str]]) -> pd.DataFrame:
+    rows = []
+    for date, values in time_series.items():
+        raw_close = float(values["4. close"])
+        adjusted_close = float(values["5. adjusted close"])
+        factor = adjusted_close / raw_close if raw_close != 0 else 1.0
+        rows.append(
+            {
+                "date": pd.to_datetime(date),
+                "Open": float(values["1. open"]) * factor,
+                "High": float(values["2. high"]) * factor,
+                "Low": float(values["3. low"]) * factor,
+                "Close": adjusted_close,
+                "Volume": int(values["6. volume"]),
+            }
+        )
+    return pd.DataFrame(rows).set_index("date").sort_index()
+
+
+class TestParseOhlcvSeries:
+    """Test raw intraday bar parsing."""
+
+    def test_matches_row_by_row_conversion(self):
+        """Values, order and dtypes match the per-row loop."""
+        series = _intraday_series(50)
+        expected = (
+            pd.DataFrame(
+                [
+                    {
+                        "timestamp": pd.to_datetime(ts),
+                        "Open": float(v["1. open"]),
+                        "High": float(v["2. high"]),
+                        "Low": float(v["3. low"]),
+                        "Close": float(v["4. close"]),
+                        "Volume": int(v["5. volume"]),
+                    }
+                    for ts, v in series.items()
+                ]
+            )
+            .set_index("timestamp")
+            .sort_index()
+        )
+
+        df = parse_ohlcv_series(series)
+
+        pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+    def test_localizes_once(self):
+        """Naive vendor timestamps are localized to the given timezone."""
+        df = parse_ohlcv_series(_intraday_series(3), tz="America/New_York")
+
+        assert str(df.index.tz) == "America/New_York"
+        assert df.index[0] == pd.Timestamp("2025-01-10 04:00", tz="America/New_York")
+
+    def test_unordered_input_is_sorted(self):
+        """Out-of-order payloads still come back oldest first."""
+        items = list(_intraday_series(5).items())
+        shuffled = dict(items[2:] + items[:2])
+
+        df = parse_ohlcv_series(shuffled)
+
+        assert df.index.is_monotonic_increasing
+        assert len(df) == 5
+
+    def test_empty_series(self):
+        """An empty mapping gives an empty, correctly typed frame."""
+        df = parse_ohlcv_series({}, tz="America/New_York")
+
+        assert df.empty
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert df["Volume"].dtype == "int64"
+
+    def test_missing_field_raises(self):
+        """A bar without a required field raises KeyError."""
+        series = _intraday_series(2)
+        del next(iter(series.values()))["5. volume"]
+
+        with pytest.raises(KeyError):
+            parse_ohlcv_series(series)
+
+
+class TestParseAdjustedOhlcvSeries:
+    """Test split/dividend-adjusted bar parsing."""
+
+    def test_matches_row_by_row_conversion(self):
+        """Adjustment factor (incl. zero close) matches the per-row loop."""
+        series = _adjusted_series()
+
+        df = parse_adjusted_ohlcv_series(series)
+
+        pd.testing.assert_frame_equal(df, _legacy_adjusted(series))
+
+    def test_split_adjusted_values(self):
+        """Pre-split OHLC is scaled to the adjusted close."""
+        df = parse_adjusted_ohlcv_series(_adjusted_series())
+
+        assert df.loc["2025-01-09", "Open"] == pytest.approx(170.0)
+        assert df.loc["2025-01-09", "Close"] == 172.0
+        assert df.loc["2025-01-08", "Open"] == 1.0
+
+
+class TestParseValueSeries:
+    """Test macro/treasury series parsing."""
+
+    def test_parses_and_sorts(self):
+        """Records become a date-indexed float column, oldest first."""
+        df = parse_value_series(
+            [
+                {"date": "2025-02-01", "value": "4.10"},
+                {"date": "2025-01-01", "value": "4.25"},
+            ]
+        )
+
+        assert df.index.name == "date"
+        assert df["value"].tolist() == [4.25, 4.10]
+
+    def test_skip_missing(self):
+        """'.' values are dropped when skip_missing is set."""
+        records = [
+            {"date": "2025-01-02", "value": "."},
+            {"date": "2025-01-01", "value": "4.25"},
+        ]
+
+        df = parse_value_series(records, skip_missing=True)
+
+        assert df["value"].tolist() == [4.25]
+
+    def test_missing_value_raises_by_default(self):
+        """'.' values are not numeric unless skipped."""
+        with pytest.raises(ValueError):
+            parse_value_series([{"date": "2025-01-02", "value": "."}])
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from src.core.config import Settings
 from src.services.market_data.quotes import QuotesMixin
 
 
@@ -16,10 +17,8 @@ from src.services.market_data.quotes import QuotesMixin
 
 @pytest.fixture
 def mock_settings():
-    """Mock Settings"""
-    settings = Mock()
-    settings.alpha_vantage_api_key = "test_api_key"
-    return settings
+    """Settings with a test API key"""
+    return Settings(alpha_vantage_api_key="test_api_key")
 
 
 @pytest.fixture
@@ -177,9 +176,7 @@ class TestSearchSymbols:
     @pytest.mark.asyncio
     async def test_search_symbols_exception(self, quotes_service):
         """Test symbol search with network exception"""
-        quotes_service.client.get = AsyncMock(
-            side_effect=Exception("Connection error")
-        )
+        quotes_service.client.get = AsyncMock(side_effect=Exception("Connection error"))
 
         with pytest.raises(Exception) as exc_info:
             await quotes_service.search_symbols("AAPL")
@@ -265,9 +262,7 @@ class TestGetQuote:
         """Test quote when no data available"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Global Quote": {}  # Empty quote
-        }
+        mock_response.json.return_value = {"Global Quote": {}}  # Empty quote
         quotes_service.client.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(ValueError) as exc_info:
@@ -280,9 +275,7 @@ class TestGetQuote:
         """Test quote when key is missing"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "Error Message": "Invalid symbol"
-        }
+        mock_response.json.return_value = {"Error Message": "Invalid symbol"}
         quotes_service.client.get = AsyncMock(return_value=mock_response)
 
         with pytest.raises(ValueError) as exc_info:
@@ -337,6 +330,80 @@ class TestGetQuote:
         assert "Timeout" in str(exc_info.value)
 
 
+# ===== get_bulk_quotes Tests =====
+
+
+class TestGetBulkQuotes:
+    """Test get_bulk_quotes method"""
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes_success(self, quotes_service):
+        """Test rows are mapped to the get_quote field layout"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "endpoint": "Realtime Bulk Quotes",
+            "data": [
+                {
+                    "symbol": "AAPL",
+                    "timestamp": "2025-01-10 16:00:00.000",
+                    "open": "150.00",
+                    "high": "152.50",
+                    "low": "149.50",
+                    "close": "151.75",
+                    "volume": "75000000",
+                    "previous_close": "149.00",
+                    "change": "2.75",
+                    "change_percent": "1.85%",
+                },
+                {"symbol": "msft", "close": "410.00", "volume": "1000"},
+            ],
+        }
+        quotes_service.client.get = AsyncMock(return_value=mock_response)
+
+        result = await quotes_service.get_bulk_quotes(["AAPL", "MSFT"])
+
+        params = quotes_service.client.get.call_args.kwargs["params"]
+        assert params["function"] == "REALTIME_BULK_QUOTES"
+        assert params["symbol"] == "AAPL,MSFT"
+        assert set(result) == {"AAPL", "MSFT"}
+        assert result["AAPL"]["price"] == 151.75
+        assert result["AAPL"]["latest_trading_day"] == "2025-01-10"
+        assert result["AAPL"]["change_percent"] == "1.85"
+        assert result["MSFT"]["price"] == 410.0
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes_not_entitled(self, quotes_service):
+        """Test premium-only notice returns None"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"message": "This is a premium API function."}
+        quotes_service.client.get = AsyncMock(return_value=mock_response)
+
+        assert await quotes_service.get_bulk_quotes(["AAPL"]) is None
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes_throttled_raises(self, quotes_service):
+        """Test a throttle notice raises instead of reporting not entitled"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "Information": "Our standard API rate limit is 25 requests per day."
+        }
+        quotes_service.client.get = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(ValueError, match="rate limit"):
+            await quotes_service.get_bulk_quotes(["AAPL"])
+
+    @pytest.mark.asyncio
+    async def test_get_bulk_quotes_rejects_oversized_batch(self, quotes_service):
+        """Test more symbols than the vendor limit raises"""
+        symbols = [f"S{i}" for i in range(QuotesMixin.BULK_QUOTES_LIMIT + 1)]
+
+        with pytest.raises(ValueError, match="At most"):
+            await quotes_service.get_bulk_quotes(symbols)
+
+
 # ===== get_market_status Tests =====
 
 
@@ -423,9 +490,7 @@ class TestGetMarketStatus:
     @pytest.mark.asyncio
     async def test_get_market_status_exception(self, quotes_service):
         """Test market status with network exception"""
-        quotes_service.client.get = AsyncMock(
-            side_effect=Exception("Network error")
-        )
+        quotes_service.client.get = AsyncMock(side_effect=Exception("Network error"))
 
         with pytest.raises(Exception) as exc_info:
             await quotes_service.get_market_status()
@@ -433,9 +498,7 @@ class TestGetMarketStatus:
         assert "Network error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_get_market_status_unknown_timezone(
-        self, quotes_service
-    ):
+    async def test_get_market_status_unknown_timezone(self, quotes_service):
         """Test market status with region not in timezone map"""
         mock_response = Mock()
         mock_response.status_code = 200
@@ -0,0 +1,138 @@
+"""
+Unit tests for the columnar OHLCVBars container.
+Covers DataFrame/cache round-trips, legacy list decoding and the newest-first
+sequence behaviour existing OHLCVData callers rely on.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.data_manager import OHLCVBars, OHLCVData
+
+
+def make_frame(num_bars: int = 5, tz: str | None = None) -> pd.DataFrame:
+    index = pd.date_range("2025-01-01", periods=num_bars, freq="D", tz=tz)
+    close = np.linspace(100.0, 110.0, num_bars)
+    return pd.DataFrame(
+        {
+            "Open": close - 1,
+            "High": close + 2,
+            "Low": close - 2,
+            "Close": close,
+            "Volume": np.arange(1, num_bars + 1) * 1000,
+        },
+        index=index,
+    )
+
+
+def legacy_rows(df: pd.DataFrame) -> list[OHLCVData]:
+    """Reference for the removed row-by-row DataFrame conversion."""
+    rows = []
+    for idx, row in df.iterrows():
+        dt = idx.to_pydatetime()
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=UTC)
+        rows.append(
+            OHLCVData(
+                date=dt,
+                open=float(row["Open"]),
+                high=float(row["High"]),
+                low=float(row["Low"]),
+                close=float(row["Close"]),
+                volume=int(row["Volume"]),
+            )
+        )
+    rows.sort(key=lambda x: x.date, reverse=True)
+    return rows
+
+
+class TestConstruction:
+    """Building bars from vendor DataFrames."""
+
+    def test_matches_legacy_row_conversion(self):
+        df = make_frame()
+
+        assert OHLCVBars.from_dataframe(df).to_list() == legacy_rows(df)
+
+    def test_unsorted_input_is_stored_oldest_first(self):
+        df = make_frame().iloc[::-1]
+        bars = OHLCVBars.from_dataframe(df)
+
+        assert np.all(np.diff(bars.timestamps) > 0)
+        assert bars[0].close == pytest.approx(110.0)
+
+    def test_lowercase_columns(self):
+        df = make_frame().rename(columns=str.lower)
+
+        assert OHLCVBars.from_dataframe(df).close[-1] == pytest.approx(110.0)
+
+    def test_empty_and_none(self):
+        assert len(OHLCVBars.from_dataframe(None)) == 0
+        assert not OHLCVBars.from_dataframe(pd.DataFrame())
+
+    def test_intraday_timezone_is_preserved(self):
+        df = make_frame(tz="America/New_York")
+        bars = OHLCVBars.from_dataframe(df)
+
+        assert bars.tz == "America/New_York"
+        assert bars[-1].date == df.index[0].to_pydatetime()
+        pd.testing.assert_index_equal(bars.index, df.index.as_unit("ns"))
+
+
+class TestSequenceAdapter:
+    """OHLCVBars behaves like the old newest-first list."""
+
+    def test_indexing_and_iteration(self):
+        bars = OHLCVBars.from_dataframe(make_frame())
+        rows = list(bars)
+
+        assert len(bars) == 5
+        assert rows[0] == bars[0]
+        assert rows[-1] == bars[-1]
+        assert rows[0].date > rows[-1].date
+        assert bars[1:3] == rows[1:3]
+
+    def test_out_of_range_raises(self):
+        bars = OHLCVBars.from_dataframe(make_frame(3))
+
+        with pytest.raises(IndexError):
+            bars[3]
+
+
+class TestSerialization:
+    """Cache payload round-trips."""
+
+    def test_round_trip_through_json(self):
+        bars = OHLCVBars.from_dataframe(make_frame(tz="America/New_York"))
+
+        restored = OHLCVBars.from_cached(json.loads(json.dumps(bars.to_dict())))
+
+        assert restored.tz == bars.tz
+        pd.testing.assert_frame_equal(restored.to_dataframe(), bars.to_dataframe())
+
+    def test_legacy_list_entries_still_decode(self):
+        df = make_frame()
+        cached = [row.to_dict() for row in legacy_rows(df)]
+
+        restored = OHLCVBars.from_cached(cached)
+
+        assert restored.to_list() == legacy_rows(df)
+
+    def test_to_dataframe_is_oldest_first(self):
+        df = make_frame()
+        bars = OHLCVBars.from_dataframe(df.iloc[::-1])
+
+        result = bars.to_dataframe()
+
+        assert result.index.is_monotonic_increasing
+        assert result.index[0] == pd.Timestamp(datetime(2025, 1, 1, tzinfo=UTC))
+        np.testing.assert_array_equal(result["Close"], df["Close"])
+
+    def test_from_records_round_trip(self):
+        rows = legacy_rows(make_frame())
+
+        assert OHLCVBars.from_records(rows).to_list() == rows
@@ -0,0 +1,247 @@
+"""
+Unit tests for request-scoped OHLCV sharing in the Data Manager Layer.
+
+Covers OHLCVScope/ohlcv_scope through DataManager.get_ohlcv and the ReAct
+agent's Fibonacci, Stochastic and historical-prices tools sharing one series
+within an agent run.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.core.config import Settings
+from src.database.redis import RedisCache
+from src.services.data_manager import (
+    BarStore,
+    DataFetchError,
+    DataManager,
+    OHLCVBars,
+    current_ohlcv_scope,
+    ohlcv_scope,
+)
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+def make_df(days: int, end: Any = "2025-01-10") -> pd.DataFrame:
+    index = pd.bdate_range(end=end, periods=days, name="date")
+    close = 150 + 20 * np.sin(np.linspace(0, 6 * np.pi, days))
+    return pd.DataFrame(
+        {
+            "Open": close - 1,
+            "High": close + 1,
+            "Low": close - 2,
+            "Close": close,
+            "Volume": np.arange(days, dtype=np.int64) + 1000,
+        },
+        index=index,
+    )
+
+
+class BarsService:
+    """Alpha Vantage stand-in serving daily history after a short delay."""
+
+    def __init__(self, history: pd.DataFrame, failures: int = 0):
+        self.history = history
+        self.failures = failures
+        self.calls: list[tuple[str, str]] = []
+
+    async def get_daily_bars(self, symbol: str, outputsize: str = "compact"):
+        self.calls.append((symbol, outputsize))
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("vendor down")
+        return self.history if outputsize == "full" else self.history.iloc[-100:]
+
+    get_weekly_bars = get_monthly_bars = get_daily_bars
+
+
+@pytest.fixture
+def redis() -> RedisCache:
+    return make_pod(FakeRedisServer())
+
+
+@pytest.fixture
+def service() -> BarsService:
+    return BarsService(make_df(400))
+
+
+class TestOHLCVScope:
+    """Test get_ohlcv sharing inside and outside ohlcv_scope()."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_load(self, redis, service):
+        """Callers in one scope get the same bars from a single load."""
+        dm = DataManager(redis, service)
+
+        with ohlcv_scope() as scope:
+            first, second, third = await asyncio.gather(
+                dm.get_ohlcv("AAPL", "daily"),
+                dm.get_ohlcv("aapl", "daily"),
+                dm.get_ohlcv("AAPL", "daily", "compact"),
+            )
+            later = await dm.get_ohlcv("AAPL", "daily")
+
+        assert first is second is third is later
+        assert service.calls == [("AAPL", "compact")]
+        l2 = dm.cache_stats()["l2"]
+        assert (l2["hits"], l2["misses"]) == (0, 1)
+        assert (scope.loads, scope.hits) == (1, 3)
+
+    @pytest.mark.asyncio
+    async def test_series_keyed_by_granularity_and_outputsize(self, redis, service):
+        """Different granularities and output sizes are separate series."""
+        dm = DataManager(redis, service)
+
+        with ohlcv_scope() as scope:
+            daily = await dm.get_ohlcv("AAPL", "daily")
+            weekly = await dm.get_ohlcv("AAPL", "weekly")
+            full = await dm.get_ohlcv("AAPL", "daily", "full")
+
+        assert daily is not weekly and daily is not full
+        assert scope.loads == 3 and len(scope) == 3
+
+    @pytest.mark.asyncio
+    async def test_no_sharing_outside_scope(self, redis, service):
+        """Without a scope every call goes back to the cache."""
+        dm = DataManager(redis, service)
+
+        with ohlcv_scope():
+            await dm.get_ohlcv("AAPL", "daily")
+        assert current_ohlcv_scope() is None
+
+        first = await dm.get_ohlcv("AAPL", "daily")
+        second = await dm.get_ohlcv("AAPL", "daily")
+
+        assert first is not second
+        l2 = dm.cache_stats()["l2"]
+        assert (l2["hits"], l2["misses"]) == (2, 1)
+        assert len(service.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_retried(self, redis):
+        """A failed load is not shared; the next call loads again."""
+        service = BarsService(make_df(400), failures=1)
+        dm = DataManager(redis, service)
+
+        with ohlcv_scope() as scope:
+            with pytest.raises(DataFetchError):
+                await dm.get_ohlcv("AAPL", "daily")
+            bars = await dm.get_ohlcv("AAPL", "daily")
+
+        assert len(bars) == 100
+        assert scope.loads == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_load(self, redis, service):
+        """A caller that gives up (tool timeout) leaves the load to others."""
+        dm = DataManager(redis, service)
+
+        with ohlcv_scope():
+            waiter = asyncio.ensure_future(dm.get_ohlcv("AAPL", "daily"))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            bars = await dm.get_ohlcv("AAPL", "daily")
+
+        assert len(bars) == 100
+        assert service.calls == [("AAPL", "compact")]
+
+    @pytest.mark.asyncio
+    async def test_bar_store_history_shares_compact_tail(
+        self, redis, service, tmp_path
+    ):
+        """Full daily history from the bar store reuses the scope's compact series."""
+        store = BarStore(tmp_path)
+        store.write("daily", "AAPL", OHLCVBars.from_dataframe(make_df(400)[:-20]))
+        dm = DataManager(redis, service, bar_store=store)
+
+        with ohlcv_scope():
+            history, compact = await asyncio.gather(
+                dm.get_ohlcv("AAPL", "daily", "full"),
+                dm.get_ohlcv("AAPL", "daily", "compact"),
+            )
+
+        assert len(history) == 400
+        assert service.calls == [("AAPL", "compact")]
+
+
+class OneTurnModel(BaseChatModel):
+    """Fake model: one turn of tool calls, then a final answer."""
+
+    tool_calls: list[dict[str, Any]]
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "one-turn"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "OneTurnModel":
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        if self.calls == 1:
+            message = AIMessage(content="", tool_calls=self.tool_calls)
+        else:
+            message = AIMessage(content="Done.")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+class TestAgentRunSharing:
+    """Test the agent's OHLCV tools sharing series within one run."""
+
+    @pytest.mark.asyncio
+    async def test_tools_of_one_run_share_series(self, redis, tmp_path):
+        """Fibonacci, Stochastic and history for one symbol: one vendor call."""
+        store = BarStore(tmp_path)
+        history = make_df(400, end=pd.Timestamp.now(tz="UTC").normalize())
+        service = BarsService(history)
+        store.write("daily", "AAPL", OHLCVBars.from_dataframe(history[:-20]))
+        settings = Settings(
+            dashscope_api_key="test",
+            langfuse_public_key="",
+            langfuse_secret_key="",
+            fred_api_key="",
+            bar_store_enabled=False,
+        )
+        model = OneTurnModel(
+            tool_calls=[
+                {"name": "fibonacci_analysis_tool", "args": {"symbol": "AAPL"}},
+                {"name": "stochastic_analysis_tool", "args": {"symbol": "AAPL"}},
+                {"name": "get_historical_prices", "args": {"symbol": "AAPL"}},
+            ]
+        )
+        for i, call in enumerate(model.tool_calls):
+            call["id"] = f"call_{i}"
+        data_manager = DataManager(redis, service, bar_store=store)
+        agent = FinancialAnalysisReActAgent(
+            settings,
+            ticker_data_service=MagicMock(),
+            market_service=MagicMock(),
+            data_manager=data_manager,
+            llm=model,
+        )
+
+        result = await agent.ainvoke("Analyze AAPL")
+
+        tool_results = [m.content for m in result["messages"] if m.type == "tool"]
+        assert len(tool_results) == 3
+        assert not any("error" in content.lower() for content in tool_results)
+        assert service.calls == [("AAPL", "compact")]
+        l2 = data_manager.cache_stats()["l2"]
+        assert l2["hits"] + l2["misses"] == 1
@@ -0,0 +1,305 @@
+"""Tests for the columnar options chain and vectorized PCR engine."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from src.services.data_manager import (
+    CacheKeys,
+    DataFetchError,
+    DataManager,
+    OptionContract,
+    OptionsChain,
+    PCRParams,
+    QuoteData,
+    SymbolPCRData,
+)
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+def make_quote(symbol: str, price: float = 100.0) -> QuoteData:
+    return QuoteData(
+        symbol=symbol,
+        price=price,
+        volume=1000,
+        latest_trading_day="2026-10-16",
+        previous_close=99.0,
+        change=1.0,
+        change_percent=1.0,
+        open=99.0,
+        high=101.0,
+        low=98.0,
+    )
+
+
+def make_contracts(count: int = 400, seed: int = 0) -> list[OptionContract]:
+    rng = np.random.default_rng(seed)
+    expirations = [datetime(2026, 11, 20), datetime(2026, 12, 18)]
+    return [
+        OptionContract(
+            contract_id=f"NVDA{i}",
+            symbol="NVDA",
+            expiration=expirations[i % 2],
+            strike=float(rng.integers(60, 140)),
+            option_type=("call", "put", "")[int(rng.integers(0, 3))],
+            last_price=float(rng.uniform(0.1, 5.0)),
+            bid=1.0,
+            ask=1.1,
+            volume=10,
+            open_interest=int(rng.integers(0, 2000)),
+            implied_volatility=0.4,
+            delta=None if i % 5 == 0 else 0.5,
+        )
+        for i in range(count)
+    ]
+
+
+def loop_pcr(
+    contracts: list[OptionContract], price: float, params: PCRParams
+) -> tuple[float, float, int]:
+    """Reference per-contract loop (the previous implementation)."""
+    low = price * (1 - params.atm_zone_pct)
+    high = price * (1 + params.atm_zone_pct)
+    puts = calls = 0.0
+    count = 0
+    for c in contracts:
+        if not (low <= c.strike <= high):
+            continue
+        if c.last_price < params.min_premium or c.open_interest < params.min_oi:
+            continue
+        notional = c.open_interest * c.last_price * 100
+        if c.option_type == "put":
+            puts += notional
+        elif c.option_type == "call":
+            calls += notional
+        count += 1
+    return puts, calls, count
+
+
+class TestOptionsChainPCR:
+    """Test PCR aggregates over the columnar chain."""
+
+    def test_matches_contract_loop_for_each_param_set(self):
+        """A sweep gives the same totals as the loop run once per parameter set."""
+        contracts = make_contracts()
+        chain = OptionsChain.from_contracts("NVDA", contracts)
+        sweep = [
+            PCRParams(),
+            PCRParams(atm_zone_pct=0.05),
+            PCRParams(atm_zone_pct=0.30, min_premium=1.0, min_oi=1000),
+            PCRParams(min_oi=0, min_premium=0.0),
+        ]
+
+        results = chain.pcr(100.0, sweep)
+
+        assert [r.params for r in results] == sweep
+        for totals, params in zip(results, sweep, strict=True):
+            puts, calls, count = loop_pcr(contracts, 100.0, params)
+            assert totals.put_notional == pytest.approx(puts)
+            assert totals.call_notional == pytest.approx(calls)
+            assert totals.contracts_analyzed == count
+            assert totals.atm_zone_low == pytest.approx(100 * (1 - params.atm_zone_pct))
+
+    def test_by_expiry_sums_to_totals(self):
+        """Per-expiry aggregates partition the totals and match the loop."""
+        contracts = make_contracts()
+        chain = OptionsChain.from_contracts("NVDA", contracts)
+
+        (totals,) = chain.pcr(100.0, [PCRParams()], by_expiry=True)
+
+        assert set(totals.by_expiry) == {"2026-11-20", "2026-12-18"}
+        assert sum(p for p, _, _ in totals.by_expiry.values()) == pytest.approx(
+            totals.put_notional
+        )
+        assert sum(n for _, _, n in totals.by_expiry.values()) == (
+            totals.contracts_analyzed
+        )
+        november = [c for c in contracts if c.expiration.month == 11]
+        puts, calls, count = loop_pcr(november, 100.0, PCRParams())
+        assert totals.by_expiry["2026-11-20"] == (
+            pytest.approx(puts),
+            pytest.approx(calls),
+            count,
+        )
+
+    def test_empty_chain(self):
+        """An empty chain gives zero totals."""
+        chain = OptionsChain.from_contracts("NVDA", [])
+
+        (totals,) = chain.pcr(100.0, [PCRParams()], by_expiry=True)
+
+        assert len(chain) == 0
+        assert totals.contracts_analyzed == 0
+        assert totals.by_expiry == {}
+
+
+class TestOptionsChainSerialization:
+    """Test cache round trips."""
+
+    def test_columnar_round_trip(self):
+        """to_dict/from_cached keeps every contract, including missing deltas."""
+        contracts = make_contracts(20)
+        chain = OptionsChain.from_contracts("NVDA", contracts)
+
+        restored = OptionsChain.from_cached("NVDA", chain.to_dict())
+
+        assert restored.to_contracts() == contracts
+
+    def test_legacy_list_entry(self):
+        """Entries cached as a list of contract dicts are still readable."""
+        contracts = make_contracts(20)
+
+        restored = OptionsChain.from_cached("NVDA", [c.to_dict() for c in contracts])
+
+        assert restored.to_contracts() == contracts
+
+
+class TestPCRCacheKeys:
+    """Test parameter-specific PCR cache keys."""
+
+    def test_default_params_keep_legacy_key(self):
+        """Default parameters use the key cached entries already live under."""
+        suffix = DataManager._pcr_key_params(PCRParams(), by_expiry=False)
+
+        assert CacheKeys.pcr_symbol("nvda", suffix) == "market:pcr:NVDA"
+
+    def test_custom_params_and_expiry_get_own_key(self):
+        """Other parameters and the per-expiry breakdown are cached separately."""
+        params = PCRParams(atm_zone_pct=0.1, min_premium=0.5, min_oi=1000)
+
+        assert (
+            CacheKeys.pcr_symbol("NVDA", DataManager._pcr_key_params(params, False))
+            == "market:pcr:NVDA:0.1:0.5:1000"
+        )
+        assert (
+            CacheKeys.pcr_symbol("NVDA", DataManager._pcr_key_params(PCRParams(), True))
+            == "market:pcr:NVDA:0.15:0.5:500:expiry"
+        )
+
+
+class TestSymbolPCRSweep:
+    """Test DataManager.get_symbol_pcr_sweep."""
+
+    @pytest.fixture
+    def data_manager(self):
+        manager = DataManager(make_pod(FakeRedisServer()), AsyncMock())
+        manager.get_quote = AsyncMock(return_value=make_quote("NVDA"))
+        manager._fetch_options_chain = AsyncMock(
+            return_value=OptionsChain.from_contracts("NVDA", make_contracts())
+        )
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_sweep_fetches_chain_once(self, data_manager):
+        """All parameter sets are answered from one options fetch."""
+        sweep = [PCRParams(), PCRParams(atm_zone_pct=0.05), PCRParams(min_oi=10**6)]
+
+        results = await data_manager.get_symbol_pcr_sweep("nvda", sweep, by_expiry=True)
+
+        data_manager._fetch_options_chain.assert_awaited_once()
+        assert isinstance(results[0], SymbolPCRData)
+        assert results[1].atm_zone_pct == 0.05
+        assert results[2] is None  # No contract has that much open interest
+        assert {e.expiration for e in results[0].expiries} == {
+            "2026-11-20",
+            "2026-12-18",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_symbol_pcr_matches_sweep(self, data_manager):
+        """Single-set lookups agree with the sweep."""
+        params = PCRParams(atm_zone_pct=0.2, min_premium=1.0, min_oi=800)
+
+        single = await data_manager.get_symbol_pcr("NVDA", 0.2, 1.0, 800)
+        (swept,) = await data_manager.get_symbol_pcr_sweep("NVDA", [params])
+
+        assert single is not None and swept is not None
+        assert single.pcr == swept.pcr
+        assert single.contracts_analyzed == swept.contracts_analyzed
+        assert single.expiries == []
+
+
+class TestSymbolsPCRBatch:
+    """Test DataManager.get_symbols_pcr."""
+
+    @pytest.fixture
+    def data_manager(self):
+        manager = DataManager(make_pod(FakeRedisServer()), AsyncMock())
+        manager.get_quotes = AsyncMock(
+            side_effect=lambda symbols: {
+                s: make_quote(s) for s in symbols if s != "NOQUOTE"
+            }
+        )
+
+        async def fetch_chain(symbol: str) -> OptionsChain:
+            if symbol == "BROKEN":
+                raise DataFetchError("timeout", "alpha_vantage")
+            return OptionsChain.from_contracts(symbol, make_contracts())
+
+        manager._fetch_options_chain = AsyncMock(side_effect=fetch_chain)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_partial_results_with_errors(self, data_manager):
+        """Good symbols get PCR; the rest report why, in request order."""
+        result = await data_manager.get_symbols_pcr(
+            ["nvda", "NOQUOTE", "BROKEN", "NVDA", "AMD"]
+        )
+
+        assert list(result.data) == ["NVDA", "AMD"]
+        assert result.get("amd").symbol == "AMD"
+        assert result.errors["NOQUOTE"] == "quote unavailable"
+        assert "timeout" in result.errors["BROKEN"]
+        # One quote batch and one chain fetch per distinct symbol
+        data_manager.get_quotes.assert_awaited_once_with(
+            ["NVDA", "NOQUOTE", "BROKEN", "AMD"]
+        )
+        assert data_manager._fetch_options_chain.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_uses_per_symbol_pcr_cache(self, data_manager):
+        """Cached symbols are not recalculated; entries match get_symbol_pcr."""
+        first = await data_manager.get_symbols_pcr(["NVDA", "AMD"])
+        data_manager.get_quotes.reset_mock()
+
+        again = await data_manager.get_symbols_pcr(["NVDA", "AMD"])
+        single = await data_manager.get_symbol_pcr("NVDA")
+
+        data_manager.get_quotes.assert_not_called()
+        assert again.data["NVDA"].pcr == first.data["NVDA"].pcr
+        assert single is not None and single.pcr == first.data["NVDA"].pcr
+
+    @pytest.mark.asyncio
+    async def test_bounds_chain_fetches(self, data_manager):
+        """No more than max_concurrency options chains load at once."""
+        in_flight = peak = 0
+
+        async def slow_chain(symbol: str) -> OptionsChain:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OptionsChain.from_contracts(symbol, make_contracts(50))
+
+        data_manager._fetch_options_chain = AsyncMock(side_effect=slow_chain)
+
+        result = await data_manager.get_symbols_pcr(
+            [f"S{i}" for i in range(10)], max_concurrency=3
+        )
+
+        assert len(result.data) + len(result.errors) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chain_loads_are_shared(self, data_manager):
+        """Concurrent callers asking for the same chain share one fetch."""
+        chains = await asyncio.gather(
+            *(data_manager.get_options_chain("nvda") for _ in range(5))
+        )
+
+        data_manager._fetch_options_chain.assert_awaited_once()
+        assert all(len(chain) == 400 for chain in chains)
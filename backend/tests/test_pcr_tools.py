@@ -2,6 +2,7 @@
 
 Tests cover:
 - get_put_call_ratio tool success cases
+- get_put_call_ratios (watchlist) tool
 - Error handling (None result, exceptions)
 - Output formatting (_format_pcr_output)
 - Sentiment emoji selection based on PCR value
@@ -12,8 +13,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.agent.tools.pcr_tools import _format_pcr_output, create_pcr_tools
-from src.services.data_manager import SymbolPCRData
+from src.agent.tools.pcr_tools import (
+    MAX_WATCHLIST_SYMBOLS,
+    _format_pcr_output,
+    create_pcr_tools,
+)
+from src.services.data_manager import BatchPCRResult, SymbolPCRData
 
 
 @pytest.fixture
@@ -122,6 +127,77 @@ class TestGetPutCallRatioTool:
         assert "NVDA" in result
 
 
+class TestGetPutCallRatiosTool:
+    """Tests for get_put_call_ratios (watchlist) tool."""
+
+    @pytest.mark.asyncio
+    async def test_watchlist_in_one_call(
+        self,
+        mock_data_manager: MagicMock,
+        sample_pcr_data: SymbolPCRData,
+        sample_pcr_bearish: SymbolPCRData,
+    ) -> None:
+        """One batched lookup; partial results list the missing symbols."""
+        mock_data_manager.get_symbols_pcr = AsyncMock(
+            return_value=BatchPCRResult(
+                data={"NVDA": sample_pcr_data, "AAPL": sample_pcr_bearish},
+                errors={"XYZ": "options failed: empty"},
+            )
+        )
+        tools = create_pcr_tools(mock_data_manager)
+
+        result = await tools[1].ainvoke({"symbols": ["nvda", "AAPL", "NVDA", "xyz"]})
+
+        mock_data_manager.get_symbols_pcr.assert_awaited_once_with(
+            ["NVDA", "AAPL", "XYZ"]
+        )
+        assert "(2 of 3 symbols)" in result
+        assert "| **NVDA** | $142.50 |" in result
+        assert "1.46" in result
+        # (25.50 + 35.80) / (42.30 + 24.50)
+        assert "Combined PCR: 0.92" in result
+        assert "XYZ: options failed: empty" in result
+
+    @pytest.mark.asyncio
+    async def test_no_symbol_has_data(self, mock_data_manager: MagicMock) -> None:
+        """Every symbol failing gives the reasons instead of a table."""
+        mock_data_manager.get_symbols_pcr = AsyncMock(
+            return_value=BatchPCRResult(errors={"XYZ": "quote unavailable"})
+        )
+        tools = create_pcr_tools(mock_data_manager)
+
+        result = await tools[1].ainvoke({"symbols": ["XYZ"]})
+
+        assert "Unable to calculate" in result
+        assert "XYZ: quote unavailable" in result
+
+    @pytest.mark.asyncio
+    async def test_rejects_too_many_symbols(self, mock_data_manager: MagicMock) -> None:
+        """Oversized watchlists are refused before fetching anything."""
+        mock_data_manager.get_symbols_pcr = AsyncMock()
+        tools = create_pcr_tools(mock_data_manager)
+
+        result = await tools[1].ainvoke(
+            {"symbols": [f"S{i}" for i in range(MAX_WATCHLIST_SYMBOLS + 1)]}
+        )
+
+        assert "Too many symbols" in result
+        mock_data_manager.get_symbols_pcr.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handles_exception(self, mock_data_manager: MagicMock) -> None:
+        """Errors from the batch lookup are reported, not raised."""
+        mock_data_manager.get_symbols_pcr = AsyncMock(
+            side_effect=Exception("API timeout")
+        )
+        tools = create_pcr_tools(mock_data_manager)
+
+        result = await tools[1].ainvoke({"symbols": ["NVDA"]})
+
+        assert "Error calculating" in result
+        assert "API timeout" in result
+
+
 class TestFormatPCROutput:
     """Tests for _format_pcr_output helper function."""
 
@@ -250,9 +326,10 @@ class TestToolMetadata:
     """Tests for tool metadata and configuration."""
 
     def test_tools_count(self, mock_data_manager: MagicMock) -> None:
-        """Test that exactly 1 tool is created."""
+        """Test that the single-symbol and watchlist tools are created."""
         tools = create_pcr_tools(mock_data_manager)
-        assert len(tools) == 1
+        assert len(tools) == 2
+        assert tools[1].name == "get_put_call_ratios"
 
     def test_tool_name(self, mock_data_manager: MagicMock) -> None:
         """Test tool name is correct."""
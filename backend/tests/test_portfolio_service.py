@@ -4,7 +4,7 @@ Unit tests for PortfolioService.
 Tests portfolio management with holdings CRUD and real-time pricing.
 """
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timezone
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -25,6 +25,7 @@ def mock_holding_repo():
     repo.create = AsyncMock()
     repo.update = AsyncMock()
     repo.update_price = AsyncMock()
+    repo.update_prices_batch = AsyncMock(return_value=[])
     repo.list_by_user = AsyncMock()
     repo.delete = AsyncMock()
     return repo
@@ -35,6 +36,8 @@ def mock_ticker_service():
     """Mock TickerDataService"""
     service = Mock()
     service.get_current_price = AsyncMock()
+    # Batch lookup misses everything, so tests drive get_current_price
+    service.get_current_prices = AsyncMock(side_effect=dict.fromkeys)
     return service
 
 
@@ -223,7 +226,7 @@ class TestGetUserHoldingsWithPrices:
         """Test successful retrieval of holdings with prices"""
         mock_holding_repo.list_by_user.return_value = [sample_holding]
         mock_ticker_service.get_current_price.return_value = 180.0
-        mock_holding_repo.update_price.return_value = sample_holding
+        mock_holding_repo.update_prices_batch.return_value = [sample_holding]
 
         result = await portfolio_service.get_user_holdings_with_prices("user_456")
 
@@ -267,7 +270,109 @@ class TestGetUserHoldingsWithPrices:
 
         assert len(result) == 1
         # Original holding returned (price update skipped)
-        mock_holding_repo.update_price.assert_not_called()
+        mock_holding_repo.update_prices_batch.assert_not_called()
+
+
+class BatchTickerService:
+    """Ticker service stand-in with the multi-symbol price lookup."""
+
+    def __init__(self, prices, batch_misses=()):
+        self.prices = prices
+        self.batch_misses = set(batch_misses)
+        self.batch_calls = []
+        self.single_calls = []
+
+    async def get_current_prices(self, symbols):
+        self.batch_calls.append(list(symbols))
+        return {
+            s: None if s in self.batch_misses else self.prices.get(s) for s in symbols
+        }
+
+    async def get_current_price(self, symbol):
+        self.single_calls.append(symbol)
+        return self.prices.get(symbol)
+
+
+class BatchHoldingRepo:
+    """Holding repository stand-in with the bulk price update."""
+
+    def __init__(self, holdings):
+        self.holdings = holdings
+        self.batches = []
+
+    async def list_by_user(self, user_id):
+        return self.holdings
+
+    async def update_prices_batch(self, updates):
+        self.batches.append(updates)
+        return [
+            h.model_copy(update={"current_price": p, "market_value": h.quantity * p})
+            for h, p in updates
+        ]
+
+
+def make_holding(symbol: str) -> Holding:
+    return Holding(
+        holding_id=f"hold_{symbol}",
+        user_id="user_456",
+        symbol=symbol,
+        quantity=10.0,
+        avg_price=100.0,
+        cost_basis=1000.0,
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+class TestBatchedPriceRefresh:
+    """Test the batched price refresh path"""
+
+    @pytest.mark.asyncio
+    async def test_one_price_request_and_one_bulk_write(self, mock_settings):
+        """All symbols priced together and written in one batch"""
+        holdings = [make_holding(s) for s in ["AAPL", "MSFT", "NVDA"]]
+        ticker = BatchTickerService({"AAPL": 200.0, "MSFT": 0.0})
+        repo = BatchHoldingRepo(holdings)
+        service = PortfolioService(repo, ticker, mock_settings)
+
+        result = await service.get_user_holdings_with_prices("user_456")
+
+        assert ticker.batch_calls == [["AAPL", "MSFT", "NVDA"]]
+        assert ticker.single_calls == ["NVDA"]
+        assert len(repo.batches) == 1
+        assert [(h.symbol, p) for h, p in repo.batches[0]] == [("AAPL", 200.0)]
+        # Order preserved; unpriced holdings returned unchanged
+        assert [h.symbol for h in result] == ["AAPL", "MSFT", "NVDA"]
+        assert result[0].market_value == 2000.0
+        assert result[1] is holdings[1]
+
+    @pytest.mark.asyncio
+    async def test_batch_misses_fall_back_per_symbol(self, mock_settings):
+        """Symbols the batch lookup couldn't price are retried one at a time"""
+        holdings = [make_holding(s) for s in ["AAPL", "MSFT"]]
+        ticker = BatchTickerService(
+            {"AAPL": 200.0, "MSFT": 300.0}, batch_misses={"MSFT"}
+        )
+        service = PortfolioService(BatchHoldingRepo(holdings), ticker, mock_settings)
+
+        result = await service.get_user_holdings_with_prices("user_456")
+
+        assert ticker.single_calls == ["MSFT"]
+        assert [h.current_price for h in result] == [200.0, 300.0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_failure_keeps_holdings(self, mock_settings):
+        """Holdings are still returned if the bulk update fails"""
+        holdings = [make_holding("AAPL")]
+        repo = BatchHoldingRepo(holdings)
+        repo.update_prices_batch = AsyncMock(side_effect=Exception("DB down"))
+        service = PortfolioService(
+            repo, BatchTickerService({"AAPL": 200.0}), mock_settings
+        )
+
+        result = await service.get_user_holdings_with_prices("user_456")
+
+        assert result == holdings
 
 
 # ===== get_portfolio_summary Tests =====
@@ -283,7 +388,7 @@ class TestGetPortfolioSummary:
         """Test successful portfolio summary calculation"""
         mock_holding_repo.list_by_user.return_value = [sample_holding]
         mock_ticker_service.get_current_price.return_value = 175.0
-        mock_holding_repo.update_price.return_value = sample_holding
+        mock_holding_repo.update_prices_batch.return_value = [sample_holding]
 
         result = await portfolio_service.get_portfolio_summary("user_456")
 
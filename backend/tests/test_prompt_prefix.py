@@ -0,0 +1,216 @@
+"""
+Tests for the ReAct agent's stable prompt prefix.
+
+Tests cover:
+- System message rendered once per day and reused across steps and runs
+- Static-first message order seen by the model
+- Tool schemas bound once and shared by agents with the same content hash
+- Cached input tokens reported in the agent result
+"""
+
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.agent.prompt_prefix import get_prompt_prefix
+from src.core.config import Settings
+
+
+@tool
+def get_quote(symbol: str) -> str:
+    """Get the latest quote for a symbol."""
+    return f"{symbol}: $100.00"
+
+
+@tool
+def get_news(symbol: str) -> str:
+    """Get recent news for a symbol."""
+    return f"{symbol}: no news"
+
+
+class RecordingModel(BaseChatModel):
+    """Fake model: records each step's input; one tool call, then an answer."""
+
+    calls: list[list[BaseMessage]] = []
+    bound_tools: list[Any] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "RecordingModel":
+        self.bound_tools.append(tools)
+        return self
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls.append(messages)
+        if messages[-1].type == "human":
+            call = {"name": "get_historical_prices", "args": {"symbol": "AAPL"}}
+            message = AIMessage(
+                content="",
+                tool_calls=[{**call, "id": "call_1"}],
+                usage_metadata={
+                    "input_tokens": 6000,
+                    "output_tokens": 20,
+                    "total_tokens": 6020,
+                    "input_token_details": {"cache_read": 0},
+                },
+            )
+        else:
+            message = AIMessage(
+                content="AAPL is flat.",
+                usage_metadata={
+                    "input_tokens": 6100,
+                    "output_tokens": 40,
+                    "total_tokens": 6140,
+                    "input_token_details": {"cache_read": 5980},
+                },
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def make_agent(model: BaseChatModel) -> FinancialAnalysisReActAgent:
+    settings = Settings(
+        dashscope_api_key="test",
+        langfuse_public_key="",
+        langfuse_secret_key="",
+        fred_api_key="",
+    )
+    return FinancialAnalysisReActAgent(
+        settings,
+        ticker_data_service=MagicMock(),
+        market_service=MagicMock(),
+        llm=model,
+    )
+
+
+class TestPromptPrefix:
+    """Test PromptPrefix rendering and sharing."""
+
+    def test_system_message_rendered_once_per_day(self):
+        """The same SystemMessage is returned until the date changes."""
+        prefix = get_prompt_prefix([get_quote], template="Today is {current_date}.")
+
+        first = prefix.system_message(date(2026, 10, 16))
+        again = prefix.system_message(date(2026, 10, 16))
+        next_day = prefix.system_message(date(2026, 10, 17))
+
+        assert first is again
+        assert first.content == "Today is 2026-10-16."
+        assert next_day.content == "Today is 2026-10-17."
+        assert prefix.renders == 2
+
+    def test_six_months_ago_in_template(self):
+        """The template also gets the start of the 6-month window."""
+        prefix = get_prompt_prefix(
+            [get_quote], template="{six_months_ago} to {current_date}"
+        )
+
+        message = prefix.system_message(date(2026, 10, 16))
+
+        assert message.content == "2026-04-19 to 2026-10-16"
+
+    def test_prompt_puts_system_message_first(self):
+        """As a LangGraph prompt it returns the system message, then the state."""
+        prefix = get_prompt_prefix([get_quote], template="Today is {current_date}.")
+        conversation = [AIMessage(content="earlier answer")]
+
+        messages = prefix({"messages": conversation})
+
+        assert isinstance(messages[0], SystemMessage)
+        assert messages[1:] == conversation
+
+    def test_identical_content_shares_prefix(self):
+        """Same tools and template share one prefix; any change gets a new one."""
+        template = "Today is {current_date}."
+        first = get_prompt_prefix([get_quote, get_news], template=template)
+        second = get_prompt_prefix([get_quote, get_news], template=template)
+        reordered = get_prompt_prefix([get_news, get_quote], template=template)
+        other_template = get_prompt_prefix([get_quote, get_news], template="v2")
+
+        assert first is second
+        assert first.content_hash != reordered.content_hash
+        assert first.content_hash != other_template.content_hash
+        assert [s["function"]["name"] for s in first.tool_schemas] == [
+            "get_quote",
+            "get_news",
+        ]
+
+
+class TestAgentPromptPrefix:
+    """Test the agent sending the prefix on every step."""
+
+    @pytest.mark.asyncio
+    async def test_model_sees_system_prompt_then_conversation(self):
+        """Every step gets the same system message followed by the messages."""
+        model = RecordingModel(calls=[], bound_tools=[])
+        agent = make_agent(model)
+
+        result = await agent.ainvoke(
+            "How is AAPL?",
+            conversation_history=[
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello!"},
+            ],
+        )
+
+        assert len(model.calls) == 2
+        first_step, second_step = model.calls
+        assert [m.type for m in first_step] == ["system", "human", "ai", "human"]
+        assert first_step[0] is second_step[0]
+        assert first_step[0].content.startswith("You are a senior financial analyst")
+        assert date.today().isoformat() in first_step[0].content
+        assert first_step[-1].content.startswith("How is AAPL?")
+        # Step 2 extends step 1's input, so the whole of it is a cacheable prefix
+        assert second_step[: len(first_step)] == first_step
+        assert [m.type for m in second_step[len(first_step) :]] == ["ai", "tool"]
+        assert result["final_answer"] == "AAPL is flat."
+
+    @pytest.mark.asyncio
+    async def test_runs_reuse_system_message(self):
+        """Separate runs and agents send the identical system message."""
+        model = RecordingModel(calls=[], bound_tools=[])
+        first_agent, second_agent = make_agent(model), make_agent(model)
+
+        await first_agent.ainvoke("How is AAPL?")
+        await second_agent.ainvoke("How is MSFT?", language="zh-CN")
+
+        assert first_agent.prompt_prefix is second_agent.prompt_prefix
+        system_messages = {id(call[0]) for call in model.calls}
+        assert len(system_messages) == 1
+
+    def test_model_bound_with_prefix_schemas(self):
+        """The model is bound with the prefix's precomputed tool schemas."""
+        model = RecordingModel(calls=[], bound_tools=[])
+
+        agent = make_agent(model)
+
+        assert model.bound_tools[0] is agent.prompt_prefix.tool_schemas
+        assert [s["function"]["name"] for s in model.bound_tools[0]] == [
+            t.name for t in agent.tools
+        ]
+
+    @pytest.mark.asyncio
+    async def test_result_reports_cached_input_tokens(self):
+        """Prefix cache hits reported by the provider reach the agent result."""
+        model = RecordingModel(calls=[], bound_tools=[])
+        agent = make_agent(model)
+
+        result = await agent.ainvoke("How is AAPL?")
+
+        assert result["input_tokens"] == 12100
+        assert result["cached_input_tokens"] == 5980
+        assert result["total_tokens"] == 12160
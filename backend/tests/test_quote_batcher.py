@@ -0,0 +1,244 @@
+"""
+Unit tests for quote batching in the Data Manager Layer.
+
+Covers QuoteBatcher coalescing and DataManager.get_quote/get_quotes using
+REALTIME_BULK_QUOTES with a per-symbol fallback.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.services.data_manager import CacheKeys, DataManager, QuoteBatcher
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+
+def _quote(symbol: str, price: float = 100.0) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "price": price,
+        "volume": 1000,
+        "latest_trading_day": "2025-01-10",
+        "previous_close": price - 1,
+        "change": 1.0,
+        "change_percent": "1.0",
+        "open": price - 1,
+        "high": price + 1,
+        "low": price - 2,
+    }
+
+
+class BulkQuoteService:
+    """Alpha Vantage stand-in that records bulk and single quote calls."""
+
+    def __init__(self, bulk_enabled: bool = True, throttled_calls: int = 0):
+        self.bulk_enabled = bulk_enabled
+        self.throttled_calls = throttled_calls
+        self.bulk_calls: list[list[str]] = []
+        self.single_calls: list[str] = []
+
+    async def get_bulk_quotes(self, symbols: list[str]):
+        self.bulk_calls.append(list(symbols))
+        if not self.bulk_enabled:
+            return None
+        if self.throttled_calls:
+            # AlphaVantageService raises on throttle notices
+            self.throttled_calls -= 1
+            raise ValueError("Alpha Vantage rate limit: {'Note': '...'}")
+        # Vendor silently drops unknown symbols
+        return {s: _quote(s) for s in symbols if s != "UNKNOWN"}
+
+    async def get_quote(self, symbol: str):
+        self.single_calls.append(symbol)
+        if symbol == "UNKNOWN":
+            raise ValueError(f"No quote data for symbol: {symbol}")
+        return _quote(symbol)
+
+
+class TestQuoteBatcher:
+    """Test QuoteBatcher coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_fetch(self):
+        """Loads within the window are fetched in one call."""
+        fetch_many = AsyncMock(
+            side_effect=lambda symbols: {s: s.lower() for s in symbols}
+        )
+        batcher = QuoteBatcher(fetch_many, window_seconds=0.01)
+
+        results = await asyncio.gather(*(batcher.load(s) for s in ["A", "B", "C"]))
+
+        assert results == ["a", "b", "c"]
+        fetch_many.assert_awaited_once_with(["A", "B", "C"])
+        assert batcher.stats.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_symbols_are_joined(self):
+        """A symbol already pending is not requested twice."""
+        fetch_many = AsyncMock(side_effect=lambda symbols: dict.fromkeys(symbols, 1))
+        batcher = QuoteBatcher(fetch_many, window_seconds=0.01)
+
+        await asyncio.gather(batcher.load("A"), batcher.load_many(["A", "B"]))
+
+        fetch_many.assert_awaited_once_with(["A", "B"])
+        assert batcher.stats.joined == 1
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_immediately(self):
+        """Full batches flush without waiting for the window."""
+        fetch_many = AsyncMock(side_effect=lambda symbols: dict.fromkeys(symbols, 1))
+        batcher = QuoteBatcher(fetch_many, window_seconds=10, max_batch=2)
+
+        result = await asyncio.wait_for(batcher.load_many(["A", "B", "C", "D"]), 1)
+
+        assert set(result) == {"A", "B", "C", "D"}
+        assert fetch_many.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_symbol_resolves_none(self):
+        """Symbols the upstream leaves out resolve to None."""
+        batcher = QuoteBatcher(AsyncMock(return_value={"A": 1}), window_seconds=0)
+
+        assert await batcher.load_many(["A", "B"]) == {"A": 1}
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_waiters(self):
+        """A failed batch raises in every caller and is counted."""
+        batcher = QuoteBatcher(
+            AsyncMock(side_effect=RuntimeError("boom")), window_seconds=0.01
+        )
+
+        results = await asyncio.gather(
+            batcher.load("A"), batcher.load("B"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert batcher.stats.failures == 1
+
+
+class TestDataManagerQuotes:
+    """Test batched quote access through DataManager."""
+
+    @pytest.fixture
+    def av_service(self):
+        return BulkQuoteService()
+
+    @pytest.fixture
+    def server(self):
+        return FakeRedisServer()
+
+    @pytest.fixture
+    def redis(self, server):
+        return make_pod(server)
+
+    @pytest.fixture
+    def data_manager(self, redis, av_service):
+        return DataManager(redis, av_service)
+
+    @pytest.mark.asyncio
+    async def test_get_quotes_uses_one_bulk_request(
+        self, data_manager, av_service, server
+    ):
+        """All misses are fetched in one bulk call and cached per symbol."""
+        quotes = await data_manager.get_quotes(["nvda", "AMD", "NVDA"])
+
+        assert set(quotes) == {"NVDA", "AMD"}
+        assert av_service.bulk_calls == [["NVDA", "AMD"]]
+        assert av_service.single_calls == []
+        assert CacheKeys.quote("NVDA") in server.data
+        assert CacheKeys.quote("AMD") in server.data
+
+    @pytest.mark.asyncio
+    async def test_get_quotes_only_fetches_misses(self, data_manager, av_service):
+        """Cached symbols are not requested again."""
+        await data_manager.get_quote("NVDA")
+        av_service.bulk_calls.clear()
+
+        quotes = await data_manager.get_quotes(["NVDA", "AMD"])
+
+        assert set(quotes) == {"NVDA", "AMD"}
+        assert av_service.bulk_calls == [["AMD"]]
+
+    @pytest.mark.asyncio
+    async def test_get_quotes_chunks_to_vendor_limit(self, data_manager, av_service):
+        """Large requests are split into QUOTE_BATCH_SIZE chunks."""
+        symbols = [f"S{i}" for i in range(DataManager.QUOTE_BATCH_SIZE + 5)]
+
+        quotes = await data_manager.get_quotes(symbols)
+
+        assert len(quotes) == len(symbols)
+        assert [len(c) for c in av_service.bulk_calls] == [
+            DataManager.QUOTE_BATCH_SIZE,
+            5,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_quote_calls_are_merged(
+        self, data_manager, av_service
+    ):
+        """Single-symbol callers in the same window share one bulk request."""
+        quotes = await asyncio.gather(
+            *(data_manager.get_quote(s) for s in ["NVDA", "AMD", "TSM"])
+        )
+
+        assert [q.symbol for q in quotes] == ["NVDA", "AMD", "TSM"]
+        assert len(av_service.bulk_calls) == 1
+        assert sorted(av_service.bulk_calls[0]) == ["AMD", "NVDA", "TSM"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_quotes_when_not_entitled(self, redis):
+        """Non-premium keys fall back to GLOBAL_QUOTE and stop trying bulk."""
+        av_service = BulkQuoteService(bulk_enabled=False)
+        data_manager = DataManager(redis, av_service)
+
+        quotes = await data_manager.get_quotes(["NVDA", "AMD"])
+        await data_manager.get_quotes(["TSM"])
+
+        assert set(quotes) == {"NVDA", "AMD"}
+        assert len(av_service.bulk_calls) == 1
+        assert sorted(av_service.single_calls) == ["AMD", "NVDA", "TSM"]
+
+    @pytest.mark.asyncio
+    async def test_throttle_keeps_bulk_quotes_enabled(self, redis):
+        """A throttled bulk call falls back once; later batches use bulk again."""
+        av_service = BulkQuoteService(throttled_calls=1)
+        data_manager = DataManager(redis, av_service)
+
+        quotes = await data_manager.get_quotes(["NVDA", "AMD"])
+        await data_manager.get_quotes(["TSM"])
+
+        assert set(quotes) == {"NVDA", "AMD"}
+        assert data_manager._bulk_quotes_enabled
+        assert av_service.bulk_calls == [["NVDA", "AMD"], ["TSM"]]
+        assert sorted(av_service.single_calls) == ["AMD", "NVDA"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_is_omitted(self, data_manager, av_service):
+        """Symbols nobody returns are left out of get_quotes."""
+        quotes = await data_manager.get_quotes(["NVDA", "UNKNOWN"])
+
+        assert set(quotes) == {"NVDA"}
+        assert av_service.single_calls == ["UNKNOWN"]
+
+    @pytest.mark.asyncio
+    async def test_get_quote_unknown_symbol_raises(self, data_manager):
+        """A single unknown symbol still raises DataFetchError."""
+        from src.services.data_manager import DataFetchError
+
+        with pytest.raises(DataFetchError):
+            await data_manager.get_quote("UNKNOWN")
+
+    @pytest.mark.asyncio
+    async def test_prefetch_shared_includes_quotes(self, data_manager, av_service):
+        """prefetch_shared fills context.quotes from one batch."""
+        data_manager.get_ohlcv = AsyncMock(return_value=[])
+
+        context = await data_manager.prefetch_shared(
+            symbols=["NVDA", "AMD"], include_quotes=True
+        )
+
+        assert context.get_quote("nvda") is not None
+        assert context.get_quote("AMD") is not None
+        assert len(av_service.bulk_calls) == 1
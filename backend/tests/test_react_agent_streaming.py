@@ -0,0 +1,268 @@
+"""Tests for token streaming from the ReAct agent to SSE.
+
+Tests cover:
+- FinancialAnalysisReActAgent.astream token and result events
+- stream_with_react_agent forwarding tokens interleaved with tool events
+- Title marker held back from the stream but used for the chat title
+"""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.agent.langgraph_react_agent import FinancialAnalysisReActAgent
+from src.api.chat.streaming.react_agent import stream_with_react_agent
+from src.api.schemas.chat_models import ChatRequest
+from src.core.config import Settings
+
+ANSWER = "AAPL closed near its monthly high; momentum is positive."
+TITLE_SUFFIX = "\n[chat_title: AAPL Momentum]"
+
+
+class ScriptedStreamingChatModel(BaseChatModel):
+    """Chat model that streams scripted turns token by token."""
+
+    turns: list[AIMessage]
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-streaming"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "ScriptedStreamingChatModel":
+        return self
+
+    def _chunks(self) -> list[AIMessageChunk]:
+        turn = self.turns[self.calls]
+        self.calls += 1
+        usage = {"token_usage": {"input_tokens": 100, "output_tokens": 20}}
+        chunks = [
+            AIMessageChunk(content=token)
+            for token in turn.content.split(" ")
+            for token in (token, " ")
+        ][:-1]
+        if turn.tool_calls:
+            chunks.append(
+                AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": call["name"],
+                            "args": json.dumps(call["args"]),
+                            "id": call["id"],
+                            "index": i,
+                        }
+                        for i, call in enumerate(turn.tool_calls)
+                    ],
+                )
+            )
+        chunks[-1].response_metadata = usage
+        return chunks
+
+    def _generate(
+        self, messages: list[BaseMessage], stop: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        message = self.turns[self.calls]
+        self.calls += 1
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: Any = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ):
+        for chunk in self._chunks():
+            generation = ChatGenerationChunk(message=chunk)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=generation)
+            yield generation
+
+
+def tool_turn(content: str = "") -> AIMessage:
+    return AIMessage(
+        content=content,
+        tool_calls=[
+            {"name": "get_historical_prices", "args": {"symbol": "AAPL"}, "id": "c1"}
+        ],
+    )
+
+
+def make_agent(turns: list[AIMessage]) -> FinancialAnalysisReActAgent:
+    settings = Settings(
+        dashscope_api_key="test",
+        langfuse_public_key="",
+        langfuse_secret_key="",
+        fred_api_key="",
+        bar_store_enabled=False,
+    )
+    market_service = MagicMock()
+    market_service.get_daily_bars = AsyncMock(return_value=pd.DataFrame())
+    return FinancialAnalysisReActAgent(
+        settings,
+        ticker_data_service=MagicMock(),
+        market_service=market_service,
+        llm=ScriptedStreamingChatModel(turns=turns),
+    )
+
+
+class TestAgentAstream:
+    """Test FinancialAnalysisReActAgent.astream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_tokens_then_result(self):
+        """Answer tokens stream one by one, then the ainvoke-shaped result."""
+        agent = make_agent([tool_turn(), AIMessage(content=ANSWER)])
+
+        events = [e async for e in agent.astream("How is AAPL doing?")]
+
+        tokens = [e["content"] for e in events if e["type"] == "token"]
+        result = events[-1]["result"]
+        assert events[-1]["type"] == "result"
+        assert len(tokens) == len(ANSWER.split(" ")) * 2 - 1
+        assert "".join(tokens) == ANSWER == result["final_answer"]
+        assert result["tool_executions"] == 1
+        assert result["input_tokens"] == 200
+        assert "error" not in result
+
+    @pytest.mark.asyncio
+    async def test_separates_model_turns(self):
+        """Text before a tool call and the answer are kept apart."""
+        agent = make_agent([tool_turn("Checking prices."), AIMessage(content=ANSWER)])
+
+        events = [e async for e in agent.astream("How is AAPL doing?")]
+
+        text = "".join(e["content"] for e in events if e["type"] == "token")
+        assert text == f"Checking prices.\n\n{ANSWER}"
+        assert events[-1]["result"]["final_answer"] == ANSWER
+
+    @pytest.mark.asyncio
+    async def test_model_error_ends_with_error_result(self):
+        """A failing model yields an error result instead of raising."""
+        agent = make_agent([])  # No scripted turns: the model raises
+
+        events = [e async for e in agent.astream("How is AAPL doing?")]
+
+        assert [e["type"] for e in events] == ["result"]
+        assert "error" in events[0]["result"]
+
+
+def parse_sse(body: list[str]) -> list[dict[str, Any]]:
+    return [json.loads(chunk.removeprefix("data: ")) for chunk in body]
+
+
+def client_text(events: list[dict[str, Any]]) -> str:
+    """Answer text as a client renders it: chunks, replaced by an answer event."""
+    text = ""
+    for event in events:
+        if event["type"] == "chunk":
+            text += event["content"]
+        elif event["type"] == "answer":
+            text = event["content"]
+    return text
+
+
+@pytest.fixture
+def services() -> dict[str, Any]:
+    chat_service = MagicMock()
+    chat_service.create_chat = AsyncMock(return_value=MagicMock(chat_id="chat-1"))
+    chat_service.add_message = AsyncMock(return_value=MagicMock(message_id="msg-1"))
+    chat_service.get_chat_messages = AsyncMock(return_value=[])
+    chat_service.get_chat = AsyncMock(return_value=MagicMock(ui_state=None))
+    chat_service.update_title_if_new = AsyncMock()
+
+    credit_service = MagicMock()
+    credit_service.check_balance = AsyncMock(return_value=True)
+    credit_service.create_pending_transaction = AsyncMock(
+        return_value=MagicMock(transaction_id="txn-1")
+    )
+    credit_service.complete_transaction_with_deduction = AsyncMock(
+        return_value=(MagicMock(actual_cost=1.5), MagicMock(credits=98.5))
+    )
+    credit_service.fail_transaction = AsyncMock()
+
+    return {
+        "chat_service": chat_service,
+        "credit_service": credit_service,
+        "context_manager": MagicMock(),
+        "message_repo": MagicMock(),
+    }
+
+
+async def run_stream(agent, services) -> list[dict[str, Any]]:
+    response = await stream_with_react_agent(
+        request=ChatRequest(message="How is AAPL doing?"),
+        user_id="user-1",
+        agent=agent,
+        **services,
+    )
+    return parse_sse([chunk async for chunk in response.body_iterator])
+
+
+class TestStreamWithReactAgent:
+    """Test SSE streaming of agent tokens."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_streamed_after_tool_events(self, services):
+        """Tool events come first, then the answer as several chunks."""
+        agent = make_agent([tool_turn(), AIMessage(content=ANSWER + TITLE_SUFFIX)])
+
+        events = await run_stream(agent, services)
+
+        types = [e["type"] for e in events]
+        chunks = [e["content"] for e in events if e["type"] == "chunk"]
+        stages = [e.get("stage") for e in events if e["type"] == "latency"]
+        assert types.index("tool_start") < types.index("tool_end")
+        assert types.index("tool_end") < types.index("chunk")
+        assert len(chunks) > 1
+        assert "".join(chunks) == ANSWER
+        assert "answer" not in types
+        assert stages.index("first_tool") < stages.index("first_chunk")
+        assert types[-1] == "done"
+
+    @pytest.mark.asyncio
+    async def test_title_marker_not_streamed(self, services):
+        """The title marker is held back but still titles the chat."""
+        agent = make_agent([AIMessage(content=ANSWER + TITLE_SUFFIX)])
+
+        events = await run_stream(agent, services)
+
+        streamed = "".join(e["content"] for e in events if e["type"] == "chunk")
+        assert "chat_title" not in streamed
+        saved = services["chat_service"].add_message.await_args_list[-1].kwargs
+        assert saved["content"] == ANSWER
+        title_call = services["chat_service"].update_title_if_new.await_args.kwargs
+        assert title_call["llm_title"] == "AAPL Momentum"
+
+    @pytest.mark.asyncio
+    async def test_streamed_text_matches_saved_message(self, services):
+        """Text from tool-calling turns is replaced by the saved answer."""
+        agent = make_agent(
+            [tool_turn("Checking prices."), AIMessage(content=ANSWER + TITLE_SUFFIX)]
+        )
+
+        events = await run_stream(agent, services)
+
+        streamed = "".join(e["content"] for e in events if e["type"] == "chunk")
+        assert streamed == f"Checking prices.\n\n{ANSWER}"
+        saved = services["chat_service"].add_message.await_args_list[-1].kwargs
+        assert saved["content"] == ANSWER
+        assert client_text(events) == saved["content"]
+
+    @pytest.mark.asyncio
+    async def test_agent_error_fails_transaction(self, services):
+        """An agent failure reports an error event and releases credits."""
+        agent = make_agent([])
+
+        events = await run_stream(agent, services)
+
+        assert events[-1]["type"] == "error"
+        assert events[-1]["error_code"] == "AGENT_EXECUTION_FAILED"
+        services["credit_service"].fail_transaction.assert_awaited_once_with("txn-1")
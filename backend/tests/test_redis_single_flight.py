@@ -0,0 +1,309 @@
+"""
+Unit tests for RedisCache single-flight deduplication.
+Uses an in-memory Redis stand-in shared by several RedisCache "pods" that
+counts every command, so tests can assert coalescing and Redis traffic.
+"""
+
+import asyncio
+import fnmatch
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from src.database.redis import RedisCache
+
+
+class FakeRedisServer:
+    """Shared keyspace + pub/sub with a per-command counter."""
+
+    def __init__(self, latency: float = 0.0):
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.channels: dict[str, list[asyncio.Queue]] = {}
+        self.ops: Counter[str] = Counter()
+        self.reads: list[str] = []  # Keys read by GET, in order
+        self.published: list[tuple[str, str]] = []  # (channel, message)
+        self.latency = latency  # Seconds per round-trip
+
+    @property
+    def total_ops(self) -> int:
+        return sum(self.ops.values())
+
+    def client(self) -> "FakeRedisClient":
+        return FakeRedisClient(self)
+
+    def read(self, key: str) -> Any:
+        self.reads.append(key)
+        return self.data.get(key)
+
+    def pttl(self, key: str) -> int:
+        if key not in self.data:
+            return -2
+        ttl = self.ttls.get(key)
+        return -1 if ttl is None else ttl * 1000
+
+
+class FakeRedisClient:
+    """Subset of redis.asyncio.Redis used by RedisCache."""
+
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+
+    async def _round_trip(self, command: str) -> None:
+        self.server.ops[command] += 1
+        if self.server.latency:
+            await asyncio.sleep(self.server.latency)
+
+    async def get(self, key):
+        await self._round_trip("GET")
+        return self.server.read(key)
+
+    async def execute_command(self, command, key, **options):
+        await self._round_trip(command)
+        return self.server.read(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        await self._round_trip("SET")
+        if nx and key in self.server.data:
+            return None
+        self.server.data[key] = value
+        self.server.ttls[key] = ex
+        return True
+
+    async def delete(self, *keys):
+        await self._round_trip("DEL")
+        return sum(self.server.data.pop(key, None) is not None for key in keys)
+
+    async def exists(self, *keys):
+        await self._round_trip("EXISTS")
+        return sum(key in self.server.data for key in keys)
+
+    async def scan(self, cursor=0, match="*", count=100):
+        await self._round_trip("SCAN")
+        return 0, [k for k in self.server.data if fnmatch.fnmatchcase(k, match)]
+
+    async def publish(self, channel, message):
+        await self._round_trip("PUBLISH")
+        self.server.published.append((channel, message))
+        queues = self.server.channels.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "data": message})
+        return len(queues)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        server = self.server
+
+        async def compare_and_delete(keys, args):
+            server.ops["EVALSHA"] += 1
+            if server.data.get(keys[0]) == args[0]:
+                del server.data[keys[0]]
+                return 1
+            return 0
+
+        return compare_and_delete
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self.server)
+
+
+class FakePipeline:
+    """GET/PTTL pipeline sent in one round-trip."""
+
+    def __init__(self, client: FakeRedisClient):
+        self.client = client
+        self.commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def execute_command(self, command, key, **options):
+        self.commands.append((command, key))
+
+    def pttl(self, key):
+        self.commands.append(("PTTL", key))
+
+    async def execute(self):
+        server = self.client.server
+        await self.client._round_trip("PIPELINE")
+        results = []
+        for command, key in self.commands:
+            server.ops[command] += 1
+            results.append(server.read(key) if command == "GET" else server.pttl(key))
+        self.commands = []
+        return results
+
+
+class FakePubSub:
+    def __init__(self, server: FakeRedisServer):
+        self.server = server
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels: list[str] = []
+
+    async def subscribe(self, channel):
+        self.server.ops["SUBSCRIBE"] += 1
+        self.server.channels.setdefault(channel, []).append(self.queue)
+        self.channels.append(channel)
+
+    async def unsubscribe(self, channel):
+        self.server.ops["UNSUBSCRIBE"] += 1
+        self.server.channels[channel].remove(self.queue)
+        self.channels.remove(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        return None
+
+
+def make_pod(server: FakeRedisServer) -> RedisCache:
+    cache = RedisCache()
+    cache.client = server.client()
+    return cache
+
+
+def slow_fetch(value: Any, delay: float = 0.05):
+    calls = Counter()
+
+    async def fetch():
+        calls["fetch"] += 1
+        await asyncio.sleep(delay)
+        return value
+
+    return fetch, calls
+
+
+async def run_callers(
+    pods: list[RedisCache], callers_per_pod: int, fetch, key: str = "market:daily:X"
+) -> list[Any]:
+    return await asyncio.gather(
+        *(
+            pod.get_with_dedup(key, fetch, ttl_seconds=60, wait_timeout_seconds=2)
+            for pod in pods
+            for _ in range(callers_per_pod)
+        )
+    )
+
+
+class TestInProcessCoalescing:
+    """Same-pod callers share one flight."""
+
+    @pytest.mark.asyncio
+    async def test_200_callers_one_fetch_constant_redis_ops(self):
+        server = FakeRedisServer()
+        fetch, calls = slow_fetch({"v": 1})
+
+        results = await run_callers([make_pod(server)], 200, fetch)
+
+        assert results == [{"v": 1}] * 200
+        assert calls["fetch"] == 1
+        # GET, SET NX, GET (double-check), SET value, PUBLISH, EVALSHA
+        assert server.total_ops == 6
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_propagates_to_joined_callers(self):
+        server = FakeRedisServer()
+        pod = make_pod(server)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *(pod.get_with_dedup("k:x:y", failing) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert pod._single_flight.inflight == 0
+        assert "lock:k:x:y" not in server.data
+
+
+class TestCrossPod:
+    """Pods coordinate through the token lock and pub/sub."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_wake_on_publish(self):
+        server = FakeRedisServer()
+        pods = [make_pod(server) for _ in range(4)]
+        fetch, calls = slow_fetch({"v": 2}, delay=0.05)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await run_callers(pods, 50, fetch)
+        elapsed = loop.time() - start
+
+        assert results == [{"v": 2}] * 200
+        assert calls["fetch"] == 1
+        assert elapsed < 0.5  # Well under wait_timeout_seconds
+        assert server.total_ops <= 6 + 3 * 7
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_shared(self):
+        server = FakeRedisServer()
+        pods = [make_pod(server) for _ in range(3)]
+        fetch, calls = slow_fetch(None)
+
+        results = await run_callers(pods, 10, fetch)
+
+        assert results == [None] * 30
+        assert calls["fetch"] == 1
+
+    @pytest.mark.asyncio
+    async def test_holder_failure_lets_waiters_fetch(self):
+        server = FakeRedisServer()
+        holder, waiter = make_pod(server), make_pod(server)
+        started = asyncio.Event()
+
+        async def failing():
+            started.set()
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+
+        async def working():
+            return {"v": 3}
+
+        holder_task = asyncio.create_task(holder.get_with_dedup("k:x:y", failing))
+        await started.wait()
+        result = await waiter.get_with_dedup("k:x:y", working)
+
+        assert result == {"v": 3}
+        with pytest.raises(RuntimeError):
+            await holder_task
+
+
+class TestTokenLock:
+    """Only the owner can release a lock."""
+
+    @pytest.mark.asyncio
+    async def test_release_with_wrong_token_keeps_lock(self):
+        server = FakeRedisServer()
+        pod = make_pod(server)
+        assert await pod.acquire_lock("lock:a", token="owner")
+
+        assert not await pod.release_lock("lock:a", token="someone-else")
+        assert server.data["lock:a"] == "owner"
+        assert await pod.release_lock("lock:a", token="owner")
+        assert "lock:a" not in server.data
+
+    @pytest.mark.asyncio
+    async def test_release_without_token_is_unconditional(self):
+        server = FakeRedisServer()
+        pod = make_pod(server)
+        await pod.acquire_lock("lock:a")
+
+        assert await pod.release_lock("lock:a")
@@ -0,0 +1,214 @@
+"""
+Unit tests for stale-while-revalidate in CacheOperations.
+Covers soft/hard TTL handling, single background refresh per key (in-process
+and across pods), failure handling, metrics and DataManager integration.
+"""
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+from src.services.data_manager import (
+    CacheKeys,
+    CacheOperations,
+    DataManager,
+    LocalCache,
+)
+from src.services.data_manager.types import Granularity
+from tests.test_redis_single_flight import FakeRedisServer, make_pod
+
+KEY = CacheKeys.options("AAPL")
+TTL = 3600
+STALE = 600
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def counting_fetch(value, delay: float = 0.0):
+    calls: Counter[str] = Counter()
+
+    async def fetch():
+        calls["fetch"] += 1
+        await asyncio.sleep(delay)
+        return value
+
+    return fetch, calls
+
+
+async def seed(ops: CacheOperations, clock: FakeClock, value, age: float) -> None:
+    """Store a value as if it had been written `age` seconds ago."""
+    now = clock.now
+    clock.now = now - age
+    await ops.set(KEY, value, TTL, STALE)
+    clock.now = now
+
+
+class TestSoftAndHardTTL:
+    """Entries are fresh, stale-but-served, or expired by age."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_not_refreshed(self):
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(FakeRedisServer()), clock=clock)
+        await seed(ops, clock, [{"v": 1}], age=TTL - 1)
+        fetch, calls = counting_fetch([{"v": 2}])
+
+        entry = await ops.get_entry_with_fetch(KEY, fetch, TTL, STALE)
+
+        assert entry is not None
+        assert entry.value == [{"v": 1}]
+        assert not entry.stale
+        assert entry.age_seconds(clock.now) == TTL - 1
+        assert calls["fetch"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_one_refresh_runs(self):
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(FakeRedisServer()), clock=clock)
+        await seed(ops, clock, [{"v": 1}], age=TTL + 60)
+        release = asyncio.Event()
+        calls = 0
+
+        async def gated_fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [{"v": 2}]
+
+        # Returns while the refresh is still blocked upstream
+        entries = await asyncio.gather(
+            *(ops.get_entry_with_fetch(KEY, gated_fetch, TTL, STALE) for _ in range(20))
+        )
+
+        assert all(e is not None and e.stale for e in entries)
+        assert all(e.value == [{"v": 1}] for e in entries if e is not None)
+
+        release.set()
+        await ops.wait_for_refreshes()
+        assert calls == 1
+        entry = await ops.get_entry_with_fetch(KEY, gated_fetch, TTL, STALE)
+        assert entry is not None
+        assert entry.value == [{"v": 2}]
+        assert not entry.stale
+
+    @pytest.mark.asyncio
+    async def test_l1_copy_past_hard_ttl_is_refetched(self):
+        server = FakeRedisServer()
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(server), LocalCache(), clock=clock)
+        await seed(ops, clock, [{"v": 1}], age=TTL + STALE + 1)
+        server.data.clear()  # Expired in Redis; L1 still holds a copy
+        fetch, calls = counting_fetch([{"v": 2}])
+
+        assert await ops.get_with_fetch(KEY, fetch, TTL, STALE) == [{"v": 2}]
+        assert calls["fetch"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_ttl_covers_stale_window(self):
+        server = FakeRedisServer()
+        ops = CacheOperations(make_pod(server))
+
+        await ops.set(KEY, [{"v": 1}], TTL, STALE)
+
+        assert server.ttls[KEY] == TTL + STALE
+
+
+class TestBackgroundRefresh:
+    """Refresh failures, cross-pod locking and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_serving_stale(self):
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(FakeRedisServer()), clock=clock)
+        await seed(ops, clock, [{"v": 1}], age=TTL + 60)
+
+        async def failing():
+            raise RuntimeError("rate limited")
+
+        await ops.get_with_fetch(KEY, failing, TTL, STALE)
+        await ops.wait_for_refreshes()
+
+        assert await ops.get_with_fetch(KEY, failing, TTL, STALE) == [{"v": 1}]
+        stats = ops.stats()["stale"]
+        assert stats["refresh_failures"] == 1
+        assert stats["stale_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_one_pod_refreshes(self):
+        server = FakeRedisServer()
+        clock = FakeClock()
+        pod_a = CacheOperations(make_pod(server), clock=clock)
+        pod_b = CacheOperations(make_pod(server), clock=clock)
+        await seed(pod_a, clock, [{"v": 1}], age=TTL + 60)
+        fetch, calls = counting_fetch([{"v": 2}], delay=0.05)
+
+        await pod_a.get_with_fetch(KEY, fetch, TTL, STALE)
+        await asyncio.sleep(0.01)  # pod A now holds the refresh lock
+        await pod_b.get_with_fetch(KEY, fetch, TTL, STALE)
+        await asyncio.gather(pod_a.wait_for_refreshes(), pod_b.wait_for_refreshes())
+
+        assert calls["fetch"] == 1
+        assert pod_a.stats()["stale"]["refreshes"] == 1
+        assert pod_b.stats()["stale"]["refresh_skipped"] == 1
+        assert "lock:refresh:" + KEY not in server.data
+
+    @pytest.mark.asyncio
+    async def test_stats_report_staleness_age(self):
+        clock = FakeClock()
+        ops = CacheOperations(make_pod(FakeRedisServer()), clock=clock)
+        await seed(ops, clock, [{"v": 1}], age=TTL + 120)
+        fetch, _ = counting_fetch([{"v": 2}])
+
+        await ops.get_with_fetch(KEY, fetch, TTL, STALE)
+        await ops.wait_for_refreshes()
+
+        stats = ops.stats()["stale"]
+        assert stats["max_stale_age_seconds"] == TTL + 120
+        assert stats["stale_hits_by_type"] == {"market:options": 1}
+        assert stats["refreshing"] == 0
+
+
+class TestDataManagerStaleness:
+    """DataManager wires per-domain windows and surfaces age on bars."""
+
+    def test_granularity_stale_windows(self):
+        assert Granularity.DAILY.stale_ttl_seconds > 0
+        assert Granularity.MIN_5.stale_ttl_seconds == 0
+        assert DataManager.STALE_TTL_QUOTE == 0
+
+    @pytest.mark.asyncio
+    async def test_get_ohlcv_marks_stale_bars(self):
+        df = pd.DataFrame(
+            {
+                "Open": [1.0, 2.0],
+                "High": [1.5, 2.5],
+                "Low": [0.5, 1.5],
+                "Close": [1.2, 2.2],
+                "Volume": [100, 200],
+            },
+            index=pd.to_datetime(["2024-01-02", "2024-01-03"], utc=True),
+        )
+        av_service = MagicMock()
+        av_service.get_daily_bars = AsyncMock(return_value=df)
+        dm = DataManager(make_pod(FakeRedisServer()), av_service)
+        clock = FakeClock()
+        dm._cache._clock = clock
+
+        fresh = await dm.get_ohlcv("AAPL", "daily")
+        clock.now += Granularity.DAILY.ttl_seconds + 30
+        stale = await dm.get_ohlcv("AAPL", "daily")
+        await dm.stop_cache_sync()
+
+        assert not fresh.stale
+        assert stale.stale
+        assert stale.stored_at == fresh.stored_at
+        assert len(stale) == 2
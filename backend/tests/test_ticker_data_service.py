@@ -413,6 +413,28 @@ class TestTickerDataServiceCaching:
             assert any("Cache hit" in str(call) for call in log_calls)
 
 
+class TestCurrentPrices:
+    """Test suite for multi-symbol current price lookup."""
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_fetched_in_one_request(self):
+        """Cached prices are reused; the rest come from one Alpaca request."""
+        cache = Mock(spec=RedisCache)
+        cache.get = AsyncMock(
+            side_effect=lambda key: 150.0 if key == "current_price:AAPL" else None
+        )
+        cache.set = AsyncMock(return_value=True)
+        alpaca = Mock()
+        alpaca.get_latest_prices = AsyncMock(return_value={"MSFT": 400.0, "X": None})
+        service = TickerDataService(cache, alpaca_data_service=alpaca)
+
+        prices = await service.get_current_prices(["AAPL", "MSFT", "X"])
+
+        assert prices == {"AAPL": 150.0, "MSFT": 400.0, "X": None}
+        alpaca.get_latest_prices.assert_awaited_once_with(["MSFT", "X"])
+        cache.set.assert_awaited_once_with("current_price:MSFT", 400.0, ttl_seconds=30)
+
+
 # TestTickerDataServiceYfinance class removed - marked with:
 # @pytest.mark.skip(reason="yfinance deprecated - migrated to Alpha Vantage")
 #
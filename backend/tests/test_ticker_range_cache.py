@@ -0,0 +1,260 @@
+"""
+Unit tests for the range-indexed ticker cache.
+Covers segment merging and gap computation, and TickerDataService serving
+overlapping date ranges from cached bars while fetching only the gaps.
+"""
+
+import json
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from src.core.data.range_cache import (
+    RangeEntry,
+    merge_segments,
+    missing_ranges,
+)
+from src.core.data.ticker_data_service import TickerDataService
+from src.services.data_manager import codec
+
+
+class DictRedis:
+    """Minimal async Redis stand-in backed by a dict."""
+
+    def __init__(self):
+        self.data: dict[str, Any] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return True
+
+    async def get_raw(self, key):
+        return self.data.get(key)
+
+    async def set_raw(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return True
+
+
+class FakeAlpaca:
+    """Alpaca data stand-in returning one bar per weekday, recording calls."""
+
+    def __init__(self):
+        self.calls: list[tuple[str, str]] = []
+        self.fail = False
+        self.holidays: set[str] = set()
+
+    async def get_bars(
+        self, symbol, interval, start_date, end_date, raise_errors=False
+    ):
+        self.calls.append((start_date, end_date))
+        if self.fail:
+            if raise_errors:
+                raise RuntimeError("Alpaca unavailable")
+            return pd.DataFrame()
+        days = pd.bdate_range(start_date, end_date)
+        days = days[~days.strftime("%Y-%m-%d").isin(self.holidays)]
+        index = pd.DatetimeIndex(days + pd.Timedelta(hours=5)).tz_localize("UTC")
+        close = [float(d.toordinal() % 1000) for d in days]
+        return pd.DataFrame(
+            {
+                "Open": close,
+                "High": close,
+                "Low": close,
+                "Close": close,
+                "Volume": [1000.0] * len(days),
+            },
+            index=index,
+        )
+
+
+class TestSegments:
+    """Test coverage bookkeeping."""
+
+    def test_merge_overlapping_and_adjacent(self):
+        """Overlapping and touching segments collapse into one."""
+        segments = [
+            ("2024-03-01", "2024-03-31"),
+            ("2024-01-01", "2024-01-31"),
+            ("2024-02-01", "2024-02-10"),
+            ("2024-01-15", "2024-01-20"),
+        ]
+
+        assert merge_segments(segments) == [
+            ("2024-01-01", "2024-02-10"),
+            ("2024-03-01", "2024-03-31"),
+        ]
+
+    def test_missing_ranges(self):
+        """Only uncovered sub-ranges are reported."""
+        segments = [("2024-02-01", "2024-02-29"), ("2024-04-01", "2024-04-30")]
+
+        assert missing_ranges(segments, "2024-01-15", "2024-05-10") == [
+            ("2024-01-15", "2024-01-31"),
+            ("2024-03-01", "2024-03-31"),
+            ("2024-05-01", "2024-05-10"),
+        ]
+        assert missing_ranges(segments, "2024-02-05", "2024-02-20") == []
+        assert missing_ranges([], "2024-01-01", "2024-01-02") == [
+            ("2024-01-01", "2024-01-02")
+        ]
+
+    def test_entry_roundtrip(self):
+        """Entries survive the columnar codec."""
+        entry = RangeEntry()
+        frame = pd.DataFrame(
+            {"Close": [1.0, 2.0]},
+            index=pd.DatetimeIndex(["2024-01-02 05:00", "2024-01-03 05:00"], tz="UTC"),
+        )
+        entry.add("2024-01-01", "2024-01-05", frame)
+
+        payload = entry.to_bytes()
+        restored = RangeEntry.from_bytes(payload)
+
+        assert payload[len(codec.MAGIC) + 1] == codec.COLUMNAR.codec_id
+        assert restored.segments == [("2024-01-01", "2024-01-05")]
+        pd.testing.assert_frame_equal(
+            restored.frame, entry.frame, check_freq=False, check_index_type=False
+        )
+
+    def test_empty_and_legacy_entries(self):
+        """Entries without bars and JSON entries still decode."""
+        empty = RangeEntry(segments=[("2024-12-25", "2024-12-25")])
+        legacy = {
+            "segments": [["2024-01-02", "2024-01-02"]],
+            "index": [1704171600000000000],
+            "tz": "UTC",
+            "columns": {"Close": [1.0]},
+        }
+
+        restored = RangeEntry.from_bytes(empty.to_bytes())
+        from_json = RangeEntry.from_bytes(json.dumps(legacy).encode())
+
+        assert restored.segments == [("2024-12-25", "2024-12-25")]
+        assert restored.frame.empty
+        assert from_json.frame["Close"].tolist() == [1.0]
+        assert str(from_json.frame.index[0]) == "2024-01-02 05:00:00+00:00"
+
+
+class TestTickerDataServiceRanges:
+    """Test gap-aware fetching through get_ticker_history."""
+
+    @pytest.fixture
+    def alpaca(self):
+        return FakeAlpaca()
+
+    @pytest.fixture
+    def service(self, alpaca):
+        return TickerDataService(DictRedis(), alpaca_data_service=alpaca)
+
+    @pytest.mark.asyncio
+    async def test_sub_range_served_from_cache(self, service, alpaca):
+        """A range inside a cached one needs no fetch."""
+        full = await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-01-01", end_date="2024-12-31"
+        )
+
+        half = await service.get_ticker_history(
+            "aapl", "1d", start_date="2024-01-01", end_date="2024-06-30"
+        )
+
+        assert alpaca.calls == [("2024-01-01", "2024-12-31")]
+        assert len(half) == len(pd.bdate_range("2024-01-01", "2024-06-30"))
+        pd.testing.assert_frame_equal(
+            half,
+            full.loc[:"2024-06-30 23:59"],
+            check_freq=False,
+            check_index_type=False,
+        )
+        assert service.range_stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_overlap_fetches_only_gaps(self, service, alpaca):
+        """Overlapping ranges fetch just the uncovered ends."""
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-03-01", end_date="2024-06-30"
+        )
+
+        df = await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-01-01", end_date="2024-09-30"
+        )
+
+        assert alpaca.calls[1:] == [
+            ("2024-01-01", "2024-02-29"),
+            ("2024-07-01", "2024-09-30"),
+        ]
+        assert len(df) == len(pd.bdate_range("2024-01-01", "2024-09-30"))
+        assert df.index.is_monotonic_increasing
+        assert not df.index.duplicated().any()
+        assert service.range_stats.partial == 1
+
+    @pytest.mark.asyncio
+    async def test_today_is_never_covered(self, service, alpaca):
+        """The still-forming current day is refetched on every range miss."""
+        today = date.today()
+        start = (today - timedelta(days=30)).isoformat()
+
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date=start, end_date=today.isoformat()
+        )
+        await service.get_ticker_history(
+            "AAPL",
+            "1d",
+            start_date=(today - timedelta(days=10)).isoformat(),
+            end_date=today.isoformat(),
+        )
+
+        assert alpaca.calls[-1] == (today.isoformat(), today.isoformat())
+
+    @pytest.mark.asyncio
+    async def test_holiday_gap_is_recorded(self, service, alpaca):
+        """A settled gap without bars (market holiday) is cached as covered."""
+        alpaca.holidays = {"2024-12-25"}
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-12-16", end_date="2024-12-24"
+        )
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-12-26", end_date="2024-12-31"
+        )
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-12-16", end_date="2024-12-31"
+        )
+
+        df = await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-12-20", end_date="2024-12-27"
+        )
+
+        assert alpaca.calls[2:] == [("2024-12-25", "2024-12-25")]
+        assert len(df) == 5
+        assert service.range_stats.hits == 1
+
+    def test_intraday_entries_have_lower_row_cap(self, service):
+        """Minute-bar entries are written back only up to the intraday cap."""
+        assert service._max_range_rows("1d") == TickerDataService.MAX_RANGE_ROWS
+        assert (
+            service._max_range_rows("1m") == TickerDataService.MAX_INTRADAY_RANGE_ROWS
+        )
+        assert (
+            TickerDataService.MAX_INTRADAY_RANGE_ROWS < TickerDataService.MAX_RANGE_ROWS
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_gap_is_not_recorded(self, service, alpaca):
+        """A failed fetch leaves the gap uncovered."""
+        alpaca.fail = True
+        await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-01-01", end_date="2024-01-31"
+        )
+        alpaca.fail = False
+
+        df = await service.get_ticker_history(
+            "AAPL", "1d", start_date="2024-01-08", end_date="2024-01-12"
+        )
+
+        assert len(df) == 5
+        assert alpaca.calls[-1] == ("2024-01-08", "2024-01-12")
@@ -7,6 +7,7 @@ Tests chat title generation utilities.
 import pytest
 
 from src.core.utils.title_utils import (
+    StreamingTitleFilter,
     detect_action,
     extract_symbols,
     extract_title_from_response,
@@ -237,3 +238,52 @@ class TestExtractTitleFromResponse:
         assert title == "Title"
         assert cleaned == "Line 1\nLine 2"
         assert cleaned.strip() == "Line 1\nLine 2"
+
+
+# ===== StreamingTitleFilter Tests =====
+
+
+def stream_through(chunks: list[str]) -> tuple[list[str], str | None, str]:
+    """Feed chunks through a filter; return released pieces, title, cleaned."""
+    title_filter = StreamingTitleFilter()
+    released = [title_filter.feed(chunk) for chunk in chunks]
+    title, cleaned, remainder = title_filter.finish()
+    released.append(remainder)
+    return released, title, cleaned
+
+
+class TestStreamingTitleFilter:
+    """Test StreamingTitleFilter"""
+
+    def test_marker_split_across_chunks_is_held_back(self):
+        """Test marker pieces are never released"""
+        released, title, cleaned = stream_through(
+            ["AAPL is ", "strong.\n[ch", "at_tit", "le: AAPL Outlook]"]
+        )
+
+        assert "".join(released) == "AAPL is strong."
+        assert all("[" not in piece for piece in released)
+        assert title == "AAPL Outlook"
+        assert cleaned == "AAPL is strong."
+
+    def test_text_released_as_it_arrives(self):
+        """Test ordinary text and brackets are not delayed"""
+        title_filter = StreamingTitleFilter()
+
+        assert title_filter.feed("Levels [1] and") == "Levels [1] and"
+        assert title_filter.feed(" [2]") == " [2]"
+
+    def test_trailing_whitespace_released_with_next_text(self):
+        """Test whitespace waits for the next chunk"""
+        title_filter = StreamingTitleFilter()
+
+        assert title_filter.feed("Hello ") == "Hello"
+        assert title_filter.feed("world") == " world"
+
+    def test_no_title(self):
+        """Test a response without a marker is released in full"""
+        released, title, cleaned = stream_through(["Plain answer [", "see above"])
+
+        assert "".join(released) == "Plain answer [see above"
+        assert title is None
+        assert cleaned == "Plain answer [see above"
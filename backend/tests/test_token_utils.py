@@ -9,7 +9,10 @@ Tests token usage extraction from:
 
 from unittest.mock import Mock
 
+from langchain_core.messages import AIMessage
+
 from src.core.utils.token_utils import (
+    extract_token_usage_details_from_messages,
     extract_token_usage_from_agent_result,
     extract_token_usage_from_messages,
 )
@@ -296,6 +299,86 @@ class TestExtractTokenUsageFromMessages:
         assert total_tokens == 675
 
 
+# ===== Prompt Prefix Cache Hit Tests =====
+
+
+class TestExtractTokenUsageDetails:
+    """Test token usage with prompt prefix cache hits from real AIMessages"""
+
+    def test_usage_metadata_dict_is_counted(self):
+        """LangChain usage_metadata is a dict, not an object with attributes"""
+        message = AIMessage(
+            content="Hello",
+            usage_metadata={
+                "input_tokens": 120,
+                "output_tokens": 30,
+                "total_tokens": 150,
+            },
+        )
+
+        assert extract_token_usage_from_messages([message]) == (120, 30, 150)
+
+    def test_cache_read_from_usage_metadata(self):
+        """input_token_details.cache_read is reported as cached input tokens"""
+        message = AIMessage(
+            content="Hello",
+            usage_metadata={
+                "input_tokens": 6000,
+                "output_tokens": 200,
+                "total_tokens": 6200,
+                "input_token_details": {"cache_read": 5800},
+            },
+        )
+
+        assert extract_token_usage_details_from_messages([message]) == {
+            "input_tokens": 6000,
+            "output_tokens": 200,
+            "total_tokens": 6200,
+            "cached_input_tokens": 5800,
+        }
+
+    def test_cached_tokens_from_dashscope_and_openai_usage(self):
+        """prompt_tokens_details.cached_tokens is summed across AI messages"""
+        dashscope = AIMessage(
+            content="",
+            response_metadata={
+                "token_usage": {
+                    "input_tokens": 6000,
+                    "output_tokens": 50,
+                    "prompt_tokens_details": {"cached_tokens": 5632},
+                }
+            },
+        )
+        openai = AIMessage(
+            content="Done",
+            response_metadata={
+                "usage": {
+                    "prompt_tokens": 6400,
+                    "completion_tokens": 300,
+                    "prompt_tokens_details": {"cached_tokens": 6016},
+                }
+            },
+        )
+
+        usage = extract_token_usage_details_from_messages([dashscope, openai])
+
+        assert usage["input_tokens"] == 12400
+        assert usage["output_tokens"] == 350
+        assert usage["cached_input_tokens"] == 11648
+
+    def test_no_cache_details_reports_zero(self):
+        """Providers without cache details report no cached tokens"""
+        message = AIMessage(
+            content="Hello",
+            response_metadata={"token_usage": {"input_tokens": 30, "output_tokens": 4}},
+        )
+
+        usage = extract_token_usage_details_from_messages([message])
+
+        assert usage["cached_input_tokens"] == 0
+        assert usage["total_tokens"] == 34
+
+
 # ===== Extract Token Usage from Agent Result Tests =====
 
 
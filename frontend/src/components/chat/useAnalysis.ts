@@ -223,6 +223,17 @@ export const useAnalysis = (
             // Symbol context - takes priority over DB ui_state, eliminates race condition
             current_symbol: currentSymbol || undefined,
           },
+          (answer: string) => {
+            // Saved answer replaces text streamed from tool-calling turns
+            accumulatedContent = answer;
+            setMessages((prev) =>
+              prev.map((msg: any) =>
+                msg._id === assistantMessageId
+                  ? { ...msg, content: accumulatedContent }
+                  : msg,
+              ),
+            );
+          },
         );
       });
     },
@@ -186,6 +186,8 @@ export const chatService = {
    * @param onTitleGenerated Callback when title is generated
    * @param onDone Callback when streaming completes
    * @param onError Callback for errors
+   * @param onAnswer Callback with the saved answer, replacing the streamed
+   *   chunks (sent when they included text from tool-calling turns)
    */
   sendMessageStreamPersistent(
     message: string,
@@ -235,6 +237,7 @@ export const chatService = {
       // Symbol Context (takes priority over DB ui_state, eliminates race condition)
       current_symbol?: string;
     },
+    onAnswer?: (content: string) => void,
   ): () => void {
     const baseURL =
       import.meta.env.VITE_API_URL !== undefined
@@ -311,6 +314,8 @@ export const chatService = {
               onChatCreated(data.chat_id);
             } else if (data.type === "chunk" && data.content) {
               onChunk(data.content);
+            } else if (data.type === "answer" && onAnswer) {
+              onAnswer(data.content);
             } else if (
               data.type === "title_generated" &&
               onTitleGenerated &&
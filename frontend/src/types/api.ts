@@ -198,6 +198,10 @@ export type StreamEvent =
       type: "chunk";
       content: string;
     }
+  | {
+      type: "answer";
+      content: string;
+    }
   | {
       type: "title_generated";
       title: string;